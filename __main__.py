@@ -1,15 +1,29 @@
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from src.vista.InterfazEPorra import App_EPorra
 from src.logica.Logica_mock import Logica_mock
-from src.logica.manager_eporra import ManagerEPorra
-from src.modelo.declarative_base import E_PORRA_ADDRESS
+from src.logica.almacenamiento import crear_logica
+from src.logica.grabacion import Grabadora
+from src.vista.vigilancia import Vigilante
 
 if __name__ == '__main__':
     # Punto inicial de la aplicación
 
     logica = Logica_mock()
-    manager_eporra = ManagerEPorra(E_PORRA_ADDRESS)
+    # El almacenamiento se elige por despliegue (sqlite por defecto)
+    manager_eporra = crear_logica(os.environ.get('EPORRA_ALMACENAMIENTO', 'sqlite'))
+    if os.environ.get('EPORRA_GRABACION'):
+        # Graba las llamadas para reproducirlas con benchmarks.reproducir
+        manager_eporra = Grabadora(manager_eporra, os.environ['EPORRA_GRABACION'])
 
-    app = App_EPorra(sys.argv, manager_eporra)
-    sys.exit(app.exec_())
\ No newline at end of file
+    vigilante = None
+    if os.environ.get('EPORRA_VIGILANCIA'):
+        # Registra los bloqueos del bucle de eventos y las latencias por accion
+        vigilante = Vigilante(os.environ['EPORRA_VIGILANCIA'],
+                              int(os.environ.get('EPORRA_UMBRAL_BLOQUEO', 200)))
+
+    app = App_EPorra(sys.argv, manager_eporra, vigilante)
+    codigo = app.exec_()
+    manager_eporra.cerrar()
+    sys.exit(codigo)
@@ -0,0 +1,57 @@
+"""
+Comparacion del registro de apuestas con la base de datos en disco y en
+memoria con puntos de control.
+
+Uso: python -m benchmarks.memoria [numero de apuestas]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+
+
+def medir(address, numero_apuestas, **opciones):
+    """
+    Funcion para medir cuantas apuestas por segundo registra la logica.
+    """
+    logica = ManagerEPorra(address, **opciones)
+    carrera = Carrera(nombre='Carrera', abierta=True, ganancia=0)
+    carrera.competidores.extend([
+        Competidor(nombre='Competidor 1', probabilidad=0.5, ganador=False),
+        Competidor(nombre='Competidor 2', probabilidad=0.5, ganador=False)])
+    logica.session.add(carrera)
+    logica.session.commit()
+    for i in range(10):
+        logica.aniadir_apostador('Apostador {}'.format(i))
+
+    inicio = time.perf_counter()
+    for i in range(numero_apuestas):
+        logica.crear_apuesta('Apostador {}'.format(i % 10), 'Carrera', 10,
+                             'Competidor {}'.format(i % 2 + 1))
+    duracion = time.perf_counter() - inicio
+    logica.cerrar()
+    return numero_apuestas / duracion
+
+
+def main(numero_apuestas):
+    directorio = tempfile.mkdtemp()
+    try:
+        modos = [
+            ('disco', 'disco.sqlite', {}),
+            ('memoria', 'memoria.sqlite', {'en_memoria': True, 'intervalo_guardado': 1}),
+        ]
+        for nombre, archivo, opciones in modos:
+            address = 'sqlite:///' + os.path.join(directorio, archivo)
+            velocidad = medir(address, numero_apuestas, **opciones)
+            print('{:<8} {:>10.0f} apuestas/s'.format(nombre, velocidad))
+    finally:
+        shutil.rmtree(directorio)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
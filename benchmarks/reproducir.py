@@ -0,0 +1,43 @@
+"""
+Reproduccion de una grabacion de llamadas contra una base de datos nueva, con
+el resumen de latencias por metodo.
+
+Uso: python -m benchmarks.reproducir grabacion.jsonl [velocidad] [almacenamiento]
+
+La velocidad 1 respeta los tiempos de la grabacion y 0 ejecuta las llamadas sin
+esperas (por defecto). El almacenamiento es 'sqlite' (por defecto) o 'memoria'.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+from src.logica.almacenamiento import crear_logica
+from src.logica.grabacion import reproducir, resumir_latencias
+
+
+def main(ruta, velocidad, almacenamiento):
+    directorio = tempfile.mkdtemp()
+    try:
+        opciones = {}
+        if almacenamiento == 'sqlite':
+            opciones['address'] = 'sqlite:///' + os.path.join(directorio, 'reproduccion.sqlite')
+        logica = crear_logica(almacenamiento, **opciones)
+        try:
+            resultados = reproducir(ruta, logica, velocidad or None)
+        finally:
+            logica.cerrar()
+    finally:
+        shutil.rmtree(directorio)
+
+    print('{:<32} {:>8} {:>7} {:>9} {:>9} {:>9} {:>9}'.format(
+        'metodo', 'llamadas', 'errores', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms'))
+    for fila in resumir_latencias(resultados):
+        print('{Metodo:<32} {Llamadas:>8} {Errores:>7} {p50:>9.2f} {p95:>9.2f} '
+              '{p99:>9.2f} {Maximo:>9.2f}'.format(**fila))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1],
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0,
+         sys.argv[3] if len(sys.argv) > 3 else 'sqlite')
@@ -21,12 +21,12 @@ class Logica_mock():
                           'Abierta': True}]
         self.apostadores = [{'Nombre': 'Pepe Pérez'}, {
             'Nombre': "Ana Andrade"}, {'Nombre': "Aymara Castillo"}]
-        self.apuestas = [{'Apostador': 'Pepe Pérez', 'Carrera': 'Carrera 1', 'Valor': 10, 'Competidor': 'Juan Pablo Montoya'},
-                         {'Apostador': 'Ana Andrade', 'Carrera': 'Carrera 1',
+        self.apuestas = [{'Id': 1, 'Apostador': 'Pepe Pérez', 'Carrera': 'Carrera 1', 'Valor': 10, 'Competidor': 'Juan Pablo Montoya'},
+                         {'Id': 2, 'Apostador': 'Ana Andrade', 'Carrera': 'Carrera 1',
                              'Valor': 25, 'Competidor': 'Michael Schumacher'},
-                         {'Apostador': 'Aymara Castillo', 'Carrera': 'Carrera 1',
+                         {'Id': 3, 'Apostador': 'Aymara Castillo', 'Carrera': 'Carrera 1',
                              'Valor': 14, 'Competidor': 'Juan Pablo Montoya'},
-                         {'Apostador': 'Aymara Castillo', 'Carrera': 'Carrera 2', 'Valor': 45, 'Competidor': 'Usain Bolt'}]
+                         {'Id': 4, 'Apostador': 'Aymara Castillo', 'Carrera': 'Carrera 2', 'Valor': 45, 'Competidor': 'Usain Bolt'}]
         self.ganancias = [{'Carrera': 'Carrera 1', 'Ganancias': [('Pepe Pérez', 13), ('Ana Andrade', 0), ('Aymara Castillo', 15)], 'Ganancias de la casa': 4},
                           {'Carrera': 'Carrera 2', 'Ganancias': [('Pepe Pérez', 32), ('Ana Andrade', 12), ('Aymara Castillo', 34)], 'Ganancias de la casa': -10}]
 
@@ -58,8 +58,17 @@ class Logica_mock():
     def editar_apostador(self, id, nombre):
         self.apostadores[id]['Nombre'] = nombre
 
-    def eliminar_apostador(self, id):
-        del self.apostadores[id]
+    def eliminar_apostador(self, nombre):
+        self.apostadores = [a for a in self.apostadores if a['Nombre'] != nombre]
+        self.apuestas = [a for a in self.apuestas if a['Apostador'] != nombre]
+
+    def buscar_apostadores(self, prefijo, k=20):
+        return [a.copy() for a in self.apostadores
+                if a['Nombre'].lower().startswith(prefijo.lower())][:k]
+
+    def buscar_competidores(self, id_carrera, prefijo, k=20):
+        return [c.copy() for c in self.carreras[id_carrera]['Competidores']
+                if c['Nombre'].lower().startswith(prefijo.lower())][:k]
 
     def dar_competidores_carrera(self, id):
         return self.carreras[id]['Competidores'].copy()
@@ -82,11 +91,15 @@ class Logica_mock():
         nombre_carrera = self.carreras[id_carrera]['Nombre']
         return list(filter(lambda x: x['Carrera'] == nombre_carrera, self.apuestas))
 
+    def _buscar_apuesta(self, id_apuesta):
+        return next((a for a in self.apuestas if a['Id'] == id_apuesta), None)
+
     def dar_apuesta(self, id_carrera, id_apuesta):
-        return self.dar_apuestas_carrera(id_carrera)[id_apuesta].copy()
+        return self._buscar_apuesta(id_apuesta).copy()
 
     def crear_apuesta(self, apostador, id_carrera, valor, competidor):
         n_apuesta = {}
+        n_apuesta['Id'] = max([a['Id'] for a in self.apuestas], default=0) + 1
         n_apuesta['Apostador'] = apostador
         n_apuesta['Carrera'] = self.carreras[id_carrera]['Nombre']
         n_apuesta['Valor'] = valor
@@ -94,27 +107,18 @@ class Logica_mock():
         self.apuestas.append(n_apuesta)
 
     def editar_apuesta(self, id_apuesta, apostador, carrera, valor, competidor):
-        self.apuestas[id_apuesta]['Apostador'] = apostador
-        self.apuestas[id_apuesta]['Carrera'] = carrera
-        self.apuestas[id_apuesta]['Valor'] = valor
-        self.apuestas[id_apuesta]['Competidor'] = competidor
+        apuesta = self._buscar_apuesta(id_apuesta)
+        apuesta['Apostador'] = apostador
+        apuesta['Carrera'] = carrera
+        apuesta['Valor'] = valor
+        apuesta['Competidor'] = competidor
 
     def eliminar_apuesta(self, id_carrera, id_apuesta):
-        nombre_carrera = self.carreras[id_carrera]['Nombre']
-        i = 0
-        id = 0
-        while i < len(self.apuestas):
-            if self.apuestas[i]['Carrera'] == nombre_carrera:
-                if id == id_apuesta:
-                    self.apuestas.pop(i)
-                    return True
-                else:
-                    id += 1
-            i += 1
-
-        return False
-
-        del self.apuesta[id_apuesta]
+        apuesta = self._buscar_apuesta(id_apuesta)
+        if apuesta is None:
+            return False
+        self.apuestas.remove(apuesta)
+        return True
 
     def dar_reporte_ganancias(self, id_carrera, id_competidor):
         self.carreras[id_carrera]['Abierta'] = False
@@ -123,3 +127,7 @@ class Logica_mock():
         for ganancias in self.ganancias:
             if ganancias['Carrera'] == n_carrera:
                 return ganancias['Ganancias'], ganancias['Ganancias de la casa']
+
+    def dar_version_datos(self):
+        # Sin escritores externos no hay cambios que detectar
+        return None
@@ -0,0 +1,65 @@
+"""
+Seleccion del almacenamiento de E-Porra. Todas las implementaciones de la
+logica siguen la interfaz de Logica_mock (carreras, competidores, apostadores,
+apuestas y reporte de ganancias) y usan las mismas validaciones, por lo que la
+interfaz grafica no depende de donde se guardan los datos. Las reglas comunes
+(reglas.py) leen los datos a traves de la interfaz Repositorio, que cada
+almacenamiento implementa.
+"""
+from src.modelo.declarative_base import E_PORRA_ADDRESS
+from .manager_eporra import ManagerEPorra
+from .manager_memoria import ManagerMemoria
+
+
+def _sqlite(address=E_PORRA_ADDRESS, **opciones):
+    """
+    Funcion para crear la logica sobre SQLite. Las opciones son las de
+    ManagerEPorra (fragmentos, instantanea, modo en memoria, archivo).
+    """
+    return ManagerEPorra(address, **opciones)
+
+
+def _memoria(**opciones):
+    """
+    Funcion para crear la logica en memoria, sin persistencia. No tiene
+    opciones; se rechazan en lugar de ignorarlas en silencio.
+    """
+    if opciones:
+        raise ValueError("El almacenamiento en memoria no tiene opciones: {}".format(
+            ', '.join(sorted(opciones))))
+    return ManagerMemoria()
+
+
+ALMACENAMIENTOS = {
+    'sqlite': _sqlite,
+    'memoria': _memoria,
+}
+
+
+def registrar_almacenamiento(nombre, fabrica):
+    """
+    Funcion para aniadir un almacenamiento.
+
+    Args:
+        nombre (str): nombre con el que se elige el almacenamiento.
+        fabrica (callable): recibe las opciones del despliegue y retorna una
+            logica con la interfaz de Logica_mock, que implementa Repositorio y
+            tiene un metodo cerrar.
+    """
+    if nombre in ALMACENAMIENTOS:
+        raise ValueError("Ya existe un almacenamiento con nombre: {}".format(nombre))
+    ALMACENAMIENTOS[nombre] = fabrica
+
+
+def crear_logica(almacenamiento='sqlite', **opciones):
+    """
+    Funcion para crear la logica de E-Porra con el almacenamiento elegido.
+
+    Args:
+        almacenamiento (str): nombre de un almacenamiento registrado.
+        opciones: argumentos para la fabrica del almacenamiento.
+    """
+    if almacenamiento not in ALMACENAMIENTOS:
+        raise ValueError("No existe el almacenamiento {}, las opciones son: {}".format(
+            almacenamiento, ', '.join(sorted(ALMACENAMIENTOS))))
+    return ALMACENAMIENTOS[almacenamiento](**opciones)
@@ -0,0 +1,111 @@
+"""
+Cache de los resultados de las consultas de listas de la logica (carreras,
+apostadores, competidores y apuestas de una carrera). Cada resultado se guarda
+con la version de los datos con la que se construyo y solo se reutiliza
+mientras esa version no cambie, es decir, mientras nadie (esta logica u otra
+terminal) confirme escrituras.
+"""
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+
+def _copiar(valor):
+    """
+    Funcion para copiar un resultado: las listas y diccionarios se copian (la
+    interfaz modifica las listas que recibe) y el resto de valores, inmutables,
+    se comparten.
+    """
+    if isinstance(valor, dict):
+        return {llave: _copiar(v) for llave, v in valor.items()}
+    if isinstance(valor, list):
+        return [_copiar(v) for v in valor]
+    return valor
+
+
+class CacheConsultas():
+    """
+    Clase que guarda los ultimos resultados de las consultas, por metodo y
+    argumentos, descartando los menos usados al superar la capacidad. Lleva
+    los aciertos y fallos de cada metodo.
+    """
+
+    def __init__(self, capacidad=256):
+        """
+        Args:
+            capacidad (int): numero maximo de resultados guardados; 0 desactiva
+                la cache.
+        """
+        self.capacidad = capacidad
+        self._resultados = OrderedDict()
+        self._metricas = {}
+        self._lock = threading.Lock()
+
+    def obtener(self, metodo, args, version, consultar):
+        """
+        Metodo para obtener el resultado de una consulta, reutilizando el
+        guardado si se construyo con la misma version de los datos.
+
+        Args:
+            metodo (str): nombre del metodo consultado.
+            args (tuple): argumentos de la consulta.
+            version: version actual de los datos.
+            consultar (callable): funcion que ejecuta la consulta.
+
+        Returns:
+            una copia del resultado.
+        """
+        llave = (metodo, args)
+        with self._lock:
+            metricas = self._metricas.setdefault(metodo, {'Aciertos': 0, 'Fallos': 0})
+            guardado = self._resultados.get(llave)
+            if guardado is not None and guardado[0] == version:
+                self._resultados.move_to_end(llave)
+                metricas['Aciertos'] += 1
+                return _copiar(guardado[1])
+            metricas['Fallos'] += 1
+        resultado = consultar()
+        if self.capacidad > 0:
+            with self._lock:
+                self._resultados[llave] = (version, _copiar(resultado))
+                self._resultados.move_to_end(llave)
+                while len(self._resultados) > self.capacidad:
+                    self._resultados.popitem(last=False)
+        return resultado
+
+    def limpiar(self):
+        """Metodo para descartar todos los resultados guardados"""
+        with self._lock:
+            self._resultados.clear()
+
+    def dar_metricas(self):
+        """
+        Metodo para obtener los aciertos, fallos y tasa de aciertos de cada
+        metodo y del total.
+        """
+        with self._lock:
+            metricas = {metodo: dict(m) for metodo, m in self._metricas.items()}
+        total = {'Aciertos': sum(m['Aciertos'] for m in metricas.values()),
+                 'Fallos': sum(m['Fallos'] for m in metricas.values())}
+        metricas['Total'] = total
+        for m in metricas.values():
+            consultas = m['Aciertos'] + m['Fallos']
+            m['Tasa de aciertos'] = m['Aciertos'] / consultas if consultas else 0.0
+        metricas['Total']['Resultados guardados'] = len(self._resultados)
+        return metricas
+
+
+def cacheado(metodo):
+    """
+    Decorador de los metodos de consulta de ManagerEPorra cuyo resultado se
+    guarda en la cache de la logica. Las llamadas con argumentos por nombre
+    (como uso_interno, que retorna objetos del ORM) no se guardan.
+    """
+    @wraps(metodo)
+    def consultar(self, *args, **kwargs):
+        if kwargs:
+            return metodo(self, *args, **kwargs)
+        return self.cache_consultas.obtener(
+            metodo.__name__, args, self.dar_version_datos(),
+            lambda: metodo(self, *args))
+    return consultar
@@ -0,0 +1,238 @@
+"""
+Grabacion y reproduccion de la carga de trabajo de la logica de E-Porra. La
+grabadora envuelve una logica y escribe cada llamada publica (metodo,
+argumentos, momento, duracion y tamano del resultado) como una linea JSON en
+un archivo que solo crece. Una grabacion se puede reproducir contra otra logica,
+normalmente sobre una base de datos nueva, para medir las latencias con la
+misma mezcla de llamadas. Los metodos que retornan un generador (como
+generar_reporte_ganancias) se graban al terminar de recorrerlo, con el numero
+de elementos entregados. Las consultas periodicas de la interfaz
+(dar_version_datos) no se graban.
+"""
+import inspect
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from decimal import Decimal
+
+# Metodos que la interfaz llama periodicamente; grabarlos llenaria la
+# grabacion sin representar la carga de trabajo
+SIN_GRABAR = ('dar_version_datos',)
+
+
+def _codificar(valor):
+    """
+    Funcion para convertir a JSON los argumentos que no lo son: los Decimal se
+    guardan como texto y los objetos del modelo (carreras, competidores,
+    apostadores) por su nombre.
+    """
+    if isinstance(valor, Decimal):
+        return {'__decimal__': str(valor)}
+    if hasattr(valor, 'nombre'):
+        return {'__nombre__': valor.nombre}
+    raise TypeError("No se puede grabar un argumento de tipo {}".format(type(valor).__name__))
+
+
+def _decodificar(logica, valor):
+    """
+    Funcion inversa de _codificar. Un objeto grabado por su nombre se busca como
+    carrera en la logica de destino; si no existe se usa el nombre.
+    """
+    if isinstance(valor, dict):
+        if '__decimal__' in valor:
+            return Decimal(valor['__decimal__'])
+        if '__nombre__' in valor:
+            carrera = logica.dar_carrera(valor['__nombre__'])
+            return carrera if carrera is not None else valor['__nombre__']
+        return {llave: _decodificar(logica, v) for llave, v in valor.items()}
+    if isinstance(valor, list):
+        return [_decodificar(logica, v) for v in valor]
+    return valor
+
+
+def _tamano(resultado):
+    """Funcion para medir el tamano del resultado de una llamada"""
+    if resultado is None:
+        return 0
+    if isinstance(resultado, (list, tuple, dict)):
+        return len(resultado)
+    return 1
+
+
+class Grabadora():
+    """
+    Clase que envuelve una logica y graba sus llamadas publicas. Las llamadas
+    que la logica hace a sus propios metodos no se graban, por lo que la
+    reproduccion no las ejecuta dos veces. Los atributos que no son metodos se
+    leen directamente de la logica.
+    """
+
+    def __init__(self, logica, ruta, sin_grabar=SIN_GRABAR):
+        """
+        Args:
+            logica: logica a grabar (ManagerEPorra, ManagerMemoria...).
+            ruta (str): archivo de la grabacion; si ya existe se agregan lineas.
+            sin_grabar (tuple): metodos cuyas llamadas no se graban.
+        """
+        self.logica = logica
+        self.ruta = ruta
+        self.sin_grabar = sin_grabar
+        self._archivo = open(ruta, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._inicio = time.perf_counter()
+
+    def __getattr__(self, nombre):
+        atributo = getattr(self.logica, nombre)
+        if nombre.startswith('_') or not callable(atributo) or nombre in self.sin_grabar:
+            return atributo
+
+        def grabar(*args, **kwargs):
+            momento = time.perf_counter()
+            error = None
+            resultado = None
+            try:
+                resultado = atributo(*args, **kwargs)
+                if inspect.isgenerator(resultado):
+                    return self._grabar_generador(resultado, nombre, args, kwargs, momento)
+                return resultado
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                if not inspect.isgenerator(resultado):
+                    self._escribir(self._llamada(nombre, args, kwargs, momento,
+                                                 _tamano(resultado), error))
+        return grabar
+
+    def _llamada(self, nombre, args, kwargs, momento, tamano, error):
+        """Metodo para construir el registro de una llamada que termino"""
+        return {
+            'momento': round(momento - self._inicio, 6),
+            'metodo': nombre,
+            'args': list(args),
+            'kwargs': kwargs,
+            'duracion': round(time.perf_counter() - momento, 6),
+            'tamano': tamano,
+            'error': error,
+        }
+
+    def _grabar_generador(self, generador, nombre, args, kwargs, momento):
+        """
+        Metodo que recorre el generador retornado por una llamada y la graba
+        cuando se agota, falla o se abandona. La duracion va hasta ese momento
+        y el tamano es el numero de elementos entregados; si se abandono, el
+        error es 'Interrumpido'.
+        """
+        elementos = 0
+        error = None
+        try:
+            while True:
+                try:
+                    elemento = next(generador)
+                except StopIteration as fin:
+                    return fin.value
+                elementos += 1
+                yield elemento
+        except GeneratorExit:
+            error = 'Interrumpido'
+            generador.close()
+            raise
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            llamada = self._llamada(nombre, args, kwargs, momento, elementos, error)
+            llamada['generador'] = True
+            self._escribir(llamada)
+
+    def _escribir(self, llamada):
+        """Metodo para agregar una llamada al archivo de la grabacion"""
+        linea = json.dumps(llamada, default=_codificar, separators=(',', ':'),
+                           ensure_ascii=False)
+        with self._lock:
+            self._archivo.write(linea + '\n')
+            self._archivo.flush()
+
+    def cerrar(self):
+        """Metodo para cerrar la grabacion y la logica grabada"""
+        with self._lock:
+            self._archivo.close()
+        self.logica.cerrar()
+
+
+def leer_grabacion(ruta):
+    """Funcion para leer las llamadas de una grabacion, en orden"""
+    with open(ruta, encoding='utf-8') as archivo:
+        return [json.loads(linea) for linea in archivo if linea.strip()]
+
+
+def reproducir(ruta, logica, velocidad=None):
+    """
+    Funcion para ejecutar de nuevo las llamadas de una grabacion contra una
+    logica. Los errores de las llamadas no detienen la reproduccion (tambien
+    ocurrieron al grabar). Los ids de las apuestas coinciden con los grabados
+    si la logica parte de una base de datos vacia, como la original. Los
+    generadores se recorren dentro de la medicion: completos, o hasta el numero
+    de elementos grabado si la llamada original se interrumpio.
+
+    Args:
+        ruta (str): archivo de la grabacion.
+        logica: logica de destino.
+        velocidad (float): 1 respeta los tiempos entre llamadas de la
+            grabacion, 10 los reproduce diez veces mas rapido; None ejecuta las
+            llamadas sin esperas.
+
+    Returns:
+        dict: latencias en segundos de cada metodo y numero de errores, con la
+            forma {metodo: {'latencias': [...], 'errores': n}}.
+    """
+    resultados = {}
+    inicio = time.perf_counter()
+    for llamada in leer_grabacion(ruta):
+        if velocidad:
+            espera = llamada['momento'] / velocidad - (time.perf_counter() - inicio)
+            if espera > 0:
+                time.sleep(espera)
+        args = _decodificar(logica, llamada['args'])
+        kwargs = _decodificar(logica, llamada['kwargs'])
+        resultado = resultados.setdefault(llamada['metodo'], {'latencias': [], 'errores': 0})
+        momento = time.perf_counter()
+        try:
+            retorno = getattr(logica, llamada['metodo'])(*args, **kwargs)
+            if inspect.isgenerator(retorno):
+                if llamada.get('error') == 'Interrumpido':
+                    deque(itertools.islice(retorno, llamada['tamano']), maxlen=0)
+                    retorno.close()
+                else:
+                    deque(retorno, maxlen=0)
+        except Exception:
+            resultado['errores'] += 1
+        resultado['latencias'].append(time.perf_counter() - momento)
+    return resultados
+
+
+def resumir_latencias(resultados):
+    """
+    Funcion para resumir por metodo las latencias de una reproduccion
+    (llamadas, errores y percentiles 50, 95 y 99 en milisegundos), ordenado
+    por el tiempo total.
+    """
+    def percentil(ordenadas, p):
+        return ordenadas[min(len(ordenadas) - 1, int(p / 100 * len(ordenadas)))] * 1000
+
+    resumen = []
+    for metodo, resultado in resultados.items():
+        ordenadas = sorted(resultado['latencias'])
+        resumen.append({
+            'Metodo': metodo,
+            'Llamadas': len(ordenadas),
+            'Errores': resultado['errores'],
+            'p50': percentil(ordenadas, 50),
+            'p95': percentil(ordenadas, 95),
+            'p99': percentil(ordenadas, 99),
+            'Maximo': ordenadas[-1] * 1000,
+            'Total': sum(ordenadas) * 1000,
+        })
+    return sorted(resumen, key=lambda r: -r['Total'])
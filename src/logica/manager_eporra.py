@@ -1,99 +1,298 @@
+import contextlib
+import re
+from datetime import datetime
+
+from sqlalchemy import event, func, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine.url import make_url
+
+from src.modelo.busqueda import filtro_prefijo, normalizar
 from src.modelo.declarative_base import Base, crear_session
+from src.modelo.dinero import a_centavos, de_centavos
+from src.modelo.migraciones import migrar
 from src.modelo.apuesta import Apuesta
+from src.modelo.archivo import Archivo
+from src.modelo.cambio_pendiente import CambioPendiente, EstadoCarrera
 from src.modelo.apostador import Apostador
-from src.modelo.competidor import Competidor
+from src.modelo.competidor import ORDEN_DE_CREACION, Competidor, calcular_multiplicador
 from src.modelo.carrera import Carrera
+from src.modelo.estadistica_apostador import EstadisticaApostador
+from src.modelo.fragmentos import Fragmentos
+from src.modelo.instantanea import Instantanea
+from src.modelo.memoria import PuntosDeControl
+from src.modelo.version_datos import VersionDatos
+from src.modelo.volumen_apuestas import MINUTOS_VOLUMEN, VolumenApuestas, inicio_ventana, minuto
 from .Logica_mock import Logica_mock
+from .cache_consultas import CacheConsultas, cacheado
+from .reglas import (calcular_exposicion, generar_reporte_ganancias, reporte_ganancias,
+                     validar_resultados)
+from .repositorio import Repositorio
+from .validaciones import (validar_competidor, validar_competidor_de_carrera,
+                           validar_competidores_nuevos, validar_ganador,
+                           validar_nombre_apostador, validar_nombre_carrera,
+                           validar_probabilidades, validar_valor_apuesta)
+
+
+# Excepcion y mensaje de la validacion equivalente a cada restriccion de la
+# base de datos
+MENSAJES_RESTRICCIONES = [
+    ('carrera.nombre', ValueError, "Ya existe una carrera con nombre: {}"),
+    ('apostador.nombre', ValueError, "Ya existe un apostador con el mismo nombre"),
+    ('competidor.nombre', ValueError, "Ya existe un competidor con el nombre: {}"),
+    ('ck_carrera_nombre_vacio', Exception, "El nombre de la carrera no debe estar vacio"),
+    ('ck_carrera_nombre_largo', ValueError, "El nombre de la carrera puede tener hasta 200 caracteres"),
+    ('ck_apostador_nombre', ValueError, "El nombre del apostador debe tener entre 1 y 200 caracteres"),
+    ('ck_competidor_nombre_vacio', Exception, "El nombre del competidor no puede estar vacio"),
+    ('ck_competidor_nombre_largo', ValueError, "El nombre del competidor no puede tener mas de 200 caracteres"),
+    ('ck_competidor_probabilidad', ValueError, "La probabilidad debe ser mayor a 0 y menor a 1"),
+    ('ck_apuesta_valor', ValueError, "El valor de la apuesta debe serpositivo y mayor a cero"),
+]
+
+
+# Mensaje de SQLite, p. ej. 'UNIQUE constraint failed: carrera.nombre' o
+# 'CHECK constraint failed: ck_carrera_nombre_vacio'
+RESTRICCION_INCUMPLIDA = re.compile(r'constraint failed: ([\w.]+(?:, [\w.]+)*)')
+
+
+def _restricciones_incumplidas(error):
+    """
+    Funcion para obtener las restricciones que reporta un error de integridad de
+    SQLite: las columnas de un UNIQUE o el nombre de un CHECK.
+    """
+    encontrada = RESTRICCION_INCUMPLIDA.search(str(error.orig))
+    return encontrada.group(1).split(', ') if encontrada else []
+
+
+def _error_de_restriccion(error, nombre=None):
+    """
+    Funcion para convertir un error de integridad en la excepcion de la
+    validacion equivalente. Si la restriccion no se conoce se retorna el error.
+    """
+    restricciones = _restricciones_incumplidas(error)
+    for restriccion, tipo, mensaje in MENSAJES_RESTRICCIONES:
+        if restriccion in restricciones:
+            return tipo(mensaje.format(nombre))
+    return error
 
 
-class ManagerEPorra(Logica_mock):
+class ManagerEPorra(Logica_mock, Repositorio):
     """
     Clase principal para el manejo de la logica de la pagina E-Porra
     """
 
-    def __init__(self, address) -> None:
+    def __init__(self, address, directorio_fragmentos=None, instantanea=None,
+                 intervalo_instantanea=None, en_memoria=False, intervalo_guardado=None,
+                 archivo=None, capacidad_cache=256) -> None:
         """
         Metodo contructor de la clase para la logica. En esta se inicializa
         el motor para la conexion con la BD.
+
+        Args:
+            address (str): direccion de la base de datos principal.
+            directorio_fragmentos (str): si se indica, las apuestas de cada
+                carrera se guardan en su propio archivo SQLite dentro de esta
+                carpeta (modo fragmentado).
+            instantanea (str): si se indica, los reportes se consultan en una
+                copia de solo lectura de la base de datos principal, guardada en
+                este archivo o en memoria si es ':memory:'.
+            intervalo_instantanea (float): segundos entre actualizaciones de la
+                copia de los reportes.
+            en_memoria (bool): si es True la base de datos se maneja en memoria;
+                se carga del archivo de address al iniciar y se guarda en el
+                despues de los commits (como maximo cada intervalo_guardado
+                segundos) y al llamar a cerrar.
+            intervalo_guardado (float): segundos minimos entre puntos de
+                control en modo en memoria.
+            archivo (str): archivo SQLite al que se mueven las carreras
+                liquidadas con archivar_carreras.
+            capacidad_cache (int): numero de resultados de consultas de listas
+                que se guardan mientras los datos no cambien; 0 la desactiva.
         """
-        (self.engine, self.session) = crear_session(address)
-        Base.metadata.create_all(self.engine)
+        (self.engine, self.session) = crear_session(address, en_memoria)
+        self.puntos_de_control = None
+        if en_memoria:
+            self.puntos_de_control = PuntosDeControl(
+                self.engine, make_url(address).database, intervalo_guardado)
+            self.puntos_de_control.cargar()
+        migrar(self.engine, Base.metadata, directorio_fragmentos)
+        if self.puntos_de_control is not None:
+            event.listen(self.session, 'after_commit', self.puntos_de_control.despues_de_commit)
+        self.version_datos = VersionDatos(self.engine)
+        self.fragmentos = Fragmentos(directorio_fragmentos, self.engine, self.version_datos) \
+            if directorio_fragmentos is not None else None
+        self.instantanea = Instantanea(
+            self.engine, None if instantanea == ':memory:' else instantanea,
+            intervalo_instantanea) if instantanea is not None else None
+        self.archivo = Archivo(archivo) if archivo is not None else None
+        if self.archivo is not None:
+            self.version_datos.observar(self.archivo.engine)
+        self._ultima_version = self.version_datos.actual()
+        self.cache_consultas = CacheConsultas(capacidad_cache)
         super(ManagerEPorra, self).__init__()
 
+    def _sesion_carrera(self, nombre_carrera):
+        """
+        Metodo para obtener la sesion con la que se manejan las apuestas de una
+        carrera. En modo fragmentado cada carrera tiene su propia sesion.
+        """
+        if self.fragmentos is None:
+            return self.session
+        return self.fragmentos.sesion(nombre_carrera)
+
+    def cerrar(self):
+        """
+        Metodo para liberar las conexiones de la logica. En modo en memoria se
+        guarda un ultimo punto de control.
+        """
+        self.session.close()
+        self.version_datos.cerrar()
+        if self.instantanea is not None:
+            self.instantanea.cerrar()
+        if self.fragmentos is not None:
+            self.fragmentos.cerrar()
+        if self.archivo is not None:
+            self.archivo.cerrar()
+        if self.puntos_de_control is not None:
+            self.puntos_de_control.cerrar()
+        self.engine.dispose()
+
+    def dar_version_datos(self):
+        """
+        Metodo para detectar de forma barata si los datos cambiaron: retorna un
+        valor distinto cada vez que alguien (esta logica u otra terminal sobre
+        la misma base de datos) confirma escrituras. Si hubo cambios, las
+        sesiones descartan los objetos ya cargados para que las siguientes
+        consultas lean los datos nuevos.
+        """
+        version = self.version_datos.actual()
+        if version != self._ultima_version:
+            self._ultima_version = version
+            self.session.expire_all()
+            if self.fragmentos is not None:
+                self.fragmentos.expirar()
+        return version
+
+    def dar_metricas_cache(self):
+        """
+        Metodo para obtener los aciertos, fallos y tasa de aciertos de la cache
+        de consultas, por metodo y en total.
+        """
+        return self.cache_consultas.dar_metricas()
+
+    @contextlib.contextmanager
+    def _sesion_reportes(self):
+        """
+        Metodo para obtener la sesion de las consultas de solo lectura de los
+        reportes: la copia de la base de datos si existe, o la sesion
+        principal. La copia no incluye los fragmentos, por lo que en modo
+        fragmentado las apuestas se siguen leyendo de la sesion de su carrera.
+        """
+        if self.instantanea is None:
+            yield self.session
+        else:
+            with self.instantanea.sesion() as sesion:
+                yield sesion
+
     def guardar_cambios_carrera(self, nombre, competidores, nueva_carrera):
-        """Metodo encargado de gestionar la logica para crear una carrera"""
+        """
+        Metodo encargado de gestionar la logica para crear una carrera. Los
+        nombres repetidos los detectan las restricciones de la base de datos al
+        insertar, sin consultas previas.
+        """
+        nombres = set()
         try:
-            carrera = self._crear_carrera(
+            nombre_carrera = self._crear_carrera(
                 nombre) if nueva_carrera else self.editar_carrera()
 
-            if sum([c.get('Probabilidad') for c in competidores]) != 1:
-                raise Exception(
-                    "Las probabilidades de los competidores no son iguales a 1")
+            validar_probabilidades(competidores)
 
+            nuevos = [c for c in competidores if c.get('Estado') == 'Nueva']
+            nombres = validar_competidores_nuevos(nuevos)
             for i, competidor in enumerate(competidores):
-                if competidor.get('Estado') == 'Nueva':
-                    self.aniadir_competidor(
-                        carrera, competidor['Nombre'], competidor['Probabilidad'])
-                else:
+                if competidor.get('Estado') != 'Nueva':
                     self.editar_competidor(
                         i, competidor['Nombre'], competidor['Probabilidad'])
+            self._insertar_competidores(nombre_carrera, nuevos)
             self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            if 'competidor.nombre' in _restricciones_incumplidas(e):
+                # Solo al fallar se consulta cual de los nombres ya existia
+                repetido = self.session.query(Competidor.nombre).filter(
+                    Competidor.nombre.in_(nombres)).first()
+                raise _error_de_restriccion(e, repetido[0] if repetido else None) from None
+            raise _error_de_restriccion(e, nombre.strip()) from None
         except Exception as e:
             self.session.rollback()
             raise e
 
     def _crear_carrera(self, nombre):
         """
-        Metodo para aniadir un competidor a la carrera.
+        Metodo para insertar una carrera nueva. Retorna su nombre.
 
         Args:
             nombre: nombre de la carrera.
         """
-        nombre = nombre.strip()
-        if len(nombre) == 0:
-            raise Exception("El nombre de la carrera no debe estar vacio")
-        elif len(nombre) > 200:
-            raise ValueError(
-                "El nombre de la carrera puede tener hasta 200 caracteres")
-        elif self.dar_carrera(nombre) is not None:
+        nombre = validar_nombre_carrera(nombre)
+        # El archivo no comparte las restricciones de la base de datos principal
+        if self.archivo is not None and self.archivo.contiene(nombre):
             raise ValueError(
                 "Ya existe una carrera con nombre: {}".format(nombre))
 
-        carrera = Carrera(nombre=nombre, abierta=True, ganancia=None)
-        self.session.add(carrera)
-
-        return carrera
+        self.session.execute(Carrera.__table__.insert(), {
+            'nombre': nombre, 'nombre_normalizado': normalizar(nombre),
+            'abierta': True, 'ganancia': None})
+        return nombre
 
     def aniadir_apostador(self, nombre):
         """Metodo para crear apostadores en E-Porra (Semana 7)"""
-        if nombre is None or len(nombre) <= 0 or len(nombre) > 200:
-            raise ValueError(
-                "El nombre del apostador debe tener entre 1 y 200 caracteres")
-        elif self.dar_apostador(nombre) is not None:
-            raise ValueError("Ya existe un apostador con el mismo nombre")
-        self.session.add(Apostador(nombre=nombre))
-        self.session.commit()
+        validar_nombre_apostador(nombre)
+        try:
+            self.session.execute(Apostador.__table__.insert(), {
+                'nombre': nombre, 'nombre_normalizado': normalizar(nombre)})
+            self.session.execute(EstadisticaApostador.__table__.insert(), {
+                'nombre_apostador': nombre, 'numero_apuestas': 0, 'total_apostado': 0,
+                'total_ganado': 0, 'carreras_jugadas': 0})
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise _error_de_restriccion(e, nombre) from None
 
     def aniadir_competidor(self, carrera, nombre, probabilidad):
         """
-        Metodo para aniadir un competidor a la carrera.
+        Metodo para aniadir un competidor a la carrera. Se guarda de inmediato;
+        si el nombre ya existe lo rechaza el indice unico del nombre.
         """
         if len(nombre.strip()) == 0:
             raise Exception("El nombre del competidor no puede estar vacio")
-        elif self.session.query(Competidor).filter(Competidor.nombre == nombre).first() is not None:
-            raise ValueError(
-                "Ya existe un competidor con el nombre: " + nombre)
-        elif len(nombre) > 200:
-            raise ValueError(
-                "El nombre del competidor no puede tener mas de 200 caracteres")
-        elif not isinstance(probabilidad, (int, float)):
-            raise ValueError("La probabilidad debe ser un número")
-        elif probabilidad <= 0 or probabilidad >= 1:
-            raise ValueError("La probabilidad debe ser mayor a 0 y menor a 1")
+        validar_competidor(nombre, probabilidad)
+        try:
+            self._insertar_competidores(carrera.nombre, [
+                {'Nombre': nombre, 'Probabilidad': probabilidad}])
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise _error_de_restriccion(e, nombre) from None
 
-        competidor = Competidor(
-            nombre=nombre, probabilidad=probabilidad, ganador=False)
-        carrera.competidores.append(competidor)
+    def _insertar_competidores(self, nombre_carrera, competidores):
+        """
+        Metodo para insertar los competidores nuevos de una carrera con una sola
+        sentencia. La insercion masiva no pasa por los validadores del modelo,
+        por lo que aqui se calculan el nombre normalizado y el multiplicador.
+        """
+        filas = []
+        for competidor in competidores:
+            filas.append({
+                'nombre': competidor['Nombre'],
+                'nombre_normalizado': normalizar(competidor['Nombre']),
+                'probabilidad': competidor['Probabilidad'],
+                'multiplicador': calcular_multiplicador(competidor['Probabilidad']),
+                'ganador': False,
+                'numero_apuestas': 0,
+                'total_apostado': 0,
+                'nombre_carrera': nombre_carrera,
+            })
+        self.session.bulk_insert_mappings(Competidor, filas)
 
     def crear_apuesta(self, nombre_apostador, id_carrera, valor, nombre_competidor):
         """
@@ -105,42 +304,456 @@ class ManagerEPorra(Logica_mock):
             valor (number): Valor de la apuesta a realizar
             nombre_competidor (str): nombre del competidor a quien se le hace la apuesta
         """
-        if valor <= 0:
-            raise ValueError(
-                'El valor de la apuesta debe serpositivo y mayor a cero')
-
-        carrera = self.dar_carrera(id_carrera)
+        validar_valor_apuesta(valor)
 
-        if not carrera.abierta:
+        sesion = self._sesion_carrera(id_carrera)
+        if not self._reservar_carrera_abierta(sesion, id_carrera):
+            sesion.rollback()
             raise Exception(
                 "La carrera ya ha finalizado, no es posible adicionar apuestas.")
+        carrera = sesion.query(Carrera).filter(
+            Carrera.nombre == id_carrera).first()
+
+        apostador = sesion.query(Apostador).filter(
+            Apostador.nombre == nombre_apostador).first()
+        competidor = sesion.query(Competidor).filter(
+            Competidor.nombre == nombre_competidor,
+            Competidor.nombre_carrera == id_carrera).first()
 
-        apostador = self.dar_apostador(nombre_apostador)
-        competidor = self.dar_competidor(id_carrera, nombre_competidor)
+        fecha = datetime.now()
+        nueva_carrera = apostador is not None and \
+            not self._participa(sesion, apostador.nombre, id_carrera)
+        if self.fragmentos is not None:
+            # Los resumenes se actualizan despues (ver _consolidar_fragmento),
+            # para que la apuesta solo escriba en el fragmento
+            sesion.add(CambioPendiente(
+                nombre_apostador=apostador.nombre if apostador is not None else None,
+                nombre_competidor=competidor.nombre if competidor is not None else None,
+                apuestas=1, apostado=valor, carreras=1 if nueva_carrera else 0, fecha=fecha))
+        else:
+            if apostador is not None:
+                self._registrar_estadistica(sesion, apostador.nombre, apuestas=1, apostado=valor,
+                                            carreras=1 if nueva_carrera else 0)
+            if competidor is not None:
+                self._registrar_competidor(sesion, id_carrera, competidor.nombre,
+                                           apuestas=1, apostado=valor)
+        if competidor is not None:
+            self._registrar_volumen(sesion, id_carrera, competidor.nombre, fecha,
+                                    apuestas=1, apostado=valor)
 
-        apuesta = Apuesta(valor=valor, ganancia=0, carrera=carrera,
+        apuesta = Apuesta(valor=valor, ganancia=0, fecha=fecha, carrera=carrera,
                           apostador=apostador, competidor=competidor)
 
-        self.session.add(apuesta)
+        sesion.add(apuesta)
+        sesion.commit()
+
+    def _reservar_carrera_abierta(self, sesion, nombre_carrera):
+        """
+        Metodo para comprobar que una carrera sigue abierta con una escritura
+        condicional. La escritura toma el bloqueo de la base de datos hasta el
+        commit de la apuesta, por lo que una carrera no puede cerrarse entre la
+        comprobacion y el registro de la apuesta. En modo fragmentado se usa el
+        estado de la carrera guardado en su fragmento, que es el que bloquea.
+        """
+        if self.fragmentos is not None:
+            reservadas = sesion.query(EstadoCarrera).filter(
+                EstadoCarrera.nombre_carrera == nombre_carrera,
+                EstadoCarrera.abierta.is_(True)).update(
+                {EstadoCarrera.abierta: True}, synchronize_session=False)
+            return reservadas == 1
+        reservadas = sesion.query(Carrera).filter(
+            Carrera.nombre == nombre_carrera, Carrera.abierta.is_(True)).update(
+            {Carrera.abierta: True}, synchronize_session=False)
+        return reservadas == 1
+
+    def _participa(self, sesion, nombre_apostador, nombre_carrera, excluir=()):
+        """
+        Metodo para saber si un apostador tiene apuestas en una carrera, sin
+        contar las apuestas cuyo id este en excluir.
+        """
+        consulta = sesion.query(Apuesta.id).filter(
+            Apuesta.nombre_apostador == nombre_apostador,
+            Apuesta.nombre_carrera == nombre_carrera)
+        if excluir:
+            consulta = consulta.filter(~Apuesta.id.in_(excluir))
+        return sesion.query(consulta.exists()).scalar()
+
+    def _registrar_estadistica(self, sesion, nombre_apostador, apuestas=0, apostado=0,
+                               ganado=0, carreras=0, fecha=None):
+        """
+        Metodo para sumar un cambio al resumen de un apostador. La actualizacion
+        se hace en la base de datos (columna = columna + cambio), de modo que
+        sesiones distintas no pierden cambios entre si. La fecha es la de la
+        ultima actividad; por defecto el momento actual.
+        """
+        fecha = fecha or datetime.now()
+        cambios = {
+            EstadisticaApostador.numero_apuestas: EstadisticaApostador.numero_apuestas + apuestas,
+            EstadisticaApostador.total_apostado: EstadisticaApostador.total_apostado + apostado,
+            EstadisticaApostador.total_ganado: EstadisticaApostador.total_ganado + ganado,
+            EstadisticaApostador.carreras_jugadas: EstadisticaApostador.carreras_jugadas + carreras,
+            EstadisticaApostador.ultima_actividad: fecha,
+        }
+        actualizadas = sesion.query(EstadisticaApostador).filter(
+            EstadisticaApostador.nombre_apostador == nombre_apostador).update(
+            cambios, synchronize_session=False)
+        if not actualizadas:
+            sesion.add(EstadisticaApostador(
+                nombre_apostador=nombre_apostador, numero_apuestas=apuestas,
+                total_apostado=apostado, total_ganado=ganado, carreras_jugadas=carreras,
+                ultima_actividad=fecha))
+
+    def _registrar_competidor(self, sesion, nombre_carrera, nombre_competidor, apuestas=0, apostado=0):
+        """
+        Metodo para sumar un cambio a los totales apostados por un competidor.
+        """
+        sesion.query(Competidor).filter(
+            Competidor.nombre_carrera == nombre_carrera,
+            Competidor.nombre == nombre_competidor).update({
+                Competidor.numero_apuestas: Competidor.numero_apuestas + apuestas,
+                Competidor.total_apostado: Competidor.total_apostado + apostado,
+            }, synchronize_session=False)
+
+    def _consolidar_fragmentos(self, nombres_carreras=None):
+        """
+        Metodo para sumar a los resumenes de la base de datos principal los
+        cambios pendientes de los fragmentos de unas carreras (por defecto
+        todas). Se llama antes de leer o reemplazar los resumenes; fuera del
+        modo fragmentado no hace nada.
+        """
+        if self.fragmentos is None:
+            return
+        if nombres_carreras is None:
+            nombres_carreras = [nombre for (nombre,) in self.session.query(Carrera.nombre)]
+        for nombre in nombres_carreras:
+            if self.fragmentos.existe(nombre):
+                self._consolidar_fragmento(nombre)
+
+    def _consolidar_fragmento(self, nombre_carrera):
+        """
+        Metodo para sumar los cambios pendientes del fragmento de una carrera.
+        Los resumenes y el ultimo cambio consolidado de la carrera se escriben en
+        la misma transaccion de la base de datos principal; despues se borran
+        del fragmento los cambios ya sumados. Si el proceso se interrumpe entre
+        ambos pasos, la siguiente vez solo se borran, sin sumarlos otra vez.
+        """
+        sesion = self._sesion_carrera(nombre_carrera)
+        primero, ultimo = sesion.query(func.min(CambioPendiente.id),
+                                       func.max(CambioPendiente.id)).one()
+        if ultimo is None:
+            return
+        consolidados = sesion.query(func.coalesce(Carrera.cambios_consolidados, 0)).filter(
+            Carrera.nombre == nombre_carrera).scalar()
+        if consolidados is None:
+            sesion.rollback()
+            return
+        try:
+            if ultimo > consolidados:
+                # La primera escritura toma el bloqueo de la base de datos
+                # principal; si otra terminal ya los sumo no se suman de nuevo
+                reservadas = sesion.query(Carrera).filter(
+                    Carrera.nombre == nombre_carrera,
+                    func.coalesce(Carrera.cambios_consolidados, 0) == consolidados).update(
+                    {Carrera.cambios_consolidados: ultimo}, synchronize_session=False)
+                if not reservadas:
+                    sesion.rollback()
+                    return
+                self._sumar_cambios(sesion, nombre_carrera, sesion.query(CambioPendiente).filter(
+                    CambioPendiente.id > consolidados, CambioPendiente.id <= ultimo))
+                sesion.commit()
+                consolidados = ultimo
+            if primero <= consolidados:
+                sesion.query(CambioPendiente).filter(
+                    CambioPendiente.id <= consolidados).delete(synchronize_session=False)
+            sesion.commit()
+        except Exception:
+            sesion.rollback()
+            raise
+
+    def _sumar_cambios(self, sesion, nombre_carrera, cambios):
+        """
+        Metodo para sumar un grupo de cambios pendientes a los resumenes, con
+        una actualizacion por apostador y por competidor. Los apostadores
+        eliminados despues de apostar se ignoran.
+        """
+        apostadores = {}
+        competidores = {}
+        for cambio in cambios:
+            if cambio.nombre_apostador is not None:
+                actual = apostadores.setdefault(cambio.nombre_apostador, [0, 0, 0, None])
+                actual[0] += cambio.apuestas
+                actual[1] += a_centavos(cambio.apostado)
+                actual[2] += cambio.carreras
+                actual[3] = max(actual[3] or cambio.fecha, cambio.fecha)
+            if cambio.nombre_competidor is not None:
+                actual = competidores.setdefault(cambio.nombre_competidor, [0, 0])
+                actual[0] += cambio.apuestas
+                actual[1] += a_centavos(cambio.apostado)
+        existentes = {nombre for (nombre,) in sesion.query(Apostador.nombre).filter(
+            Apostador.nombre.in_(apostadores))}
+        for nombre, (apuestas, apostado, carreras, fecha) in apostadores.items():
+            if nombre in existentes:
+                self._registrar_estadistica(sesion, nombre, apuestas=apuestas,
+                                            apostado=de_centavos(apostado),
+                                            carreras=carreras, fecha=fecha)
+        for nombre, (apuestas, apostado) in competidores.items():
+            self._registrar_competidor(sesion, nombre_carrera, nombre, apuestas=apuestas,
+                                       apostado=de_centavos(apostado))
+
+    def _registrar_volumen(self, sesion, nombre_carrera, nombre_competidor, fecha,
+                           apuestas=0, apostado=0):
+        """
+        Metodo para sumar un cambio al volumen del minuto de una apuesta. Las
+        apuestas sin fecha (anteriores al volumen), sin competidor o fuera de la
+        ventana que se conserva no cuentan. Los intervalos que quedan sin
+        apuestas se borran, y al abrir uno nuevo se borran los de la carrera que
+        salieron de la ventana.
+        """
+        limite = inicio_ventana(datetime.now(), MINUTOS_VOLUMEN)
+        if fecha is None or nombre_competidor is None or minuto(fecha) < limite:
+            return
+        intervalo = sesion.query(VolumenApuestas).filter(
+            VolumenApuestas.nombre_carrera == nombre_carrera,
+            VolumenApuestas.minuto == minuto(fecha),
+            VolumenApuestas.nombre_competidor == nombre_competidor)
+        actualizadas = intervalo.update({
+            VolumenApuestas.numero_apuestas: VolumenApuestas.numero_apuestas + apuestas,
+            VolumenApuestas.total_apostado: VolumenApuestas.total_apostado + apostado,
+        }, synchronize_session=False)
+        if actualizadas and apuestas < 0:
+            intervalo.filter(VolumenApuestas.numero_apuestas <= 0).delete(
+                synchronize_session=False)
+        elif not actualizadas and apuestas > 0:
+            sesion.query(VolumenApuestas).filter(
+                VolumenApuestas.nombre_carrera == nombre_carrera,
+                VolumenApuestas.minuto < limite).delete(synchronize_session=False)
+            sesion.add(VolumenApuestas(
+                nombre_carrera=nombre_carrera, minuto=minuto(fecha),
+                nombre_competidor=nombre_competidor, numero_apuestas=apuestas,
+                total_apostado=apostado))
+
+    def _sesion_volumen(self, nombre_carrera):
+        """
+        Metodo para obtener la sesion en la que esta el volumen por minuto de
+        una carrera, la misma de sus apuestas. Retorna None si la carrera no
+        tiene volumen (esta archivada o aun no tiene fragmento).
+        """
+        if self.archivo is not None and self.archivo.contiene(nombre_carrera):
+            return None
+        return self._sesion_apuestas_carrera(nombre_carrera)
+
+    def dar_volumen_carrera(self, nombre_carrera, minutos=1, ahora=None):
+        """
+        Metodo para obtener, por competidor, las apuestas y el valor apostado en
+        una carrera durante los ultimos minutos (incluyendo el minuto en curso).
+        Solo se leen los intervalos de la ventana, por lo que el costo no
+        depende del numero de apuestas.
+
+        Args:
+            nombre_carrera (str): nombre de la carrera.
+            minutos (int): tamano de la ventana, de a lo sumo MINUTOS_VOLUMEN.
+            ahora (datetime): final de la ventana; por defecto el momento actual.
+        """
+        sesion = self._sesion_volumen(nombre_carrera)
+        if sesion is None:
+            return []
+        desde = inicio_ventana(ahora or datetime.now(), minutos)
+        filas = sesion.query(
+            VolumenApuestas.nombre_competidor, func.sum(VolumenApuestas.numero_apuestas),
+            func.sum(VolumenApuestas.total_apostado)).filter(
+            VolumenApuestas.nombre_carrera == nombre_carrera,
+            VolumenApuestas.minuto >= desde).group_by(
+            VolumenApuestas.nombre_competidor).order_by(VolumenApuestas.nombre_competidor)
+        return [{'Competidor': competidor, 'Apuestas': apuestas, 'Apostado': apostado}
+                for competidor, apuestas, apostado in filas]
+
+    def dar_volumen_por_minuto(self, nombre_carrera, minutos=60, ahora=None):
+        """
+        Metodo para obtener el volumen de apuestas de una carrera minuto a
+        minuto y por competidor, en los ultimos minutos.
+        """
+        sesion = self._sesion_volumen(nombre_carrera)
+        if sesion is None:
+            return []
+        desde = inicio_ventana(ahora or datetime.now(), minutos)
+        filas = sesion.query(
+            VolumenApuestas.minuto, VolumenApuestas.nombre_competidor,
+            VolumenApuestas.numero_apuestas, VolumenApuestas.total_apostado).filter(
+            VolumenApuestas.nombre_carrera == nombre_carrera,
+            VolumenApuestas.minuto >= desde).order_by(
+            VolumenApuestas.minuto, VolumenApuestas.nombre_competidor)
+        return [{'Minuto': intervalo, 'Competidor': competidor, 'Apuestas': apuestas,
+                 'Apostado': apostado} for intervalo, competidor, apuestas, apostado in filas]
+
+    def dar_mayores_ganadores(self, k=10):
+        """
+        Metodo para obtener los k apostadores que mas han ganado. La consulta
+        recorre el indice del total ganado, por lo que no depende del numero
+        de apuestas.
+        """
+        self._consolidar_fragmentos()
+        with self._sesion_reportes() as sesion:
+            filas = sesion.query(EstadisticaApostador.nombre_apostador,
+                                 EstadisticaApostador.total_ganado).order_by(
+                EstadisticaApostador.total_ganado.desc(),
+                EstadisticaApostador.nombre_apostador).limit(k)
+            return [{'Apostador': nombre, 'Ganado': ganado} for nombre, ganado in filas]
+
+    def dar_mayores_apostadores(self, k=10):
+        """
+        Metodo para obtener los k apostadores que mas han apostado, usando el
+        indice del total apostado.
+        """
+        self._consolidar_fragmentos()
+        with self._sesion_reportes() as sesion:
+            filas = sesion.query(EstadisticaApostador.nombre_apostador,
+                                 EstadisticaApostador.total_apostado).order_by(
+                EstadisticaApostador.total_apostado.desc(),
+                EstadisticaApostador.nombre_apostador).limit(k)
+            return [{'Apostador': nombre, 'Apostado': apostado} for nombre, apostado in filas]
+
+    def dar_competidores_mas_apostados(self, nombre_carrera, k=10):
+        """
+        Metodo para obtener los k competidores de una carrera por los que mas
+        se ha apostado, usando el indice (carrera, total apostado).
+        """
+        self._consolidar_fragmentos([nombre_carrera])
+        with self._sesion_reportes() as sesion:
+            filas = sesion.query(Competidor.nombre, Competidor.numero_apuestas,
+                                 Competidor.total_apostado).filter(
+                Competidor.nombre_carrera == nombre_carrera).order_by(
+                Competidor.total_apostado.desc()).limit(k)
+            return [{'Competidor': nombre, 'Apuestas': apuestas, 'Apostado': apostado}
+                    for nombre, apuestas, apostado in filas]
+
+    def dar_estadisticas_apostador(self, nombre_apostador):
+        """
+        Metodo para obtener el resumen de un apostador (numero de apuestas,
+        total apostado, total ganado, carreras jugadas y ultima actividad).
+        Es una consulta por llave primaria, sin recorrer las apuestas.
+        """
+        self._consolidar_fragmentos()
+        estadistica = self.session.query(EstadisticaApostador).populate_existing().filter(
+            EstadisticaApostador.nombre_apostador == nombre_apostador).first()
+        if estadistica is None:
+            return EstadisticaApostador(numero_apuestas=0, total_apostado=de_centavos(0),
+                                        total_ganado=de_centavos(0),
+                                        carreras_jugadas=0).map_interfaz()
+        return estadistica.map_interfaz()
+
+    def _sesiones_apuestas(self):
+        """
+        Metodo para obtener las sesiones en las que hay apuestas: la principal
+        o, en modo fragmentado, la de cada carrera con fragmento, y la del
+        archivo de carreras liquidadas.
+        """
+        if self.fragmentos is None:
+            sesiones = [self.session]
+        else:
+            sesiones = [self._sesion_carrera(nombre) for (nombre,) in
+                        self.session.query(Carrera.nombre) if self.fragmentos.existe(nombre)]
+        if self.archivo is not None:
+            sesiones.append(self.archivo.session)
+        return sesiones
+
+    def reconstruir_estadisticas_apostadores(self):
+        """
+        Metodo para recalcular desde cero el resumen de todos los apostadores,
+        con una sola pasada agrupada sobre las apuestas (una por fragmento en
+        modo fragmentado). Se conserva la ultima actividad registrada.
+        """
+        self._consolidar_fragmentos()
+        acumulado = {}
+        for sesion in self._sesiones_apuestas():
+            filas = sesion.query(Apuesta.nombre_apostador, func.count(Apuesta.id),
+                                 func.sum(Apuesta.valor), func.sum(Apuesta.ganancia),
+                                 func.count(Apuesta.nombre_carrera.distinct())).group_by(
+                Apuesta.nombre_apostador)
+            for nombre, apuestas, apostado, ganado, carreras in filas:
+                actual = acumulado.setdefault(nombre, [0, 0, 0, 0])
+                actual[0] += apuestas
+                actual[1] += a_centavos(apostado or 0)
+                actual[2] += a_centavos(ganado or 0)
+                actual[3] += carreras
+
+        actividad = dict(self.session.query(EstadisticaApostador.nombre_apostador,
+                                            EstadisticaApostador.ultima_actividad))
+        self.session.query(EstadisticaApostador).delete(synchronize_session=False)
+        estadisticas = []
+        for (nombre,) in self.session.query(Apostador.nombre):
+            apuestas, apostado, ganado, carreras = acumulado.get(nombre, (0, 0, 0, 0))
+            estadisticas.append({
+                'nombre_apostador': nombre,
+                'numero_apuestas': apuestas,
+                'total_apostado': de_centavos(apostado),
+                'total_ganado': de_centavos(ganado),
+                'carreras_jugadas': carreras,
+                'ultima_actividad': actividad.get(nombre),
+            })
+        self.session.bulk_insert_mappings(EstadisticaApostador, estadisticas)
         self.session.commit()
 
+    @cacheado
     def dar_carreras(self):
         """
         Metodo para obtener las carreras de la base de datos.
         """
         carreras = [cr.map_interfaz() for cr in self.session.query(
             Carrera).order_by(Carrera.nombre.asc()).all()]
+        if self.archivo is not None:
+            carreras.extend(cr.map_interfaz() for cr in self.archivo.session.query(Carrera))
+            carreras.sort(key=lambda carrera: carrera['Nombre'])
         return carreras
 
+    @cacheado
     def dar_apostadores(self):
         """Metodo para obtener la lista de apostadores en e-porra (semana 7)"""
+        self._consolidar_fragmentos()
         apostadores = self.session.query(Apostador).order_by(
             Apostador.nombre.asc()).all()
         return [apostador.map_interfaz() for apostador in apostadores]
 
+    def buscar_apostadores(self, prefijo, k=20):
+        """
+        Metodo para buscar los primeros k apostadores cuyo nombre empieza por el
+        prefijo (sin diferenciar mayusculas ni tildes), usando el indice del
+        nombre normalizado.
+        """
+        nombres = self.session.query(Apostador.nombre).filter(
+            filtro_prefijo(Apostador.nombre_normalizado, prefijo)).order_by(
+            Apostador.nombre_normalizado).limit(k)
+        return [{'Nombre': nombre} for (nombre,) in nombres]
+
+    def buscar_carreras(self, prefijo, k=20):
+        """
+        Metodo para buscar las primeras k carreras cuyo nombre empieza por el
+        prefijo.
+        """
+        nombres = self.session.query(Carrera.nombre).filter(
+            filtro_prefijo(Carrera.nombre_normalizado, prefijo)).order_by(
+            Carrera.nombre_normalizado).limit(k)
+        return [{'Nombre': nombre} for (nombre,) in nombres]
+
+    def buscar_competidores(self, nombre_carrera, prefijo, k=20):
+        """
+        Metodo para buscar los primeros k competidores de una carrera cuyo
+        nombre empieza por el prefijo.
+        """
+        nombres = self.session.query(Competidor.nombre).filter(
+            Competidor.nombre_carrera == nombre_carrera,
+            filtro_prefijo(Competidor.nombre_normalizado, prefijo)).order_by(
+            Competidor.nombre_normalizado).limit(k)
+        return [{'Nombre': nombre} for (nombre,) in nombres]
+
     def dar_carrera(self, nombre):
-        """Metodo para obtener una carrera a partir de su nombre"""
-        return self.session.query(Carrera).filter(Carrera.nombre == nombre).first()
+        """
+        Metodo para obtener una carrera a partir de su nombre, buscandola en el
+        archivo si no esta en la base de datos principal.
+        """
+        carrera = self.session.query(Carrera).filter(Carrera.nombre == nombre).first()
+        if carrera is None and self.archivo is not None:
+            carrera = self.archivo.session.query(Carrera).filter(Carrera.nombre == nombre).first()
+        return carrera
 
     def dar_apostador(self, nombre):
         """Metodo para obtener una carrera a partir de su nombre"""
@@ -152,6 +765,7 @@ class ManagerEPorra(Logica_mock):
             Competidor.nombre == id_competidor,
             Carrera.nombre == id_carrera).first()
 
+    @cacheado
     def dar_competidores_carrera(self, nombre):
         """Metodo para obtener los competidores de una carrera especifica"""
         carrera = self.dar_carrera(nombre)
@@ -161,90 +775,516 @@ class ManagerEPorra(Logica_mock):
         """
         Metodo para elegir el ganador de una carrera.
         """
-        if(nombre_ganador is None or len(nombre_ganador) == 0):
-            raise Exception("Debe seleccionar un ganador")
-        else:
-            competidor = self.session.query(Competidor).filter(
-                Competidor.nombre == nombre_ganador).first()
-            competidor.ganador = True
-            carrera = competidor.carrera
-            self.session.query(Carrera).filter(
-                Carrera.nombre == carrera.nombre).update({Carrera.abierta: False})
+        validar_ganador(nombre_ganador)
+        # El nombre del competidor es unico, se resuelve con su indice
+        competidor = self.session.query(Competidor.nombre_carrera).filter(
+            Competidor.nombre == nombre_ganador).first()
+        if competidor is None:
+            raise ValueError("No existe el competidor {}".format(nombre_ganador))
+        self.terminar_carreras([(competidor.nombre_carrera, nombre_ganador)])
+
+    def terminar_carreras(self, resultados):
+        """
+        Metodo para terminar varias carreras en una sola transaccion.
+
+        Args:
+            resultados (list): parejas (nombre de la carrera, nombre del ganador)
+        """
+        resultados = dict(resultados)
+        if not resultados:
+            return
+        validar_resultados(self, resultados)
+
+        try:
+            # La primera escritura cierra las carreras: desde aqui ninguna
+            # apuesta puede reservarlas (ver _reservar_carrera_abierta). En modo
+            # fragmentado se cierran antes en sus fragmentos
+            if self.fragmentos is not None:
+                for nombre_carrera in resultados:
+                    self._guardar_estado_fragmento(nombre_carrera, False)
+            cerradas = self.session.query(Carrera).filter(
+                Carrera.nombre.in_(resultados), Carrera.abierta.is_(True)).update(
+                {Carrera.abierta: False}, synchronize_session=False)
+            if cerradas != len(resultados):
+                raise Exception("Alguna de las carreras ya ha finalizado")
+            self.session.query(Competidor).filter(
+                Competidor.nombre_carrera.in_(resultados)).update(
+                {Competidor.ganador: Competidor.nombre.in_(resultados.values())},
+                synchronize_session=False)
             self.session.commit()
+        except Exception:
+            self.session.rollback()
+            if self.fragmentos is not None:
+                for nombre_carrera in resultados:
+                    self._guardar_estado_fragmento(nombre_carrera)
+            raise
 
+    def _guardar_estado_fragmento(self, nombre_carrera, abierta=None):
+        """
+        Metodo para guardar en el fragmento de una carrera si recibe apuestas.
+        Por defecto se copia el estado de la carrera en la base de datos
+        principal.
+        """
+        sesion = self._sesion_carrera(nombre_carrera)
+        if abierta is None:
+            abierta = bool(sesion.query(Carrera.abierta).filter(
+                Carrera.nombre == nombre_carrera).scalar())
+        sesion.query(EstadoCarrera).update({EstadoCarrera.abierta: abierta},
+                                           synchronize_session=False)
+        sesion.commit()
+
+    def _sesion_apuestas_carrera(self, nombre):
+        """
+        Metodo para obtener la sesion en la que estan las apuestas de una
+        carrera: el archivo, su fragmento o la sesion principal. Retorna None si
+        la carrera aun no tiene fragmento.
+        """
+        if self.archivo is not None and self.archivo.contiene(nombre):
+            return self.archivo.session
+        elif self.fragmentos is not None and not self.fragmentos.existe(nombre):
+            return None
+        return self._sesion_carrera(nombre)
+
+    @cacheado
     def dar_apuestas_carrera(self, nombre, uso_interno=False):
         """Metodo para obtener las apuestas de una carrera especifica"""
-        apuestas = self.session.query(Apuesta).join(
-            Carrera).filter(Carrera.nombre == nombre)
+        sesion = self._sesion_apuestas_carrera(nombre)
+        if sesion is None:
+            return []
+        apuestas = sesion.query(Apuesta).filter(
+            Apuesta.nombre_carrera == nombre)
         apuestas = apuestas.order_by(Apuesta.nombre_apostador).all()
         return [apuesta.map_interfaz() for apuesta in apuestas] \
             if not uso_interno else apuestas
 
+    def dar_apuestas_apostador(self, nombre_apostador):
+        """
+        Metodo para obtener las apuestas de un apostador en todas las carreras,
+        ordenadas por carrera. En modo fragmentado se unen los resultados de
+        los fragmentos de cada carrera, y los del archivo si lo hay.
+        """
+        if self.fragmentos is None:
+            with self._sesion_reportes() as sesion:
+                apuestas = [apuesta.map_interfaz() for apuesta in sesion.query(Apuesta).filter(
+                    Apuesta.nombre_apostador == nombre_apostador).order_by(
+                    Apuesta.nombre_carrera, Apuesta.id)]
+        else:
+            apuestas = []
+            nombres = self.session.query(Carrera.nombre).order_by(Carrera.nombre.asc())
+            for (nombre_carrera,) in nombres:
+                if not self.fragmentos.existe(nombre_carrera):
+                    continue
+                apuestas.extend(a.map_interfaz() for a in self._sesion_carrera(
+                    nombre_carrera).query(Apuesta).filter(
+                    Apuesta.nombre_apostador == nombre_apostador).order_by(Apuesta.id))
+
+        if self.archivo is not None:
+            apuestas.extend(a.map_interfaz() for a in self.archivo.session.query(Apuesta).filter(
+                Apuesta.nombre_apostador == nombre_apostador).order_by(Apuesta.id))
+            # Las carreras archivadas no estan en la base principal: el orden
+            # estable conserva el orden por id dentro de cada carrera
+            apuestas.sort(key=lambda apuesta: apuesta['Carrera'])
+        return apuestas
+
     def dar_reporte_ganancias(self, id_carrera, id_competidor):
-        """Metodo para generar el reporte de ganancias de una carrera"""
-        carrera = self.dar_carrera(id_carrera)
-        competidor = self.dar_competidor(id_carrera, id_competidor)
+        """
+        Metodo para generar el reporte de ganancias de una carrera. El reporte
+        de una carrera terminada se guarda una sola vez (ganancia de cada
+        apuesta, ganancia de la casa y fecha de liquidacion) y las llamadas
+        siguientes lo leen sin recalcularlo. Para corregirlo se usa
+        reliquidar_carrera. Para carreras con muchas apuestas conviene
+        generar_reporte_ganancias, que no construye la lista completa.
+        """
+        return reporte_ganancias(self, id_carrera, id_competidor)
 
-        apuestas = self.dar_apuestas_carrera(id_carrera, uso_interno=True)
-        ganancias = [self._ganancia_apuesta(a, competidor) for a in apuestas]
+    def generar_reporte_ganancias(self, id_carrera, id_competidor, tamano_lote=1000):
+        """
+        Metodo generador del reporte de ganancias de una carrera: produce las
+        tuplas (apostador, ganancia) en orden de apostador a medida que lee las
+        apuestas por lotes, por lo que la memoria no crece con el tamano de la
+        carrera y quien consume el reporte puede empezar de inmediato. Si el
+        reporte no esta guardado, las ganancias de cada lote se escriben (y se
+        confirman) antes de producirlas; la carrera queda liquidada al terminar
+        de recorrerlo. Un recorrido interrumpido se puede repetir: las
+        ganancias y los resumenes de los apostadores solo cambian por la
+        diferencia con lo ya escrito.
+        El calculo es el de reglas.generar_reporte_ganancias, comun a todos los
+        almacenamientos.
 
-        carrera.ganancia = sum(a.valor for a in apuestas) - \
-            sum(j for i, j in ganancias)
+        Args:
+            id_carrera (str): nombre de la carrera.
+            id_competidor (str): nombre del competidor ganador.
+            tamano_lote (int): numero de apuestas leidas y escritas a la vez.
 
-        self.session.commit()
-        return sorted(ganancias, key=lambda g: g[0]), carrera.ganancia
+        Returns:
+            la ganancia de la casa, como valor de retorno del generador.
+        """
+        return generar_reporte_ganancias(self, id_carrera, id_competidor, tamano_lote)
 
-    def _ganancia_apuesta(self, apuesta, ganador):
+    def ganancia_liquidada(self, nombre_carrera):
+        """Metodo del Repositorio: ganancia de la casa del reporte guardado de una carrera"""
+        if self.archivo is not None and self.archivo.contiene(nombre_carrera):
+            sesion = self.archivo.session
+        else:
+            sesion = self._sesion_carrera(nombre_carrera)
+        carrera = sesion.query(Carrera).filter(Carrera.nombre == nombre_carrera).first()
+        if carrera is None:
+            raise ValueError("No existe la carrera {}".format(nombre_carrera))
+        elif carrera.fecha_liquidacion is None:
+            return None
+        return a_centavos(carrera.ganancia or 0)
+
+    def lotes_apuestas(self, nombre_carrera, tamano_lote):
+        """Metodo del Repositorio: apuestas de una carrera por lotes, en centavos"""
+        sesion = self._sesion_apuestas_carrera(nombre_carrera)
+        if sesion is None:
+            return
+        for lote in self._lotes_apuestas(sesion, nombre_carrera, tamano_lote,
+                                         Apuesta.nombre_competidor, Apuesta.valor, Apuesta.ganancia):
+            yield [(id_apuesta, nombre_apostador, nombre_competidor, a_centavos(valor),
+                    a_centavos(ganancia or 0))
+                   for id_apuesta, nombre_apostador, nombre_competidor, valor, ganancia in lote]
+
+    def guardar_ganancias(self, nombre_carrera, ganancias, cambios):
+        """
+        Metodo del Repositorio: las ganancias de un lote y los resumenes de sus
+        apostadores se confirman en el mismo commit, asi un recorrido
+        interrumpido no deja ganancias guardadas sin su resumen.
         """
-        Metodo para calcular la ganancia de una apuesta a partir de su informacion
-        y el ganador de la carrera.
+        sesion = self._sesion_carrera(nombre_carrera)
+        try:
+            sesion.bulk_update_mappings(Apuesta, [
+                {'id': id_apuesta, 'ganancia': de_centavos(centavos)}
+                for id_apuesta, centavos in ganancias])
+            for nombre_apostador, cambio in cambios.items():
+                if cambio:
+                    self._registrar_estadistica(sesion, nombre_apostador, ganado=de_centavos(cambio))
+            sesion.commit()
+        except Exception as e:
+            sesion.rollback()
+            raise e
+
+    def guardar_liquidacion(self, nombre_carrera, ganancia):
+        """Metodo del Repositorio: ganancia de la casa y fecha de liquidacion de una carrera"""
+        sesion = self._sesion_carrera(nombre_carrera)
+        carrera = sesion.query(Carrera).filter(Carrera.nombre == nombre_carrera).first()
+        carrera.ganancia = de_centavos(ganancia)
+        if not carrera.abierta:
+            carrera.fecha_liquidacion = datetime.now()
+        sesion.commit()
+
+    def _lotes_apuestas(self, sesion, nombre_carrera, tamano_lote, *columnas):
+        """
+        Metodo para leer las apuestas de una carrera por lotes, ordenadas por
+        apostador y id, como filas (id, nombre_apostador, *columnas). Cada lote
+        continua desde la ultima fila del anterior usando el indice de
+        (carrera, apostador), sin desplazamientos.
+        """
+        consulta = sesion.query(Apuesta.id, Apuesta.nombre_apostador, *columnas).filter(
+            Apuesta.nombre_carrera == nombre_carrera)
+        # SQLite ordena primero las apuestas sin apostador; la comparacion por
+        # tuplas no admite nulos, por eso se recorren aparte
+        partes = [
+            (consulta.filter(Apuesta.nombre_apostador.is_(None)).order_by(Apuesta.id),
+             (Apuesta.id,)),
+            (consulta.filter(Apuesta.nombre_apostador.isnot(None)).order_by(
+                Apuesta.nombre_apostador, Apuesta.id),
+             (Apuesta.nombre_apostador, Apuesta.id)),
+        ]
+        for parte, llave in partes:
+            ultima = None
+            while True:
+                pagina = parte if ultima is None else parte.filter(tuple_(*llave) > tuple_(*ultima))
+                lote = pagina.limit(tamano_lote).all()
+                if lote:
+                    yield lote
+                if len(lote) < tamano_lote:
+                    break
+                ultima = tuple(getattr(lote[-1], columna.key) for columna in llave)
+
+    def reliquidar_carrera(self, nombre_carrera, nombre_ganador=None):
+        """
+        Metodo para recalcular el reporte de ganancias guardado de una carrera
+        terminada, por ejemplo despues de corregir sus apuestas o su ganador.
+        Las carreras archivadas no se pueden reliquidar.
 
         Args:
-            apuesta (obj: Apuesta): Apuesta para calcular la ganancia. 
-            ganador (obj: Competidor): Ganador de la carrera 
+            nombre_carrera (str): nombre de la carrera.
+            nombre_ganador (str): nuevo ganador; si es None se conserva el
+                ganador elegido al terminar la carrera.
+        """
+        sesion = self._sesion_carrera(nombre_carrera)
+        carrera = sesion.query(Carrera).filter(
+            Carrera.nombre == nombre_carrera).first()
+        if carrera is None:
+            raise ValueError("No existe la carrera {}".format(nombre_carrera))
+        elif carrera.abierta:
+            raise Exception("La carrera {} no ha finalizado".format(nombre_carrera))
+        competidores = {c.nombre: c for c in carrera.competidores}
+        if nombre_ganador is None:
+            nombre_ganador = next((c.nombre for c in competidores.values() if c.ganador), None)
+        validar_ganador(nombre_ganador)
+        if nombre_ganador not in competidores:
+            raise ValueError("No existe el competidor {} en la carrera {}".format(
+                nombre_ganador, nombre_carrera))
+
+        for competidor in competidores.values():
+            competidor.ganador = competidor.nombre == nombre_ganador
+        carrera.fecha_liquidacion = None
+        return self.dar_reporte_ganancias(nombre_carrera, nombre_ganador)
+
+    def dar_exposicion_carrera(self, nombre_carrera):
+        """
+        Metodo para calcular, por cada competidor de una carrera, cuanto se ha
+        apostado por el, cuanto tendria que pagar la casa si gana y la ganancia
+        resultante de la casa.
+        """
+        return calcular_exposicion(self, nombre_carrera)
+
+    @contextlib.contextmanager
+    def _sesion_exposicion(self, nombre_carrera):
         """
-        ganancia = 0
-        if apuesta.nombre_competidor == ganador.nombre:
-            ganancia = apuesta.valor / \
-                (ganador.probabilidad/(1-ganador.probabilidad))
-            ganancia = round(ganancia + apuesta.valor, 2)
+        Metodo para obtener la sesion con la que se calcula la exposicion de
+        una carrera: la de su fragmento o la de los reportes.
+        """
+        if self.fragmentos is not None:
+            yield self._sesion_carrera(nombre_carrera)
+        else:
+            with self._sesion_reportes() as sesion:
+                yield sesion
+
+    def multiplicadores_carrera(self, nombre_carrera):
+        """Metodo del Repositorio: multiplicador de cada competidor de una carrera"""
+        with self._sesion_exposicion(nombre_carrera) as sesion:
+            return dict(sesion.query(Competidor.nombre, Competidor.multiplicador).filter(
+                Competidor.nombre_carrera == nombre_carrera))
+
+    def apostado_por_competidor(self, nombre_carrera):
+        """Metodo del Repositorio: centavos apostados por cada competidor de una carrera"""
+        if self.fragmentos is not None and not self.fragmentos.existe(nombre_carrera):
+            return {}
+        with self._sesion_exposicion(nombre_carrera) as sesion:
+            filas = sesion.query(Apuesta.nombre_competidor, func.sum(Apuesta.valor)).filter(
+                Apuesta.nombre_carrera == nombre_carrera).group_by(Apuesta.nombre_competidor)
+            return {nombre: a_centavos(valor) for nombre, valor in filas}
 
-        apuesta.ganancia = ganancia
-        return (apuesta.nombre_apostador, ganancia)
+    def multiplicador_competidor(self, nombre_carrera, nombre_competidor):
+        """Metodo del Repositorio: multiplicador vigente de un competidor de una carrera"""
+        return self._sesion_carrera(nombre_carrera).query(Competidor.multiplicador).filter(
+            Competidor.nombre == nombre_competidor,
+            Competidor.nombre_carrera == nombre_carrera).scalar()
+
+    def carreras_abiertas(self, resultados):
+        """Metodo del Repositorio: si esta abierta cada carrera cuyo ganador existe"""
+        encontrados = self.session.query(Competidor.nombre_carrera, Competidor.nombre,
+                                         Carrera.abierta).join(Carrera).filter(
+            Competidor.nombre_carrera.in_(resultados),
+            Competidor.nombre.in_(resultados.values())).all()
+        return {carrera: abierta for carrera, ganador, abierta in encontrados
+                if resultados[carrera] == ganador}
+
+    def archivar_carreras(self):
+        """
+        Metodo para mover al archivo las carreras liquidadas (terminadas y con
+        reporte de ganancias guardado), junto con sus competidores y apuestas. Cada
+        carrera se guarda primero en el archivo y despues se borra de la base
+        de datos principal (en cascada) y de su fragmento.
+        """
+        if self.archivo is None:
+            raise ValueError("No se ha configurado un archivo de carreras")
+        nombres = [nombre for (nombre,) in self.session.query(Carrera.nombre).filter(
+            Carrera.fecha_liquidacion.isnot(None))]
+        self._consolidar_fragmentos(nombres)
+        for nombre in nombres:
+            carrera = dict(self.session.execute(Carrera.__table__.select().where(
+                Carrera.nombre == nombre)).first())
+            competidores = [dict(fila) for fila in self.session.execute(
+                Competidor.__table__.select().where(Competidor.nombre_carrera == nombre).order_by(
+                    ORDEN_DE_CREACION))]
+            apuestas = []
+            if self.fragmentos is None or self.fragmentos.existe(nombre):
+                filas = self._sesion_carrera(nombre).execute(Apuesta.__table__.select().where(
+                    Apuesta.nombre_carrera == nombre), mapper=Apuesta)
+                apuestas = [{k: v for k, v in fila.items() if k != 'id'} for fila in filas]
+            self.archivo.guardar(carrera, competidores, apuestas)
+
+            self.session.query(Carrera).filter(Carrera.nombre == nombre).delete(
+                synchronize_session=False)
+            self.session.commit()
+            if self.fragmentos is not None:
+                self.fragmentos.eliminar(nombre)
+        return len(nombres)
 
     def eliminar_carrera(self, nombre_carrera):
         """
         Metodo para eliminar una carrera.
         """
         resultado = 0
-        apuestas_carrera = self.dar_apuestas_carrera(nombre_carrera)
-        if apuestas_carrera:
+        if self._tiene_apuestas(nombre_carrera):
             return resultado
         else:
-            self.session.query(Carrera).filter(Carrera.nombre == nombre_carrera).delete()
+            self._consolidar_fragmentos([nombre_carrera])
+            # Los competidores se borran en la base de datos (ON DELETE CASCADE)
+            self.session.query(Carrera).filter(Carrera.nombre == nombre_carrera).delete(
+                synchronize_session=False)
             self.session.commit()
+            if self.fragmentos is not None:
+                self.fragmentos.eliminar(nombre_carrera)
             resultado = 1
             return resultado
 
+    def _tiene_apuestas(self, nombre_carrera):
+        """
+        Metodo para saber con una consulta EXISTS si una carrera tiene apuestas.
+        """
+        if self.fragmentos is not None and not self.fragmentos.existe(nombre_carrera):
+            return False
+        sesion = self._sesion_carrera(nombre_carrera)
+        return sesion.query(sesion.query(Apuesta).filter(
+            Apuesta.nombre_carrera == nombre_carrera).exists()).scalar()
+
+    def eliminar_apostador(self, nombre):
+        """
+        Metodo para eliminar un apostador junto con sus apuestas y su resumen.
+        Los totales de los competidores se descuentan con una consulta agrupada
+        y los hijos se borran en la base de datos (ON DELETE CASCADE), sin
+        cargar el historial en memoria.
+        """
+        if self.dar_apostador(nombre) is None:
+            return False
+        self._consolidar_fragmentos()
+        for sesion in self._sesiones_apuestas():
+            filas = sesion.query(Apuesta.nombre_carrera, Apuesta.nombre_competidor,
+                                 func.count(Apuesta.id), func.sum(Apuesta.valor)).filter(
+                Apuesta.nombre_apostador == nombre).group_by(
+                Apuesta.nombre_carrera, Apuesta.nombre_competidor).all()
+            for carrera, competidor, apuestas, apostado in filas:
+                self._registrar_competidor(sesion, carrera, competidor, apuestas=-apuestas,
+                                           apostado=-(apostado or 0))
+            if self.archivo is None or sesion is not self.archivo.session:
+                self._descontar_volumen_apostador(sesion, nombre)
+            if sesion is not self.session:
+                # Los fragmentos y el archivo no tienen la tabla de apostadores
+                sesion.query(Apuesta).filter(Apuesta.nombre_apostador == nombre).delete(
+                    synchronize_session=False)
+            sesion.commit()
+        self.session.query(Apostador).filter(Apostador.nombre == nombre).delete(
+            synchronize_session=False)
+        self.session.commit()
+        return True
+
+    def _descontar_volumen_apostador(self, sesion, nombre_apostador):
+        """
+        Metodo para descontar del volumen por minuto las apuestas de un
+        apostador, agrupadas por carrera, competidor y minuto.
+        """
+        # La fecha se guarda como texto 'AAAA-MM-DD HH:MM:SS.ffffff'
+        intervalo = func.substr(Apuesta.fecha, 1, 16)
+        filas = sesion.query(Apuesta.nombre_carrera, Apuesta.nombre_competidor, intervalo,
+                             func.count(Apuesta.id), func.sum(Apuesta.valor)).filter(
+            Apuesta.nombre_apostador == nombre_apostador, Apuesta.fecha.isnot(None)).group_by(
+            Apuesta.nombre_carrera, Apuesta.nombre_competidor, intervalo).all()
+        for carrera, competidor, texto, apuestas, apostado in filas:
+            self._registrar_volumen(sesion, carrera, competidor,
+                                    datetime.strptime(texto, '%Y-%m-%d %H:%M'),
+                                    apuestas=-apuestas, apostado=-(apostado or 0))
+
+    def dar_apuesta(self, id_carrera, id_apuesta):
+        """
+        Metodo para obtener una apuesta a partir de su llave primaria.
+
+        Args:
+            id_carrera (str): nombre de la carrera de la apuesta
+            id_apuesta (int): id de la apuesta
+        """
+        apuesta = self._apuesta_carrera(id_carrera, id_apuesta)
+        return apuesta.map_interfaz() if apuesta is not None else None
+
+    def _apuesta_carrera(self, nombre_carrera, id_apuesta):
+        """
+        Metodo para obtener por llave primaria una apuesta de una carrera.
+        """
+        if self.fragmentos is not None and not self.fragmentos.existe(nombre_carrera):
+            return None
+        apuesta = self._sesion_carrera(nombre_carrera).query(Apuesta).get(id_apuesta)
+        if apuesta is None or apuesta.nombre_carrera != nombre_carrera:
+            return None
+        return apuesta
+
     def editar_apuesta(self, id_apuesta, apostador, carrera, valor, competidor):
         """
         Metodo para editar una apuesta.
-        
+
+        Args:
+            id_apuesta (int): id (llave primaria) de la apuesta
+            apostador (str): nuevo apostador
+            carrera (str): nombre de la carrera de la apuesta
+            valor (number): nuevo valor
+            competidor (str): nuevo competidor
         """
+        if valor is None or not valor > 1:
+            return False
+        apuesta = self._apuesta_carrera(carrera, id_apuesta)
+        if apuesta is None or (apostador is not None and self.session.query(Apostador.nombre).filter(
+                Apostador.nombre == apostador).first() is None):
+            return False
+        validar_competidor_de_carrera(competidor, carrera, self.multiplicadores_carrera(carrera))
+        sesion = self._sesion_carrera(carrera)
         try:
-            if valor is not None and valor > 1:
-                apuesta_seleccionada = self.dar_apuestas_carrera(carrera)[id_apuesta]
-                apostador_anterior, competidor_anterior = apuesta_seleccionada['Apostador'],  apuesta_seleccionada['Competidor']
-                self.session.query(Apuesta).\
-                    filter_by(nombre_apostador = apostador_anterior, nombre_competidor=competidor_anterior).update({
-                        Apuesta.valor: valor,
-                        Apuesta.nombre_apostador: apostador,
-                        Apuesta.nombre_competidor: competidor
-                })
-                self.session.commit()
-                return True
-            else:
-                return False
+            self._quitar_de_estadistica(sesion, apuesta.nombre_apostador, carrera, [apuesta])
+            if apostador is not None:
+                nueva_carrera = not self._participa(sesion, apostador, carrera, excluir=[apuesta.id])
+                self._registrar_estadistica(sesion, apostador, apuestas=1, apostado=valor,
+                                            ganado=apuesta.ganancia or 0,
+                                            carreras=1 if nueva_carrera else 0)
+            self._registrar_competidor(sesion, carrera, apuesta.nombre_competidor,
+                                       apuestas=-1, apostado=-apuesta.valor)
+            self._registrar_competidor(sesion, carrera, competidor, apuestas=1, apostado=valor)
+            self._registrar_volumen(sesion, carrera, apuesta.nombre_competidor, apuesta.fecha,
+                                    apuestas=-1, apostado=-apuesta.valor)
+            self._registrar_volumen(sesion, carrera, competidor, apuesta.fecha,
+                                    apuestas=1, apostado=valor)
+            apuesta.valor = valor
+            apuesta.nombre_apostador = apostador
+            apuesta.nombre_competidor = competidor
+            sesion.commit()
         except Exception as e:
-            print(e)
-            return False
\ No newline at end of file
+            sesion.rollback()
+            raise e
+        return True
+
+    def eliminar_apuesta(self, id_carrera, id_apuesta):
+        """
+        Metodo para eliminar una apuesta.
+
+        Args:
+            id_carrera (str): nombre de la carrera de la apuesta
+            id_apuesta (int): id (llave primaria) de la apuesta
+        """
+        apuesta = self._apuesta_carrera(id_carrera, id_apuesta)
+        if apuesta is None:
+            return False
+        sesion = self._sesion_carrera(id_carrera)
+        self._quitar_de_estadistica(sesion, apuesta.nombre_apostador, id_carrera, [apuesta])
+        self._registrar_competidor(sesion, id_carrera, apuesta.nombre_competidor,
+                                   apuestas=-1, apostado=-apuesta.valor)
+        self._registrar_volumen(sesion, id_carrera, apuesta.nombre_competidor, apuesta.fecha,
+                                apuestas=-1, apostado=-apuesta.valor)
+        sesion.delete(apuesta)
+        sesion.commit()
+        return True
+
+    def _quitar_de_estadistica(self, sesion, nombre_apostador, nombre_carrera, apuestas):
+        """
+        Metodo para descontar del resumen de un apostador un grupo de sus
+        apuestas en una carrera, antes de editarlas o eliminarlas.
+        """
+        if nombre_apostador is None or not apuestas:
+            return
+        ids = [a.id for a in apuestas]
+        sigue = self._participa(sesion, nombre_apostador, nombre_carrera, excluir=ids)
+        self._registrar_estadistica(
+            sesion, nombre_apostador, apuestas=-len(apuestas),
+            apostado=-de_centavos(sum(a_centavos(a.valor) for a in apuestas)),
+            ganado=-de_centavos(sum(a_centavos(a.ganancia or 0) for a in apuestas)),
+            carreras=0 if sigue else -1)
\ No newline at end of file
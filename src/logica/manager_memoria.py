@@ -0,0 +1,822 @@
+import bisect
+import heapq
+from datetime import datetime
+from decimal import Decimal
+
+from src.modelo.busqueda import LIMITE_PREFIJO, normalizar
+from src.modelo.competidor import calcular_multiplicador
+from src.modelo.dinero import a_centavos, de_centavos
+from src.modelo.volumen_apuestas import MINUTOS_VOLUMEN, inicio_ventana, minuto
+from .reglas import (calcular_exposicion, generar_reporte_ganancias, reporte_ganancias,
+                     validar_resultados)
+from .repositorio import Repositorio
+from .validaciones import (validar_competidor, validar_competidor_de_carrera,
+                           validar_competidores_nuevos, validar_ganador,
+                           validar_nombre_apostador, validar_nombre_carrera,
+                           validar_probabilidades, validar_valor_apuesta)
+
+
+def _numeric(valor):
+    """
+    Funcion para redondear un numero igual que una columna Numeric de SQLite
+    (se guarda como punto flotante y se lee con 10 decimales), para que las
+    cuotas y los pagos coincidan con los de ManagerEPorra.
+    """
+    return None if valor is None else Decimal('%.10f' % float(valor))
+
+
+class _Carrera():
+    __slots__ = ('nombre', 'abierta', 'ganancia_centavos', 'fecha_liquidacion',
+                 'competidores', 'apuestas', 'volumen')
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.abierta = True
+        self.ganancia_centavos = None
+        self.fecha_liquidacion = None
+        self.competidores = {}
+        self.apuestas = {}
+        # {minuto: {competidor: [apuestas, centavos]}}
+        self.volumen = {}
+
+    @property
+    def ganancia(self):
+        return None if self.ganancia_centavos is None else de_centavos(self.ganancia_centavos)
+
+    def map_interfaz(self):
+        return {
+            'Nombre': self.nombre,
+            'Abierta': self.abierta,
+            'Ganancia': self.ganancia,
+            'Competidores': [c.map_interfaz() for c in self.competidores.values()]
+        }
+
+
+class _Competidor():
+    __slots__ = ('nombre', 'nombre_carrera', 'probabilidad', 'multiplicador',
+                 'ganador', 'numero_apuestas', 'total_apostado_centavos')
+
+    def __init__(self, nombre, nombre_carrera, probabilidad):
+        self.nombre = nombre
+        self.nombre_carrera = nombre_carrera
+        self.probabilidad = _numeric(probabilidad)
+        self.multiplicador = _numeric(calcular_multiplicador(probabilidad))
+        self.ganador = False
+        self.numero_apuestas = 0
+        self.total_apostado_centavos = 0
+
+    def map_interfaz(self):
+        return {
+            'Nombre': self.nombre,
+            'Probabilidad': self.probabilidad,
+            'Multiplicador': self.multiplicador,
+        }
+
+
+class _Apostador():
+    __slots__ = ('nombre', 'numero_apuestas', 'total_apostado_centavos', 'total_ganado_centavos',
+                 'carreras_jugadas', 'ultima_actividad', 'apuestas', 'por_carrera')
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.numero_apuestas = 0
+        self.total_apostado_centavos = 0
+        self.total_ganado_centavos = 0
+        self.carreras_jugadas = 0
+        self.ultima_actividad = None
+        self.apuestas = {}
+        self.por_carrera = {}
+
+    def estadistica_interfaz(self):
+        return {
+            'Apuestas': self.numero_apuestas,
+            'Apostado': de_centavos(self.total_apostado_centavos),
+            'Ganado': de_centavos(self.total_ganado_centavos),
+            'Carreras': self.carreras_jugadas,
+            'Ultima actividad': self.ultima_actividad,
+        }
+
+    def map_interfaz(self):
+        interfaz = {'Nombre': self.nombre}
+        interfaz.update(self.estadistica_interfaz())
+        return interfaz
+
+
+class _Apuesta():
+    __slots__ = ('id', 'valor_centavos', 'ganancia_centavos', 'fecha', 'nombre_apostador',
+                 'nombre_competidor', 'nombre_carrera')
+
+    def __init__(self, id, valor_centavos, nombre_apostador, nombre_competidor, nombre_carrera):
+        self.id = id
+        self.valor_centavos = valor_centavos
+        self.ganancia_centavos = 0
+        self.fecha = datetime.now()
+        self.nombre_apostador = nombre_apostador
+        self.nombre_competidor = nombre_competidor
+        self.nombre_carrera = nombre_carrera
+
+    @property
+    def valor(self):
+        return de_centavos(self.valor_centavos)
+
+    @property
+    def ganancia(self):
+        return de_centavos(self.ganancia_centavos)
+
+    def map_interfaz(self):
+        return {
+            'Id': self.id,
+            'Valor': self.valor,
+            'Ganancia': self.ganancia,
+            'Competidor': self.nombre_competidor,
+            'Apostador': self.nombre_apostador,
+            'Carrera': self.nombre_carrera,
+        }
+
+
+class ManagerMemoria(Repositorio):
+    """
+    Implementacion de la logica de E-Porra que guarda todo en memoria, con
+    diccionarios indexados por carrera, apostador, competidor e id de apuesta.
+    Tiene la misma interfaz, reglas de validacion y resultados que
+    ManagerEPorra, y sirve para simulaciones, pruebas y mediciones. Los datos
+    se pierden al terminar el proceso.
+    """
+
+    def __init__(self) -> None:
+        self._carreras = {}
+        self._competidores = {}
+        self._apostadores = {}
+        self._apuestas = {}
+        self._siguiente_id = 1
+        # Listas ordenadas de (nombre normalizado, nombre) para las busquedas
+        self._indice_carreras = []
+        self._indice_apostadores = []
+
+    def cerrar(self):
+        """Metodo para liberar los recursos de la logica (no hay ninguno)"""
+
+    def dar_version_datos(self):
+        # Sin escritores externos no hay cambios que detectar
+        return None
+
+    @staticmethod
+    def _indexar(indice, nombre):
+        bisect.insort(indice, (normalizar(nombre), nombre))
+
+    @staticmethod
+    def _desindexar(indice, nombre):
+        posicion = bisect.bisect_left(indice, (normalizar(nombre), nombre))
+        del indice[posicion]
+
+    @staticmethod
+    def _buscar_en_indice(indice, prefijo, k):
+        prefijo = normalizar(prefijo or '')
+        posicion = bisect.bisect_left(indice, (prefijo,))
+        resultado = []
+        while posicion < len(indice) and len(resultado) < k and \
+                indice[posicion][0] <= prefijo + LIMITE_PREFIJO:
+            resultado.append({'Nombre': indice[posicion][1]})
+            posicion += 1
+        return resultado
+
+    def guardar_cambios_carrera(self, nombre, competidores, nueva_carrera):
+        """Metodo encargado de gestionar la logica para crear una carrera"""
+        if nueva_carrera:
+            carrera = self._crear_carrera(nombre)
+        else:
+            carrera = self._carreras.get(nombre)
+            if carrera is None:
+                raise ValueError("No existe una carrera con nombre: {}".format(nombre))
+
+        validar_probabilidades(competidores)
+
+        nuevos = [c for c in competidores if c.get('Estado') == 'Nueva']
+        for nombre_competidor in validar_competidores_nuevos(nuevos):
+            if nombre_competidor in self._competidores:
+                raise ValueError(
+                    "Ya existe un competidor con el nombre: " + nombre_competidor)
+        # Los competidores existentes llegan primero, en el orden de la carrera
+        actuales = list(carrera.competidores)
+        for i, competidor in enumerate(competidores):
+            if competidor.get('Estado') != 'Nueva':
+                self.editar_competidor(
+                    carrera.nombre, actuales[i], competidor['Nombre'], competidor['Probabilidad'])
+
+        if nueva_carrera:
+            self._carreras[carrera.nombre] = carrera
+            self._indexar(self._indice_carreras, carrera.nombre)
+        for competidor in nuevos:
+            self._agregar_competidor(carrera, competidor['Nombre'], competidor['Probabilidad'])
+
+    def _crear_carrera(self, nombre):
+        """
+        Metodo para validar y construir una carrera nueva, sin registrarla.
+        """
+        nombre = validar_nombre_carrera(nombre)
+        if nombre in self._carreras:
+            raise ValueError(
+                "Ya existe una carrera con nombre: {}".format(nombre))
+        return _Carrera(nombre)
+
+    def _agregar_competidor(self, carrera, nombre, probabilidad):
+        competidor = _Competidor(nombre, carrera.nombre, probabilidad)
+        carrera.competidores[nombre] = competidor
+        self._competidores[nombre] = competidor
+
+    def editar_carrera(self, id_carrera, nombre):
+        """
+        Metodo para cambiar el nombre de una carrera, junto con las
+        referencias de sus competidores, apuestas y apostadores.
+        """
+        carrera = self._carreras.get(id_carrera)
+        if carrera is None:
+            return False
+        nombre = validar_nombre_carrera(nombre)
+        if nombre == carrera.nombre:
+            return True
+        if nombre in self._carreras:
+            raise ValueError(
+                "Ya existe una carrera con nombre: {}".format(nombre))
+
+        del self._carreras[id_carrera]
+        self._desindexar(self._indice_carreras, id_carrera)
+        carrera.nombre = nombre
+        self._carreras[nombre] = carrera
+        self._indexar(self._indice_carreras, nombre)
+        for competidor in carrera.competidores.values():
+            competidor.nombre_carrera = nombre
+        for apuesta in carrera.apuestas.values():
+            apuesta.nombre_carrera = nombre
+        for apostador in self._apostadores.values():
+            if id_carrera in apostador.por_carrera:
+                apostador.por_carrera[nombre] = apostador.por_carrera.pop(id_carrera)
+        return True
+
+    def editar_competidor(self, id_carrera, id_competidor, nombre, probabilidad):
+        """
+        Metodo para cambiar el nombre y la probabilidad de un competidor; sus
+        apuestas y su volumen pasan al nuevo nombre.
+        """
+        carrera = self._carreras.get(id_carrera)
+        competidor = carrera.competidores.get(id_competidor) if carrera is not None else None
+        if competidor is None:
+            return False
+        validar_competidor(nombre, probabilidad)
+        if nombre != id_competidor and nombre in self._competidores:
+            raise ValueError(
+                "Ya existe un competidor con el nombre: " + nombre)
+
+        competidor.probabilidad = _numeric(probabilidad)
+        competidor.multiplicador = _numeric(calcular_multiplicador(probabilidad))
+        if nombre == id_competidor:
+            return True
+
+        # Se reconstruye el diccionario para conservar el orden de la carrera
+        competidor.nombre = nombre
+        carrera.competidores = {c.nombre: c for c in carrera.competidores.values()}
+        del self._competidores[id_competidor]
+        self._competidores[nombre] = competidor
+        for apuesta in carrera.apuestas.values():
+            if apuesta.nombre_competidor == id_competidor:
+                apuesta.nombre_competidor = nombre
+        for intervalo in carrera.volumen.values():
+            if id_competidor in intervalo:
+                intervalo[nombre] = intervalo.pop(id_competidor)
+        return True
+
+    def eliminar_competidor(self, id_carrera, id_competidor):
+        """
+        Metodo para eliminar un competidor sin apuestas de una carrera.
+        """
+        carrera = self._carreras.get(id_carrera)
+        competidor = carrera.competidores.get(id_competidor) if carrera is not None else None
+        if competidor is None or competidor.numero_apuestas > 0:
+            return False
+        del carrera.competidores[id_competidor]
+        del self._competidores[id_competidor]
+        return True
+
+    def aniadir_apostador(self, nombre):
+        """Metodo para crear apostadores en E-Porra"""
+        validar_nombre_apostador(nombre)
+        if nombre in self._apostadores:
+            raise ValueError("Ya existe un apostador con el mismo nombre")
+        self._apostadores[nombre] = _Apostador(nombre)
+        self._indexar(self._indice_apostadores, nombre)
+
+    def editar_apostador(self, id_apostador, nombre):
+        """
+        Metodo para cambiar el nombre de un apostador y de sus apuestas.
+        """
+        apostador = self._apostadores.get(id_apostador)
+        if apostador is None:
+            return False
+        validar_nombre_apostador(nombre)
+        if nombre == id_apostador:
+            return True
+        if nombre in self._apostadores:
+            raise ValueError("Ya existe un apostador con el mismo nombre")
+
+        del self._apostadores[id_apostador]
+        self._desindexar(self._indice_apostadores, id_apostador)
+        apostador.nombre = nombre
+        self._apostadores[nombre] = apostador
+        self._indexar(self._indice_apostadores, nombre)
+        for apuesta in apostador.apuestas.values():
+            apuesta.nombre_apostador = nombre
+        return True
+
+    def aniadir_competidor(self, carrera, nombre, probabilidad):
+        """
+        Metodo para aniadir un competidor a la carrera.
+        """
+        if len(nombre.strip()) == 0:
+            raise Exception("El nombre del competidor no puede estar vacio")
+        elif nombre in self._competidores:
+            raise ValueError(
+                "Ya existe un competidor con el nombre: " + nombre)
+        validar_competidor(nombre, probabilidad)
+        self._agregar_competidor(carrera, nombre, probabilidad)
+
+    def crear_apuesta(self, nombre_apostador, id_carrera, valor, nombre_competidor):
+        """
+        Metodo para la creacion de una apuesta, en tiempo constante.
+        """
+        validar_valor_apuesta(valor)
+        carrera = self._carreras.get(id_carrera)
+        if carrera is None or not carrera.abierta:
+            raise Exception(
+                "La carrera ya ha finalizado, no es posible adicionar apuestas.")
+
+        apostador = self._apostadores.get(nombre_apostador)
+        competidor = carrera.competidores.get(nombre_competidor)
+        centavos = a_centavos(valor)
+        apuesta = _Apuesta(self._siguiente_id, centavos,
+                           apostador.nombre if apostador is not None else None,
+                           competidor.nombre if competidor is not None else None,
+                           carrera.nombre)
+        self._siguiente_id += 1
+
+        if apostador is not None:
+            nueva_carrera = not self._participa(apostador, carrera.nombre)
+            self._registrar_estadistica(apostador, apuestas=1, apostado=centavos,
+                                        carreras=1 if nueva_carrera else 0)
+        if competidor is not None:
+            competidor.numero_apuestas += 1
+            competidor.total_apostado_centavos += centavos
+        self._registrar_volumen(carrera, apuesta.nombre_competidor, apuesta.fecha, 1, centavos)
+        self._indexar_apuesta(apuesta)
+
+    def _indexar_apuesta(self, apuesta):
+        self._apuestas[apuesta.id] = apuesta
+        self._carreras[apuesta.nombre_carrera].apuestas[apuesta.id] = apuesta
+        self._indexar_en_apostador(apuesta)
+
+    def _indexar_en_apostador(self, apuesta):
+        apostador = self._apostadores.get(apuesta.nombre_apostador)
+        if apostador is not None:
+            apostador.apuestas[apuesta.id] = apuesta
+            apostador.por_carrera[apuesta.nombre_carrera] = \
+                apostador.por_carrera.get(apuesta.nombre_carrera, 0) + 1
+
+    def _desindexar_apuesta(self, apuesta):
+        del self._apuestas[apuesta.id]
+        self._carreras[apuesta.nombre_carrera].apuestas.pop(apuesta.id, None)
+        self._desindexar_de_apostador(apuesta)
+
+    def _desindexar_de_apostador(self, apuesta):
+        apostador = self._apostadores.get(apuesta.nombre_apostador)
+        if apostador is not None:
+            del apostador.apuestas[apuesta.id]
+            apostador.por_carrera[apuesta.nombre_carrera] -= 1
+            if not apostador.por_carrera[apuesta.nombre_carrera]:
+                del apostador.por_carrera[apuesta.nombre_carrera]
+
+    def _participa(self, apostador, nombre_carrera, excluir=()):
+        """
+        Metodo para saber si un apostador tiene apuestas en una carrera, sin
+        contar las apuestas cuyo id este en excluir.
+        """
+        cuenta = apostador.por_carrera.get(nombre_carrera, 0)
+        for id_apuesta in excluir:
+            apuesta = apostador.apuestas.get(id_apuesta)
+            if apuesta is not None and apuesta.nombre_carrera == nombre_carrera:
+                cuenta -= 1
+        return cuenta > 0
+
+    def _registrar_estadistica(self, apostador, apuestas=0, apostado=0, ganado=0, carreras=0):
+        """
+        Metodo para sumar un cambio (en centavos) al resumen de un apostador.
+        """
+        apostador.numero_apuestas += apuestas
+        apostador.total_apostado_centavos += apostado
+        apostador.total_ganado_centavos += ganado
+        apostador.carreras_jugadas += carreras
+        apostador.ultima_actividad = datetime.now()
+
+    def _quitar_de_estadistica(self, apuesta):
+        """
+        Metodo para descontar una apuesta del resumen de su apostador, antes de
+        editarla o eliminarla.
+        """
+        apostador = self._apostadores.get(apuesta.nombre_apostador)
+        if apostador is None:
+            return
+        sigue = self._participa(apostador, apuesta.nombre_carrera, excluir=[apuesta.id])
+        self._registrar_estadistica(apostador, apuestas=-1, apostado=-apuesta.valor_centavos,
+                                    ganado=-apuesta.ganancia_centavos,
+                                    carreras=0 if sigue else -1)
+
+    def _registrar_competidor(self, nombre_carrera, nombre_competidor, apuestas, apostado):
+        competidor = self._carreras[nombre_carrera].competidores.get(nombre_competidor)
+        if competidor is not None:
+            competidor.numero_apuestas += apuestas
+            competidor.total_apostado_centavos += apostado
+
+    def _registrar_volumen(self, carrera, nombre_competidor, fecha, apuestas, apostado):
+        """
+        Metodo para sumar un cambio (en centavos) al volumen de un minuto, con
+        la misma ventana y limpieza que ManagerEPorra.
+        """
+        limite = inicio_ventana(datetime.now(), MINUTOS_VOLUMEN)
+        if nombre_competidor is None or minuto(fecha) < limite:
+            return
+        if minuto(fecha) not in carrera.volumen:
+            for intervalo in [i for i in carrera.volumen if i < limite]:
+                del carrera.volumen[intervalo]
+        intervalo = carrera.volumen.setdefault(minuto(fecha), {})
+        volumen = intervalo.setdefault(nombre_competidor, [0, 0])
+        volumen[0] += apuestas
+        volumen[1] += apostado
+        if volumen[0] <= 0:
+            del intervalo[nombre_competidor]
+            if not intervalo:
+                del carrera.volumen[minuto(fecha)]
+
+    def _intervalos_volumen(self, nombre_carrera, minutos, ahora):
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is None:
+            return []
+        desde = inicio_ventana(ahora or datetime.now(), minutos)
+        return sorted((intervalo, competidores) for intervalo, competidores in carrera.volumen.items()
+                      if intervalo >= desde)
+
+    def dar_volumen_carrera(self, nombre_carrera, minutos=1, ahora=None):
+        """
+        Metodo para obtener, por competidor, las apuestas y el valor apostado en
+        una carrera durante los ultimos minutos.
+        """
+        totales = {}
+        for _, competidores in self._intervalos_volumen(nombre_carrera, minutos, ahora):
+            for nombre, (apuestas, centavos) in competidores.items():
+                total = totales.setdefault(nombre, [0, 0])
+                total[0] += apuestas
+                total[1] += centavos
+        return [{'Competidor': nombre, 'Apuestas': totales[nombre][0],
+                 'Apostado': de_centavos(totales[nombre][1])} for nombre in sorted(totales)]
+
+    def dar_volumen_por_minuto(self, nombre_carrera, minutos=60, ahora=None):
+        """
+        Metodo para obtener el volumen de apuestas de una carrera minuto a
+        minuto y por competidor, en los ultimos minutos.
+        """
+        return [{'Minuto': intervalo, 'Competidor': nombre, 'Apuestas': competidores[nombre][0],
+                 'Apostado': de_centavos(competidores[nombre][1])}
+                for intervalo, competidores in self._intervalos_volumen(nombre_carrera, minutos, ahora)
+                for nombre in sorted(competidores)]
+
+    def dar_mayores_ganadores(self, k=10):
+        """Metodo para obtener los k apostadores que mas han ganado"""
+        mayores = heapq.nsmallest(k, self._apostadores.values(),
+                                  key=lambda a: (-a.total_ganado_centavos, a.nombre))
+        return [{'Apostador': a.nombre, 'Ganado': de_centavos(a.total_ganado_centavos)}
+                for a in mayores]
+
+    def dar_mayores_apostadores(self, k=10):
+        """Metodo para obtener los k apostadores que mas han apostado"""
+        mayores = heapq.nsmallest(k, self._apostadores.values(),
+                                  key=lambda a: (-a.total_apostado_centavos, a.nombre))
+        return [{'Apostador': a.nombre, 'Apostado': de_centavos(a.total_apostado_centavos)}
+                for a in mayores]
+
+    def dar_competidores_mas_apostados(self, nombre_carrera, k=10):
+        """
+        Metodo para obtener los k competidores de una carrera por los que mas
+        se ha apostado.
+        """
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is None:
+            return []
+        mayores = sorted(carrera.competidores.values(),
+                         key=lambda c: -c.total_apostado_centavos)[:k]
+        return [{'Competidor': c.nombre, 'Apuestas': c.numero_apuestas,
+                 'Apostado': de_centavos(c.total_apostado_centavos)} for c in mayores]
+
+    def dar_estadisticas_apostador(self, nombre_apostador):
+        """Metodo para obtener el resumen de un apostador"""
+        apostador = self._apostadores.get(nombre_apostador)
+        if apostador is None:
+            return _Apostador(nombre_apostador).estadistica_interfaz()
+        return apostador.estadistica_interfaz()
+
+    def reconstruir_estadisticas_apostadores(self):
+        """
+        Metodo para recalcular desde cero el resumen de todos los apostadores a
+        partir de sus apuestas. Se conserva la ultima actividad registrada.
+        """
+        for apostador in self._apostadores.values():
+            apostador.numero_apuestas = len(apostador.apuestas)
+            apostador.total_apostado_centavos = sum(a.valor_centavos for a in apostador.apuestas.values())
+            apostador.total_ganado_centavos = sum(a.ganancia_centavos for a in apostador.apuestas.values())
+            apostador.carreras_jugadas = len(apostador.por_carrera)
+
+    def dar_carreras(self):
+        """Metodo para obtener las carreras ordenadas por nombre"""
+        return [self._carreras[nombre].map_interfaz() for nombre in sorted(self._carreras)]
+
+    def dar_apostadores(self):
+        """Metodo para obtener los apostadores ordenados por nombre"""
+        return [self._apostadores[nombre].map_interfaz() for nombre in sorted(self._apostadores)]
+
+    def buscar_apostadores(self, prefijo, k=20):
+        """Metodo para buscar los primeros k apostadores por prefijo"""
+        return self._buscar_en_indice(self._indice_apostadores, prefijo, k)
+
+    def buscar_carreras(self, prefijo, k=20):
+        """Metodo para buscar las primeras k carreras por prefijo"""
+        return self._buscar_en_indice(self._indice_carreras, prefijo, k)
+
+    def buscar_competidores(self, nombre_carrera, prefijo, k=20):
+        """Metodo para buscar los primeros k competidores de una carrera por prefijo"""
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is None:
+            return []
+        indice = sorted((normalizar(nombre), nombre) for nombre in carrera.competidores)
+        return self._buscar_en_indice(indice, prefijo, k)
+
+    def dar_carrera(self, nombre):
+        """Metodo para obtener una carrera a partir de su nombre"""
+        return self._carreras.get(nombre)
+
+    def dar_apostador(self, nombre):
+        """Metodo para obtener un apostador a partir de su nombre"""
+        return self._apostadores.get(nombre)
+
+    def dar_competidor(self, id_carrera, id_competidor):
+        """Metodo para obtener un competidor de una carrera"""
+        carrera = self._carreras.get(id_carrera)
+        return carrera.competidores.get(id_competidor) if carrera is not None else None
+
+    def dar_competidores_carrera(self, nombre):
+        """Metodo para obtener los competidores de una carrera especifica"""
+        carrera = self.dar_carrera(nombre)
+        return [competidor.map_interfaz() for competidor in carrera.competidores.values()]
+
+    def terminar_carrera(self, nombre_ganador):
+        """
+        Metodo para elegir el ganador de una carrera.
+        """
+        validar_ganador(nombre_ganador)
+        competidor = self._competidores.get(nombre_ganador)
+        if competidor is None:
+            raise ValueError("No existe el competidor {}".format(nombre_ganador))
+        self.terminar_carreras([(competidor.nombre_carrera, nombre_ganador)])
+
+    def terminar_carreras(self, resultados):
+        """
+        Metodo para terminar varias carreras a la vez; si alguna no se puede
+        terminar no se modifica ninguna.
+
+        Args:
+            resultados (list): parejas (nombre de la carrera, nombre del ganador)
+        """
+        resultados = dict(resultados)
+        validar_resultados(self, resultados)
+
+        for nombre_carrera, nombre_ganador in resultados.items():
+            carrera = self._carreras[nombre_carrera]
+            carrera.abierta = False
+            for competidor in carrera.competidores.values():
+                competidor.ganador = competidor.nombre == nombre_ganador
+
+    def dar_apuestas_carrera(self, nombre, uso_interno=False):
+        """Metodo para obtener las apuestas de una carrera, ordenadas por apostador"""
+        carrera = self._carreras.get(nombre)
+        if carrera is None:
+            return []
+        apuestas = sorted(carrera.apuestas.values(), key=lambda a: (
+            a.nombre_apostador is not None, a.nombre_apostador or ''))
+        return [apuesta.map_interfaz() for apuesta in apuestas] \
+            if not uso_interno else apuestas
+
+    def dar_apuestas_apostador(self, nombre_apostador):
+        """
+        Metodo para obtener las apuestas de un apostador en todas las carreras,
+        ordenadas por carrera.
+        """
+        apostador = self._apostadores.get(nombre_apostador)
+        if apostador is None:
+            return []
+        apuestas = sorted(apostador.apuestas.values(), key=lambda a: (a.nombre_carrera, a.id))
+        return [apuesta.map_interfaz() for apuesta in apuestas]
+
+    def dar_reporte_ganancias(self, id_carrera, id_competidor):
+        """
+        Metodo para generar el reporte de ganancias de una carrera, con las
+        mismas reglas que ManagerEPorra. El reporte de una carrera terminada se
+        guarda y las llamadas siguientes lo leen sin recalcularlo.
+        """
+        return reporte_ganancias(self, id_carrera, id_competidor)
+
+    def generar_reporte_ganancias(self, id_carrera, id_competidor, tamano_lote=1000):
+        """
+        Metodo generador del reporte de ganancias, con la misma interfaz que el
+        de ManagerEPorra; la ganancia de la casa es el valor de retorno del
+        generador.
+        """
+        return generar_reporte_ganancias(self, id_carrera, id_competidor, tamano_lote)
+
+    def ganancia_liquidada(self, nombre_carrera):
+        """Metodo del Repositorio: ganancia de la casa del reporte guardado de una carrera"""
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is None:
+            raise ValueError("No existe la carrera {}".format(nombre_carrera))
+        elif carrera.fecha_liquidacion is None:
+            return None
+        return carrera.ganancia_centavos
+
+    def lotes_apuestas(self, nombre_carrera, tamano_lote):
+        """Metodo del Repositorio: apuestas de una carrera por lotes, en centavos"""
+        apuestas = sorted(self._carreras[nombre_carrera].apuestas.values(), key=lambda a: (
+            a.nombre_apostador is not None, a.nombre_apostador or '', a.id))
+        filas = [(a.id, a.nombre_apostador, a.nombre_competidor, a.valor_centavos,
+                  a.ganancia_centavos) for a in apuestas]
+        for inicio in range(0, len(filas), tamano_lote):
+            yield filas[inicio:inicio + tamano_lote]
+
+    def guardar_ganancias(self, nombre_carrera, ganancias, cambios):
+        """Metodo del Repositorio: ganancias de un lote y resumenes de sus apostadores"""
+        for id_apuesta, centavos in ganancias:
+            self._apuestas[id_apuesta].ganancia_centavos = centavos
+        for nombre_apostador, cambio in cambios.items():
+            apostador = self._apostadores.get(nombre_apostador)
+            if apostador is not None and cambio:
+                self._registrar_estadistica(apostador, ganado=cambio)
+
+    def guardar_liquidacion(self, nombre_carrera, ganancia):
+        """Metodo del Repositorio: ganancia de la casa y fecha de liquidacion de una carrera"""
+        carrera = self._carreras[nombre_carrera]
+        carrera.ganancia_centavos = ganancia
+        if not carrera.abierta:
+            carrera.fecha_liquidacion = datetime.now()
+
+    def reliquidar_carrera(self, nombre_carrera, nombre_ganador=None):
+        """
+        Metodo para recalcular el reporte de ganancias guardado de una carrera
+        terminada, conservando el ganador si nombre_ganador es None.
+        """
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is None:
+            raise ValueError("No existe la carrera {}".format(nombre_carrera))
+        elif carrera.abierta:
+            raise Exception("La carrera {} no ha finalizado".format(nombre_carrera))
+        if nombre_ganador is None:
+            nombre_ganador = next((c.nombre for c in carrera.competidores.values() if c.ganador), None)
+        validar_ganador(nombre_ganador)
+        if nombre_ganador not in carrera.competidores:
+            raise ValueError("No existe el competidor {} en la carrera {}".format(
+                nombre_ganador, nombre_carrera))
+
+        for competidor in carrera.competidores.values():
+            competidor.ganador = competidor.nombre == nombre_ganador
+        carrera.fecha_liquidacion = None
+        return self.dar_reporte_ganancias(nombre_carrera, nombre_ganador)
+
+    def dar_exposicion_carrera(self, nombre_carrera):
+        """
+        Metodo para calcular, por cada competidor de una carrera, cuanto se ha
+        apostado por el, cuanto pagaria la casa si gana y su ganancia.
+        """
+        return calcular_exposicion(self, nombre_carrera)
+
+    def multiplicadores_carrera(self, nombre_carrera):
+        """Metodo del Repositorio: multiplicador de cada competidor de una carrera"""
+        carrera = self._carreras[nombre_carrera]
+        return {nombre: c.multiplicador for nombre, c in carrera.competidores.items()}
+
+    def apostado_por_competidor(self, nombre_carrera):
+        """Metodo del Repositorio: centavos apostados por cada competidor de una carrera"""
+        apostado = {}
+        for apuesta in self._carreras[nombre_carrera].apuestas.values():
+            apostado[apuesta.nombre_competidor] = \
+                apostado.get(apuesta.nombre_competidor, 0) + apuesta.valor_centavos
+        return apostado
+
+    def multiplicador_competidor(self, nombre_carrera, nombre_competidor):
+        """Metodo del Repositorio: multiplicador vigente de un competidor de una carrera"""
+        competidor = self._carreras[nombre_carrera].competidores.get(nombre_competidor)
+        return competidor.multiplicador if competidor is not None else None
+
+    def carreras_abiertas(self, resultados):
+        """Metodo del Repositorio: si esta abierta cada carrera cuyo ganador existe"""
+        abiertas = {}
+        for nombre_carrera, nombre_ganador in resultados.items():
+            carrera = self._carreras.get(nombre_carrera)
+            if carrera is not None and nombre_ganador in carrera.competidores:
+                abiertas[nombre_carrera] = carrera.abierta
+        return abiertas
+
+    def eliminar_carrera(self, nombre_carrera):
+        """
+        Metodo para eliminar una carrera sin apuestas.
+        """
+        carrera = self._carreras.get(nombre_carrera)
+        if carrera is not None and carrera.apuestas:
+            return 0
+        if carrera is not None:
+            del self._carreras[nombre_carrera]
+            self._desindexar(self._indice_carreras, nombre_carrera)
+            for nombre in carrera.competidores:
+                del self._competidores[nombre]
+        return 1
+
+    def eliminar_apostador(self, nombre):
+        """
+        Metodo para eliminar un apostador junto con sus apuestas.
+        """
+        apostador = self._apostadores.get(nombre)
+        if apostador is None:
+            return False
+        for apuesta in list(apostador.apuestas.values()):
+            self._registrar_competidor(apuesta.nombre_carrera, apuesta.nombre_competidor,
+                                       apuestas=-1, apostado=-apuesta.valor_centavos)
+            self._registrar_volumen(self._carreras[apuesta.nombre_carrera], apuesta.nombre_competidor,
+                                    apuesta.fecha, -1, -apuesta.valor_centavos)
+            self._desindexar_apuesta(apuesta)
+        del self._apostadores[nombre]
+        self._desindexar(self._indice_apostadores, nombre)
+        return True
+
+    def dar_apuesta(self, id_carrera, id_apuesta):
+        """
+        Metodo para obtener una apuesta a partir de su id.
+        """
+        apuesta = self._apuesta_carrera(id_carrera, id_apuesta)
+        return apuesta.map_interfaz() if apuesta is not None else None
+
+    def _apuesta_carrera(self, nombre_carrera, id_apuesta):
+        apuesta = self._apuestas.get(id_apuesta)
+        if apuesta is None or apuesta.nombre_carrera != nombre_carrera:
+            return None
+        return apuesta
+
+    def editar_apuesta(self, id_apuesta, apostador, carrera, valor, competidor):
+        """
+        Metodo para editar una apuesta.
+        """
+        if valor is None or not valor > 1:
+            return False
+        apuesta = self._apuesta_carrera(carrera, id_apuesta)
+        if apuesta is None or (apostador is not None and apostador not in self._apostadores):
+            return False
+        validar_competidor_de_carrera(competidor, carrera, self._carreras[carrera].competidores)
+
+        centavos = a_centavos(valor)
+        self._quitar_de_estadistica(apuesta)
+        if apostador is not None:
+            nuevo = self._apostadores[apostador]
+            nueva_carrera = not self._participa(nuevo, carrera, excluir=[apuesta.id])
+            self._registrar_estadistica(nuevo, apuestas=1, apostado=centavos,
+                                        ganado=apuesta.ganancia_centavos,
+                                        carreras=1 if nueva_carrera else 0)
+        self._registrar_competidor(carrera, apuesta.nombre_competidor,
+                                   apuestas=-1, apostado=-apuesta.valor_centavos)
+        self._registrar_competidor(carrera, competidor, apuestas=1, apostado=centavos)
+        registro = self._carreras[carrera]
+        self._registrar_volumen(registro, apuesta.nombre_competidor, apuesta.fecha,
+                                -1, -apuesta.valor_centavos)
+        self._registrar_volumen(registro, competidor, apuesta.fecha, 1, centavos)
+
+        # La apuesta conserva su lugar (orden de creacion) en la carrera
+        self._desindexar_de_apostador(apuesta)
+        apuesta.valor_centavos = centavos
+        apuesta.nombre_apostador = apostador
+        apuesta.nombre_competidor = competidor
+        self._indexar_en_apostador(apuesta)
+        return True
+
+    def eliminar_apuesta(self, id_carrera, id_apuesta):
+        """
+        Metodo para eliminar una apuesta.
+        """
+        apuesta = self._apuesta_carrera(id_carrera, id_apuesta)
+        if apuesta is None:
+            return False
+        self._quitar_de_estadistica(apuesta)
+        self._registrar_competidor(id_carrera, apuesta.nombre_competidor,
+                                   apuestas=-1, apostado=-apuesta.valor_centavos)
+        self._registrar_volumen(self._carreras[id_carrera], apuesta.nombre_competidor,
+                                apuesta.fecha, -1, -apuesta.valor_centavos)
+        self._desindexar_apuesta(apuesta)
+        return True
@@ -0,0 +1,112 @@
+"""
+Reglas de E-Porra que no dependen del almacenamiento. Reciben un Repositorio
+para leer los datos que necesitan.
+"""
+from decimal import ROUND_HALF_EVEN
+
+from src.modelo.dinero import de_centavos
+from .validaciones import validar_ganador
+
+
+def validar_resultados(repositorio, resultados):
+    """
+    Funcion para comprobar que se pueden terminar unas carreras: cada ganador
+    es un competidor de su carrera y la carrera sigue abierta.
+
+    Args:
+        repositorio (Repositorio): datos de las carreras.
+        resultados (dict): nombre de la carrera -> nombre del ganador.
+    """
+    for nombre_ganador in resultados.values():
+        validar_ganador(nombre_ganador)
+    abiertas = repositorio.carreras_abiertas(resultados)
+    for nombre_carrera, nombre_ganador in resultados.items():
+        if nombre_carrera not in abiertas:
+            raise ValueError("No existe el competidor {} en la carrera {}".format(
+                nombre_ganador, nombre_carrera))
+        elif not abiertas[nombre_carrera]:
+            raise Exception("La carrera {} ya ha finalizado".format(nombre_carrera))
+
+
+def calcular_exposicion(repositorio, nombre_carrera):
+    """
+    Funcion para calcular, por cada competidor de una carrera, cuanto se ha
+    apostado por el, cuanto tendria que pagar la casa si gana y la ganancia
+    resultante de la casa. Se hace una sola multiplicacion por competidor.
+    """
+    multiplicadores = repositorio.multiplicadores_carrera(nombre_carrera)
+    apostado = repositorio.apostado_por_competidor(nombre_carrera)
+    total = sum(apostado.values())
+
+    exposicion = []
+    for nombre in sorted(multiplicadores):
+        valor = apostado.get(nombre, 0)
+        pago = int((valor * multiplicadores[nombre]).to_integral_value(ROUND_HALF_EVEN))
+        exposicion.append({
+            'Competidor': nombre,
+            'Multiplicador': multiplicadores[nombre],
+            'Apostado': de_centavos(valor),
+            'Pago': de_centavos(pago),
+            'Ganancia de la casa': de_centavos(total - pago),
+        })
+    return exposicion
+
+
+def generar_reporte_ganancias(repositorio, nombre_carrera, nombre_ganador, tamano_lote=1000):
+    """
+    Funcion generadora del reporte de ganancias de una carrera: produce las
+    parejas (apostador, ganancia) y retorna la ganancia de la casa. Si el
+    reporte esta guardado solo se lee. Si no, cada apuesta por el ganador gana
+    su valor por el multiplicador (redondeado al centavo) y las ganancias de
+    cada lote se guardan antes de producirlas; un recorrido interrumpido se
+    puede repetir, ya que los apostadores solo reciben la diferencia con lo ya
+    guardado.
+
+    Args:
+        repositorio (Repositorio): datos de la carrera.
+        nombre_carrera (str): nombre de la carrera.
+        nombre_ganador (str): nombre del competidor ganador.
+        tamano_lote (int): numero de apuestas leidas y guardadas a la vez.
+    """
+    guardada = repositorio.ganancia_liquidada(nombre_carrera)
+    if guardada is not None:
+        for lote in repositorio.lotes_apuestas(nombre_carrera, tamano_lote):
+            for _, nombre_apostador, _, _, ganancia in lote:
+                yield (nombre_apostador, de_centavos(ganancia))
+        return de_centavos(guardada)
+
+    multiplicador = repositorio.multiplicador_competidor(nombre_carrera, nombre_ganador)
+    total_apostado = 0
+    total_pagado = 0
+    for lote in repositorio.lotes_apuestas(nombre_carrera, tamano_lote):
+        ganancias = []
+        cambios = {}
+        for id_apuesta, nombre_apostador, nombre_competidor, valor, anterior in lote:
+            centavos = 0
+            if multiplicador is not None and nombre_competidor == nombre_ganador:
+                centavos = int((valor * multiplicador).to_integral_value(ROUND_HALF_EVEN))
+            if nombre_apostador is not None:
+                cambios[nombre_apostador] = cambios.get(nombre_apostador, 0) + centavos - anterior
+            total_apostado += valor
+            total_pagado += centavos
+            ganancias.append((id_apuesta, centavos))
+        repositorio.guardar_ganancias(nombre_carrera, ganancias, cambios)
+        for (_, nombre_apostador, _, _, _), (_, centavos) in zip(lote, ganancias):
+            yield (nombre_apostador, de_centavos(centavos))
+
+    repositorio.guardar_liquidacion(nombre_carrera, total_apostado - total_pagado)
+    return de_centavos(total_apostado - total_pagado)
+
+
+def reporte_ganancias(repositorio, nombre_carrera, nombre_ganador):
+    """
+    Funcion para obtener el reporte de ganancias completo de una carrera: la
+    lista de parejas (apostador, ganancia) y la ganancia de la casa.
+    """
+    generador = generar_reporte_ganancias(repositorio, nombre_carrera, nombre_ganador)
+    ganancias = []
+    while True:
+        try:
+            ganancias.append(next(generador))
+        except StopIteration as fin:
+            return ganancias, fin.value
@@ -0,0 +1,98 @@
+"""
+Interfaz de acceso a los datos que usan las reglas de E-Porra (reglas.py).
+Cada almacenamiento la implementa sobre sus propias estructuras (SQLite en
+ManagerEPorra, diccionarios en ManagerMemoria), de modo que las reglas se
+escriben una sola vez.
+"""
+
+
+class Repositorio():
+    """
+    Clase base de los almacenamientos. Los valores monetarios se entregan en
+    centavos.
+    """
+
+    def multiplicadores_carrera(self, nombre_carrera):
+        """
+        Metodo para obtener el multiplicador de pago de cada competidor de una
+        carrera.
+
+        Returns:
+            dict: nombre del competidor -> multiplicador (Decimal).
+        """
+        raise NotImplementedError
+
+    def apostado_por_competidor(self, nombre_carrera):
+        """
+        Metodo para obtener cuanto se ha apostado por cada competidor de una
+        carrera; los competidores sin apuestas pueden no aparecer.
+
+        Returns:
+            dict: nombre del competidor -> centavos apostados.
+        """
+        raise NotImplementedError
+
+    def multiplicador_competidor(self, nombre_carrera, nombre_competidor):
+        """
+        Metodo para obtener, de los datos vigentes, el multiplicador de pago de
+        un competidor de una carrera.
+
+        Returns:
+            Decimal: el multiplicador, o None si el competidor no es de la
+            carrera.
+        """
+        raise NotImplementedError
+
+    def carreras_abiertas(self, resultados):
+        """
+        Metodo para saber, de las parejas (carrera, ganador) en las que el
+        ganador es un competidor de la carrera, si la carrera esta abierta.
+
+        Args:
+            resultados (dict): nombre de la carrera -> nombre del ganador.
+
+        Returns:
+            dict: nombre de la carrera -> abierta (bool); las parejas que no
+            existen no aparecen.
+        """
+        raise NotImplementedError
+
+    def ganancia_liquidada(self, nombre_carrera):
+        """
+        Metodo para obtener la ganancia de la casa del reporte guardado de una
+        carrera. Lanza ValueError si la carrera no existe.
+
+        Returns:
+            int: centavos, o None si el reporte de la carrera no esta guardado.
+        """
+        raise NotImplementedError
+
+    def lotes_apuestas(self, nombre_carrera, tamano_lote):
+        """
+        Metodo para recorrer por lotes las apuestas de una carrera en el orden
+        del reporte de ganancias: primero las apuestas sin apostador y despues
+        por apostador e id.
+
+        Returns:
+            generador de listas de tuplas (id, apostador, competidor, valor,
+            ganancia), con los valores en centavos.
+        """
+        raise NotImplementedError
+
+    def guardar_ganancias(self, nombre_carrera, ganancias, cambios):
+        """
+        Metodo para guardar, a la vez, la ganancia de un lote de apuestas y el
+        cambio que causa en el total ganado de cada apostador.
+
+        Args:
+            ganancias (list): parejas (id de la apuesta, centavos ganados).
+            cambios (dict): nombre del apostador -> diferencia en centavos.
+        """
+        raise NotImplementedError
+
+    def guardar_liquidacion(self, nombre_carrera, ganancia):
+        """
+        Metodo para guardar la ganancia de la casa (centavos) de una carrera;
+        si la carrera esta terminada su reporte queda guardado.
+        """
+        raise NotImplementedError
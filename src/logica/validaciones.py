@@ -0,0 +1,87 @@
+"""
+Reglas de validacion de E-Porra que no dependen del almacenamiento. Las usan
+todas las implementaciones de la logica, de modo que los mensajes de error son
+los mismos sin importar donde se guardan los datos. Las validaciones que
+necesitan consultar los datos (nombres repetidos, carreras cerradas) quedan en
+cada implementacion.
+"""
+
+
+def validar_nombre_carrera(nombre):
+    """
+    Funcion para validar el nombre de una carrera. Retorna el nombre sin
+    espacios al inicio ni al final.
+    """
+    nombre = nombre.strip()
+    if len(nombre) == 0:
+        raise Exception("El nombre de la carrera no debe estar vacio")
+    elif len(nombre) > 200:
+        raise ValueError(
+            "El nombre de la carrera puede tener hasta 200 caracteres")
+    return nombre
+
+
+def validar_probabilidades(competidores):
+    """Funcion para validar que las probabilidades de una carrera suman uno"""
+    if sum([c.get('Probabilidad') for c in competidores]) != 1:
+        raise Exception(
+            "Las probabilidades de los competidores no son iguales a 1")
+
+
+def validar_competidor(nombre, probabilidad):
+    """Funcion para validar el nombre y la probabilidad de un competidor"""
+    if len(nombre.strip()) == 0:
+        raise Exception("El nombre del competidor no puede estar vacio")
+    elif len(nombre) > 200:
+        raise ValueError(
+            "El nombre del competidor no puede tener mas de 200 caracteres")
+    elif not isinstance(probabilidad, (int, float)):
+        raise ValueError("La probabilidad debe ser un número")
+    elif probabilidad <= 0 or probabilidad >= 1:
+        raise ValueError("La probabilidad debe ser mayor a 0 y menor a 1")
+
+
+def validar_competidores_nuevos(competidores):
+    """
+    Funcion para validar en una sola pasada los competidores nuevos de una
+    carrera, incluyendo nombres repetidos entre ellos. Retorna el conjunto de
+    nombres, para buscar repetidos en los datos guardados.
+    """
+    nombres = set()
+    for competidor in competidores:
+        validar_competidor(competidor['Nombre'], competidor['Probabilidad'])
+        if competidor['Nombre'] in nombres:
+            raise ValueError(
+                "Ya existe un competidor con el nombre: " + competidor['Nombre'])
+        nombres.add(competidor['Nombre'])
+    return nombres
+
+
+def validar_competidor_de_carrera(nombre_competidor, nombre_carrera, competidores):
+    """
+    Funcion para validar que el competidor de una apuesta, si lo tiene, es uno
+    de los competidores (nombres) de su carrera.
+    """
+    if nombre_competidor is not None and nombre_competidor not in competidores:
+        raise ValueError("No existe el competidor {} en la carrera {}".format(
+            nombre_competidor, nombre_carrera))
+
+
+def validar_nombre_apostador(nombre):
+    """Funcion para validar el nombre de un apostador"""
+    if nombre is None or len(nombre) <= 0 or len(nombre) > 200:
+        raise ValueError(
+            "El nombre del apostador debe tener entre 1 y 200 caracteres")
+
+
+def validar_valor_apuesta(valor):
+    """Funcion para validar el valor de una apuesta nueva"""
+    if valor <= 0:
+        raise ValueError(
+            'El valor de la apuesta debe serpositivo y mayor a cero')
+
+
+def validar_ganador(nombre_ganador):
+    """Funcion para validar el ganador elegido al terminar una carrera"""
+    if nombre_ganador is None or len(nombre_ganador) == 0:
+        raise Exception("Debe seleccionar un ganador")
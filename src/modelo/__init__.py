@@ -1,4 +1,6 @@
 from .apostador import Apostador
 from .apuesta import Apuesta
 from .carrera import Carrera
-from .competidor import Competidor
\ No newline at end of file
+from .competidor import Competidor
+from .estadistica_apostador import EstadisticaApostador
+from .volumen_apuestas import VolumenApuestas
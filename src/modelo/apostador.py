@@ -1,21 +1,40 @@
-from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import CheckConstraint, Column, String
+from sqlalchemy.orm import relationship, validates
 
+from .busqueda import normalizar
 from .declarative_base import Base
 
 class Apostador(Base):
     __tablename__ = 'apostador'
 
     nombre = Column(String, primary_key=True)
+    nombre_normalizado = Column(String, index=True)
+
+    __table_args__ = (
+        CheckConstraint('length(nombre) BETWEEN 1 AND 200', name='ck_apostador_nombre'),
+    )
 
     apuestas = relationship('Apuesta', backref='apostador',
-                                cascade='all, delete, delete-orphan')
+                                cascade='all, delete, delete-orphan',
+                                passive_deletes=True)
+    estadistica = relationship('EstadisticaApostador', uselist=False, lazy='joined',
+                               cascade='all, delete, delete-orphan',
+                               passive_deletes=True)
+
+    @validates('nombre')
+    def _validar_nombre(self, key, nombre):
+        """El nombre normalizado se mantiene para la busqueda por prefijo"""
+        self.nombre_normalizado = normalizar(nombre)
+        return nombre
 
     def map_interfaz(self):
         """
         Metodo para hacer el mapping entre el ORM y 
         los dict utilizados por la interfaz
         """
-        return {
+        interfaz = {
             'Nombre': self.nombre,
         }
+        if self.estadistica is not None:
+            interfaz.update(self.estadistica.map_interfaz())
+        return interfaz
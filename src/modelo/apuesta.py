@@ -1,23 +1,36 @@
-from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, ForeignKeyConstraint, Index, Integer, String
 
 from .declarative_base import Base
+from .dinero import Dinero
 
 class Apuesta(Base):
     __tablename__ = 'apuesta'
 
     id = Column(Integer, primary_key=True)
-    valor = Column(Numeric)
-    ganancia = Column(Numeric)
+    valor = Column(Dinero)
+    ganancia = Column(Dinero)
+    fecha = Column(DateTime)
 
-    nombre_apostador = Column(String, ForeignKey('apostador.nombre'))
-    nombre_competidor = Column(String, ForeignKey('competidor.nombre'))
-    nombre_carrera = Column(String, ForeignKey('carrera.nombre'))
+    nombre_apostador = Column(String, ForeignKey('apostador.nombre', ondelete='CASCADE'))
+    nombre_competidor = Column(String)
+    nombre_carrera = Column(String, ForeignKey('carrera.nombre', ondelete='CASCADE'))
+
+    __table_args__ = (
+        ForeignKeyConstraint(['nombre_competidor', 'nombre_carrera'],
+                             ['competidor.nombre', 'competidor.nombre_carrera'],
+                             ondelete='CASCADE'),
+        Index('ix_apuesta_carrera_apostador', nombre_carrera, nombre_apostador),
+        # valor esta en centavos
+        CheckConstraint('valor > 0', name='ck_apuesta_valor'),
+    )
 
 
     def map_interfaz(self):
         return {
+            'Id': self.id,
             'Valor': self.valor,
             'Ganancia': self.ganancia,
             'Competidor': self.nombre_competidor,
             'Apostador': self.nombre_apostador,
+            'Carrera': self.nombre_carrera,
         }
\ No newline at end of file
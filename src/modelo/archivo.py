@@ -0,0 +1,64 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from .apuesta import Apuesta
+from .carrera import Carrera
+from .competidor import Competidor
+from .declarative_base import Base
+from .migraciones import agregar_columnas_faltantes
+
+
+class Archivo():
+    """
+    Clase encargada del archivo SQLite al que se mueven las carreras ya
+    liquidadas, con sus competidores y apuestas. Asi las tablas de la base de
+    datos principal solo crecen con las carreras en curso.
+    """
+
+    TABLAS = (Carrera.__table__, Competidor.__table__, Apuesta.__table__)
+
+    def __init__(self, ruta):
+        """
+        Args:
+            ruta (str): archivo SQLite donde se guardan las carreras archivadas.
+        """
+        self.ruta = ruta
+        self.engine = create_engine('sqlite:///' + ruta)
+        Base.metadata.create_all(self.engine, tables=self.TABLAS)
+        # Un competidor nuevo puede repetir el nombre de uno ya archivado
+        self.engine.execute('DROP INDEX IF EXISTS ux_competidor_nombre')
+        for tabla in self.TABLAS:
+            agregar_columnas_faltantes(self.engine, tabla)
+        self.session = sessionmaker(bind=self.engine)()
+
+    def contiene(self, nombre_carrera):
+        """Metodo para saber si una carrera esta archivada"""
+        return self.session.query(Carrera.nombre).filter(
+            Carrera.nombre == nombre_carrera).first() is not None
+
+    def guardar(self, carrera, competidores, apuestas):
+        """
+        Metodo para guardar en el archivo una carrera con sus competidores y
+        apuestas, como diccionarios de columnas. Si la carrera ya estaba
+        archivada (un archivado interrumpido) se reemplaza. Las apuestas
+        reciben un id nuevo en el archivo.
+
+        Args:
+            carrera (dict): columnas de la carrera.
+            competidores (list): columnas de cada competidor.
+            apuestas (list): columnas de cada apuesta, sin el id.
+        """
+        with self.engine.begin() as conexion:
+            for tabla in reversed(self.TABLAS):
+                columna = tabla.c.nombre if tabla is Carrera.__table__ else tabla.c.nombre_carrera
+                conexion.execute(tabla.delete().where(columna == carrera['nombre']))
+            conexion.execute(Carrera.__table__.insert(), carrera)
+            if competidores:
+                conexion.execute(Competidor.__table__.insert(), competidores)
+            if apuestas:
+                conexion.execute(Apuesta.__table__.insert(), apuestas)
+
+    def cerrar(self):
+        """Metodo para cerrar la sesion y las conexiones del archivo"""
+        self.session.close()
+        self.engine.dispose()
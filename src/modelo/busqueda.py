@@ -0,0 +1,25 @@
+import unicodedata
+
+LIMITE_PREFIJO = '\U0010ffff'
+
+
+def normalizar(nombre):
+    """
+    Funcion para normalizar un nombre para las busquedas: sin tildes, sin
+    espacios repetidos y sin diferenciar mayusculas de minusculas.
+    """
+    if nombre is None:
+        return None
+    descompuesto = unicodedata.normalize('NFKD', nombre)
+    sin_tildes = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return ' '.join(sin_tildes.casefold().split())
+
+
+def filtro_prefijo(columna, prefijo):
+    """
+    Funcion para construir el filtro por prefijo sobre una columna de nombre
+    normalizado. Se usa un rango (>= prefijo y < prefijo + ultimo caracter)
+    para que SQLite recorra solo la parte del indice que corresponde.
+    """
+    prefijo = normalizar(prefijo or '')
+    return columna.between(prefijo, prefijo + LIMITE_PREFIJO)
@@ -0,0 +1,37 @@
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy.ext.declarative import declarative_base
+
+from .dinero import Dinero
+
+# Tablas que solo existen en los archivos de fragmentos
+BaseFragmento = declarative_base()
+
+
+class EstadoCarrera(BaseFragmento):
+    """
+    Copia, en el fragmento, de si la carrera recibe apuestas. Registrar una
+    apuesta la comprueba aqui, de modo que solo escribe en el fragmento.
+    """
+    __tablename__ = 'estado_carrera'
+
+    nombre_carrera = Column(String, primary_key=True)
+    abierta = Column(Boolean, nullable=False)
+
+
+class CambioPendiente(BaseFragmento):
+    """
+    Cambio causado por una apuesta del fragmento al resumen de su apostador y
+    a los totales de su competidor, que aun no se ha sumado a la base de datos
+    principal. El id nunca se reutiliza (AUTOINCREMENT): la carrera guarda el
+    ultimo id consolidado.
+    """
+    __tablename__ = 'cambio_pendiente'
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    id = Column(Integer, primary_key=True)
+    nombre_apostador = Column(String)
+    nombre_competidor = Column(String)
+    apuestas = Column(Integer, default=0)
+    apostado = Column(Dinero, default=0)
+    carreras = Column(Integer, default=0)
+    fecha = Column(DateTime)
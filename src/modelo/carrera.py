@@ -1,19 +1,41 @@
-from sqlalchemy import Boolean, Column, Numeric, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Integer, String
+from sqlalchemy.orm import relationship, validates
 
+from .busqueda import normalizar
+from .competidor import ORDEN_DE_CREACION
 from .declarative_base import Base
+from .dinero import Dinero
 
 class Carrera(Base):
     __tablename__ = 'carrera'
 
     nombre = Column(String, primary_key=True)
+    nombre_normalizado = Column(String, index=True)
     abierta = Column(Boolean)
-    ganancia = Column(Numeric)
+    ganancia = Column(Dinero)
+    # Momento en que se guardo el reporte de ganancias de la carrera terminada
+    fecha_liquidacion = Column(DateTime)
+    # Ultimo cambio pendiente de su fragmento sumado a los resumenes
+    cambios_consolidados = Column(Integer, default=0)
+
+    __table_args__ = (
+        CheckConstraint('length(trim(nombre)) > 0', name='ck_carrera_nombre_vacio'),
+        CheckConstraint('length(nombre) <= 200', name='ck_carrera_nombre_largo'),
+    )
 
     competidores = relationship('Competidor', backref='carrera',
-                                cascade='all, delete, delete-orphan')
+                                order_by=ORDEN_DE_CREACION,
+                                cascade='all, delete, delete-orphan',
+                                passive_deletes=True)
     apuestas = relationship('Apuesta', backref='carrera',
-                            cascade='all, delete, delete-orphan')
+                            cascade='all, delete, delete-orphan',
+                            passive_deletes=True)
+
+    @validates('nombre')
+    def _validar_nombre(self, key, nombre):
+        """El nombre normalizado se mantiene para la busqueda por prefijo"""
+        self.nombre_normalizado = normalizar(nombre)
+        return nombre
 
     def map_interfaz(self):
         return {
@@ -1,19 +1,80 @@
-from sqlalchemy import Boolean, Column, Numeric, ForeignKey, String
-from sqlalchemy.orm import relationship
+from decimal import Decimal
 
+from sqlalchemy import (Boolean, CheckConstraint, Column, Numeric, ForeignKey, Index, Integer, String,
+                        literal_column)
+from sqlalchemy.orm import relationship, validates
+
+from .busqueda import normalizar
 from .declarative_base import Base
+from .dinero import Dinero
+
+# Orden en que se agregaron los competidores (rowid de SQLite). Sin el, el
+# orden depende del indice que elija SQLite; la interfaz edita los
+# competidores por su posicion en la lista.
+ORDEN_DE_CREACION = literal_column('competidor.rowid')
+
+
+def calcular_multiplicador(probabilidad):
+    """
+    Funcion para calcular el multiplicador de pago (1 / probabilidad) de un
+    competidor, que es la cuota que muestra la interfaz. Si la probabilidad no
+    es valida se retorna None.
+    """
+    if not isinstance(probabilidad, (int, float, Decimal)) or isinstance(probabilidad, bool):
+        return None
+    probabilidad = Decimal(str(probabilidad))
+    if probabilidad <= 0 or probabilidad >= 1:
+        return None
+    return 1 / probabilidad
+
 
 class Competidor(Base):
     __tablename__ = 'competidor'
 
     nombre = Column(String, primary_key=True)
+    nombre_normalizado = Column(String)
     probabilidad = Column(Numeric)
+    multiplicador = Column(Numeric)
     ganador = Column(Boolean)
+    numero_apuestas = Column(Integer, default=0)
+    total_apostado = Column(Dinero, default=0)
 
-    nombre_carrera = Column(String, ForeignKey('carrera.nombre'), primary_key=True)
+    nombre_carrera = Column(String, ForeignKey('carrera.nombre', ondelete='CASCADE'),
+                            primary_key=True)
 
+    __table_args__ = (
+        Index('ix_competidor_carrera_apostado', nombre_carrera, total_apostado.desc()),
+        Index('ix_competidor_carrera_nombre', nombre_carrera, nombre_normalizado),
+        # El nombre de un competidor no se repite entre carreras
+        Index('ux_competidor_nombre', nombre, unique=True),
+        CheckConstraint('length(trim(nombre)) > 0', name='ck_competidor_nombre_vacio'),
+        CheckConstraint('length(nombre) <= 200', name='ck_competidor_nombre_largo'),
+        CheckConstraint('probabilidad > 0 AND probabilidad < 1',
+                        name='ck_competidor_probabilidad'),
+    )
+
+    @validates('nombre')
+    def _validar_nombre(self, key, nombre):
+        """El nombre normalizado se mantiene para la busqueda por prefijo"""
+        self.nombre_normalizado = normalizar(nombre)
+        return nombre
+
+    # La carrera de la apuesta la escribe la relacion Apuesta.carrera; aqui
+    # solo se usa para unir con el competidor de esa misma carrera.
     apuestas = relationship('Apuesta', backref='competidor',
-                                cascade='all, delete, delete-orphan')
+                                primaryjoin='and_(Competidor.nombre == foreign(Apuesta.nombre_competidor), '
+                                            'Competidor.nombre_carrera == Apuesta.nombre_carrera)',
+                                cascade='all, delete, delete-orphan',
+                                passive_deletes=True)
+
+    @validates('probabilidad')
+    def _validar_probabilidad(self, key, probabilidad):
+        """
+        Cada vez que cambia la probabilidad se recalcula el multiplicador, para
+        no tener que derivarlo en cada liquidacion.
+        """
+        self.multiplicador = calcular_multiplicador(probabilidad)
+        return probabilidad
 
     def map_interfaz(self):
         """
@@ -23,4 +84,5 @@ class Competidor(Base):
         return {
             'Nombre': self.nombre,
             'Probabilidad': self.probabilidad,
+            'Multiplicador': self.multiplicador,
         }
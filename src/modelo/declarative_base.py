@@ -1,13 +1,32 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 E_PORRA_ADDRESS = 'sqlite:///aplicacion.sqlite'
 TESTING_ADDRESS = 'sqlite:///aplicacion_test.sqlite'
 
 Base = declarative_base()
 
-def crear_session(address):
-    engine = create_engine(address)
+def _activar_llaves_foraneas(conexion, registro):
+    """
+    SQLite no valida las llaves foraneas (ni borra en cascada) a menos que se
+    active en cada conexion.
+    """
+    cursor = conexion.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+def crear_session(address, en_memoria=False):
+    if en_memoria:
+        # Una sola conexion compartida por todos los hilos. La conexion no se
+        # reinicia al devolverla, ya que los puntos de control la toman
+        # mientras otra sesion puede estar usandola.
+        engine = create_engine('sqlite://', poolclass=StaticPool, pool_reset_on_return=None,
+                               connect_args={'check_same_thread': False})
+    else:
+        engine = create_engine(address)
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', _activar_llaves_foraneas)
     Session = sessionmaker(bind=engine)
     return (engine, Session())
@@ -0,0 +1,38 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+CENTAVOS = 100
+
+
+def a_centavos(valor):
+    """
+    Funcion para convertir un valor monetario (int, float o Decimal) a un
+    entero en centavos, redondeando al centavo mas cercano.
+    """
+    if isinstance(valor, int):
+        return valor * CENTAVOS
+    if not isinstance(valor, Decimal):
+        valor = Decimal(str(valor))
+    return int((valor * CENTAVOS).to_integral_value(ROUND_HALF_EVEN))
+
+
+def de_centavos(centavos):
+    """Funcion para convertir un entero en centavos a un Decimal con 2 decimales"""
+    return Decimal(centavos).scaleb(-2)
+
+
+class Dinero(TypeDecorator):
+    """
+    Tipo de columna para los valores monetarios. En la base de datos se guarda
+    un entero con el valor en centavos, de modo que las sumas se hacen en SQLite
+    sin errores de punto flotante; en Python se expone como Decimal.
+    """
+    impl = Integer
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else a_centavos(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else de_centavos(value)
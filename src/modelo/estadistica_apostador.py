@@ -0,0 +1,39 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from .declarative_base import Base
+from .dinero import Dinero
+
+
+class EstadisticaApostador(Base):
+    """
+    Resumen acumulado de la actividad de un apostador. Se mantiene de forma
+    incremental al crear, editar, eliminar y liquidar apuestas, para no tener
+    que recorrer la tabla de apuestas cada vez que se consulta.
+    """
+    __tablename__ = 'estadistica_apostador'
+
+    nombre_apostador = Column(String, ForeignKey('apostador.nombre', ondelete='CASCADE'),
+                              primary_key=True)
+    numero_apuestas = Column(Integer, default=0)
+    total_apostado = Column(Dinero, default=0)
+    total_ganado = Column(Dinero, default=0)
+    carreras_jugadas = Column(Integer, default=0)
+    ultima_actividad = Column(DateTime)
+
+    __table_args__ = (
+        Index('ix_estadistica_apostador_ganado', total_ganado.desc(), nombre_apostador),
+        Index('ix_estadistica_apostador_apostado', total_apostado.desc(), nombre_apostador),
+    )
+
+    def map_interfaz(self):
+        """
+        Metodo para hacer el mapping entre el ORM y 
+        los dict utilizados por la interfaz
+        """
+        return {
+            'Apuestas': self.numero_apuestas,
+            'Apostado': self.total_apostado,
+            'Ganado': self.total_ganado,
+            'Carreras': self.carreras_jugadas,
+            'Ultima actividad': self.ultima_actividad,
+        }
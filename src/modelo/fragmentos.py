@@ -0,0 +1,126 @@
+import hashlib
+import os
+import threading
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from .apuesta import Apuesta
+from .cambio_pendiente import BaseFragmento, CambioPendiente, EstadoCarrera
+from .carrera import Carrera
+from .migraciones import agregar_columnas_faltantes
+from .volumen_apuestas import VolumenApuestas
+
+
+class Fragmentos():
+    """
+    Clase encargada de administrar los archivos SQLite en los que se guardan
+    las apuestas de cada carrera cuando la aplicacion trabaja en modo
+    fragmentado. Cada carrera tiene su propio archivo, que se crea y se
+    conecta solo cuando se necesita. Ademas de las apuestas y su volumen por
+    minuto, el fragmento guarda si la carrera esta abierta y los cambios a los
+    resumenes que aun no se han sumado a la base de datos principal, para que
+    registrar una apuesta no escriba en ella.
+    """
+
+    def __init__(self, directorio, engine_principal, version_datos=None):
+        """
+        Args:
+            directorio (str): carpeta donde se guardan los archivos de apuestas.
+            engine_principal (Engine): motor de la base de datos principal, en
+                la que siguen viviendo carreras, competidores y apostadores.
+            version_datos (VersionDatos): si se indica, cuenta los commits de
+                cada fragmento como escrituras y observa los fragmentos que se
+                crean en la carpeta.
+        """
+        self.directorio = directorio
+        self.engine_principal = engine_principal
+        self.version_datos = version_datos
+        self._engines = {}
+        self._sesiones = {}
+        self._lock = threading.Lock()
+        os.makedirs(directorio, exist_ok=True)
+        if version_datos is not None:
+            version_datos.observar_directorio(directorio)
+
+    def ruta(self, nombre_carrera):
+        """Metodo para obtener la ruta del archivo de apuestas de una carrera"""
+        llave = hashlib.sha1(nombre_carrera.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directorio, 'apuestas_{}.sqlite'.format(llave))
+
+    def existe(self, nombre_carrera):
+        """Metodo para saber si una carrera ya tiene archivo de apuestas"""
+        return nombre_carrera in self._engines or os.path.exists(self.ruta(nombre_carrera))
+
+    def _engine(self, nombre_carrera):
+        """
+        Metodo para obtener (creando si es necesario) el motor del fragmento
+        de una carrera.
+        """
+        engine = self._engines.get(nombre_carrera)
+        if engine is None:
+            engine = create_engine('sqlite:///' + self.ruta(nombre_carrera))
+            Apuesta.__table__.create(engine, checkfirst=True)
+            agregar_columnas_faltantes(engine, Apuesta.__table__)
+            VolumenApuestas.__table__.create(engine, checkfirst=True)
+            BaseFragmento.metadata.create_all(engine)
+            if engine.execute(EstadoCarrera.__table__.select()).first() is None:
+                # El estado se copia de la carrera al crear el fragmento
+                abierta = self.engine_principal.execute(select([Carrera.abierta]).where(
+                    Carrera.nombre == nombre_carrera)).scalar()
+                engine.execute(EstadoCarrera.__table__.insert(),
+                               nombre_carrera=nombre_carrera, abierta=bool(abierta))
+            if self.version_datos is not None:
+                self.version_datos.observar(engine)
+            self._engines[nombre_carrera] = engine
+        return engine
+
+    def sesion(self, nombre_carrera):
+        """
+        Metodo para obtener la sesion asociada a una carrera. Las apuestas se
+        leen y escriben en el fragmento de la carrera, junto con su volumen por
+        minuto, el estado y los cambios pendientes; el resto de tablas en la base de datos principal. Cada carrera tiene su propia sesion, por lo que
+        carreras distintas pueden recibir apuestas en paralelo.
+        """
+        with self._lock:
+            sesion = self._sesiones.get(nombre_carrera)
+            if sesion is None:
+                engine = self._engine(nombre_carrera)
+                Session = sessionmaker(bind=self.engine_principal, binds={
+                    Apuesta: engine, VolumenApuestas: engine, EstadoCarrera: engine,
+                    CambioPendiente: engine})
+                sesion = Session()
+                self._sesiones[nombre_carrera] = sesion
+            return sesion
+
+    def expirar(self):
+        """Metodo para descartar los objetos cargados en las sesiones de los fragmentos"""
+        with self._lock:
+            for sesion in self._sesiones.values():
+                sesion.expire_all()
+
+    def eliminar(self, nombre_carrera):
+        """Metodo para eliminar el fragmento de una carrera"""
+        with self._lock:
+            sesion = self._sesiones.pop(nombre_carrera, None)
+            if sesion is not None:
+                sesion.close()
+            engine = self._engines.pop(nombre_carrera, None)
+            if engine is not None:
+                if self.version_datos is not None:
+                    self.version_datos.dejar_de_observar(engine)
+                engine.dispose()
+            if os.path.exists(self.ruta(nombre_carrera)):
+                os.remove(self.ruta(nombre_carrera))
+
+    def cerrar(self):
+        """Metodo para cerrar las sesiones y conexiones de todos los fragmentos"""
+        with self._lock:
+            for sesion in self._sesiones.values():
+                sesion.close()
+            for engine in self._engines.values():
+                if self.version_datos is not None:
+                    self.version_datos.dejar_de_observar(engine)
+                engine.dispose()
+            self._sesiones.clear()
+            self._engines.clear()
@@ -0,0 +1,140 @@
+import contextlib
+import os
+import sqlite3
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+class Instantanea():
+    """
+    Clase encargada de mantener una copia de solo lectura de la base de datos
+    principal para los reportes. La copia se hace con la API de respaldo de
+    SQLite por bloques de paginas, por lo que la base de datos principal solo
+    se bloquea mientras se copia cada bloque y las consultas largas de los
+    reportes nunca bloquean el registro de apuestas.
+    """
+
+    PAGINAS_POR_PASO = 256
+
+    def __init__(self, engine_principal, ruta=None, intervalo=None):
+        """
+        Args:
+            engine_principal (Engine): motor de la base de datos principal.
+            ruta (str): archivo donde se guarda la copia; si es None la copia
+                se mantiene en memoria.
+            intervalo (float): segundos entre actualizaciones automaticas; si
+                es None la copia solo se actualiza al llamar a refrescar.
+        """
+        self.engine_principal = engine_principal
+        self.ruta = ruta
+        self._engine = None
+        self._Session = None
+        # Por cada copia (su motor): sesiones abiertas y ruta del archivo
+        self._copias = {}
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self.refrescar()
+        if intervalo is not None:
+            self._hilo = threading.Thread(target=self._programar, args=(intervalo,), daemon=True)
+            self._hilo.start()
+
+    def _copiar(self, destino):
+        """Metodo para copiar la base de datos principal en la conexion destino"""
+        fuente = self.engine_principal.raw_connection()
+        try:
+            fuente.connection.backup(destino, pages=self.PAGINAS_POR_PASO)
+        finally:
+            fuente.close()
+
+    def refrescar(self):
+        """
+        Metodo para actualizar la copia. La copia nueva se construye aparte y
+        reemplaza a la anterior al terminar; las consultas que ya estaban en
+        curso terminan sobre la copia anterior, que se libera cuando se cierra
+        la ultima de sus sesiones. En archivo, las copias se alternan entre dos
+        rutas para no reemplazar un archivo que sigue abierto; si las dos estan
+        en uso, esta actualizacion se omite.
+        """
+        with self._lock:
+            if self.ruta is None:
+                ruta = None
+                conexion = sqlite3.connect(':memory:', check_same_thread=False)
+                self._copiar(conexion)
+            else:
+                ruta = self._ruta_libre()
+                if ruta is None:
+                    return
+                temporal = ruta + '.tmp'
+                destino = sqlite3.connect(temporal)
+                try:
+                    self._copiar(destino)
+                finally:
+                    destino.close()
+                os.replace(temporal, ruta)
+                conexion = sqlite3.connect('file:{}?mode=ro'.format(ruta), uri=True,
+                                           check_same_thread=False)
+            conexion.execute('PRAGMA query_only=ON')
+            anterior = self._engine
+            self._engine = create_engine('sqlite://', creator=lambda: conexion,
+                                         poolclass=StaticPool)
+            self._Session = sessionmaker(bind=self._engine)
+            self._copias[self._engine] = [0, ruta]
+            if anterior is not None:
+                self._liberar(anterior)
+
+    def _ruta_libre(self):
+        """
+        Metodo para obtener la ruta en la que se puede escribir la copia nueva:
+        una de las dos que se alternan que no tenga una copia abierta.
+        """
+        en_uso = {ruta for _, ruta in self._copias.values()}
+        for ruta in (self.ruta, self.ruta + '.2'):
+            if ruta not in en_uso:
+                return ruta
+        return None
+
+    def _liberar(self, engine):
+        """
+        Metodo para cerrar una copia reemplazada si ya no tiene sesiones
+        abiertas. Se llama con el candado tomado.
+        """
+        if engine is not self._engine and self._copias[engine][0] == 0:
+            del self._copias[engine]
+            engine.dispose()
+
+    def _programar(self, intervalo):
+        """Metodo que actualiza la copia cada intervalo segundos"""
+        while not self._detener.wait(intervalo):
+            self.refrescar()
+
+    @contextlib.contextmanager
+    def sesion(self):
+        """
+        Metodo para obtener una sesion de solo lectura sobre la copia actual.
+        La sesion se cierra al salir del bloque with.
+        """
+        with self._lock:
+            engine = self._engine
+            self._copias[engine][0] += 1
+            sesion = self._Session()
+        try:
+            yield sesion
+        finally:
+            sesion.close()
+            with self._lock:
+                self._copias[engine][0] -= 1
+                self._liberar(engine)
+
+    def cerrar(self):
+        """Metodo para detener las actualizaciones y liberar la copia"""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        with self._lock:
+            for engine in self._copias:
+                engine.dispose()
+            self._copias.clear()
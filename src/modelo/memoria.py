@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class PuntosDeControl():
+    """
+    Clase encargada de hacer durable una base de datos en memoria. Al iniciar
+    se carga el archivo de la base de datos y luego se guarda una copia en el
+    archivo despues de los commits (como maximo una vez cada intervalo) y al
+    cerrar, usando la API de respaldo de SQLite. Las copias se hacen en el hilo
+    que acaba de confirmar, entre llamadas a la logica, y no en un hilo aparte:
+    todas las sesiones comparten la misma conexion, y una copia concurrente
+    podria incluir cambios de una transaccion que otro hilo aun no confirma. Lo
+    que se registre despues del ultimo punto de control se pierde si la
+    aplicacion termina sin cerrar.
+    """
+
+    ESPERA_TRANSACCION = 0.01
+    ESPERA_MAXIMA = 5
+
+    def __init__(self, engine, ruta, intervalo=None):
+        """
+        Args:
+            engine (Engine): motor de la base de datos en memoria (StaticPool).
+            ruta (str): archivo en el que se guarda la base de datos.
+            intervalo (float): segundos minimos entre puntos de control
+                despues de un commit; si es None solo se guarda al llamar a
+                guardar o cerrar.
+        """
+        self.engine = engine
+        self.ruta = ruta
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._ultimo = time.monotonic()
+
+    def cargar(self):
+        """Metodo para copiar el archivo, si existe, a la base de datos en memoria"""
+        if not os.path.exists(self.ruta):
+            return
+        fuente = sqlite3.connect(self.ruta)
+        destino = self.engine.raw_connection()
+        try:
+            fuente.backup(destino.connection)
+        finally:
+            destino.close()
+            fuente.close()
+
+    def despues_de_commit(self, sesion):
+        """
+        Metodo que se registra como evento after_commit de las sesiones de la
+        logica: guarda un punto de control si ya paso el intervalo desde el
+        anterior.
+        """
+        if self.intervalo is not None and time.monotonic() - self._ultimo >= self.intervalo:
+            self.guardar()
+
+    def guardar(self):
+        """
+        Metodo para guardar un punto de control. Si la conexion compartida
+        tiene una transaccion abierta se espera a que termine, como maximo
+        ESPERA_MAXIMA segundos. La copia se escribe en un archivo temporal que
+        reemplaza al anterior al terminar.
+        """
+        with self._lock:
+            fuente = self.engine.raw_connection()
+            try:
+                limite = time.monotonic() + self.ESPERA_MAXIMA
+                while fuente.connection.in_transaction:
+                    if time.monotonic() >= limite:
+                        raise TimeoutError(
+                            "No se pudo guardar el punto de control: hay una transaccion abierta")
+                    time.sleep(self.ESPERA_TRANSACCION)
+                temporal = self.ruta + '.tmp'
+                destino = sqlite3.connect(temporal)
+                try:
+                    fuente.connection.backup(destino)
+                finally:
+                    destino.close()
+                os.replace(temporal, self.ruta)
+                self._ultimo = time.monotonic()
+            finally:
+                fuente.close()
+
+    def cerrar(self):
+        """Metodo para guardar el ultimo punto de control"""
+        self.guardar()
@@ -0,0 +1,355 @@
+import os
+
+from sqlalchemy import create_engine
+
+from .busqueda import normalizar
+from .declarative_base import Base
+
+
+def _dinero_en_centavos(conexion):
+    """
+    Paso 1: los valores monetarios pasan de Numeric (punto flotante en SQLite)
+    a enteros en centavos.
+    """
+    conexion.execute(
+        "UPDATE apuesta SET valor = CAST(ROUND(valor * 100) AS INTEGER), "
+        "ganancia = CAST(ROUND(ganancia * 100) AS INTEGER)")
+    conexion.execute(
+        "UPDATE carrera SET ganancia = CAST(ROUND(ganancia * 100) AS INTEGER)")
+
+
+def _cuotas_competidor(conexion):
+    """
+    Paso 2: la cuota y el multiplicador de pago se guardan en el competidor.
+    """
+    conexion.execute("ALTER TABLE competidor ADD COLUMN cuota NUMERIC")
+    conexion.execute("ALTER TABLE competidor ADD COLUMN multiplicador NUMERIC")
+    conexion.execute(
+        "UPDATE competidor SET cuota = probabilidad / (1.0 - probabilidad), "
+        "multiplicador = 1.0 / probabilidad "
+        "WHERE probabilidad > 0 AND probabilidad < 1")
+
+
+def _estadisticas_apostador(conexion):
+    """
+    Paso 3: se calcula el resumen de cada apostador a partir de sus apuestas.
+    """
+    conexion.execute(
+        "INSERT INTO estadistica_apostador (nombre_apostador, numero_apuestas, "
+        "total_apostado, total_ganado, carreras_jugadas) "
+        "SELECT apostador.nombre, COUNT(apuesta.id), COALESCE(SUM(apuesta.valor), 0), "
+        "COALESCE(SUM(apuesta.ganancia), 0), COUNT(DISTINCT apuesta.nombre_carrera) "
+        "FROM apostador LEFT JOIN apuesta ON apuesta.nombre_apostador = apostador.nombre "
+        "GROUP BY apostador.nombre")
+
+
+def _tablas_de_posiciones(conexion):
+    """
+    Paso 4: totales apostados por competidor e indices para las tablas de
+    posiciones.
+    """
+    conexion.execute("ALTER TABLE competidor ADD COLUMN numero_apuestas INTEGER DEFAULT 0")
+    conexion.execute("ALTER TABLE competidor ADD COLUMN total_apostado INTEGER DEFAULT 0")
+    conexion.execute(
+        "UPDATE competidor SET "
+        "numero_apuestas = (SELECT COUNT(*) FROM apuesta WHERE apuesta.nombre_carrera = "
+        "competidor.nombre_carrera AND apuesta.nombre_competidor = competidor.nombre), "
+        "total_apostado = (SELECT COALESCE(SUM(valor), 0) FROM apuesta WHERE apuesta.nombre_carrera = "
+        "competidor.nombre_carrera AND apuesta.nombre_competidor = competidor.nombre)")
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_competidor_carrera_apostado "
+        "ON competidor (nombre_carrera, total_apostado DESC)")
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_estadistica_apostador_ganado "
+        "ON estadistica_apostador (total_ganado DESC, nombre_apostador)")
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_estadistica_apostador_apostado "
+        "ON estadistica_apostador (total_apostado DESC, nombre_apostador)")
+
+
+def _nombres_normalizados(conexion):
+    """
+    Paso 5: nombres normalizados e indices para la busqueda por prefijo.
+    """
+    for tabla in ('apostador', 'carrera', 'competidor'):
+        conexion.execute("ALTER TABLE {} ADD COLUMN nombre_normalizado VARCHAR".format(tabla))
+        nombres = [n for (n,) in conexion.execute("SELECT DISTINCT nombre FROM {}".format(tabla))]
+        for nombre in nombres:
+            conexion.execute(
+                "UPDATE {} SET nombre_normalizado = ? WHERE nombre = ?".format(tabla),
+                (normalizar(nombre), nombre))
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_apostador_nombre_normalizado "
+        "ON apostador (nombre_normalizado)")
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_carrera_nombre_normalizado "
+        "ON carrera (nombre_normalizado)")
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_competidor_carrera_nombre "
+        "ON competidor (nombre_carrera, nombre_normalizado)")
+
+
+def _indice_apuestas_carrera(conexion):
+    """
+    Paso 6: indice de las apuestas por carrera y apostador.
+    """
+    conexion.execute(
+        "CREATE INDEX IF NOT EXISTS ix_apuesta_carrera_apostador "
+        "ON apuesta (nombre_carrera, nombre_apostador)")
+
+
+def _llaves_en_cascada(conexion):
+    """
+    Paso 7: las llaves foraneas borran en cascada y la apuesta apunta al
+    competidor por su llave completa (nombre y carrera). La tabla se crea con
+    el indice unico del paso 8, por lo que antes se renombran los repetidos.
+    """
+    renombrados = _renombrar_competidores_repetidos(conexion)
+    _reconstruir_tablas(conexion, ('competidor', 'apuesta', 'estadistica_apostador'))
+    return renombrados
+
+
+def _reconstruir_tablas(conexion, nombres):
+    """
+    Funcion para llevar tablas existentes a su definicion actual. SQLite no
+    permite cambiar las llaves ni las restricciones de una tabla, por lo que se
+    crea la tabla con la definicion actual y se copian sus datos.
+    """
+    # Evita que el RENAME reescriba las referencias de las otras tablas
+    conexion.execute("PRAGMA legacy_alter_table=ON")
+    for nombre in nombres:
+        tabla = Base.metadata.tables[nombre]
+        columnas = [fila[1] for fila in conexion.execute("PRAGMA table_info({})".format(nombre))
+                    if fila[1] in tabla.c]
+        for indice in tabla.indexes:
+            conexion.execute("DROP INDEX IF EXISTS {}".format(indice.name))
+        conexion.execute("ALTER TABLE {0} RENAME TO {0}_anterior".format(nombre))
+        tabla.create(conexion)
+        # En orden de rowid, que es el orden de creacion de los competidores
+        conexion.execute("INSERT INTO {0} ({1}) SELECT {1} FROM {0}_anterior ORDER BY rowid".format(
+            nombre, ', '.join(columnas)))
+        conexion.execute("DROP TABLE {}_anterior".format(nombre))
+    conexion.execute("PRAGMA legacy_alter_table=OFF")
+
+
+def _nombre_competidor_unico(conexion):
+    """
+    Paso 8: indice unico sobre el nombre del competidor, que respalda la
+    validacion de nombres repetidos al guardar una carrera.
+    """
+    renombrados = _renombrar_competidores_repetidos(conexion)
+    conexion.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_competidor_nombre ON competidor (nombre)")
+    return renombrados
+
+
+def _renombrar_competidores_repetidos(conexion):
+    """
+    Funcion para que el nombre del competidor sea unico en una base de datos en
+    la que solo lo era dentro de cada carrera. El competidor de la primera
+    carrera (en orden alfabetico) conserva el nombre y los demas pasan a
+    llamarse 'Nombre (Carrera)', junto con sus apuestas. Las apuestas guardadas
+    en fragmentos las renombra migrar con _renombrar_en_fragmentos.
+
+    Returns:
+        list: tuplas (carrera, nombre anterior, nombre nuevo).
+    """
+    repetidos = conexion.execute(
+        "SELECT nombre, nombre_carrera FROM competidor WHERE nombre IN "
+        "(SELECT nombre FROM competidor GROUP BY nombre HAVING COUNT(*) > 1) "
+        "ORDER BY nombre, nombre_carrera").fetchall()
+    usados = {nombre for (nombre,) in conexion.execute("SELECT nombre FROM competidor")}
+    anterior = None
+    renombrados = []
+    for nombre, carrera in repetidos:
+        if nombre != anterior:
+            anterior = nombre
+            continue
+        nuevo = _nombre_disponible(nombre, carrera, usados)
+        usados.add(nuevo)
+        conexion.execute(
+            "UPDATE competidor SET nombre = ?, nombre_normalizado = ? "
+            "WHERE nombre = ? AND nombre_carrera = ?",
+            (nuevo, normalizar(nuevo), nombre, carrera))
+        conexion.execute(
+            "UPDATE apuesta SET nombre_competidor = ? "
+            "WHERE nombre_competidor = ? AND nombre_carrera = ?", (nuevo, nombre, carrera))
+        renombrados.append((carrera, nombre, nuevo))
+    return renombrados
+
+
+def _renombrar_en_fragmentos(directorio, renombrados):
+    """
+    Funcion para llevar los competidores renombrados a los fragmentos de una
+    carpeta: las apuestas de la carrera y los cambios pendientes del fragmento
+    de la carrera. Cada fragmento se actualiza en su propia transaccion, antes
+    de confirmar la migracion de la base de datos principal; si esta falla, al
+    repetirla se obtienen los mismos nombres y los fragmentos ya renombrados no
+    cambian.
+    """
+    if not os.path.isdir(directorio):
+        return
+    for archivo in sorted(os.listdir(directorio)):
+        if not (archivo.startswith('apuestas_') and archivo.endswith('.sqlite')):
+            continue
+        engine = create_engine('sqlite:///' + os.path.join(directorio, archivo))
+        try:
+            with engine.begin() as conexion:
+                tablas = {nombre for (nombre,) in conexion.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'")}
+                carrera_fragmento = conexion.execute(
+                    "SELECT nombre_carrera FROM estado_carrera").scalar() \
+                    if 'estado_carrera' in tablas else None
+                for carrera, nombre, nuevo in renombrados:
+                    if 'apuesta' in tablas:
+                        conexion.execute(
+                            "UPDATE apuesta SET nombre_competidor = ? "
+                            "WHERE nombre_competidor = ? AND nombre_carrera = ?",
+                            (nuevo, nombre, carrera))
+                    if 'cambio_pendiente' in tablas and carrera == carrera_fragmento:
+                        conexion.execute(
+                            "UPDATE cambio_pendiente SET nombre_competidor = ? "
+                            "WHERE nombre_competidor = ?", (nuevo, nombre))
+        finally:
+            engine.dispose()
+
+
+def _nombre_disponible(nombre, carrera, usados):
+    """
+    Funcion para obtener un nombre 'Nombre (Carrera)' que no este en usados, de
+    hasta 200 caracteres; si hace falta se agrega un numero.
+    """
+    numero = 1
+    while True:
+        sufijo = ' ({})'.format(carrera[:60]) if numero == 1 else \
+            ' ({} {})'.format(carrera[:60], numero)
+        nuevo = nombre[:200 - len(sufijo)] + sufijo
+        if nuevo not in usados:
+            return nuevo
+        numero += 1
+
+
+def _agregar_columna(conexion, tabla, columna, tipo):
+    """
+    Funcion para agregar una columna si la tabla no la tiene. Las tablas que
+    reconstruyen los pasos 7 y 10 ya se crean con todas las columnas actuales.
+    """
+    columnas = [fila[1] for fila in conexion.execute("PRAGMA table_info({})".format(tabla))]
+    if columna not in columnas:
+        conexion.execute("ALTER TABLE {} ADD COLUMN {} {}".format(tabla, columna, tipo))
+
+
+def _fecha_liquidacion(conexion):
+    """
+    Paso 9: fecha de liquidacion de la carrera. Las carreras terminadas que ya
+    tienen reporte de ganancias se dan por liquidadas.
+    """
+    _agregar_columna(conexion, 'carrera', 'fecha_liquidacion', 'DATETIME')
+    conexion.execute(
+        "UPDATE carrera SET fecha_liquidacion = CURRENT_TIMESTAMP "
+        "WHERE abierta = 0 AND ganancia IS NOT NULL")
+
+
+def _restricciones_check(conexion):
+    """
+    Paso 10: restricciones CHECK sobre los nombres, la probabilidad del
+    competidor y el valor de la apuesta. Si hay datos que no las cumplen la
+    migracion falla y la base de datos queda como estaba.
+    """
+    _reconstruir_tablas(conexion, ('carrera', 'apostador', 'competidor', 'apuesta'))
+
+
+def _fecha_apuesta(conexion):
+    """
+    Paso 11: fecha de registro de la apuesta. Las apuestas anteriores quedan
+    sin fecha y no cuentan en el volumen por minuto.
+    """
+    _agregar_columna(conexion, 'apuesta', 'fecha', 'DATETIME')
+
+
+def _cambios_consolidados(conexion):
+    """
+    Paso 12: ultimo cambio pendiente del fragmento de la carrera que ya se sumo
+    a los resumenes de apostadores y competidores.
+    """
+    _agregar_columna(conexion, 'carrera', 'cambios_consolidados', 'INTEGER DEFAULT 0')
+
+
+def _restricciones_de_nombres(conexion):
+    """
+    Paso 13: las restricciones de nombre vacio y de nombre largo de carreras y
+    competidores se separan, para reportar cada una con su mensaje.
+    """
+    _reconstruir_tablas(conexion, ('carrera', 'competidor'))
+
+
+def _sin_cuota(conexion):
+    """
+    Paso 14: la cuota (probabilidad / (1 - probabilidad)) no se usaba; la
+    cuota que se muestra es el multiplicador de pago.
+    """
+    _reconstruir_tablas(conexion, ('competidor',))
+
+
+def agregar_columnas_faltantes(engine, tabla):
+    """
+    Funcion para agregar a una tabla de un archivo secundario (fragmentos,
+    archivo de carreras), que no tiene version de esquema, las columnas que se
+    han agregado al modelo despues de crearla.
+    """
+    columnas = [fila[1] for fila in engine.execute('PRAGMA table_info({})'.format(tabla.name))]
+    for columna in tabla.c:
+        if columna.name not in columnas:
+            engine.execute('ALTER TABLE {} ADD COLUMN {} {}'.format(
+                tabla.name, columna.name, columna.type.compile(engine.dialect)))
+
+
+PASOS = [
+    (1, _dinero_en_centavos),
+    (2, _cuotas_competidor),
+    (3, _estadisticas_apostador),
+    (4, _tablas_de_posiciones),
+    (5, _nombres_normalizados),
+    (6, _indice_apuestas_carrera),
+    (7, _llaves_en_cascada),
+    (8, _nombre_competidor_unico),
+    (9, _fecha_liquidacion),
+    (10, _restricciones_check),
+    (11, _fecha_apuesta),
+    (12, _cambios_consolidados),
+    (13, _restricciones_de_nombres),
+    (14, _sin_cuota),
+]
+
+VERSION = PASOS[-1][0]
+
+
+def migrar(engine, metadata, directorio_fragmentos=None):
+    """
+    Funcion para crear el esquema y llevar una base de datos existente a la
+    version actual. La version se guarda en PRAGMA user_version; las bases de
+    datos nuevas se marcan directamente con la ultima version. Las tablas que
+    faltan se crean antes de aplicar los pasos, las existentes conservan su
+    estructura anterior hasta que un paso la modifica. Las llaves foraneas se
+    desactivan mientras se aplican los pasos, que pueden reconstruir tablas.
+    Los pasos que renombran competidores retornan los renombrados, que tambien
+    se renombran en los fragmentos de directorio_fragmentos si se indica.
+    """
+    existente = engine.has_table('apuesta')
+    metadata.create_all(engine)
+    with engine.connect() as conexion:
+        # Solo tiene efecto fuera de una transaccion
+        conexion.execute('PRAGMA foreign_keys=OFF')
+        try:
+            with conexion.begin():
+                version = conexion.execute('PRAGMA user_version').scalar()
+                renombrados = []
+                if existente:
+                    for numero, paso in PASOS:
+                        if numero > version:
+                            renombrados.extend(paso(conexion) or [])
+                if renombrados and directorio_fragmentos is not None:
+                    _renombrar_en_fragmentos(directorio_fragmentos, renombrados)
+                conexion.execute('PRAGMA user_version = {}'.format(VERSION))
+        finally:
+            conexion.execute('PRAGMA foreign_keys=ON')
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import threading
+
+from sqlalchemy import event
+
+
+class VersionDatos():
+    """
+    Clase encargada de detectar, sin consultar las tablas, si la base de datos
+    principal o alguno de los archivos observados (fragmentos y archivo de
+    carreras) cambio. Por cada archivo, una conexion propia de solo lectura
+    lee PRAGMA data_version, que SQLite incrementa cuando otra conexion (de
+    esta u otra terminal) confirma una escritura en ese archivo; la lectura
+    cuesta microsegundos. PRAGMA data_version solo cubre el archivo de su
+    conexion, por lo que de las carpetas observadas (la de los fragmentos) se
+    lista ademas que archivos existen: un fragmento que otra terminal crea
+    cambia la version aunque esta logica no lo haya abierto, y al consultarlo
+    se abre y se observa. Las escrituras confirmadas por los motores de la
+    logica se cuentan aparte, ya que en modo en memoria no hay otra conexion
+    que las observe.
+    """
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine (Engine): motor de la base de datos principal.
+        """
+        self.engine = engine
+        self._engines = []
+        self._conexiones = {}
+        self._directorios = []
+        self._escrituras = 0
+        self._lock = threading.Lock()
+        self.observar(engine)
+
+    def observar(self, engine):
+        """
+        Metodo para incluir otro motor: se cuentan sus commits y, si es un
+        archivo SQLite, se observa su PRAGMA data_version.
+        """
+        event.listen(engine, 'commit', self._registrar_escritura)
+        self._engines.append(engine)
+        ruta = engine.url.database
+        if engine.dialect.name == 'sqlite' and ruta and ruta != ':memory:':
+            conexion = sqlite3.connect('file:{}?mode=ro'.format(ruta), uri=True,
+                                       check_same_thread=False)
+            with self._lock:
+                self._conexiones[engine] = conexion
+
+    def observar_directorio(self, directorio, extension='.sqlite'):
+        """
+        Metodo para incluir en la version los archivos con la extension que
+        existen en una carpeta, de modo que crear o borrar uno la cambie.
+        """
+        self._directorios.append((directorio, extension))
+
+    def dejar_de_observar(self, engine):
+        """Metodo para dejar de observar un motor, antes de borrar su archivo"""
+        if engine not in self._engines:
+            return
+        event.remove(engine, 'commit', self._registrar_escritura)
+        self._engines.remove(engine)
+        with self._lock:
+            conexion = self._conexiones.pop(engine, None)
+            if conexion is not None:
+                conexion.close()
+
+    def _registrar_escritura(self, conexion):
+        """Metodo que cuenta cada commit hecho con el motor de la logica"""
+        self._escrituras += 1
+
+    def actual(self):
+        """
+        Metodo para obtener la version de los datos. Dos llamadas retornan lo
+        mismo solo si entre ellas nadie confirmo escrituras en los archivos
+        observados.
+        """
+        with self._lock:
+            versiones = tuple(conexion.execute('PRAGMA data_version').fetchone()[0]
+                              for conexion in self._conexiones.values())
+        archivos = tuple(frozenset(nombre for nombre in os.listdir(directorio)
+                                   if nombre.endswith(extension))
+                         for directorio, extension in self._directorios)
+        return (versiones, archivos, self._escrituras)
+
+    def cerrar(self):
+        """Metodo para liberar las conexiones de observacion"""
+        for engine in self._engines:
+            event.remove(engine, 'commit', self._registrar_escritura)
+        self._engines = []
+        self._directorios = []
+        with self._lock:
+            for conexion in self._conexiones.values():
+                conexion.close()
+            self._conexiones = {}
@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+
+from .declarative_base import Base
+from .dinero import Dinero
+
+
+# Ventana mas larga (en minutos) que se consulta; los intervalos mas antiguos
+# se borran
+MINUTOS_VOLUMEN = 60
+
+
+def minuto(fecha):
+    """Funcion para obtener el minuto (intervalo del volumen) de una fecha"""
+    return fecha.replace(second=0, microsecond=0)
+
+
+def inicio_ventana(ahora, minutos):
+    """
+    Funcion para obtener el primer minuto de una ventana que termina en ahora
+    (incluyendo el minuto en curso), de a lo sumo MINUTOS_VOLUMEN minutos.
+    """
+    return minuto(ahora) - timedelta(minutes=min(minutos, MINUTOS_VOLUMEN) - 1)
+
+
+class VolumenApuestas(Base):
+    """
+    Apuestas recibidas en cada minuto por cada competidor de una carrera. Se
+    mantiene de forma incremental al crear, editar y eliminar apuestas, para
+    consultar el volumen reciente sin recorrer la tabla de apuestas. La llave
+    (carrera, minuto, competidor) permite leer una ventana de tiempo como un
+    rango del indice. Se guarda junto a las apuestas (en modo fragmentado, en
+    el fragmento de la carrera) y solo se conservan los intervalos con
+    apuestas de los ultimos MINUTOS_VOLUMEN minutos.
+    """
+    __tablename__ = 'volumen_apuestas'
+
+    nombre_carrera = Column(String, ForeignKey('carrera.nombre', ondelete='CASCADE'),
+                            primary_key=True)
+    minuto = Column(DateTime, primary_key=True)
+    nombre_competidor = Column(String, primary_key=True)
+    numero_apuestas = Column(Integer, default=0)
+    total_apostado = Column(Dinero, default=0)
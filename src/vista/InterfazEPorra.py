@@ -1,3 +1,6 @@
+from functools import wraps
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
 from .Vista_lista_carreras import Vista_lista_carreras
@@ -5,6 +8,22 @@ from .Vista_lista_apostadores import Vista_lista_apostadores
 from .Vista_carrera import Vista_carrera
 from .Vista_lista_apuestas import Vista_lista_apuestas
 from .Vista_reporte_ganancias import Vista_reporte_ganancias
+from .gestor_vistas import GestorVistas
+from .vigilancia import LogicaVigilada
+
+
+def _vista(metodo):
+    """
+    Decorador de las funciones que reconstruyen una vista, para medirlas como
+    acciones del vigilante (vista.<funcion>) cuando hay uno.
+    """
+    @wraps(metodo)
+    def medir(self, *args, **kwargs):
+        if self.vigilante is None:
+            return metodo(self, *args, **kwargs)
+        with self.vigilante.accion('vista.' + metodo.__name__):
+            return metodo(self, *args, **kwargs)
+    return medir
 
 
 class App_EPorra(QApplication):
@@ -12,21 +31,61 @@ class App_EPorra(QApplication):
     Clase principal de la interfaz que coordina las diferentes vistas/ventanas de la aplicación
     """
 
-    def __init__(self, sys_argv, logica):
+    def __init__(self, sys_argv, logica, vigilante=None, intervalo_refresco=1000):
         """
         Constructor de la interfaz. Debe recibir la lógica e iniciar la aplicación en la ventana principal.
+        Si recibe un vigilante, el bucle de eventos le envía latidos y se miden las llamadas a la lógica
+        y las reconstrucciones de vistas. Cada intervalo_refresco milisegundos se revisa si otra terminal
+        cambió los datos para actualizar las listas abiertas.
         """
         super(App_EPorra, self).__init__(sys_argv)
 
+        self.vigilante = vigilante
+        if vigilante is not None:
+            logica = LogicaVigilada(logica, vigilante)
+            self.temporizador_vigilancia = QTimer(self)
+            self.temporizador_vigilancia.timeout.connect(vigilante.latido)
+            self.temporizador_vigilancia.start(vigilante.intervalo)
+            self.aboutToQuit.connect(vigilante.cerrar)
+            vigilante.iniciar()
         self.logica = logica
+        self.vistas = GestorVistas(self)
         self.mostrar_vista_lista_carreras()
 
+        self.version_datos = self.logica.dar_version_datos()
+        if self.version_datos is not None:
+            self.temporizador_refresco = QTimer(self)
+            self.temporizador_refresco.timeout.connect(self.refrescar_vistas_abiertas)
+            self.temporizador_refresco.start(intervalo_refresco)
+
+    def refrescar_vistas_abiertas(self):
+        """
+        Esta función actualiza las listas abiertas si los datos cambiaron desde la última revisión.
+        Mientras nadie escribe solo se consulta la versión de los datos; las ventanas solo se
+        reconstruyen si sus datos son distintos de los que muestran.
+        """
+        version = self.logica.dar_version_datos()
+        if version == self.version_datos:
+            return
+        self.version_datos = version
+        if self.vistas.abierta(Vista_lista_carreras):
+            self.vistas.refrescar(
+                Vista_lista_carreras, 'mostrar_carreras', self.logica.dar_carreras())
+        if self.vistas.abierta(Vista_lista_apostadores):
+            self.vistas.refrescar(
+                Vista_lista_apostadores, 'mostrar_apostadores', self.logica.dar_apostadores())
+        if self.vistas.abierta(Vista_lista_apuestas):
+            self.vistas.refrescar(
+                Vista_lista_apuestas, 'mostrar_apuestas',
+                self.carrera_actual, self.logica.dar_apuestas_carrera(self.carrera_actual))
+
+    @_vista
     def mostrar_vista_lista_carreras(self):
         """
         Esta función inicializa la ventana de la lista de carreras
         """
-        self.vista_lista_carreras = Vista_lista_carreras(self)
-        self.vista_lista_carreras.mostrar_carreras(self.logica.dar_carreras())
+        self.vista_lista_carreras = self.vistas.mostrar(
+            Vista_lista_carreras, 'mostrar_carreras', self.logica.dar_carreras())
 
     def guardar_carrera(self, nombre, competidores):
         """
@@ -35,7 +94,8 @@ class App_EPorra(QApplication):
         nueva_carrera = self.carrera_actual is None
         self.logica.guardar_cambios_carrera(
             nombre, competidores, nueva_carrera)
-        self.vista_lista_carreras.mostrar_carreras(self.logica.dar_carreras())
+        self.vistas.refrescar(
+            Vista_lista_carreras, 'mostrar_carreras', self.logica.dar_carreras())
 
     def dar_competidor(self, id_competidor):
         """
@@ -69,24 +129,24 @@ class App_EPorra(QApplication):
         Esta función inserta un apostador a la aplicación
         """
         self.logica.aniadir_apostador(nombre)
-        self.vista_lista_apostadores.mostrar_apostadores(
-            self.logica.dar_apostadores())
+        self.vistas.refrescar(
+            Vista_lista_apostadores, 'mostrar_apostadores', self.logica.dar_apostadores())
 
     def editar_apostador(self, id, nombre):
         """
         Esta función edita la información de un apostador
         """
         self.logica.editar_apostador(id, nombre)
-        self.vista_lista_apostadores.mostrar_apostadores(
-            self.logica.dar_apostadores())
+        self.vistas.refrescar(
+            Vista_lista_apostadores, 'mostrar_apostadores', self.logica.dar_apostadores())
 
+    @_vista
     def mostrar_apostadores(self):
         """
         Esta función muestra la ventana con la lista de apostadores
         """
-        self.vista_lista_apostadores = Vista_lista_apostadores(self)
-        self.vista_lista_apostadores.mostrar_apostadores(
-            self.logica.dar_apostadores())
+        self.vista_lista_apostadores = self.vistas.mostrar(
+            Vista_lista_apostadores, 'mostrar_apostadores', self.logica.dar_apostadores())
 
     def dar_apostadores(self):
         """
@@ -94,19 +154,33 @@ class App_EPorra(QApplication):
         """
         return self.logica.dar_apostadores()
 
+    def buscar_apostadores(self, prefijo):
+        """
+        Esta función retorna los apostadores cuyo nombre empieza por el prefijo
+        """
+        return self.logica.buscar_apostadores(prefijo)
+
+    def buscar_competidores(self, prefijo):
+        """
+        Esta función retorna los competidores de la carrera actual cuyo nombre
+        empieza por el prefijo
+        """
+        return self.logica.buscar_competidores(self.carrera_actual, prefijo)
+
     def dar_competidores(self):
         """
         Esta función retorna la lista de competidores
         """
         return self.logica.dar_competidores_carrera(self.carrera_actual)
 
+    @_vista
     def mostrar_apuestas(self, id_carrera):
         """
         Esta función muestra las apuestas de una carrera
         """
         self.carrera_actual = id_carrera
-        self.vista_lista_apuestas = Vista_lista_apuestas(self)
-        self.vista_lista_apuestas.mostrar_apuestas(
+        self.vista_lista_apuestas = self.vistas.mostrar(
+            Vista_lista_apuestas, 'mostrar_apuestas',
             self.carrera_actual, self.logica.dar_apuestas_carrera(id_carrera))
 
     def dar_apuesta(self, id_apuesta):
@@ -121,7 +195,8 @@ class App_EPorra(QApplication):
         """
         self.logica.crear_apuesta(
             apostador, self.carrera_actual, valor, competidor)
-        self.vista_lista_apuestas.mostrar_apuestas(
+        self.vistas.refrescar(
+            Vista_lista_apuestas, 'mostrar_apuestas',
             self.carrera_actual, self.logica.dar_apuestas_carrera(self.carrera_actual))
 
     def editar_apuesta(self, id_apuesta, competidor, valor, apostador):
@@ -130,7 +205,9 @@ class App_EPorra(QApplication):
         """
         nombre_carrera = self.logica.dar_carrera(self.carrera_actual).nombre
         valor = self.logica.editar_apuesta(id_apuesta, apostador, nombre_carrera, valor, competidor)
-        self.vista_lista_apuestas.mostrar_apuestas(nombre_carrera, self.logica.dar_apuestas_carrera(self.carrera_actual))
+        self.vistas.refrescar(
+            Vista_lista_apuestas, 'mostrar_apuestas',
+            nombre_carrera, self.logica.dar_apuestas_carrera(self.carrera_actual))
         if valor is False:
             self.mostrar_mensaje_error("El valor de la apuesta debe ser igual a un número positivo (mayor a uno)")
         
@@ -140,10 +217,11 @@ class App_EPorra(QApplication):
         """
         resultado = self.logica.eliminar_carrera(indice_carrera)
         if resultado:
-            self.vista_lista_carreras.mostrar_carreras(
-                self.logica.dar_carreras())
+            self.vistas.refrescar(
+                Vista_lista_carreras, 'mostrar_carreras', self.logica.dar_carreras())
         return resultado;
 
+    @_vista
     def mostrar_reporte_ganancias(self, nombre_ganador):
         """
         Esta función muestra el reporte de ganancias para una carrera con apuestas
@@ -152,17 +230,16 @@ class App_EPorra(QApplication):
 
         lista_ganancias, ganancias_casa = self.logica.dar_reporte_ganancias(
             self.carrera_actual, nombre_ganador)
-        self.vista_reporte_ganancias = Vista_reporte_ganancias(self)
-        self.vista_reporte_ganancias.mostrar_ganancias(
-            lista_ganancias, ganancias_casa)
+        self.vista_reporte_ganancias = self.vistas.mostrar(
+            Vista_reporte_ganancias, 'mostrar_ganancias', lista_ganancias, ganancias_casa)
 
-    def eliminar_apostador(self, id_apostador):
+    def eliminar_apostador(self, nombre_apostador):
         """
         Esta función elimina un apostador
         """
-        self.logica.eliminar_apostador(id_apostador)
-        self.vista_lista_apostadores.mostrar_apostadores(
-            self.logica.dar_apostadores())
+        self.logica.eliminar_apostador(nombre_apostador)
+        self.vistas.refrescar(
+            Vista_lista_apostadores, 'mostrar_apostadores', self.logica.dar_apostadores())
 
     def eliminar_apuesta(self, id_apuesta):
         """
@@ -171,22 +248,25 @@ class App_EPorra(QApplication):
         resultado = self.logica.eliminar_apuesta(
             self.carrera_actual, id_apuesta)
         print(resultado)
-        nombre_carrera = self.logica.dar_carrera(self.carrera_actual)['Nombre']
-        self.vista_lista_apuestas.mostrar_apuestas(
-            nombre_carrera, self.logica.dar_apuestas_carrera(self.carrera_actual))
+        self.vistas.refrescar(
+            Vista_lista_apuestas, 'mostrar_apuestas',
+            self.carrera_actual, self.logica.dar_apuestas_carrera(self.carrera_actual))
 
+    @_vista
     def mostrar_carrera(self, id_carrera=None):
         """
         Esta función muestra una carrera en la ventana de carreras
         """
         self.carrera_actual = id_carrera
+        # La ventana se reutiliza pero siempre se puebla: descarta los cambios sin guardar
         if id_carrera is not None:
-            self.vista_carrera = Vista_carrera(self)
-            self.vista_carrera.mostrar_competidores(
-                self.carrera_actual, self.logica.dar_competidores_carrera(self.carrera_actual))
+            self.vista_carrera = self.vistas.mostrar(
+                Vista_carrera, 'mostrar_competidores',
+                self.carrera_actual, self.logica.dar_competidores_carrera(self.carrera_actual),
+                forzar=True)
         else:
-            self.vista_carrera = Vista_carrera(self)
-            self.vista_carrera.mostrar_competidores('', [])
+            self.vista_carrera = self.vistas.mostrar(
+                Vista_carrera, 'mostrar_competidores', '', [], forzar=True)
 
     def aniadir_competidor(self, nombre, probabilidad):
         """
@@ -195,8 +275,9 @@ class App_EPorra(QApplication):
         self.logica.aniadir_competidor(
             self.carrera_actual, nombre, probabilidad)
         nombre_carrera = self.logica.dar_carrera(self.carrera_actual)['Nombre']
-        self.vista_carrera.mostrar_competidores(
-            nombre_carrera, self.logica.dar_competidores_carrera(self.carrera_actual))
+        self.vistas.refrescar(
+            Vista_carrera, 'mostrar_competidores',
+            nombre_carrera, self.logica.dar_competidores_carrera(self.carrera_actual), forzar=True)
 
     def mostrar_mensaje_error(self, mensaje):
         """
@@ -4,6 +4,7 @@ from PyQt5.QtCore import *
 
 from functools import partial
 from .Vista_crear_competidor import Dialogo_crear_competidor
+from .recursos import icono
 
 
 class Vista_carrera(QWidget):
@@ -16,14 +17,12 @@ class Vista_carrera(QWidget):
         super().__init__()
 
         self.titulo = ''
-        self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.interfaz=principal            
 
         self.width = 720
         self.height = 550
         self.inicializar_GUI()
-        self.show()
        
 
     def inicializar_GUI(self):
@@ -31,7 +30,7 @@ class Vista_carrera(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.distribuidor_base = QVBoxLayout(self)
 
@@ -71,9 +70,13 @@ class Vista_carrera(QWidget):
         etiqueta_fecha.setFont(QFont("Times",weight=QFont.Bold)) 
         self.distribuidor_actividades.addWidget(etiqueta_fecha, 0, 1, Qt.AlignCenter|Qt.AlignTop)
 
+        etiqueta_cuota = QLabel("Cuota")
+        etiqueta_cuota.setFont(QFont("Times",weight=QFont.Bold)) 
+        self.distribuidor_actividades.addWidget(etiqueta_cuota, 0, 2, Qt.AlignCenter|Qt.AlignTop)
+
         etiqueta_accion = QLabel("Acciones")
         etiqueta_accion.setFont(QFont("Times",weight=QFont.Bold)) 
-        self.distribuidor_actividades.addWidget(etiqueta_accion, 0, 2, 0, 2, alignment=Qt.AlignCenter|Qt.AlignTop)
+        self.distribuidor_actividades.addWidget(etiqueta_accion, 0, 3, 0, 2, alignment=Qt.AlignCenter|Qt.AlignTop)
 
         #Creación de la caja con los botones
         self.widget_botones = QWidget()
@@ -85,21 +88,21 @@ class Vista_carrera(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(200, 40)
         self.btn_volver.setToolTip("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(icono("007-back-button.png"))
         self.distribuidor_botones.addWidget(self.btn_volver, 0, 0, Qt.AlignCenter)
         self.btn_volver.clicked.connect(self.volver)
 
         self.btn_aniadir_competidor = QPushButton("Añadir competidor", self)
         self.btn_aniadir_competidor.setFixedSize(200, 40)
         self.btn_aniadir_competidor.setToolTip("Añadir competidor")
-        self.btn_aniadir_competidor.setIcon(QIcon("src/recursos/003-multiple-users-silhouette.png"))
+        self.btn_aniadir_competidor.setIcon(icono("003-multiple-users-silhouette.png"))
         self.distribuidor_botones.addWidget(self.btn_aniadir_competidor, 0, 1, Qt.AlignCenter)
         self.btn_aniadir_competidor.clicked.connect(self.aniadir_competidor)
 
         self.btn_guardar_carrera = QPushButton("Guardar Carrera", self)
         self.btn_guardar_carrera.setFixedSize(200, 40)
         self.btn_guardar_carrera.setToolTip("Guardar Carrera")
-        self.btn_guardar_carrera.setIcon(QIcon("src/recursos/floppy-disk.png"))
+        self.btn_guardar_carrera.setIcon(icono("floppy-disk.png"))
         self.distribuidor_botones.addWidget(self.btn_guardar_carrera, 0, 2, Qt.AlignCenter)
         self.btn_guardar_carrera.clicked.connect(self.guardar_cambios)
 
@@ -118,15 +121,16 @@ class Vista_carrera(QWidget):
 
 
         #Este pedazo de código borra todos los contenidos anteriores de la tabla (salvo los encabezados)
-        while self.distribuidor_actividades.count()>3:
-            child = self.distribuidor_actividades.takeAt(3)
+        while self.distribuidor_actividades.count()>4:
+            child = self.distribuidor_actividades.takeAt(4)
             if child.widget():
                 child.widget().deleteLater()
 
         self.distribuidor_actividades.setColumnStretch(0, 1)
         self.distribuidor_actividades.setColumnStretch(1, 1)
-        self.distribuidor_actividades.setColumnStretch(2, 0)
+        self.distribuidor_actividades.setColumnStretch(2, 1)
         self.distribuidor_actividades.setColumnStretch(3, 0)
+        self.distribuidor_actividades.setColumnStretch(4, 0)
 
         if (len(self.competidores)<1):
             self.btn_guardar_carrera.setEnabled(False)
@@ -147,31 +151,36 @@ class Vista_carrera(QWidget):
             self.distribuidor_actividades.addWidget(etiqueta_valor, numero_fila, 1, alignment=Qt.AlignCenter
             )
 
+            #Los competidores que aun no se han guardado no tienen la cuota calculada
+            multiplicador = competidor.get("Multiplicador")
+            etiqueta_cuota = QLabel("" if multiplicador is None else "{:,.2f}".format(multiplicador))
+            self.distribuidor_actividades.addWidget(etiqueta_cuota, numero_fila, 2, alignment=Qt.AlignCenter)
+
             btn_editar = QPushButton("", self)
             btn_editar.setToolTip("Edit")
             btn_editar.setGeometry(0, 0, 40, 40)
             btn_editar.setFixedSize(40, 40)
-            btn_editar.setIcon(QIcon("src/recursos/004-edit-button.png"))
+            btn_editar.setIcon(icono("004-edit-button.png"))
             btn_editar.setIconSize(QSize(40, 40))
             btn_editar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             btn_editar.clicked.connect(partial(self.editar_competidor, numero_fila-1))
-            self.distribuidor_actividades.addWidget(btn_editar, numero_fila, 2)
+            self.distribuidor_actividades.addWidget(btn_editar, numero_fila, 3)
 
             btn_eliminar = QPushButton("", self)
             btn_eliminar.setToolTip("Delete")
             btn_eliminar.setGeometry(0, 0, 40, 40)
             btn_eliminar.setFixedSize(40, 40)
-            btn_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
+            btn_eliminar.setIcon(icono("005-delete.png"))
             btn_eliminar.setIconSize(QSize(40, 40))
             btn_eliminar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             btn_eliminar.clicked.connect(partial(self.eliminar_competidor, numero_fila-1))
-            self.distribuidor_actividades.addWidget(btn_eliminar, numero_fila, 3)
+            self.distribuidor_actividades.addWidget(btn_eliminar, numero_fila, 4)
 
             numero_fila=numero_fila+1
         
         #Elemento para ajustar la forma de la tabla (y evitar que queden muy espaciados)
         elemento_de_espacio = QSpacerItem(140, 360-numero_fila*40 if numero_fila*40<=360 else 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        self.distribuidor_actividades.addItem(elemento_de_espacio, numero_fila, 0, 1, 3)
+        self.distribuidor_actividades.addItem(elemento_de_espacio, numero_fila, 0, 1, 4)
 
 
     def eliminar_competidor(self, indice_competidor):
@@ -182,7 +191,7 @@ class Vista_carrera(QWidget):
         mensaje_confirmacion.setIcon(QMessageBox.Question)
         mensaje_confirmacion.setText("¿Esta seguro de que desea eliminar este competidor?\nRecuerde que esta acción es irreversible")        
         mensaje_confirmacion.setWindowTitle("¿Desea borrar este competidor?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        mensaje_confirmacion.setWindowIcon(icono("smallLogo.png"))
         mensaje_confirmacion.setStandardButtons(QMessageBox.Yes | QMessageBox.No ) 
         respuesta=mensaje_confirmacion.exec_()
         if respuesta == QMessageBox.Yes:
@@ -224,6 +233,7 @@ class Vista_carrera(QWidget):
         if dialogo.resultado == 1:
             self.competidores[indice_competidor]['Nombre']=dialogo.texto_nombre.text()
             self.competidores[indice_competidor]['Probabilidad'] = float(dialogo.texto_probabilidad.text())
+            self.competidores[indice_competidor].pop('Multiplicador', None)
             self.competidores[indice_competidor]['Estado'] = self.competidores[indice_competidor].get('Estado', 'Editada')
             self.mostrar_competidores(self.texto_nombre.text(), self.competidores)
    
@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import * 
 from PyQt5.QtCore import *
 from functools import partial
+from .recursos import icono
 
 
 class Dialogo_crear_apostador(QDialog):
@@ -15,7 +16,7 @@ class Dialogo_crear_apostador(QDialog):
 
         
         self.setFixedSize(400, 125)
-        self.setWindowIcon(QIcon("src/devcuentasclaras/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.resultado = ""
 
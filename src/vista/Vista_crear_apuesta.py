@@ -2,24 +2,26 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import * 
 from PyQt5.QtCore import *
 from functools import partial
+from .recursos import icono
 
 
 class Dialogo_crear_apuesta(QDialog):
     #Diálogo para crear o editar una apuesta
 
-    def __init__(self, apostadores, competidores, apuesta=None):
+    def __init__(self, buscar_apostadores, buscar_competidores, apuesta=None):
         """
-        Constructor del diálogo
+        Constructor del diálogo. Recibe las funciones de búsqueda por prefijo de
+        apostadores y competidores, que se consultan a medida que se escribe.
         """   
         super().__init__()
 
         
         self.setFixedSize(340, 250)
-        self.setWindowIcon(QIcon("src/devcuentasclaras/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.resultado = ""
-        self.apostadores = apostadores
-        self.competidores = competidores
+        self.buscar_apostadores = buscar_apostadores
+        self.buscar_competidores = buscar_competidores
 
         self.widget_lista = QListWidget()
         
@@ -44,9 +46,7 @@ class Dialogo_crear_apuesta(QDialog):
         etiqueta_concepto=QLabel("Apostador")
         distribuidor_dialogo.addWidget(etiqueta_concepto,numero_fila,0)                
 
-        self.combobox_apostadores = QComboBox(self)
-        for apostador in self.apostadores:
-            self.combobox_apostadores.addItem(apostador["Nombre"])
+        self.combobox_apostadores = self.crear_combobox_busqueda(self.buscar_apostadores)
         distribuidor_dialogo.addWidget(self.combobox_apostadores,numero_fila,1,1,3)
         numero_fila=numero_fila+1
 
@@ -62,9 +62,7 @@ class Dialogo_crear_apuesta(QDialog):
         distribuidor_dialogo.addWidget(etiqueta_viajero,numero_fila,0)                
 
         
-        self.combobox_competidores = QComboBox(self)
-        for competidor in self.competidores:
-            self.combobox_competidores.addItem(competidor["Nombre"])             
+        self.combobox_competidores = self.crear_combobox_busqueda(self.buscar_competidores)
         distribuidor_dialogo.addWidget(self.combobox_competidores,numero_fila,1,1,3)
 
         numero_fila=numero_fila+1
@@ -82,10 +80,29 @@ class Dialogo_crear_apuesta(QDialog):
         #Si el diálogo se usa para editar, se debe poblar con la información del gasto a editar
         if apuesta != None:
             self.texto_valor.setText(str(apuesta["Valor"]))
-            indice_apostador = self.combobox_apostadores.findText(apuesta["Apostador"])
-            self.combobox_apostadores.setCurrentIndex(indice_apostador)
-            indice_competidor = self.combobox_competidores.findText(apuesta["Competidor"])
-            self.combobox_competidores.setCurrentIndex(indice_competidor)
+            self.combobox_apostadores.setEditText(apuesta["Apostador"])
+            self.combobox_competidores.setEditText(apuesta["Competidor"])
+
+    def crear_combobox_busqueda(self, buscar):
+        """
+        Esta función crea un combobox editable cuyas sugerencias se consultan a
+        la lógica con el texto escrito, en lugar de cargar todas las opciones
+        """
+        combobox = QComboBox(self)
+        combobox.setEditable(True)
+        combobox.setInsertPolicy(QComboBox.NoInsert)
+
+        modelo = QStringListModel(self)
+        completer = QCompleter(modelo, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        combobox.setCompleter(completer)
+
+        def actualizar(texto):
+            modelo.setStringList([resultado["Nombre"] for resultado in buscar(texto)])
+
+        combobox.lineEdit().textEdited.connect(actualizar)
+        combobox.addItems([resultado["Nombre"] for resultado in buscar("")])
+        return combobox
 
     
     def guardar(self):
@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import * 
 from PyQt5.QtCore import *
 from functools import partial
+from .recursos import icono
 
 class Dialogo_crear_competidor(QDialog):
     #Diálogo para crear un competidor
@@ -14,7 +15,7 @@ class Dialogo_crear_competidor(QDialog):
 
         self.setFixedSize(400,110)
         
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.resultado = ""
 
@@ -4,6 +4,7 @@ from PyQt5.QtCore import *
 
 from functools import partial
 from .Vista_crear_apostador import Dialogo_crear_apostador
+from .recursos import icono
 
 class Vista_lista_apostadores(QWidget):
     #Ventana que muestra la lista de apostadores
@@ -21,7 +22,6 @@ class Vista_lista_apostadores(QWidget):
         self.width = 400
         self.height = 330
         self.inicializar_GUI()
-        self.show()
 
 
     def inicializar_GUI(self):
@@ -29,7 +29,7 @@ class Vista_lista_apostadores(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
          
         self.distribuidor_base = QVBoxLayout(self)        
 
@@ -43,14 +43,14 @@ class Vista_lista_apostadores(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(150, 40)
         self.btn_volver.setToolTip("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(icono("007-back-button.png"))
         self.btn_volver.clicked.connect(self.volver)
 
         self.distribuidor_base.addStretch()
         self.btn_aniadir_apostador=QPushButton("Añadir Apostador",self)
         self.btn_aniadir_apostador.setFixedSize(150,40)
         self.btn_aniadir_apostador.setToolTip("Añadir Apostador")                
-        self.btn_aniadir_apostador.setIcon(QIcon("src/recursos/006-add.png"))
+        self.btn_aniadir_apostador.setIcon(icono("006-add.png"))
         self.btn_aniadir_apostador.clicked.connect(self.mostrar_dialogo_aniadir_apostador)
 
         self.contenedor_tabla = QGroupBox(self)
@@ -117,12 +117,15 @@ class Vista_lista_apostadores(QWidget):
             etiqueta_nombre=QLabel(apostador["Nombre"])          
             etiqueta_nombre.setWordWrap(True)
             etiqueta_nombre.setFixedSize(90,40)
+            if "Apuestas" in apostador:
+                etiqueta_nombre.setToolTip("Apuestas: {}\nCarreras: {}\nApostado: ${:,.2f}\nGanado: ${:,.2f}".format(
+                    apostador["Apuestas"], apostador["Carreras"], apostador["Apostado"], apostador["Ganado"]))
             self.distribuidor_tabla_apostadores.addWidget(etiqueta_nombre, numero_fila+1,0, Qt.AlignTop)
 
             boton_editar=QPushButton("",self)
             boton_editar.setToolTip("Editar")
             boton_editar.setFixedSize(30,30)
-            boton_editar.setIcon(QIcon("src/recursos/004-edit-button.png"))
+            boton_editar.setIcon(icono("004-edit-button.png"))
             boton_editar.clicked.connect(partial(self.mostrar_dialogo_editar_apostador, numero_fila) )
             self.distribuidor_tabla_apostadores.addWidget(boton_editar, numero_fila+1,1,Qt.AlignTop)
 
@@ -130,7 +133,7 @@ class Vista_lista_apostadores(QWidget):
             etiqueta_eliminar=QPushButton("",self)
             etiqueta_eliminar.setToolTip("Borrar")
             etiqueta_eliminar.setFixedSize(30,30)
-            etiqueta_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
+            etiqueta_eliminar.setIcon(icono("005-delete.png"))
             etiqueta_eliminar.clicked.connect(partial(self.eliminar_apostador, numero_fila) )
             self.distribuidor_tabla_apostadores.addWidget(etiqueta_eliminar, numero_fila+1,2,Qt.AlignTop)
 
@@ -157,11 +160,11 @@ class Vista_lista_apostadores(QWidget):
         mensaje_confirmacion.setIcon(QMessageBox.Question)
         mensaje_confirmacion.setText("¿Esta seguro de que desea eliminar este apostador?\nRecuerde que esta acción es irreversible")        
         mensaje_confirmacion.setWindowTitle("¿Desea borrar este apostador?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        mensaje_confirmacion.setWindowIcon(icono("smallLogo.png"))
         mensaje_confirmacion.setStandardButtons(QMessageBox.Yes | QMessageBox.No ) 
         respuesta=mensaje_confirmacion.exec_()
         if respuesta == QMessageBox.Yes:
-            self.interfaz.eliminar_apostador(indice_apostador)          
+            self.interfaz.eliminar_apostador(self.apostadores[indice_apostador]['Nombre'])          
 
 
     def mostrar_dialogo_aniadir_apostador(self):
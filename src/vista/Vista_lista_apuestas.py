@@ -6,6 +6,7 @@ from functools import partial
 from PyQt5.QtWidgets import QWidget
 
 from .Vista_crear_apuesta import Dialogo_crear_apuesta
+from .recursos import icono
 
 class Vista_lista_apuestas(QWidget):
     #Ventana que muestra la lista de apuestas
@@ -21,18 +22,16 @@ class Vista_lista_apuestas(QWidget):
         self.width = 720
         self.height = 560
 
-        self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.interfaz = interfaz
         self.inicializar_GUI()
-        self.show()
 
     def inicializar_GUI(self):
 
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.distribuidor_base = QVBoxLayout(self)
 
@@ -89,14 +88,14 @@ class Vista_lista_apuestas(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(200, 40)
         self.btn_volver.setToolTip("Añadir Actividad")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(icono("007-back-button.png"))
         self.distribuidor_botones.addWidget(self.btn_volver, 0, 0, Qt.AlignCenter)
         self.btn_volver.clicked.connect(self.volver)
 
         self.btn_aniadir_apuesta = QPushButton("Añadir apuesta", self)
         self.btn_aniadir_apuesta.setFixedSize(200, 40)
         self.btn_aniadir_apuesta.setToolTip("Añadir competidor")
-        self.btn_aniadir_apuesta.setIcon(QIcon("src/recursos/009-money.png"))
+        self.btn_aniadir_apuesta.setIcon(icono("009-money.png"))
         self.distribuidor_botones.addWidget(self.btn_aniadir_apuesta, 0, 1, Qt.AlignCenter)
         self.btn_aniadir_apuesta.clicked.connect(self.aniadir_apuesta)
 
@@ -134,20 +133,20 @@ class Vista_lista_apuestas(QWidget):
             btn_editar.setToolTip("Editar")
             btn_editar.setGeometry(0, 0, 35, 35)
             btn_editar.setFixedSize(35, 35)
-            btn_editar.setIcon(QIcon("src/recursos/004-edit-button.png"))
+            btn_editar.setIcon(icono("004-edit-button.png"))
             btn_editar.setIconSize(QSize(35, 35))
             btn_editar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            btn_editar.clicked.connect(partial(self.editar_apuesta, numero_fila-1))
+            btn_editar.clicked.connect(partial(self.editar_apuesta, apuesta["Id"]))
             self.distribuidor_actividades.addWidget(btn_editar, numero_fila, 3, alignment=Qt.AlignTop)
 
             btn_eliminar = QPushButton("", self)
             btn_eliminar.setToolTip("Eliminar")
             btn_eliminar.setGeometry(0, 0, 35, 35)
             btn_eliminar.setFixedSize(35, 35)
-            btn_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
+            btn_eliminar.setIcon(icono("005-delete.png"))
             btn_eliminar.setIconSize(QSize(35, 35))
             btn_eliminar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            btn_eliminar.clicked.connect(partial(self.eliminar_apuesta, numero_fila-1))
+            btn_eliminar.clicked.connect(partial(self.eliminar_apuesta, apuesta["Id"]))
             self.distribuidor_actividades.addWidget(btn_eliminar, numero_fila, 4, alignment=Qt.AlignTop)
 
             numero_fila+=1
@@ -170,7 +169,7 @@ class Vista_lista_apuestas(QWidget):
         """
         try:
 
-            dialogo = Dialogo_crear_apuesta(self.interfaz.dar_apostadores(), self.interfaz.dar_competidores())
+            dialogo = Dialogo_crear_apuesta(self.interfaz.buscar_apostadores, self.interfaz.buscar_competidores)
             dialogo.exec_()
             if dialogo.resultado == 1:
                 self.interfaz.aniadir_apuesta(str(dialogo.combobox_competidores.currentText()), float(dialogo.texto_valor.text()), str(dialogo.combobox_apostadores.currentText()))
@@ -184,7 +183,7 @@ class Vista_lista_apuestas(QWidget):
         Esta función permite ejecutar el diálogo para editar una apuesta
         """ 
         try:
-            dialogo = Dialogo_crear_apuesta(self.interfaz.dar_apostadores(), self.interfaz.dar_competidores(), self.interfaz.dar_apuesta(id_apuesta))
+            dialogo = Dialogo_crear_apuesta(self.interfaz.buscar_apostadores, self.interfaz.buscar_competidores, self.interfaz.dar_apuesta(id_apuesta))
             dialogo.exec_()
             if dialogo.resultado == 1:
                 self.interfaz.editar_apuesta(id_apuesta, str(dialogo.combobox_competidores.currentText()), float(dialogo.texto_valor.text()), str(dialogo.combobox_apostadores.currentText()))
@@ -202,7 +201,7 @@ class Vista_lista_apuestas(QWidget):
         mensaje_confirmacion.setIcon(QMessageBox.Question)
         mensaje_confirmacion.setText("¿Esta seguro de que desea eliminar esta apuesta?\nRecuerde que esta acción es irreversible")        
         mensaje_confirmacion.setWindowTitle("¿Desea eliminar esta apuesta?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        mensaje_confirmacion.setWindowIcon(icono("smallLogo.png"))
         mensaje_confirmacion.setStandardButtons(QMessageBox.Yes | QMessageBox.No ) 
         respuesta=mensaje_confirmacion.exec_()
         if respuesta == QMessageBox.Yes:
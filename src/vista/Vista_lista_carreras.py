@@ -5,6 +5,7 @@ from functools import partial
 
 
 from .Vista_terminar_carrera import Dialogo_terminar_carrera
+from .recursos import icono, imagen
 
 
 class Vista_lista_carreras(QWidget):
@@ -29,13 +30,13 @@ class Vista_lista_carreras(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.title)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.distribuidor_base = QVBoxLayout(self)
 
         # Creación del logo de encabezado
         self.logo = QLabel(self)
-        self.pixmap = QPixmap("src/recursos/EporraHeader.png")
+        self.pixmap = imagen("EporraHeader.png")
         self.pixmap = self.pixmap.scaled(400, 150, Qt.KeepAspectRatio)
         self.logo.setPixmap(self.pixmap)
         self.logo.setAlignment(Qt.AlignCenter)
@@ -62,7 +63,7 @@ class Vista_lista_carreras(QWidget):
         self.btn_aniadir_actividad = QPushButton("Añadir Carrera", self)
         self.btn_aniadir_actividad.setFixedSize(200, 40)
         self.btn_aniadir_actividad.setToolTip("Añadir Carrera")
-        self.btn_aniadir_actividad.setIcon(QIcon("src/recursos/006-add.png"))
+        self.btn_aniadir_actividad.setIcon(icono("006-add.png"))
         self.btn_aniadir_actividad.setIconSize(QSize(120, 120))
         self.distribuidor_botones.addWidget(
             self.btn_aniadir_actividad, 0, 0, Qt.AlignLeft)
@@ -72,7 +73,7 @@ class Vista_lista_carreras(QWidget):
         self.btn_ver_viajeros = QPushButton("Ver Apostadores", self)
         self.btn_ver_viajeros.setFixedSize(200, 40)
         self.btn_ver_viajeros.setToolTip("Ver Apostadores")
-        self.btn_ver_viajeros.setIcon(QIcon("src/recursos/010-people-24.png"))
+        self.btn_ver_viajeros.setIcon(icono("010-people-24.png"))
         self.btn_ver_viajeros.setIconSize(QSize(120, 120))
         self.btn_ver_viajeros.clicked.connect(self.mostrar_apostadores)
         self.distribuidor_botones.addWidget(
@@ -90,9 +91,6 @@ class Vista_lista_carreras(QWidget):
         self.tabla_carreras.setWidget(self.widget_tabla_actividades)
         self.distribuidor_base.addWidget(self.tabla_carreras)
 
-        # Hacemos la ventana visible
-        self.show()
-
     def mostrar_carreras(self, lista_carreras):
         """
         Esta función puebla la tabla con las carreras
@@ -148,7 +146,7 @@ class Vista_lista_carreras(QWidget):
                 btn_ver_actividad.setToolTip("Editar carrera")
                 btn_ver_actividad.setFixedSize(40, 40)
                 btn_ver_actividad.setIcon(
-                    QIcon("src/recursos/004-edit-button.png"))
+                    icono("004-edit-button.png"))
                 btn_ver_actividad.clicked.connect(
                     partial(self.mostrar_carrera, dic_carrera['Nombre']))
                 self.distribuidor_tabla_carreras.addWidget(
@@ -157,7 +155,7 @@ class Vista_lista_carreras(QWidget):
                 btn_editar = QPushButton("", self)
                 btn_editar.setToolTip("Añadir apuestas")
                 btn_editar.setFixedSize(40, 40)
-                btn_editar.setIcon(QIcon("src/recursos/009-money.png"))
+                btn_editar.setIcon(icono("009-money.png"))
                 btn_editar.clicked.connect(
                     partial(self.mostrar_apuestas, dic_carrera['Nombre']))
                 self.distribuidor_tabla_carreras.addWidget(
@@ -166,7 +164,7 @@ class Vista_lista_carreras(QWidget):
                 btn_terminar = QPushButton("", self)
                 btn_terminar.setToolTip("Terminar")
                 btn_terminar.setFixedSize(40, 40)
-                btn_terminar.setIcon(QIcon("src/recursos/reward.png"))
+                btn_terminar.setIcon(icono("reward.png"))
                 btn_terminar.clicked.connect(
                     partial(self.terminar_carrera, dic_carrera['Nombre']))
                 self.distribuidor_tabla_carreras.addWidget(
@@ -175,7 +173,7 @@ class Vista_lista_carreras(QWidget):
                 btn_eliminar = QPushButton("", self)
                 btn_eliminar.setToolTip("Eliminar")
                 btn_eliminar.setFixedSize(40, 40)
-                btn_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
+                btn_eliminar.setIcon(icono("005-delete.png"))
                 btn_eliminar.clicked.connect(
                     partial(self.eliminar_carrera, dic_carrera['Nombre']))
                 self.distribuidor_tabla_carreras.addWidget(
@@ -243,7 +241,7 @@ class Vista_lista_carreras(QWidget):
         mensaje_confirmacion.setText(
             "¿Esta seguro de que desea borrar esta carrera?\nRecuerde que esta acción es irreversible")
         mensaje_confirmacion.setWindowTitle("¿Desea borrar esta carrera?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        mensaje_confirmacion.setWindowIcon(icono("smallLogo.png"))
         mensaje_confirmacion.setStandardButtons(
             QMessageBox.Yes | QMessageBox.No)
         respuesta = mensaje_confirmacion.exec_()
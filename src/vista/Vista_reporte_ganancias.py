@@ -4,6 +4,7 @@ from PyQt5.QtCore import *
 from PyQt5.QtWidgets import QWidget
 
 from functools import partial
+from .recursos import icono
 
 class Vista_reporte_ganancias(QWidget):
     #Ventana que muestra el reporte de ganancias para una carrera
@@ -21,19 +22,17 @@ class Vista_reporte_ganancias(QWidget):
         self.width = 400
         self.height = 560
 
-        self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.interfaz = interfaz
 
         self.inicializar_GUI()
-        self.show()
 
     def inicializar_GUI(self):
 
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/smallLogo.png"))
+        self.setWindowIcon(icono("smallLogo.png"))
 
         self.distribuidor_base = QVBoxLayout(self)
 
@@ -84,7 +83,7 @@ class Vista_reporte_ganancias(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(200, 40)
         self.btn_volver.setToolTip("Añadir Actividad")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(icono("007-back-button.png"))
         self.btn_volver.setIconSize(QSize(120, 120))
         self.btn_volver.clicked.connect(self.volver)
         self.distribuidor_base.addWidget(self.btn_volver)
@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
+from .recursos import icono
 
 
 class Dialogo_terminar_carrera(QDialog,):
@@ -16,7 +17,7 @@ class Dialogo_terminar_carrera(QDialog,):
 
         self.setFixedSize(340, 150)
         self.setWindowIcon(
-            QIcon("src/devcuentasclaras/recursos/smallLogo.png"))
+            icono("smallLogo.png"))
         self.setWindowTitle("Terminar carrera")
         self.resultado = ""
 
@@ -43,13 +44,13 @@ class Dialogo_terminar_carrera(QDialog,):
         numero_fila+=1
 
         self.btn_generar_reporte = QPushButton("Generar reporte")
-        self.btn_generar_reporte.setIcon(QIcon("src/recursos/008-data-spreadsheet.png"))
+        self.btn_generar_reporte.setIcon(icono("008-data-spreadsheet.png"))
         self.distribuidor_dialogo.addWidget(self.btn_generar_reporte, numero_fila, 0,1,1)
         
         self.btn_generar_reporte.clicked.connect(self.generar_reporte)
 
         self.btn_volver = QPushButton("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(icono("007-back-button.png"))
         self.distribuidor_dialogo.addWidget(self.btn_volver, numero_fila, 1,1,1)
         self.btn_volver.clicked.connect(self.cancelar)
 
@@ -0,0 +1,84 @@
+"""
+Gestor de las ventanas de la interfaz. Mantiene una sola instancia por tipo de
+ventana: al navegar se vuelve a mostrar la existente en lugar de construir otra,
+y su contenido solo se reconstruye si los datos cambiaron desde la ultima vez
+que se mostraron.
+"""
+import copy
+
+from PyQt5 import sip
+
+
+class GestorVistas():
+    """
+    Clase que crea, reutiliza y refresca las ventanas de la aplicacion.
+    """
+
+    def __init__(self, interfaz):
+        """
+        Args:
+            interfaz (App_EPorra): interfaz que reciben las ventanas al crearse.
+        """
+        self.interfaz = interfaz
+        self._vistas = {}
+        self._mostrados = {}
+
+    def dar_vista(self, clase):
+        """
+        Metodo para obtener la ventana de un tipo, creandola la primera vez (o
+        si Qt ya la destruyo).
+        """
+        vista = self._vistas.get(clase)
+        if vista is None or sip.isdeleted(vista):
+            vista = self._vistas[clase] = clase(self.interfaz)
+            self._mostrados.pop(clase, None)
+        return vista
+
+    def abierta(self, clase):
+        """Metodo para saber si la ventana de un tipo existe y esta visible"""
+        vista = self._vistas.get(clase)
+        return vista is not None and not sip.isdeleted(vista) and vista.isVisible()
+
+    def mostrar(self, clase, metodo, *datos, forzar=False):
+        """
+        Metodo para mostrar la ventana de un tipo con unos datos. El metodo de
+        la ventana que la puebla solo se llama si los datos son distintos de los
+        ultimos que se le pasaron o si se pide forzar (ventanas de edicion cuyo
+        estado local se descarta al entrar).
+
+        Args:
+            clase: tipo de la ventana (Vista_lista_carreras...).
+            metodo (str): metodo de la ventana que la puebla con los datos.
+            datos: argumentos de ese metodo.
+            forzar (bool): poblar la ventana aunque los datos no hayan cambiado.
+
+        Returns:
+            la ventana mostrada.
+        """
+        vista = self.refrescar(clase, metodo, *datos, forzar=forzar)
+        vista.show()
+        vista.raise_()
+        vista.activateWindow()
+        return vista
+
+    def refrescar(self, clase, metodo, *datos, forzar=False):
+        """
+        Metodo para actualizar el contenido de una ventana sin mostrarla; igual
+        que mostrar, no hace nada si los datos no cambiaron.
+        """
+        vista = self.dar_vista(clase)
+        if forzar or self._mostrados.get(clase) != (metodo, datos):
+            getattr(vista, metodo)(*datos)
+            # Copia, porque algunas ventanas modifican las listas que reciben
+            self._mostrados[clase] = (metodo, copy.deepcopy(datos))
+        return vista
+
+    def invalidar(self, clase=None):
+        """
+        Metodo para que la proxima vez se vuelva a poblar una ventana (o todas
+        si no se indica el tipo).
+        """
+        if clase is None:
+            self._mostrados.clear()
+        else:
+            self._mostrados.pop(clase, None)
@@ -0,0 +1,45 @@
+"""
+Cache de los iconos e imagenes de la interfaz. Cada recurso se carga una sola
+vez y se comparte entre todas las ventanas, por lo que construir una lista con
+miles de filas no vuelve a leer archivos. Los recursos vienen del paquete
+compilado recursos_rc (generado desde src/recursos/recursos.qrc con
+``pyrcc5 -o src/vista/recursos_rc.py src/recursos/recursos.qrc``); si no esta,
+se leen de src/recursos con rutas absolutas, de modo que la aplicacion arranca
+desde cualquier directorio.
+"""
+import os
+
+from PyQt5.QtGui import QIcon, QPixmap
+
+try:
+    from . import recursos_rc  # noqa: F401 registra los recursos en Qt
+    PREFIJO = ':/recursos'
+except ImportError:
+    PREFIJO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'recursos')
+
+_iconos = {}
+_imagenes = {}
+
+
+def ruta_recurso(nombre):
+    """Funcion para obtener la ruta de un recurso por su nombre de archivo"""
+    return PREFIJO + '/' + nombre if PREFIJO.startswith(':') else os.path.join(PREFIJO, nombre)
+
+
+def icono(nombre):
+    """
+    Funcion para obtener el icono de un recurso. Los QIcon comparten sus datos
+    al copiarse, asi que todas las filas usan la misma imagen cargada.
+    """
+    resultado = _iconos.get(nombre)
+    if resultado is None:
+        resultado = _iconos[nombre] = QIcon(ruta_recurso(nombre))
+    return resultado
+
+
+def imagen(nombre):
+    """Funcion para obtener el pixmap de un recurso (cargado una sola vez)"""
+    resultado = _imagenes.get(nombre)
+    if resultado is None:
+        resultado = _imagenes[nombre] = QPixmap(ruta_recurso(nombre))
+    return resultado
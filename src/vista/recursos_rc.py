@@ -0,0 +1,2698 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x02\x14\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x85\x00\x00\x00\x85\
+\x01\xe2\xec\xff\xc1\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x91\x49\x44\
+\x41\x54\x48\x89\xad\x96\xc1\x4e\xc2\x40\x10\x86\xbf\x05\xc2\xc9\
+\x88\x51\x4e\x12\x13\x1f\xc0\xbb\xf1\xec\x41\xf4\xa0\x17\x5f\xc1\
+\x07\xf0\x29\x3c\xf2\x28\xc4\x07\xd0\xb3\xde\x4c\xb8\x1b\xc4\x98\
+\x18\xc5\x08\x86\x08\xa8\x30\x1e\xdc\xda\xb1\xdd\x76\xdb\xca\x24\
+\x9b\xf6\xdf\xce\xce\x3f\xff\x4c\x33\x2d\x22\x42\xda\x02\x1a\x40\
+\x07\x90\xc8\xea\x00\x1b\xbe\xf3\x15\xfc\x76\x08\x6c\x01\xa7\x91\
+\xfd\x16\x70\x6c\xaf\x89\x66\x6c\x96\xc9\x0e\xc6\x2c\x03\xab\x22\
+\xd2\x8d\xec\x6f\x02\xaf\x22\x32\xcc\x4c\x60\x8c\x69\xd8\xac\x4c\
+\x2a\x6b\xb2\x09\xd0\x16\x91\x5e\xb8\x13\xd6\xba\x0c\xdc\x13\xaf\
+\x75\xde\xf5\x08\x54\x7e\xe3\x2a\x82\xed\x05\x04\x0f\xd6\x8e\xab\
+\xc9\x37\xc0\x89\x55\xf2\x1f\x9b\xdb\x58\x40\x42\x93\x8d\x31\xeb\
+\x40\x35\x67\xe0\x4f\x11\x79\x88\xed\x3a\xde\xfb\xa6\xcd\xa2\x48\
+\x69\xf6\xa3\xf1\x4a\x8e\x4c\xea\x84\x6f\xd1\x35\x30\x55\xcf\x7a\
+\xc0\x9d\xc2\x1f\xc0\x95\xc2\x6b\x59\x14\xec\xa9\x8c\xea\xc0\x99\
+\xc2\x47\x56\x61\x80\x5b\xc0\x92\xc2\xcd\x2c\x0a\x9e\xd5\x7d\x15\
+\xe8\x2b\x3c\x05\x26\x0a\xbf\xf0\xb7\x57\xfa\x2c\x80\x97\xa0\x06\
+\x0c\x1c\x3e\x81\x0d\xac\x4f\x60\xfd\xa8\x83\x8f\x60\xc5\x43\x30\
+\xb4\x3e\xae\xb3\x6e\x02\x11\x99\x00\x23\x0b\x7d\x0a\x86\x84\x0a\
+\xc6\x22\xf2\xee\x25\xb0\xf6\x54\x80\x20\x96\x7d\x1a\x41\xe0\x9c\
+\xa7\x07\xb1\xfa\x67\x21\xc8\xd3\x83\xc2\x0a\xd2\xe6\xbd\x2e\x51\
+\x21\x05\x35\x11\xf9\x22\x6c\x7a\xd4\xde\x58\x40\x0f\xc0\x5d\xa6\
+\x91\x88\xcc\xf0\x28\x48\xfa\x26\x07\x04\x75\x7b\x0d\xe6\x51\x95\
+\x9f\x41\x08\x30\x36\xc6\x18\xe5\xe3\x24\x48\xfa\x93\xd8\x25\x9c\
+\x2f\x17\xea\xbe\x0b\xdc\x2a\x7c\x49\x38\x79\x0f\x9c\xb1\x12\x08\
+\x4a\x40\x1b\x98\xe1\x1f\xd1\x73\xe0\x1c\x28\xbb\x62\x7d\x03\x94\
+\x82\x72\x4d\x07\x4e\x0f\x13\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x03\x4a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xb2\x00\x00\x00\xb2\
+\x01\x6b\x94\x68\xe0\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\xc7\x49\x44\
+\x41\x54\x48\x89\xa5\xd5\x5f\x88\x56\x55\x14\x05\xf0\xdf\xd6\xcf\
+\xc4\xca\xd2\xd2\xa6\x26\x26\x8c\x68\x40\x0c\x7c\x28\xb0\xc6\x22\
+\xc2\x1e\xf2\x21\x1a\x25\x08\x2a\x09\x24\xa6\x22\xa3\xa7\xa2\x3f\
+\x26\x21\x51\x4f\x3d\x08\x91\xd5\x4b\x50\x50\x44\x2f\x4a\xff\x84\
+\xa8\x44\xc2\x0a\x73\x2c\x2d\xd0\x4a\x0b\x93\x0c\x1a\x4c\x2d\x26\
+\x2d\x9d\xdd\xc3\x39\x1f\xdd\xc6\xaf\x19\xa7\xd9\x70\xe0\xde\x7b\
+\xf6\xbd\xeb\xac\xb5\xd7\xde\x57\x66\x1a\xbd\x30\x0d\x0f\xa3\xb7\
+\xd3\xfe\x44\x56\xd4\x0f\xfe\x2b\x22\x62\x00\x17\xa1\x0b\x17\xe2\
+\x15\xbc\x95\x99\x27\x4f\x49\x1e\x2f\x2a\xc0\x59\x98\xdb\x60\xb0\
+\x12\x53\xeb\xf5\x39\x58\x85\x4d\x58\x8d\xae\x09\x33\x88\x88\x47\
+\xb0\x18\x81\x21\x7c\x82\xad\xf8\x3a\x33\x47\x1a\xcc\x6e\xc0\xdd\
+\x38\x89\x97\x32\xf3\xe3\xf1\x08\xb4\x01\xde\xc4\x9d\x99\x79\x3c\
+\x22\xe6\xe0\x9a\xba\x16\x60\x04\x5f\x54\xc0\xcf\x32\xf3\x68\x44\
+\x74\x63\x00\x57\x63\x20\x33\xf7\x8f\x07\xb0\x31\x33\x6f\xe9\x98\
+\x10\xd1\xc2\x42\xf4\x61\x51\x95\xec\xa7\x0a\xf8\x69\x66\x7e\x33\
+\x26\x03\x74\xe3\x81\xcc\x7c\x74\x3c\xba\x0d\xd0\xee\xca\xb0\x0f\
+\x97\xe1\x38\x1e\xea\xc4\xa4\xcd\x60\x4a\x53\xeb\x89\x46\x44\x4c\
+\xc7\x9f\xd9\xc1\x92\x81\x9d\xd8\xf7\x7f\x3f\xde\x21\x86\x33\xf3\
+\xf6\xf6\x4d\x0b\xfb\x32\xb3\xbf\x9e\x64\x11\xe6\xd7\xbd\x63\x78\
+\x03\x67\xe2\x2a\xc5\x39\xdb\xf1\x17\x6e\x53\x9a\x11\x76\x66\xe6\
+\x60\x83\xcd\xda\x26\xda\x94\xc6\xc6\x32\x3c\x88\xc3\x8d\xb5\x14\
+\x9b\x15\xad\x6f\xc4\x16\x5c\x37\x2a\x67\xb8\xbe\x3f\x37\x22\x16\
+\xe2\xc5\x88\x88\x26\x03\x11\x71\x2d\x96\x63\x45\xbb\x5b\x23\xa2\
+\x07\x2f\x2b\x56\xbc\x12\x33\xf1\x14\x3e\xc2\xb2\xcc\x1c\x8a\x88\
+\x3e\xbc\x10\x11\x33\xf0\x0b\x0e\xe0\x7c\x74\x55\xf7\xad\x83\x0d\
+\xb8\x17\x37\x8d\x9a\x47\xf7\xe3\x2e\x65\x5c\x7c\x8b\x57\x71\x46\
+\x65\x79\x47\xcd\xd9\x8a\x27\x35\xa6\x40\x7d\x7e\x2e\x56\xe0\x48\
+\xcb\x7f\xc7\x79\xf8\xb2\x9e\x6c\x07\x96\x54\xc6\x7b\x71\x69\x43\
+\x81\x5f\xf1\x74\x44\xcc\x53\xea\x75\x4c\xe9\x93\x5d\x38\xdc\x06\
+\x18\x6e\xbc\xd4\x8e\x2d\xb8\xa7\x26\x06\x9e\xc9\xcc\xe1\x3a\x08\
+\xd7\xd4\x9c\x69\xe8\x57\xe6\xd4\x07\x38\x88\x39\xb8\x44\x19\x3d\
+\x17\x47\x95\xe8\x56\xbc\x8e\xf5\x99\xf9\x61\x1b\x21\x22\xd6\x29\
+\xae\x59\x5f\xe5\xb9\x0f\xbf\x65\xe6\xe3\x75\x7f\x5b\x95\x77\xaa\
+\xd2\xed\xbd\xd8\x5f\x99\x1f\xc2\xbb\x81\x0d\x99\xd9\x5f\x0b\xf5\
+\x9c\x52\x24\x8a\x43\x56\x2a\xc5\x5f\xaa\xcc\xa4\x8d\x99\xf9\x76\
+\xe3\x00\x9f\x63\x8f\x62\x80\x19\xca\xa0\x9c\x8d\x13\xf8\x1d\x4b\
+\x02\xdb\xf0\xec\xa9\x25\x18\x33\x12\xef\x54\x19\x37\xe3\x3d\xc5\
+\x41\xad\xca\xb8\xab\x4a\xf4\x58\x0b\x4f\x60\xd6\x04\x01\xda\x71\
+\x02\xef\x2b\xd2\x2c\xc7\xe5\xf8\x11\x5f\x29\xc6\x18\xea\xf8\x47\
+\x3b\xdd\x88\x88\x41\x1c\xad\xa7\x3f\xe0\x9f\x22\xf7\x28\x43\xb4\
+\x6f\x2c\x9b\x9e\x4e\x8c\xe0\x79\x45\xaa\x1e\x85\xc9\x20\xbe\xc3\
+\x15\x78\x6d\xb2\x00\xa9\xd8\xfb\xe6\x0a\x70\xb6\x62\xf9\x9f\x15\
+\x99\xfe\x98\xac\x44\x6b\x70\xbd\xd2\x07\xdf\x2b\x32\x5d\x50\x41\
+\x17\x23\x26\x05\x50\x41\x7a\x95\x1e\x98\xa7\xe8\x3e\x84\x1f\xb0\
+\x3b\x33\xb7\xff\x0d\x03\x95\x75\x36\x73\xff\xc9\xf2\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x11\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xa6\x00\x00\x00\xa6\
+\x01\xdd\x7d\xff\x38\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x8e\x49\x44\
+\x41\x54\x48\x89\xb5\xd6\x3d\x4e\x1b\x41\x14\xc0\xf1\xdf\xae\x7c\
+\x04\xcb\x05\x9c\xc0\x4a\x09\x94\x9c\x00\xc9\xbe\x01\x92\x25\x0a\
+\x2e\xe1\x2a\xb7\x40\x51\x72\x07\xfa\x74\xc8\x05\x1f\x39\x06\x45\
+\x2a\x57\x20\x51\x64\x52\xcc\x2e\x19\x8f\x67\x37\x6b\x1b\x46\x1a\
+\xed\xda\x7e\xf3\xfe\xef\xbd\x79\x1f\xae\x42\x08\xba\x56\x55\x55\
+\x13\x9c\xe1\x14\x27\xcd\x13\x1e\xf1\xd4\x3c\x1f\x42\x08\xbf\x3b\
+\x95\x84\x10\xb6\x36\x46\x58\xe2\x0d\xe1\x3f\xfb\xad\x91\x1d\x15\
+\x75\x15\x94\x4f\x71\x3f\x40\x71\xbe\xef\x31\xed\x05\xe0\x12\xaf\
+\xd9\xc1\x5f\xb8\xc6\x39\xc6\x38\xc2\x0c\x5f\xb1\xca\x64\x5f\x71\
+\x59\x04\x34\x96\xa7\xca\x5f\x30\x2f\xb9\x9d\x19\xb5\xc0\x3a\x83\
+\x4c\x37\x00\x4d\xcc\x4b\x61\xf9\x8e\x7a\x00\xe4\x18\x77\x59\xb8\
+\x46\x29\x60\x99\x59\xbe\x2f\x24\xf5\x64\xd9\x66\xe8\x24\xcb\x96\
+\x79\xa3\x74\x1f\xc8\x22\xcb\xae\x09\x5c\xa4\x17\xda\x08\xd6\x07\
+\x40\xd2\x8b\xbf\xa8\xfd\x2b\x1e\xb8\x81\x10\xc2\x1f\x5c\xe1\x47\
+\xf2\xdb\x02\xdf\xaa\xaa\xaa\xf5\xaf\x9f\xc9\xfb\x29\xdc\x26\xc4\
+\xf3\xcc\x9a\x9d\x3d\x11\x53\xb8\x95\xbd\x85\xe7\xe4\x8b\x71\xe1\
+\xc0\x4e\x10\xb1\x4e\x5a\xb9\xe7\x1c\x70\xd4\x71\x68\x30\x44\x2c\
+\xc6\x0d\x40\x1a\xa2\x59\x8f\xeb\x83\x20\x62\xc5\xbf\x87\xa8\x16\
+\xbb\x62\xbb\xce\xba\x6e\x6e\x87\x8b\xff\x92\xbc\x3f\xb1\x99\xa6\
+\xab\x01\x69\xd8\xeb\x89\xd8\xbb\xde\xd3\x94\xed\x42\x5b\x1c\x00\
+\x99\x27\x9f\x63\xa1\x15\x5a\xc5\x1a\xc7\x7b\x42\xd2\x36\xb3\xec\
+\x6b\x76\x77\x07\x40\xb6\x9b\x5d\x47\xbb\x5e\x0f\x0c\xd7\x3c\xb3\
+\x7c\xbb\x5d\x27\xc2\xa5\x81\xb3\x12\x87\xcb\x4c\x2c\xa2\xb1\x98\
+\x8a\xd7\xd9\x85\xb6\xca\xcb\x03\x27\xf3\xe4\x73\x46\x66\x02\xf9\
+\xb0\xa1\x5f\x35\x0a\x8b\xeb\x23\xfe\xb6\xfc\x05\x82\x5f\x1b\x8d\
+\x38\x5c\xd0\x44\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x13\x9e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x19\x00\x00\x00\x19\x08\x06\x00\x00\x00\xc4\xe9\x85\x63\
+\x00\x00\x10\x44\x7a\x54\x58\x74\x52\x61\x77\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x20\x74\x79\x70\x65\x20\x65\x78\x69\x66\x00\x00\x78\
+\xda\xad\x9a\x59\x76\xe4\x3a\x8c\x44\xff\xb9\x8a\x5e\x02\xe7\x61\
+\x39\x1c\xcf\xe9\x1d\xf4\xf2\xfb\x82\x54\x66\xda\xe5\xa1\xea\x59\
+\xae\x2c\x5b\x69\x89\xe2\x80\x00\x02\x01\x4a\x6a\xfe\xdf\xff\x2e\
+\xf5\x3f\xfc\x8b\xc5\x58\xe5\x43\xca\xb1\xc4\xa8\xf9\xe7\x8b\x2f\
+\xb6\xf2\x25\xeb\xf3\xaf\xec\xdf\x46\xfb\xfd\xfb\xfc\x51\xae\x6b\
+\xe6\xfd\x79\xf5\xbc\x60\x39\xe5\x38\xba\xf3\x67\xaa\x57\xfb\xca\
+\xf9\xf0\xba\xe1\x31\x86\x69\xef\xcf\xab\x7c\x5d\xb1\xf9\xea\xe8\
+\xba\xf0\xe8\xd0\xc9\xc8\x96\x2f\xe3\xed\x24\x39\x6f\xcf\x79\xe3\
+\xaf\x8e\xca\x3c\x5f\x62\xc9\xe9\xed\x54\x9b\x3d\xc7\x7e\x35\xdc\
+\x53\x79\xfc\x84\x33\xcc\xa3\x13\xf9\x5b\xbd\x3d\xe1\x13\x56\x1a\
+\x81\x81\x9c\xb5\xd3\x19\xa7\xf9\x6d\xdd\x35\x03\x27\x3f\xc6\x55\
+\x7e\xec\xfe\xed\xec\xe3\x8c\x75\x51\x71\xf0\x2e\x5e\x33\xc1\x20\
+\xef\x96\xf7\x38\x6a\xfd\xd6\x40\xef\x8c\xfc\xf8\xa6\xfe\xb4\xfe\
+\xf3\xdb\x1f\xc6\xb7\xf5\x3a\xef\xfe\xb0\x65\xbc\x6c\xc4\x97\x4f\
+\x2f\x98\xf0\xb9\xf1\xb7\x89\xdf\x0c\xec\x9e\x33\xb2\xef\x2f\xf4\
+\xf2\x74\x88\x0f\x46\x5e\x6b\xe4\xb5\xe6\x59\x5d\xf5\x11\x8b\xc6\
+\xcb\xa3\xb4\x7a\x58\x47\xee\xa1\x61\xc3\xe4\x6e\xdf\x16\xf9\x24\
+\x7e\x02\xdf\xd3\xfe\x14\x3e\x59\x57\xdd\x01\x67\xe8\xae\x1b\x9f\
+\x6e\xf0\x6a\x50\x59\xca\x78\x33\x4c\x35\xcb\xcc\x7d\xec\xa6\x33\
+\x45\x6f\xa7\x4d\x1c\xad\xed\xc0\x22\xe7\xb2\x4b\xb6\xd8\x0e\x72\
+\x06\x70\xf8\x98\x65\x93\x2b\x6e\xb8\x0c\x66\xdd\x4e\xe5\x1c\xa7\
+\xed\x73\x2e\x66\x8f\x5b\xf6\x78\xdd\x64\x46\x1e\x86\xa6\xd6\xd0\
+\x99\xc0\xfe\xe5\x47\x7d\x77\xf1\xbf\x7c\xd4\x5a\x5d\x4c\x64\x74\
+\x7e\xda\x8a\x79\x59\xf1\x6b\xa6\x21\xc8\xc9\x6f\x5a\x01\x88\x59\
+\x17\x6e\x61\x1b\xf8\xf1\xb9\xe0\xd7\x6f\xfc\x07\x57\x05\xc1\xb0\
+\xcd\x9c\x59\x60\xd5\xed\x74\xd1\x82\x79\xf9\x96\xdb\x38\x3b\xda\
+\x05\x8e\x27\x2a\x8c\x4a\xe3\xea\x00\x13\x31\x76\x60\x32\xc6\x81\
+\x80\x8e\xc6\x05\x13\x8d\x4e\xd6\x26\x63\xb0\x63\x06\xa0\xca\xcc\
+\xad\xf3\xb6\x81\x80\x09\xc1\x0e\x26\x69\xbd\x73\xd1\xaa\x64\xb3\
+\x95\xb1\xb9\x27\x99\xdd\xd6\x06\x1b\xad\x9c\x86\x9b\x00\x22\xb8\
+\xe8\x12\xd8\x14\x57\x01\xcb\xfb\x80\xff\x24\x9f\xf1\xa1\x1a\x5c\
+\xf0\x21\x84\x18\x52\xc8\x2a\x94\x50\xa3\x8b\x3e\x86\x18\x63\x8a\
+\x42\x72\x35\xb9\xe4\x53\x48\x31\xa5\x94\x53\x49\x35\xbb\xec\x73\
+\xc8\x31\xa7\x9c\x73\xc9\xb5\xd8\xe2\xe0\xc0\x50\x62\x49\x25\x97\
+\x52\x6a\xb5\xaa\x32\x50\xa5\xaf\x4a\xfb\xca\x99\x66\x9b\x6b\xbe\
+\x85\x16\x5b\x6a\xb9\x95\x56\x3b\xee\xd3\x7d\x0f\x3d\xf6\xd4\x73\
+\x2f\xbd\x0e\x3b\xdc\x80\x26\x46\x1c\x69\xe4\x51\x46\x9d\x46\x4d\
+\x98\x62\xfa\x19\x66\x9c\x69\xe6\x59\x66\x5d\xf8\xda\x72\xcb\xaf\
+\xb0\xe2\x4a\x2b\xaf\xb2\xea\x13\xb5\x0b\xd5\x0f\x9f\xff\x80\x9a\
+\xb9\x50\xb3\x1b\x29\x69\x97\x9e\xa8\x71\x56\xa5\xf4\xe8\xc2\x08\
+\x9d\x04\xc1\x0c\xc4\xac\x37\x20\x9e\x04\x01\x1c\xda\x0a\x66\x3a\
+\x1b\xef\xad\x20\x27\x98\xe9\x62\x09\x8a\x60\x99\x64\x10\x6c\xd4\
+\x30\x82\x18\x10\xfa\x69\x6c\x58\xe6\x89\xdd\x0b\xb9\x7f\xc2\x4d\
+\x85\xfc\x4f\xb8\xd9\xbf\x21\xa7\x04\xba\xdf\x40\x4e\x01\xdd\x47\
+\xdc\x3e\x41\x6d\x48\x9e\xeb\x1b\xb1\x13\x85\x62\x53\xed\x88\x3e\
+\xae\xcf\x5c\x95\xcd\x55\x92\x5a\xbd\x7b\xfc\xbe\xa3\x96\x6a\x00\
+\xff\x1c\x6a\x6f\x6b\xb6\x56\x13\x83\x13\x69\xc3\xd6\xd6\x5b\xb4\
+\x25\x4c\x53\x8a\x0d\xb9\x4f\x65\x36\x71\x95\x9e\x3c\xc9\x2a\x60\
+\xb9\xd5\xad\x2f\xb5\x71\x5c\x03\x82\x06\xa7\xb5\x70\x28\xbd\x5a\
+\x48\xdd\x41\x28\x8c\x63\xcb\xcc\x43\xbe\x85\xe9\xb4\x74\xde\x82\
+\xaa\x23\x60\x13\x7c\x76\xa4\x5c\x5b\xa8\x50\x6e\x18\xb0\x51\x1b\
+\x53\x87\xe2\xdd\xbe\xb1\x17\xb7\x5a\x76\xa3\xb6\x56\x96\x06\x55\
+\x40\xa8\x05\x56\x75\x73\x14\x97\x4a\x99\x41\xcd\x3e\xda\xb2\xb5\
+\x4e\xe7\x5a\x73\x43\xa7\x26\xc3\xcf\x12\xaf\xd5\xad\xfc\x5c\xe8\
+\xf2\xfc\x15\xc3\xd2\xb2\x4e\x83\x6f\x2d\x70\xc6\xf1\xf7\xdc\x54\
+\x73\x6b\x76\x33\x03\x67\x5a\x4b\xa5\xb5\x95\xa6\x5c\x58\xc0\x6a\
+\x80\x75\xae\x11\x39\x29\x67\x72\xa4\x97\x55\xa5\xcd\xb2\x65\x9f\
+\x1b\x2d\xe6\x35\x0a\x06\x51\x33\xc6\x22\xa7\x5a\xf2\x82\xf1\x08\
+\x4b\x82\x4d\xa7\xbe\xf6\xcd\xba\x33\xfc\x0a\x2e\x61\x09\x7e\xef\
+\x96\x0c\x91\x33\xbd\xd7\xc8\x9c\x2c\xdf\x53\x70\x43\xd9\xd4\xe7\
+\x72\x6d\x76\xda\xda\xb1\xe7\x94\x22\xd3\xc8\x4c\x32\x45\x07\x3b\
+\x96\x1e\xf9\xe5\xc2\x4a\x69\xa4\xee\xcd\x74\x74\x5d\x6c\x4e\x93\
+\x90\x92\x8e\x75\x1d\x23\x29\x4c\x3e\xa2\x58\x25\x01\x2f\xd3\x4f\
+\x06\x23\xaf\x45\x34\x98\x69\x4d\xcb\xc3\xa6\xd5\x7c\x92\xe5\xfb\
+\x41\xdc\xf5\x55\xda\xf4\x8c\x57\xba\xab\x76\x8e\x1e\x67\x58\x73\
+\x4d\x45\x96\x9b\x23\x74\x06\x6b\x9a\xe6\x13\x98\x6c\xd0\x8b\xff\
+\xab\xe9\xe0\xf7\xb2\x2b\x9c\xcc\x58\xe3\x3b\x4b\x29\xf9\x72\xae\
+\x71\x43\x39\x66\xdd\xd7\xb9\xda\x26\x19\x1a\x29\xe7\x66\x5a\xdf\
+\xb5\x43\x10\x64\xf5\x69\xff\xef\x7a\xf8\x06\xaf\x37\x9d\xab\x3b\
+\xb3\x78\xdb\xbd\xfa\x64\x16\xd8\x27\xef\xd1\xf4\x9e\x0f\xae\xce\
+\x4d\xa9\x8e\x15\xe2\x9a\x63\x2c\xc2\xa7\x8c\x14\x71\x03\x90\xc5\
+\xb3\x7b\xed\x31\x10\x6b\x4d\xf8\x8b\x8b\xc9\x99\xdc\x53\x12\x12\
+\xa9\x0b\x97\x5d\x31\x6f\xd7\x2c\x36\x95\xba\xbb\x1c\x39\x44\xc0\
+\x18\x86\xcc\x98\xba\xa8\x1b\x12\xaa\x0f\xfb\xa8\xfc\x82\x15\xb9\
+\x09\xff\xf2\x68\x17\x22\x66\x14\x10\x16\xef\xd1\x11\xbf\xa8\x72\
+\xa1\x59\x61\x3d\x0d\xdd\xe9\x10\x4c\x6b\x84\x75\xd7\x13\xba\xd4\
+\x76\xdb\x10\xf1\xa3\x58\x99\x50\x98\x8c\xac\xf7\xc9\xba\x02\xae\
+\x4a\x6f\xa3\xd6\x0d\xf8\x4c\xad\xd3\x00\x1e\x24\x20\x59\xbb\x18\
+\xa0\xb6\x52\xe3\x84\xc4\x4b\x6c\x2e\xe9\x11\x97\xaa\x61\x16\x7c\
+\x36\x0d\x57\xab\x81\xb1\xe7\x88\x26\x96\x90\xed\xf4\xc8\x40\x02\
+\x98\xa9\x79\xd2\xc1\x4a\xac\xc0\x78\xb8\x70\xf4\xb2\xba\xc1\xaf\
+\x21\x0b\x22\x21\x0a\xc3\x76\xa7\xe0\x2c\x74\x98\x87\xd8\x27\x85\
+\x88\x6f\xba\x90\x15\x8c\x74\xc2\xfc\x83\x48\x1e\x5c\xb6\xe2\xc5\
+\x12\xfd\x7e\xb0\x78\x4b\x88\xc6\x34\x4b\x22\x4b\x04\x62\x69\xcc\
+\x88\xc9\xd5\xd4\x3e\x63\x69\xa8\x86\xb5\xc7\x9a\xc5\x38\xf8\x77\
+\x0d\x90\x23\x44\x66\x57\x06\xd7\x81\x36\x1c\x75\x7b\xb9\xb1\x19\
+\x34\x62\x2a\xdb\x1c\x90\x7b\xe9\x93\x88\x5e\x64\xda\x66\x88\x91\
+\xe5\xf2\x48\x95\x08\xb6\x63\x78\x26\xe0\xb7\x75\x58\xbb\x80\x3c\
+\x24\xa1\xe0\x2b\xc0\x5b\x60\x59\xac\xd3\xe3\x62\x34\xe0\x9c\xd5\
+\xad\x3d\x5b\x6c\xd4\x3c\xe9\x3e\xca\x8d\x91\xf3\x41\x8b\x9d\x73\
+\x82\x3d\xc8\xa4\x64\x13\xfc\xad\x21\x26\xfd\xf2\x3d\xc1\xb6\x64\
+\x29\xe8\x57\x7c\xcb\xd8\x89\x56\xea\x1e\x0e\xf4\xb3\xa9\x54\x63\
+\x36\xb4\x87\xd7\x24\xd0\x93\x81\x63\xf7\x37\x12\x6f\x5a\x7a\x7b\
+\x37\xbc\x99\x7c\x97\x6f\x68\xd4\xed\xaa\x3d\x8a\xe7\x9a\x50\x37\
+\x7b\x6a\x37\xd6\x0e\xda\xed\xea\x45\xbc\x0e\xc7\xdd\x2c\x1d\x19\
+\x1b\x29\x17\xd6\xfe\x6b\x6e\x76\x23\x8b\xc9\x8a\xc7\xce\x25\x50\
+\xcf\xaa\x7a\x3b\x03\x61\xe0\x7a\x52\xe9\xd0\x46\xf7\xbb\x69\x34\
+\xa1\x49\x36\x34\x42\x95\x71\x7d\x43\x64\x6f\x79\x6c\x64\xb7\x14\
+\xec\x77\x9a\xd5\x0c\x76\xd9\xd6\x6d\xe6\x81\xe2\xa0\x46\x5d\xff\
+\xc0\x52\x44\x13\xce\x65\xd5\x77\xf9\x71\xed\x2c\x06\x2f\x92\x35\
+\x7c\x99\x42\xee\x67\xd6\xdb\x4e\x0b\x59\xd2\x58\xbc\xc6\x0a\xcc\
+\x48\x78\x94\x0c\x42\x0c\x8f\xcb\x1e\x48\xd6\x25\xd9\x1c\xef\x9f\
+\x51\x5f\xfd\x02\x0d\x2e\x54\xd6\x0e\x23\xc9\x85\xd1\x54\xdc\x8c\
+\xf4\x1b\x24\xe2\xc6\x50\xc1\xd4\x36\x50\x3c\xdb\x6c\x51\x93\x5b\
+\x3a\xeb\xf7\x24\xca\xba\xe7\x43\x57\x64\xc7\xe5\x63\x0f\xa4\xd5\
+\x15\x20\xef\xd5\x1c\x53\xea\x64\xcf\xe1\x77\x32\x0b\x56\xd2\x51\
+\x26\x18\x37\x80\xab\xa7\x4d\x16\xd6\x2f\xb7\x6d\x4f\x1f\x62\x79\
+\xb1\x18\xfa\x65\x19\x59\x03\x64\x83\x5a\x1b\x23\x48\xee\x5f\x22\
+\xc0\x13\x05\x8e\xad\x46\x11\x60\xae\x88\x1e\x27\x07\x1b\x24\x77\
+\x96\x86\x9e\xdc\x88\x7b\x6f\x86\xf4\x86\x33\xc7\x26\x90\x09\x88\
+\x2c\x02\x3a\xef\x21\x73\xd9\xa9\x18\x15\x56\x87\xea\xcb\x54\x74\
+\xfe\xc0\x1d\x66\xeb\x94\xb7\xa0\xce\x30\x94\x46\x06\x0a\xa2\xb6\
+\x32\x3d\x99\x9a\x03\x12\xcf\xd8\xb6\x35\xeb\x8e\xe4\x3d\x92\xa4\
+\x16\x52\xb8\xac\x46\xe1\x1e\xe2\x14\xc2\xaa\x54\xad\x95\x3c\x0b\
+\x45\xb2\xda\x50\x2c\xa5\xa4\x67\xb2\x19\x5f\xc8\x33\x77\x98\x8d\
+\xfc\xe6\x84\x24\x1b\xda\x71\x9b\x1d\x8d\x85\xac\x58\x8d\x8e\xc6\
+\x9a\x0e\xa2\x09\x4f\xc8\x0f\xa9\x4a\x3a\x3f\xd9\x7c\xe7\x72\x71\
+\x82\x93\xcd\xd3\x0e\x15\xec\xbd\xb9\xb1\x5f\x58\xc7\xa9\xa4\x69\
+\xa8\x9b\xf9\xb1\x73\x9b\x16\xef\x19\x07\x13\xc2\xf2\xc1\xd4\x73\
+\xfb\xbd\xdf\x91\xd3\x96\x18\x3e\x09\xa1\x0b\xba\xf0\x0c\x63\x76\
+\x65\x5b\x3a\xe9\xc6\x05\x01\x4f\xf4\xe2\x8f\x9c\x40\x1d\x2f\x78\
+\x38\x01\xb4\x7b\x05\xb4\xfe\xe2\x48\x7c\x7e\x9a\x5f\xd4\xfb\x04\
+\x83\x19\x98\xf0\x90\xc5\x89\x3b\xf9\x63\x0f\x5d\xfb\x6e\x8e\x90\
+\x46\xde\x95\xbc\xfb\x0d\x48\x6a\xf9\x42\x23\x89\x52\x15\xeb\x70\
+\x6f\x5d\x5f\x94\x12\x8e\x4e\x2e\x09\x66\x5b\x4d\x42\x7b\x47\xb6\
+\xcc\xe0\x5d\x6c\xbf\x8b\x6c\x75\x42\x9b\x3b\xae\xe0\x16\x9a\xd8\
+\xe1\xfd\x3e\xb8\x37\xa0\xf4\x1a\xda\xd4\x26\x65\x4a\xbd\x32\x22\
+\x44\x4c\xdc\x66\x6c\x14\x0a\x85\xdf\x5c\x64\x14\xfe\x2e\xc8\xc2\
+\x52\x2d\xa5\x49\x19\xb9\xa1\xc8\x1d\xf2\x0a\x95\x8f\x5e\x93\x0c\
+\xb3\x50\xbf\xd3\xf4\x23\x1d\x0e\x73\x92\x2f\x56\xb3\x71\xc6\x55\
+\x23\xd1\x9f\x12\x6e\x45\x46\x81\xae\x98\x6b\x73\xbd\x75\x4a\x93\
+\xba\xa3\x0c\xaf\x41\x5a\x09\x1b\xb6\xd9\x44\x56\x8c\x1a\xe1\x14\
+\xca\x96\x23\x17\x45\x50\x54\xf1\xc3\xa9\xf4\x4e\xde\x41\x3f\x8f\
+\x72\xf1\x70\xab\x3b\xc6\x7e\xc7\xad\x6d\x7e\xe1\xb0\xea\xa5\x3f\
+\xcd\xd3\xcf\x60\xa5\x97\xa7\x1d\x47\x13\x37\x6b\x73\xac\x8b\xa1\
+\x3f\x12\xb4\xba\x18\x9a\xd9\xf5\xbf\x13\x2b\x94\xf9\x89\xbf\x6e\
+\x6f\x55\xc7\xf5\x7b\xa0\x27\x7c\x68\x3c\x54\xca\xe7\x47\x73\x10\
+\x7e\x47\xaa\x17\xa5\x92\x69\x5f\xac\xfa\xdf\x55\x11\x38\xa2\xc2\
+\x6b\xf3\x5d\x91\xf3\xa5\x99\x59\xc5\xc0\x03\x54\x42\x83\x19\x0a\
+\xf7\xb6\x6a\xea\xc4\xff\xfe\x91\x82\xd5\x57\x1c\xfc\x59\xf4\xad\
+\x72\x8a\x8b\xb2\x5d\xa3\x94\x80\x27\x8c\xab\xe0\x50\x68\x87\x47\
+\x4a\x9d\x03\x79\xbf\x20\x5d\x82\xa0\x8d\x1d\x73\xe2\xcf\x1f\xe3\
+\x76\xac\x8f\xf9\x59\xfd\x2c\x41\x7f\x0d\xff\xdb\x04\xbd\x6d\x60\
+\xd2\xd5\xee\xca\xe2\x92\x4b\x1e\x5e\x42\x85\x9c\xd1\x35\xc1\xd5\
+\xbe\x32\x49\xd2\x14\x4b\x82\xf4\xae\x75\x22\x26\x0c\xf8\xd9\x50\
+\xbb\xaf\x5e\x7d\x41\x2b\xfa\x6c\x7d\x94\xdd\x1d\x2c\x9f\x66\x20\
+\xbb\x6e\xbf\xaf\x5a\x6a\x4c\x5c\x33\x9f\x4c\xe2\x9d\x16\xa6\x24\
+\x68\x4f\x2d\x66\x18\xb5\xc2\xe4\x13\x1e\x1e\xe9\x9c\x43\x6e\x91\
+\x17\xd0\x5d\xac\xb8\x04\x7b\xa4\xd7\x71\x38\x1c\xe0\x32\xc4\xa3\
+\x95\xfa\xb3\x59\x7a\x77\x3f\xd8\xc8\xa5\x3f\xef\x17\xda\xff\xa3\
+\x95\xba\x9a\xa5\xff\x36\xfe\xc7\xe1\xd5\x97\xe3\x03\x3e\x34\xb5\
+\x28\x18\xd1\xad\x18\xc5\x21\x4a\xa8\xa0\x6d\xe7\x3a\xf5\x83\xe9\
+\xd5\xc6\x00\x1d\x07\x11\xc7\x59\x2b\x4f\xe6\xf0\xe4\x20\x8f\x7f\
+\x53\x61\x1c\x25\xaf\x11\xfb\xd3\xc0\x18\x43\xb7\x2d\xda\x8b\x6b\
+\xc2\xb6\x3d\xd9\x76\xf2\xda\x34\x9b\x98\x6a\x90\xb3\x55\x6a\x5a\
+\x58\x8b\xc9\xbc\x3d\xcf\xfa\xe5\x8a\xf8\x47\xbd\x6a\x6b\xc9\xf3\
+\x01\xbd\xa6\x59\xe0\x44\x91\x4b\x1c\x8c\xa3\x26\x27\xf3\x10\x1c\
+\x15\x2e\x90\xd3\x76\x7d\x6f\x97\x44\x13\xd5\x25\xbd\x30\xf3\xcb\
+\x2a\x79\x47\x44\x95\xe6\x94\xf5\xe1\x64\xdd\x7a\xd5\x6a\x27\x58\
+\xe4\xe2\xf6\xec\x7d\x5d\xae\xe2\xfd\x5a\xa6\xe7\x0b\x22\x8a\x35\
+\x50\x54\xb4\xad\xaf\x0f\x7d\x48\xc1\x2c\x7b\x4c\xd4\xd2\x26\x2f\
+\xb2\x8b\xec\x4c\xe8\x49\xc2\x19\x51\x39\x9f\x06\x71\x8f\xf3\xe0\
+\xdb\xd3\x6f\x28\x20\x66\x38\x9c\xb2\x08\x09\x82\x25\x5d\x81\x38\
+\xa3\xa8\x1f\x94\xb3\x73\x1f\xed\x23\xe6\x51\x5d\x9c\x31\x75\x21\
+\xde\x8c\x24\xef\xd6\x90\x06\xb6\xf7\x92\xbe\xb7\xf0\x48\x34\x6d\
+\x6b\x27\x89\x42\x6d\xd7\xf3\x49\x0b\x48\x7a\xca\x0d\x31\x04\x36\
+\xf3\x5a\x51\x85\xd3\xe3\x16\x27\x65\x96\xb3\x80\x4c\x0a\xb9\x98\
+\xeb\x9f\xc9\x57\x7d\x64\xdf\x2f\xc8\xf7\xda\x9b\x68\xe2\x76\xbd\
+\x4b\x29\x17\x8f\x04\x6a\x5e\xca\x58\xf5\x3d\x5d\x09\x5f\xa6\xfc\
+\x91\xba\x3f\x6a\x24\x25\x22\xe9\x8d\x46\x5a\x65\x7d\x5b\x54\x9c\
+\xb9\x51\x50\x59\x61\x10\x21\x9d\xe1\x17\xb5\x71\x55\x93\xda\xad\
+\x88\x93\xf1\xc7\x80\xc0\x90\x9e\xb8\x33\xc0\x91\xe3\x5b\x41\x5f\
+\x62\x88\xa4\xc3\xb2\x0e\xa1\x8a\xaa\x26\x81\x0f\x99\xd4\xd2\x90\
+\x12\x89\xc4\x8e\x43\x4a\xe8\xec\x3c\xbb\x0b\xbd\xb9\x07\x29\xc9\
+\xea\xe8\xed\x90\x52\xc1\x77\x83\x2e\x42\x4a\x6b\x93\xd2\xd1\x58\
+\x27\x1f\x41\xf2\x17\xa7\x1a\xca\x75\x51\xf9\x83\x7c\xd4\x51\x1d\
+\x5f\xca\xab\xbf\x1f\xd5\x0e\xa5\x1d\x48\x66\xc7\xd4\x09\x25\x79\
+\x3e\x32\x48\x02\x64\xa8\x12\x08\xde\xb0\x24\x80\xd1\x14\x59\x82\
+\x51\x42\xda\x9e\x3a\xe5\x19\xd4\xaa\xc5\xc3\x33\xc4\xb5\x78\xb8\
+\x96\x0a\xa3\x2d\x11\x50\x3e\x61\x44\xf1\xc6\x4a\x39\x03\xa7\x43\
+\xce\x85\x7c\x80\x38\x0a\x92\x60\x88\xa3\x92\x1c\x74\x4c\x21\x6d\
+\x9d\x51\x62\x3a\x59\xfd\x5c\xef\x34\xc9\xd7\x09\xea\xad\x26\x79\
+\x69\x1c\x4a\xd1\x76\x95\x52\xe2\x1e\x9f\x6a\x9c\xef\x12\xd4\xd1\
+\x4c\x9f\xef\xb1\x4d\xbc\x41\xe0\xab\x11\xdd\x85\x40\xc0\xbf\xd0\
+\x06\x13\x09\xe6\x17\x83\x23\xdf\x3a\xae\x6c\xd1\x8a\xbe\x59\x6b\
+\x22\xe3\x50\xc0\x64\xd5\x41\x54\xfc\x02\x4e\x09\x22\x11\xb6\xb0\
+\x43\xd6\x4e\x49\x33\x15\x6f\x95\xac\x43\x15\x1a\xc5\xf0\xed\x70\
+\x7b\x4a\x59\x4a\xb5\x4c\xea\x39\x26\x47\x4a\xc9\xde\x48\x9e\x02\
+\xc8\x30\x09\x4a\xc8\xb1\x79\x83\xcc\x9c\x06\x0e\x0a\x7e\x18\x28\
+\xbd\xcd\x22\x8f\x01\x6d\x2f\x29\xc4\x5a\x28\x6d\x02\x9a\x86\xc0\
+\xc9\x46\x34\xa6\x4d\x66\xce\xa8\xce\xfe\x42\xb7\xba\xcc\x6b\x93\
+\xc5\x04\x27\x1b\xa2\xdd\xa4\xb3\x2f\xda\x09\xd3\xac\x3f\x99\xca\
+\xd8\xbb\x14\x9b\x2f\x86\x51\x7f\x59\xca\x23\x40\xa5\x55\xb6\x29\
+\xbb\xcb\xd7\xfc\x38\xc3\xea\x30\x8e\xc2\x55\xcc\x5d\x58\xec\x4c\
+\x48\x58\xe6\x9a\x10\x33\x39\x53\xfa\x72\x42\xc7\x36\xc7\x34\x86\
+\x2c\xf2\x9c\x0e\x9d\x5c\x13\xc2\x62\x7b\x4a\x92\x23\xae\x49\xed\
+\xd1\xaf\x29\x3d\x26\x24\xb3\x0c\xd7\xcc\x8c\x7a\x3b\xa1\x9f\x5b\
+\x68\xf3\xd1\x6f\x58\xc8\x38\xf5\x3b\x16\x5a\x08\xf6\x5f\xb1\x90\
+\xf3\xea\x77\x2c\x24\xcf\x8e\x7e\xc5\x42\x92\xb2\x7f\xc5\x42\x78\
+\xf6\xef\x58\x48\x84\xd6\xaf\x58\x48\x0f\xf5\x3b\x16\x5a\xd4\xfd\
+\xbf\x62\xa1\x31\xd5\x2f\x58\x88\x6f\x21\xa9\x43\x8a\x7f\x73\xcb\
+\xbf\xd8\x89\xc6\x8a\x5c\xf9\xe4\xd8\x3b\xdd\xa9\x8b\x67\x6f\x77\
+\xa7\xde\x4e\x8f\xee\x1e\x15\xd2\x4e\x68\xf2\x6e\xc6\x23\xa5\xc9\
+\x39\x92\x5a\xec\x8c\x14\x6b\x70\xb1\xb9\xfd\xb8\xca\xc9\x16\x42\
+\xc8\x43\xc5\xd4\x46\xb3\x59\xf6\x10\x42\xee\x66\x6f\x1f\xc8\x5b\
+\x27\x4e\x76\xd1\xa3\x47\xce\xa2\xca\xdc\xd7\xf5\xfe\x23\x05\xaa\
+\x7f\xa9\xf7\xe3\x63\x4f\x09\xa5\xfb\xd8\x53\xb2\xf5\xda\x53\x22\
+\xd1\xa5\x7c\x8a\xe3\xcf\xf3\xe8\x75\xb7\xc8\x89\xeb\xfe\xc7\xdd\
+\x72\xaf\x08\x0a\xff\x26\x2f\x93\x8e\x62\x41\x35\x57\x4a\xab\x20\
+\x9a\x55\x1e\x16\xc9\x4e\xba\x97\x8c\x8c\xaa\xe6\x4f\x04\x58\x6d\
+\xbd\x56\xd3\x24\xa9\x96\x80\xc0\x4c\xda\x9b\x9e\x9a\x6c\xfd\x3f\
+\x3c\x5f\x1d\xe3\xe3\x67\x49\xac\x1c\xc6\x79\xf4\x65\xdc\xa9\x15\
+\x31\xa7\xbe\x18\x6b\x07\x92\x91\x8c\x7d\xa2\x71\x5c\xd1\x78\x62\
+\x2d\x2b\x9b\x7e\xa7\x2b\xb5\xbd\xff\x17\xba\x52\x57\x6c\xdf\xee\
+\x4a\x3d\x69\xe2\x66\x57\xea\x61\xac\xbb\x5d\xa9\x97\xdd\xef\x75\
+\xa5\xde\x42\x78\xa7\x2b\xf5\xde\x1b\x7e\xde\x95\x7a\xda\x9d\xd2\
+\xc0\x37\x6a\x80\x2a\xa5\x0c\x9a\x31\x99\x5a\x63\x2e\xb5\x10\xcb\
+\xba\x4f\x63\xd0\xc7\x95\x82\x24\x17\xdf\xa2\x2e\x5d\xdb\xce\x7d\
+\x04\xad\xcb\xd4\x75\x9e\xa0\x2d\xe9\x11\xb6\x83\x00\xd7\xfe\xb1\
+\x0d\x45\xe0\xec\xea\x2c\xd4\x43\xfb\xb2\x2b\x6a\xbe\xd8\xf7\x0b\
+\xb2\x57\xbb\xef\x7d\xde\xb9\x37\x34\xe5\xde\xe7\x9d\xef\xf5\xf4\
+\x57\x72\x5a\xfd\x83\x9e\xfe\x9e\x07\x84\x43\xb8\x51\xfd\x84\x7f\
+\xde\x71\x48\x3a\x15\x92\xba\xb6\xc5\xa4\xae\x72\x7b\x07\x6f\x6f\
+\x8b\x55\x18\x82\x9b\xdb\xd9\x35\xbe\x9e\xe6\xa4\x72\x76\x7c\x43\
+\xbc\x9e\xe6\x04\x23\x35\xef\x21\x24\xf5\xbe\x02\xf9\xaf\x47\xd9\
+\xa7\x3b\xd5\x9b\xfa\xe2\x19\xcd\x63\x3a\xdf\x6e\x26\xca\x12\xfb\
+\x93\xb3\x6f\x81\xfe\xc2\x5c\xdd\x03\xfd\x85\xb9\xba\x07\xfa\x0b\
+\x73\x75\x0f\xf4\x17\xe6\xea\x1e\xe8\xaf\x15\xaa\x7b\xa0\xbf\x30\
+\x57\xf7\x40\x7f\x61\xae\xee\x81\xfe\xc2\x5c\xdd\x03\xfd\x85\xb9\
+\xba\x07\xfa\xeb\x46\x75\x0f\xf4\x17\xe6\xea\x1e\xe8\xaf\xa3\xba\
+\x07\xfa\x0b\x73\x75\x0f\xf4\x17\xe6\xea\x1e\xe8\x2f\xcc\xd5\x3d\
+\xd0\x5f\x98\xab\x7b\xa0\xbf\x30\x57\xf7\x40\x7f\x61\xae\xee\x81\
+\xfe\x3a\xaa\x7b\xa0\xbf\x30\x57\xf7\x40\x7f\x61\xae\xee\x81\xfe\
+\xc2\x5c\xdd\x03\xfd\x05\x9d\xba\x07\xfa\x0b\x73\x75\x0f\xf4\x17\
+\xe6\xea\x1e\xe8\xaf\xa3\xba\x07\xfa\x0b\x73\x75\x0f\xf4\x17\xe6\
+\xea\x1e\xe8\x2f\xcc\xd5\x3d\xd0\x5f\x98\xab\x3f\x41\x97\x02\x59\
+\xf7\x76\x15\xc3\x98\xa5\x70\x9f\x3f\xef\x64\x50\x17\xc7\x2c\x4b\
+\xed\xcc\xad\xa4\xb2\x6c\x8b\xb1\xcb\x1e\x6e\x77\xd4\xb4\xae\xc9\
+\x38\x21\x45\x53\x27\x37\xe9\xe3\x33\x69\x1a\xe9\x40\x1e\x38\x64\
+\x1f\x5a\x2f\xcc\x3f\x54\x2f\xef\x35\x9d\x77\x95\x28\x83\x47\x69\
+\x43\xd7\x39\x7b\x2a\x91\x74\x94\xfb\x4c\xa6\xec\x67\x02\x66\xbd\
+\x75\xa2\xed\x42\x67\xea\x9f\x3a\xd1\x7e\x73\x0e\x17\x32\x59\x5e\
+\x65\x30\xbb\x2c\xcf\xa9\x4e\xc7\xe8\x34\x7e\xbc\x38\x87\xf4\x67\
+\xec\x51\xd7\x7e\x71\xce\x18\x79\xee\x23\xaf\x77\x26\xe7\x4a\x5f\
+\x69\x1b\xe3\xcd\x33\x1b\xf5\x7a\x68\x23\x1b\x3f\xf2\x42\xce\xf5\
+\x78\xe3\xd3\x07\x3b\x5f\x3f\xf7\x52\xef\xee\xdf\x6f\xf6\x7d\xf1\
+\x80\xec\x8b\x67\x46\x8f\xdb\xd5\xcf\xc6\xff\x38\xbc\xfa\xd9\xf8\
+\x1f\x87\x57\x3f\x1b\xff\x63\x3b\xf5\xb3\xf1\x3f\x0e\xaf\x7e\x36\
+\xfe\xc7\xe1\x3f\xc0\xff\x77\x15\x90\xce\xb3\x49\xbd\x77\x86\x82\
+\x3d\x8f\x34\x83\x3a\xcf\xc7\x5b\x08\xc9\xe2\xa3\xf2\xf2\xc0\xae\
+\x35\x3b\x2d\x57\x68\xb3\x38\x61\x3c\x89\x50\x4b\x48\xc4\x99\x08\
+\xad\x16\x96\xbc\x56\x6b\x5d\x95\xd7\x6a\xfb\x7e\xad\x36\x29\x79\
+\xad\x56\xa2\x23\xac\x7b\x75\xa4\xda\xfc\xe3\x9d\xb7\xfb\x5d\xc5\
+\xd5\x8c\xeb\x4e\x1e\x66\x9e\x27\x7f\x3a\xb7\x54\xc6\x8a\xa6\xf9\
+\x5c\x47\x63\x3a\x44\xf5\x68\x6d\x45\x4b\xe1\x3c\xf2\xb2\x7d\xee\
+\x68\x75\xca\xc6\xf3\xe0\x56\xf6\xdc\x8c\x4b\x8f\xf7\xa5\xc3\x29\
+\x99\x31\xe8\xf5\xba\x74\x94\xd7\x0a\xe5\x7d\x61\x79\x5d\xba\x9f\
+\xd7\x05\x9e\xaf\x4b\x67\x2d\x22\x62\xde\x7f\x81\x5d\x42\xe4\xfe\
+\x9b\xf0\xf2\xf0\x88\x94\xfd\xff\xee\x2c\xf9\x89\xd2\x8f\xe6\xec\
+\x00\x00\x01\x84\x69\x43\x43\x50\x49\x43\x43\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x00\x00\x78\x9c\x7d\x91\x3d\x48\xc3\x40\x1c\xc5\x5f\
+\x53\xa5\xa2\x55\x07\x2b\x88\x38\x64\xa8\x4e\x16\x44\x45\x1c\xa5\
+\x8a\x45\xb0\x50\xda\x0a\xad\x3a\x98\x5c\xfa\x05\x4d\x1a\x92\x14\
+\x17\x47\xc1\xb5\xe0\xe0\xc7\x62\xd5\xc1\xc5\x59\x57\x07\x57\x41\
+\x10\xfc\x00\x71\x73\x73\x52\x74\x91\x12\xff\x97\x14\x5a\xc4\x78\
+\x70\xdc\x8f\x77\xf7\x1e\x77\xef\x00\xa1\x5e\x66\xaa\xd9\x31\x01\
+\xa8\x9a\x65\x24\x63\x51\x31\x93\x5d\x15\x03\xaf\x08\xa2\x0f\x02\
+\x06\xd1\x23\x31\x53\x8f\xa7\x16\xd3\xf0\x1c\x5f\xf7\xf0\xf1\xf5\
+\x2e\xc2\xb3\xbc\xcf\xfd\x39\x7a\x95\x9c\xc9\x00\x9f\x48\x3c\xc7\
+\x74\xc3\x22\xde\x20\x9e\xd9\xb4\x74\xce\xfb\xc4\x21\x56\x94\x14\
+\xe2\x73\xe2\x71\x83\x2e\x48\xfc\xc8\x75\xd9\xe5\x37\xce\x05\x87\
+\x05\x9e\x19\x32\xd2\xc9\x79\xe2\x10\xb1\x58\x68\x63\xb9\x8d\x59\
+\xd1\x50\x89\xa7\x89\xc3\x8a\xaa\x51\xbe\x90\x71\x59\xe1\xbc\xc5\
+\x59\x2d\x57\x59\xf3\x9e\xfc\x85\xc1\x9c\xb6\x92\xe2\x3a\xcd\x11\
+\xc4\xb0\x84\x38\x12\x10\x21\xa3\x8a\x12\xca\xb0\x10\xa1\x55\x23\
+\xc5\x44\x92\xf6\xa3\x1e\xfe\x61\xc7\x9f\x20\x97\x4c\xae\x12\x18\
+\x39\x16\x50\x81\x0a\xc9\xf1\x83\xff\xc1\xef\x6e\xcd\xfc\xd4\xa4\
+\x9b\x14\x8c\x02\x9d\x2f\xb6\xfd\x31\x0a\x04\x76\x81\x46\xcd\xb6\
+\xbf\x8f\x6d\xbb\x71\x02\xf8\x9f\x81\x2b\xad\xe5\xaf\xd4\x81\xd9\
+\x4f\xd2\x6b\x2d\x2d\x7c\x04\xf4\x6f\x03\x17\xd7\x2d\x4d\xde\x03\
+\x2e\x77\x80\xa1\x27\x5d\x32\x24\x47\xf2\xd3\x14\xf2\x79\xe0\xfd\
+\x8c\xbe\x29\x0b\x0c\xdc\x02\xdd\x6b\x6e\x6f\xcd\x7d\x9c\x3e\x00\
+\x69\xea\x6a\xf9\x06\x38\x38\x04\xc6\x0a\x94\xbd\xee\xf1\xee\xae\
+\xf6\xde\xfe\x3d\xd3\xec\xef\x07\x22\xe9\x72\x87\x98\xda\xd8\xee\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x19\x00\x00\
+\x0f\x19\x01\xa8\xa8\xdb\x3b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe5\x0c\x0e\x02\x1a\x2e\xc0\x0d\x99\xd9\x00\x00\x01\x4b\x49\x44\
+\x41\x54\x48\xc7\xed\xd6\x31\x4b\x9c\x41\x14\x85\xe1\x67\x8c\x36\
+\x91\x6c\xa1\x4d\xb0\x89\x36\x29\xe3\xa2\x10\x6d\xa2\x56\x6a\x65\
+\xa3\x45\x20\x90\x22\xe0\xfe\x85\xfc\x16\xad\x52\x05\x8b\xa8\xa4\
+\x93\x14\x22\x89\x8d\x62\x25\x68\x61\x11\xa2\x96\x36\xb2\x49\x4c\
+\x79\xd3\x8c\xf0\xb1\xb8\xba\xeb\xb7\x6b\xe5\x81\x61\x98\x7b\x67\
+\xce\xcb\xdc\x99\x81\x81\x49\x1c\x21\x3a\xd4\x56\x34\x28\x65\xc0\
+\x26\xbe\xe4\x49\x8b\x78\x8d\x8f\xda\xd3\x67\xac\xe3\x3d\xbe\xa1\
+\x56\x4c\x06\xaa\x85\xf1\x32\xd6\xee\x30\x1c\xc7\x0e\xbe\xe3\x6b\
+\x8e\x1d\xe0\x2d\x5e\xe0\x57\x71\x47\x3d\x05\x50\x3b\x1a\xc3\x08\
+\x36\xb0\x50\xa9\x54\x52\x21\x77\x8a\x29\xcc\x61\xb5\x08\xb9\x8f\
+\x2e\x52\x4a\x9f\x9a\xe4\xce\x30\x8d\x59\xac\xf4\xea\x9e\x4e\xf1\
+\x0e\xbb\x65\x76\xd2\x1f\x11\xd5\x3b\xe6\xfc\x29\x53\xae\x73\xbc\
+\xc4\x36\x2e\xeb\xf5\xfa\xad\x67\x7a\x53\xb9\xfe\x62\x2c\xa5\xf4\
+\x34\x22\xae\x9a\xac\xdb\xc2\x93\xc2\xf8\x39\x86\xf1\xb3\x25\x48\
+\x4a\x69\x33\x22\x6a\x11\x71\x99\x81\xad\xe8\x59\xbe\xf6\xfb\x2d\
+\x41\x22\xe2\x1f\x66\xf0\x0a\x7d\x2d\x42\x7e\xe3\xa4\x9d\x72\x5d\
+\xeb\xb0\x53\xd7\xac\x11\x32\x81\xf9\x0e\xf8\x6e\x61\xaf\x19\xe4\
+\x43\x7e\xad\x3f\x4a\x00\xde\x60\xe8\x36\x88\x0c\xa8\x95\x80\xac\
+\x36\x06\x7a\x3c\x80\x1e\x21\x8f\x90\xee\x43\x52\x97\xfc\xd3\xf5\
+\x63\x3c\xc6\x52\x0e\x0e\xe6\x7e\xb4\x84\xf1\x40\xee\xab\xd9\xf7\
+\x58\x17\xfe\x5d\xc5\x76\x84\xc9\xff\x9c\x95\x6f\x88\x9f\xb1\xe1\
+\x91\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x6d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x04\x25\x00\x00\x04\x25\
+\x01\xa6\xb1\xde\x09\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\xea\x49\x44\
+\x41\x54\x48\x89\xb5\xd5\xbb\x6b\x54\x51\x10\x06\xf0\xdf\x59\xb3\
+\x31\x10\x84\xa0\xa0\x58\x44\x02\x11\x6d\x54\x6c\x04\x1f\x48\x94\
+\x80\x20\xda\x88\x10\x41\xd3\x68\xe1\x9f\xa1\x8d\x55\x10\x8b\x14\
+\x01\xb1\xb1\x55\x10\x21\xc4\xc2\x42\x90\xf8\x40\xb0\x11\x41\xd3\
+\x49\x4c\x11\x1b\x0b\x1f\x01\x25\x6a\x8e\xc5\xbd\x1b\x2f\x9b\x73\
+\x6e\x76\x03\x1e\x18\x58\x66\xbe\xf9\xbe\x61\x66\x67\x6e\x88\x31\
+\xfa\x9f\xaf\x91\x72\x86\x10\x9a\x21\x84\x66\xa7\x24\xb5\xf8\x18\
+\xe3\xaa\x61\x10\xd3\xf8\x59\xda\x34\x06\xab\x98\x04\xfe\x21\x7e\
+\xe4\xf0\x55\x70\x1f\xe6\x10\xdb\x6c\x0e\x7d\x09\xf2\xcd\x78\xb7\
+\x1e\xbe\x9a\x30\x96\x00\xb7\x6c\x2c\x21\x70\xbe\x06\x7f\xa1\x85\
+\xeb\xa9\x74\x6b\x77\x4d\x9b\x77\x86\x10\x06\x30\x8a\xad\x78\x5e\
+\x21\x0b\x09\xfc\xf0\x9a\x19\xe0\x6c\xa6\x9a\xc7\x38\x81\x4f\x15\
+\xdf\x1f\x5c\xc7\xd5\x4c\xce\x99\x54\x8b\x1a\x98\x4d\x80\x8f\xe1\
+\x63\x86\x68\x14\x1f\xda\x7c\xb3\x68\xac\x11\x28\x45\xfa\x31\xa1\
+\x18\xde\x6b\x5c\xc3\xd1\x9a\x5e\x4f\xe2\x0a\xde\x96\x39\x13\xe8\
+\xaf\x72\xae\xee\x41\x08\xe1\x74\x99\x30\x82\x5f\x68\x96\xbf\x7b\
+\xf3\xa3\xd1\x5b\xce\x64\xa5\xcc\x19\xc1\x64\xc9\xf5\x6f\x06\x98\
+\xaa\xa9\xf2\x20\x3e\x67\x62\xe7\xf0\x22\x13\x9b\x6a\x5d\x89\xf1\
+\x1a\xf2\x88\x07\x8a\x3f\xc0\x52\x9b\xff\x76\x29\x50\x97\x3b\xbe\
+\xa9\xac\x7e\x57\xa6\x05\x5f\x31\x83\xbb\x78\x55\xb6\x62\x1e\x77\
+\x70\x03\x43\xd8\x8f\xed\x99\xfc\x1d\x12\x95\xb5\x6c\x01\x07\x70\
+\x13\xdf\x12\xf1\xdf\x78\x8a\x7d\xb8\x9f\xe1\x58\x92\x09\xac\xe0\
+\x10\x9e\xac\xd3\x82\x88\xef\xd8\x8b\xf7\x99\x78\xd2\x39\x83\xcb\
+\x1d\x90\x57\x97\xf1\x52\x2a\x96\x3c\xd7\x78\x89\x53\x99\x58\xea\
+\x9d\x54\xec\xcd\x9a\xd7\x50\x0c\xeb\x11\x16\x2b\xfe\x79\xec\xe9\
+\x42\xa0\xa9\xb8\xae\xcb\x15\xdf\x22\x6e\xb5\x6f\xf2\x76\x45\xe5\
+\xc3\x78\xa3\xf3\x16\xb5\xf6\xe5\x22\x0e\x63\x5b\xf2\x54\xb4\x89\
+\x75\x2d\x90\xe2\xc9\xcd\x60\x23\x2f\xa6\x9c\x21\xf7\xd1\x0f\x21\
+\x0c\xe1\xb8\xe2\xd8\x1d\x51\x2c\xe3\x80\xe2\xfe\x2f\x2b\xf6\x64\
+\x41\xf1\x05\xbb\x17\x63\x7c\xd6\x95\x40\x46\xb4\x07\x5b\xf0\x25\
+\x76\x98\xd8\x95\xc0\x46\xde\x5f\x66\xb7\xb4\x35\xca\x3f\x49\xca\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xeb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xa6\x00\x00\x00\xa6\
+\x01\xdd\x7d\xff\x38\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x68\x49\x44\
+\x41\x54\x48\x89\xbd\x96\x31\x6e\xc2\x40\x10\x45\xdf\x5a\x46\xb9\
+\x01\x05\x7d\x64\x51\x03\x35\x07\x21\xa2\xe3\x18\x1c\x82\x33\x70\
+\x03\x9a\xdc\x21\x40\x9d\x22\x35\x2e\x82\x84\x68\x22\x14\x9a\x49\
+\xe1\xbf\xca\x6a\x59\xc7\x58\xc2\x19\x69\xb4\xd2\x78\xe6\xcf\xf8\
+\x7b\x66\xd6\xce\xcc\xa8\x13\xe7\x5c\x1f\x98\x00\x63\x60\xa4\x13\
+\x60\x07\xec\x75\x6e\xcd\xec\xb3\x16\xc4\xcc\x6e\x14\xc8\x81\x25\
+\x70\x05\x2c\xd0\xb3\x34\xb4\x5d\xe5\x9b\x27\xb1\x12\xe0\x43\xe0\
+\x4d\xc1\x27\x60\x05\xbc\x00\x05\xe0\xa4\x85\x6c\x2b\xf9\x98\x62\
+\x86\x7f\x26\x00\xe6\xc0\x45\x01\xaf\xc0\x20\x55\x55\x14\x33\x90\
+\xaf\x29\x76\x9e\x4c\xa0\xca\x2f\xc0\x17\xb0\x68\x02\x4e\x24\x5a\
+\x28\xf6\x12\xbe\x49\xc8\xb9\xa7\xa5\x35\x78\x94\xc4\xd3\x95\x87\
+\x09\x96\x9e\x96\x06\x80\x79\x4c\x41\xc2\xc7\xd3\xb5\xf4\x1d\xda\
+\x57\x27\x9c\x9a\x38\x07\x8e\xc0\xf1\x8e\x6f\x72\x12\x66\x3f\x53\
+\x9f\xf7\x80\xb5\x99\x95\xb5\xfd\x5c\x49\x4f\x5a\x2b\xc2\x58\xcb\
+\x6f\x92\xf1\x3b\x3c\xdb\x06\xf0\x36\xe2\xb1\xc6\x19\xd5\x84\x76\
+\x95\x60\x04\x50\x52\x4d\xa7\x8b\xb8\x9c\x71\x3b\xc9\x29\xbd\x02\
+\xb3\x28\xd6\x09\xb3\xcc\xff\xa8\xa2\x04\xde\x81\xa7\xc0\xf6\xac\
+\xf3\x23\xb0\x7d\xcb\xb7\x56\x36\xaa\xa4\xb8\xa3\xcf\xcf\xc0\xf9\
+\x0e\xbf\x42\x98\x9b\x8c\x6a\x2b\x42\xd5\x4d\x8f\x12\x8f\xb5\xcf\
+\xa8\x56\x6e\x57\x09\x76\xd0\x6e\xd0\x0e\xc0\xa1\xcd\xa0\xb5\x5d\
+\x15\x53\x60\xda\x6a\x55\xfc\xcb\xb2\xd3\xc3\xee\xd6\x75\xb4\x2d\
+\xbb\xb9\x70\xa2\x37\xe9\xe6\xca\x0c\x92\x3c\xec\xd2\x77\x02\x4c\
+\xca\x23\x7e\x5b\x7e\x00\x60\x93\x0e\x8d\xc0\xb9\x44\x17\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xbd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xbd\x00\x00\x00\xbd\
+\x01\x1d\x5a\xc6\xfa\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x3a\x49\x44\
+\x41\x54\x48\x89\xad\xd6\x3f\x68\x57\x57\x14\x07\xf0\xcf\x49\x9f\
+\x1a\xdc\x3a\x88\x01\x51\x24\xa4\x85\x16\x09\xda\x0e\x86\xea\xe0\
+\xa6\x4e\x0d\x74\xa9\x5b\x02\x1d\x74\x28\xe8\xa6\x74\x71\x74\x94\
+\x82\xd0\xd1\x45\x70\xcc\x54\xb2\x88\x19\xc4\x2d\xa0\xb5\x83\xa5\
+\xa5\xa5\x58\x50\x8b\x98\xa4\xa6\xf5\x5f\xe4\x74\x78\xf7\x07\xcf\
+\x9b\x97\x98\x04\xbf\x70\xe1\x9d\xef\xf9\xde\x7b\xee\xb9\xef\xdc\
+\xf3\x5e\x20\xb0\xc3\xfb\x47\x66\xe6\xcb\xc0\x3c\x3e\xeb\x38\xe6\
+\xf1\xa4\x12\x0f\xe1\x50\xf1\xd5\xf8\x18\x8f\xb1\xd4\xe3\x5b\x80\
+\xac\xc6\x89\xcc\xd4\x1d\x18\xc6\x6c\xcd\x17\xdf\x25\x4c\xac\xe1\
+\x9b\x1b\xda\x52\xf2\x9b\x40\x94\x5d\x77\xf1\x23\x1e\x54\xdc\x07\
+\x38\x5e\x7c\x35\x0e\xe3\x0f\xfc\xdd\xe3\x3b\xd2\x68\xcf\xf5\x9b\
+\x42\x4c\xe3\x17\xdc\xae\x84\xdb\xf1\x29\xee\x62\x77\x87\xff\xaf\
+\xf8\x6e\xe2\x5e\x4f\x80\xf1\x06\xcb\x99\x79\x07\x22\xe2\x21\x7e\
+\x1f\xd8\x03\x44\xc4\x30\x9e\xe1\xcb\x92\xc9\x00\x7f\xe2\x3a\x7e\
+\xad\xe7\x94\x79\xaf\x9a\x9e\xa8\xeb\xe1\x3b\x5c\xee\xd8\xcf\x71\
+\x72\xbd\x09\x81\x45\x0c\xa2\xef\xc3\x32\x9e\x56\xba\x21\x1c\xc0\
+\x4f\x3d\x6b\x8c\x6a\xcb\xfa\x9f\x1e\xdf\x48\x83\x3b\x99\x79\x0c\
+\x22\xe2\x7c\xb1\x67\xdf\xda\x45\x7b\x44\x33\x99\x79\x22\x22\x76\
+\x6a\x6b\x7f\x80\x61\xbc\xc6\x9b\x9e\x00\xb9\xd9\x23\x82\x33\xb8\
+\x80\x9f\x2b\x7e\x1c\x1f\x56\xdc\x4a\x83\x91\x88\x98\x2a\xc4\xe7\
+\xd8\x15\x11\x23\x95\x70\x1b\xf6\x44\xc4\x58\x79\xbe\x95\x99\x93\
+\x5d\x41\x44\xcc\x7a\xbb\x00\xa0\xd9\x4a\x06\xb0\x3f\x22\x4e\x57\
+\xdc\xde\x3e\x61\x83\x47\x99\x79\xb5\xec\x62\xc4\xda\xef\xe0\xab\
+\xcc\xfc\x2d\x22\xe6\x71\x0c\x93\xd5\x5a\x0f\xac\xbe\xa0\x0b\x5b\
+\xc9\xe0\x2f\xcc\x6d\x50\xbb\xb8\xd9\x32\x9d\xc6\x27\xf8\x1a\x3f\
+\x54\x9a\x6f\xb5\xb7\x7d\x15\xe6\x3a\xdd\xef\xbc\x77\x74\xd3\xa2\
+\x99\xe9\xd1\xcc\x5a\xdd\x99\xb7\x54\xa6\x70\x34\x22\xe6\x2a\x6e\
+\xbc\x4f\x18\xda\x5b\x78\xab\xd8\x1f\x69\x3f\x1c\x75\x67\x1c\xd2\
+\x76\xcd\x53\xda\xce\x59\x97\xe3\x5a\x58\x6c\x70\x1f\x53\x85\x38\
+\xab\xed\x8a\x37\x2a\xe1\x0e\x5c\x2b\x1b\x99\x2c\xba\x0d\x07\x58\
+\xc9\xcc\x45\x88\x88\x17\xf8\x77\x60\x0f\x50\xca\x74\x25\x33\x5f\
+\x45\xc4\x28\x1e\xe2\x5c\xb5\xd8\x15\x7c\x51\x47\x68\x30\x1c\x11\
+\x17\x8b\x7d\x14\x07\x22\x62\xa2\x47\x37\x16\x11\x07\x8b\xbd\xd4\
+\xd3\xd2\x9f\xf5\xa5\x10\xda\xd2\xda\xb7\x5e\x9e\x1d\xdc\xd3\x1e\
+\xd1\xf7\xda\x06\xd7\xc5\x36\xed\xbb\xea\x62\x39\x4a\x89\x6d\x18\
+\x11\xb1\x99\xdf\x9c\x37\xff\x03\xe9\xe2\xf2\x89\xf2\xa4\x19\x9e\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\x79\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x02\xe8\x7a\x54\x58\x74\x52\x61\x77\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x20\x74\x79\x70\x65\x20\x65\x78\x69\x66\x00\x00\x78\
+\xda\xed\x97\x5b\x92\xdc\x20\x0c\x45\xff\x59\x45\x96\x80\x24\x84\
+\x60\x39\x98\x47\x55\x76\x90\xe5\xe7\x82\xb1\xa7\x7b\x66\xf2\xaa\
+\xe4\x2b\xd5\xa6\x0c\x58\x60\x21\xdf\x23\xe3\x6e\xd7\xbf\x7d\x1d\
+\xee\x0b\x0e\xca\x91\x5d\x50\x4b\x31\xc7\xe8\x71\x84\x1c\x32\x17\
+\x74\x92\x3f\x8f\xbc\x6a\xf2\x61\xd5\xe7\xc5\x35\x46\xcf\x76\x77\
+\x0f\x30\x4c\x82\x56\xce\x4b\x2b\x7b\x7e\x81\x5d\xdf\x6e\xb8\xfd\
+\x1c\xcf\x76\x97\xf6\x08\xa7\xed\x68\x0f\x5c\x0e\x65\xae\xcc\xe8\
+\xb4\xc7\x20\x61\xe7\xd3\x4e\x61\x3b\xca\xfd\xec\xc4\x9c\xec\x31\
+\xd4\x83\xcf\xb6\xee\x89\x2b\x94\x7d\x1e\xdb\xe9\x8a\xc8\x9f\xd7\
+\xee\xd1\x10\x0c\x2a\x35\xc5\x42\xc2\xdc\x85\xc4\xa3\x66\xd9\x11\
+\xc8\x3c\x49\x0a\x4e\x5e\xb5\xf0\x65\x61\x61\xb7\x4c\xb4\x23\x81\
+\x20\x4f\x8f\x77\xb5\xde\x3f\x0a\xf4\x24\xf2\xd5\x73\xef\xd5\xbf\
+\x7b\xef\xc4\xe7\xb2\xed\xf2\x4e\xcb\xb8\x35\x42\xe7\xd3\x01\xd2\
+\xcf\xc5\x5f\x12\x3f\x2c\x2c\x77\x44\xfc\x3c\x60\x72\xb9\xfa\x28\
+\xf2\x18\x2d\x8d\xd1\xcf\xa7\x2b\x21\x42\xd1\xb8\x33\x6a\x89\x7d\
+\x29\x34\x27\x1e\x90\x5c\xd6\x6d\x11\xc5\x70\x2a\xfa\xb6\x4a\x46\
+\x49\xbe\xf8\x0a\xe4\xcd\x57\x7f\xa0\x54\xca\xc4\xa0\x32\x1c\x05\
+\x6a\x54\x68\x50\x5f\x6d\xa5\x8a\x10\x03\x77\x36\xb4\xcc\x15\x58\
+\xa6\x2d\x89\x71\xe6\x0a\x72\x24\x61\x16\x1a\x6c\x92\xa5\x49\x02\
+\xb3\xca\xdd\x89\xc0\xcc\x77\x2c\xb4\xd6\xcd\x6b\xbd\x8a\xac\x6f\
+\xbe\x11\xa6\x32\xc1\xd9\xc4\xfe\xc3\xe2\x7e\x36\xf8\x27\xc5\x8d\
+\x51\xa7\x44\xe4\xd3\xad\x15\xe2\xe2\x99\xd7\x08\x63\x92\x9b\x35\
+\x66\x01\x08\x8d\xcd\x4d\x97\xc0\x57\xd9\xf8\xfd\x43\xfe\x20\x55\
+\x41\x50\x97\xcc\x09\x0f\x58\xfc\x71\xba\x38\x94\xde\x72\x4b\x16\
+\x67\xc1\x3c\x45\x7b\xbe\x42\xe4\xac\x6d\x07\x90\x08\x6b\x2b\x82\
+\x41\xa6\x07\xf2\x91\x44\x29\x92\x37\x66\x23\x82\x8e\x09\x80\x0a\
+\x22\x67\x09\x7c\x80\x00\xa9\x72\x43\x90\x1c\x44\xb0\x1f\x19\x27\
+\x9e\x6b\xe3\x1e\xa3\x35\x97\x95\x23\x4f\x33\xf6\x26\x80\x50\x89\
+\x62\x60\x93\xa5\x00\x56\x08\x8a\xfc\xb1\x90\x90\x43\x45\x45\x83\
+\xaa\x46\x35\x4d\x4e\xb3\x96\x28\x31\x44\x8d\x31\x5a\x9c\x9b\x5c\
+\x31\xb1\x60\x6a\xd1\xcc\x92\x65\x2b\x49\x52\x48\x9a\x62\xb2\x94\
+\x52\x4e\x25\x73\x16\xec\x81\x9a\x63\xb6\x9c\x72\xce\xa5\xb0\x2b\
+\x58\xa8\xc0\x57\xc1\xfc\x02\xcb\xc1\x87\x1c\xe1\xd0\x23\x1e\x76\
+\xa4\x23\x1f\xa5\x22\x7d\x6a\xa8\x5a\x63\xb5\x9a\x6a\xae\xa5\x71\
+\x93\x86\x6d\xa2\xc5\x66\x2d\xb5\xdc\x4a\x27\xd7\xb1\x53\xf4\xd0\
+\xb5\xc7\x6e\x3d\xf5\xdc\xcb\x40\xae\x0d\x19\x61\xe8\x88\xc3\x46\
+\x1a\x79\x94\x9b\xda\xa6\xfa\xa1\xfc\x01\x35\xda\xd4\x78\x91\x9a\
+\xf3\xec\xa6\x06\xab\x33\xbb\x5c\xd0\xdc\x4e\x74\x32\x03\x31\x0e\
+\x04\xe2\x36\x09\x20\xa1\x79\x32\xf3\x89\x42\xe0\x49\x6e\x32\xf3\
+\x99\xf1\x52\x28\x23\x48\x9d\x6c\x5c\xa3\x49\x0c\x08\x43\x27\xd6\
+\x41\x37\xbb\x37\x72\xbf\xc5\xcd\x69\xfa\x2d\x6e\xfc\x2b\x72\x6e\
+\xa2\xfb\x17\xe4\x1c\xd0\x7d\xe4\xf6\x09\xb5\x36\xbf\x73\x75\x11\
+\x3b\xdf\xc2\xa9\xa9\x17\xbc\x7d\x18\xef\xa9\x38\x4e\x65\x7e\xd4\
+\xca\xdf\xb6\x2f\x47\x2f\x47\x2f\x47\x2f\x47\x2f\x47\x2f\x47\x2f\
+\x47\xff\x81\xa3\x81\x1f\x0f\xf8\x13\xeb\xbe\x03\x51\xcc\x9e\x2b\
+\x1b\x71\x75\xee\x00\x00\x01\x84\x69\x43\x43\x50\x49\x43\x43\x20\
+\x70\x72\x6f\x66\x69\x6c\x65\x00\x00\x78\x9c\x7d\x91\x3d\x48\xc3\
+\x40\x1c\xc5\x5f\x53\xa5\xa2\x55\x07\x2b\x88\x38\x64\xa8\x4e\x16\
+\x44\x45\x1c\xa5\x8a\x45\xb0\x50\xda\x0a\xad\x3a\x98\x5c\xfa\x05\
+\x4d\x1a\x92\x14\x17\x47\xc1\xb5\xe0\xe0\xc7\x62\xd5\xc1\xc5\x59\
+\x57\x07\x57\x41\x10\xfc\x00\x71\x73\x73\x52\x74\x91\x12\xff\x97\
+\x14\x5a\xc4\x78\x70\xdc\x8f\x77\xf7\x1e\x77\xef\x00\xa1\x5e\x66\
+\xaa\xd9\x31\x01\xa8\x9a\x65\x24\x63\x51\x31\x93\x5d\x15\x03\xaf\
+\x08\xa2\x0f\x02\x06\xd1\x23\x31\x53\x8f\xa7\x16\xd3\xf0\x1c\x5f\
+\xf7\xf0\xf1\xf5\x2e\xc2\xb3\xbc\xcf\xfd\x39\x7a\x95\x9c\xc9\x00\
+\x9f\x48\x3c\xc7\x74\xc3\x22\xde\x20\x9e\xd9\xb4\x74\xce\xfb\xc4\
+\x21\x56\x94\x14\xe2\x73\xe2\x71\x83\x2e\x48\xfc\xc8\x75\xd9\xe5\
+\x37\xce\x05\x87\x05\x9e\x19\x32\xd2\xc9\x79\xe2\x10\xb1\x58\x68\
+\x63\xb9\x8d\x59\xd1\x50\x89\xa7\x89\xc3\x8a\xaa\x51\xbe\x90\x71\
+\x59\xe1\xbc\xc5\x59\x2d\x57\x59\xf3\x9e\xfc\x85\xc1\x9c\xb6\x92\
+\xe2\x3a\xcd\x11\xc4\xb0\x84\x38\x12\x10\x21\xa3\x8a\x12\xca\xb0\
+\x10\xa1\x55\x23\xc5\x44\x92\xf6\xa3\x1e\xfe\x61\xc7\x9f\x20\x97\
+\x4c\xae\x12\x18\x39\x16\x50\x81\x0a\xc9\xf1\x83\xff\xc1\xef\x6e\
+\xcd\xfc\xd4\xa4\x9b\x14\x8c\x02\x9d\x2f\xb6\xfd\x31\x0a\x04\x76\
+\x81\x46\xcd\xb6\xbf\x8f\x6d\xbb\x71\x02\xf8\x9f\x81\x2b\xad\xe5\
+\xaf\xd4\x81\xd9\x4f\xd2\x6b\x2d\x2d\x7c\x04\xf4\x6f\x03\x17\xd7\
+\x2d\x4d\xde\x03\x2e\x77\x80\xa1\x27\x5d\x32\x24\x47\xf2\xd3\x14\
+\xf2\x79\xe0\xfd\x8c\xbe\x29\x0b\x0c\xdc\x02\xdd\x6b\x6e\x6f\xcd\
+\x7d\x9c\x3e\x00\x69\xea\x6a\xf9\x06\x38\x38\x04\xc6\x0a\x94\xbd\
+\xee\xf1\xee\xae\xf6\xde\xfe\x3d\xd3\xec\xef\x07\x22\xe9\x72\x87\
+\x98\xda\xd8\xee\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\
+\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\
+\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x00\x07\x74\
+\x49\x4d\x45\x07\xe5\x0c\x0e\x02\x16\x0d\xce\xdf\xa7\xa7\x00\x00\
+\x01\x82\x49\x44\x41\x54\x48\xc7\xdd\xd5\xbd\x6a\x94\x51\x10\x06\
+\xe0\x27\x06\x4c\xd8\x04\xb4\x08\x56\x56\x6b\x23\x6c\xa1\xa4\x55\
+\xe3\x0f\x78\x0d\x2a\x58\x68\x62\x67\xe7\x0d\xa4\xb2\xd1\x1b\x90\
+\x05\xad\xf4\x0e\xec\x04\x49\x6c\x0c\x4a\x34\x28\x68\x15\x9b\x85\
+\x74\xab\x12\x08\x04\xc1\xc4\xe6\x5d\x38\x7c\x6a\xf4\x7c\x12\x02\
+\x1e\x18\xd8\xf3\xce\xcf\x3b\x67\x76\x66\x3e\xf6\xf9\x8c\xfd\x02\
+\xbb\x80\xf3\x2d\xe3\x2d\x63\xe9\x4f\x46\x8b\xd8\x6d\x29\x8b\x35\
+\xd9\x94\x0e\x4d\xe7\x51\x12\xcd\xdf\x3f\x9d\x43\xfb\xfd\x1f\xfc\
+\xff\x04\x63\x2d\x3b\xf1\xaf\x08\x06\x58\xc0\x89\x3d\x6c\xba\xb1\
+\x19\xb4\x79\x5d\x37\x8e\x83\x74\xc9\x10\x3b\x91\x61\xb0\x91\xbe\
+\xfb\xbb\x20\xe3\x7b\x10\x7c\xc1\x26\xae\x27\xd8\x0b\x3c\xc5\x0a\
+\xbe\xe5\x65\x47\x70\x07\xcf\xdb\xbc\x60\x0e\xdb\x78\x85\x93\xc1\
+\x9e\x44\x04\x7b\x1d\x9b\xb9\xda\xe0\x13\xf8\x84\x0f\x98\x0a\x36\
+\x8f\xad\xc8\x7c\xb0\x29\x7c\x8c\xed\xe1\x1a\x82\xab\x29\xcb\xc5\
+\xdc\x8f\xa7\xf6\xcb\x91\x9d\x60\x70\x29\xb6\x57\x6a\x08\x1e\x61\
+\xa3\xb8\xcf\x26\xc8\xb5\x64\x3d\x8b\x4e\xa1\xdf\xc0\xc3\x1a\x82\
+\x15\xac\x36\x9a\xe1\x5d\x48\x3e\xe3\x56\xc3\x7e\x15\x2f\x6b\xe6\
+\x60\xd8\xd0\x7d\xc7\x19\xdc\xc6\x7b\xf4\x8b\x12\x8d\x86\x6d\x58\
+\x43\xf0\x06\xa7\x30\x53\x74\xcc\x52\x7a\xfe\x41\x02\x1e\x8b\x6e\
+\x06\xa7\xf1\xb6\xa6\x44\xbd\x94\xe3\x5e\x91\xc8\x5a\xb1\xf7\xd7\
+\x8a\xe4\xee\x07\xeb\xd5\xb6\x6a\x3f\x8e\x37\x72\x9f\xc6\x7a\x64\
+\x3a\xd8\xcd\xd8\xf4\xdb\x0c\x5a\x27\xd3\xbb\x8b\xc7\x38\x97\x2c\
+\x7b\x38\x1b\x6c\x34\xe1\x9d\xb6\xdb\x76\x12\x77\x33\x5c\xcd\xcf\
+\xe3\x56\x74\x13\xff\xba\x8e\xe1\x28\x2e\x17\x9b\x75\x1d\xcf\xf0\
+\xd5\x41\x9f\x1f\x89\x0a\x6f\x4e\xd9\xf7\xff\xa4\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x82\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x01\xfa\x00\x00\x01\xfa\
+\x01\x17\x8a\x44\x6f\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xff\x49\x44\
+\x41\x54\x48\x89\xed\xd5\x31\x4e\xc3\x40\x10\x05\xd0\x67\xe0\x00\
+\x39\x42\x8a\xa4\x0e\x15\x27\x48\x61\x29\x52\x5a\x1f\x21\x57\xc8\
+\x11\xac\x1c\x21\x55\x0e\x80\x72\x03\x37\x29\x69\x80\x3e\x07\x00\
+\x0a\xaa\x54\x69\x96\x66\x90\x8c\x31\xa6\x89\x23\x90\x32\xd2\x97\
+\x56\xfb\x67\xfe\xb7\x66\x77\xc7\x59\x4a\x49\x9f\x71\xd5\xab\xfa\
+\xc5\xe0\x4f\x18\xdc\x74\x91\x59\x96\x8d\x70\x87\x49\xe0\x36\xa8\
+\x27\x3c\x07\x1e\x52\x4a\xfb\x1f\x45\x52\x4a\xdf\x10\x62\x5b\x1c\
+\x71\x40\x42\x85\x32\x50\xc5\xde\x21\x72\xb6\x98\xb4\x6a\x35\x84\
+\xc7\xb8\x8f\xa2\x0d\x16\x78\x41\xde\xf2\x11\x79\x70\x8b\xc8\x3d\
+\x46\xed\xb8\xd5\x00\x33\xbc\x47\xf2\x08\x03\xbc\x86\xd0\x35\x0a\
+\xec\x02\x45\xec\xe5\x91\x33\x88\x9a\x4d\x68\xcc\xbe\x18\x60\x89\
+\x37\x4c\x6b\x86\x73\x54\xb1\x2e\xa2\x25\x75\x14\xc1\x55\x98\xd7\
+\xea\xa6\xa1\xb5\xfc\x9c\x12\x6b\x3c\x62\xd8\x68\xc1\x0a\x65\xac\
+\x77\x2d\x06\xbb\xe0\x4a\xac\x1a\xb5\xc3\xd0\x5c\xf7\x7e\x4d\xfb\
+\x6f\xd1\x59\x0e\xf9\x2c\xd7\xb4\xaf\x87\x96\x75\xfd\x70\x4e\x31\
+\x2a\x3a\x0d\x4e\x11\xff\x7f\x5c\x5f\x0c\x7e\x8d\x0f\x70\x19\x44\
+\xc6\x7e\x26\x8d\x35\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\xa3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x02\x58\x49\x44\x41\x54\x48\x89\xd5\xd5\x5b\x88\
+\xce\x79\x18\x07\xf0\x8f\x43\x0e\xdb\xc4\x0e\x99\xa2\xcd\x31\x6b\
+\x1d\x2e\x9c\xb6\x64\x4d\x32\xb8\x34\xab\xcc\x85\x4d\xb1\x17\x18\
+\x33\x44\xae\x5c\x50\xb8\x5c\x45\x9b\xda\x99\xcc\xb4\x7b\xc1\xb8\
+\xd8\x15\x17\x8a\xd8\xdd\x50\xb4\x2e\xd5\xb6\x9b\x50\x5b\x36\x71\
+\x41\xc9\xe6\x2c\xc3\xc5\xf3\xbc\xde\xd7\xdf\x3b\x3b\x43\x2e\x78\
+\xea\xd7\xff\xf7\x7b\xde\xe7\xf8\x7d\x0e\x2f\x1f\x3b\x0d\x78\x0b\
+\xd9\xf1\x98\x83\x21\xb8\xf3\x3e\x1d\x4c\xc6\xf7\x18\x87\x87\x98\
+\x8b\x56\x9c\xc3\xa3\xde\x94\xfb\xf5\xc0\x1f\x8a\x65\x98\x8d\x1a\
+\x6c\xc7\xbd\x8a\xdf\x27\x60\xab\xc8\xe6\x12\x4e\xe0\xdf\xbe\x3a\
+\x58\x82\x6f\x53\xf9\x6f\xec\xac\x22\x53\x8b\x91\x79\x5a\xf1\x0c\
+\xd7\xb0\x5f\x21\xab\x81\x05\xc5\xd5\x98\x92\xdf\x46\xcc\x4a\xfe\
+\x20\x2c\x15\x70\x4d\xc2\x60\x01\xef\x8f\xe8\xc6\x0e\x7c\x8e\x7d\
+\x68\xa9\x96\x09\x01\xcb\xaf\x18\x9b\xef\xc9\x38\x8a\x89\xf8\x05\
+\x2b\x30\x15\x9f\x54\x04\xd7\x85\x3f\x70\x18\x3f\xa3\x23\x9d\xbf\
+\xa2\x22\x44\x5f\x60\xb9\xc0\xf8\x3a\x16\x8a\x8e\x69\xc6\xfd\x2a\
+\x41\x75\x8a\x1a\x7d\x83\x45\x68\x47\x03\x6e\x96\x04\x8a\x10\xfd\
+\x87\x8d\x58\x8b\xd3\x02\x8e\xe1\x69\x7c\x10\x9e\xa6\x5c\xe9\xfe\
+\xa9\x72\xf1\xaf\x66\xd6\xaf\x51\xff\xc2\xfb\x05\x1e\x8b\xce\x68\
+\x4a\x5e\x73\x1a\xdc\x55\x21\xb7\x3b\x79\x1b\x04\x0a\x4d\xe9\xf0\
+\x9f\xb4\xd1\x23\xf5\xc7\xb1\x4c\xbb\x1e\x8b\xd1\xf6\x3f\xf2\x6d\
+\x02\x92\xfa\xd4\x39\x5a\x0c\xba\x08\x51\x37\x4e\x61\x1a\xce\x27\
+\xaf\x31\x95\xba\xab\x04\xf3\x0c\x67\xf2\x3d\x2f\x75\x8b\x72\x6f\
+\x50\x1d\x0e\x28\x4f\x79\x03\x36\x57\x91\xdb\x22\x0a\x5b\x0a\xb4\
+\x03\xa3\x8a\x42\xd5\x56\xc5\x03\x8c\xc0\x5e\x81\xf3\x1c\xac\x14\
+\x33\x71\x0b\x63\x44\x0d\x96\xe1\xb9\xe8\xb8\x3d\x38\x8e\x8b\x7d\
+\x71\x30\x0d\x6b\xf0\x93\x68\xd5\x33\x18\x86\x93\xf8\x52\xec\xa4\
+\x73\xa2\xa8\xed\xf9\xfd\x33\x1d\x5e\xc1\xed\x4a\x63\x95\x73\x30\
+\x1d\xdb\x70\x19\x7f\x89\xc9\xbd\x87\xcf\xc4\xf0\xb4\xe1\x42\xca\
+\x2e\x10\x2b\xe2\x09\x6e\x88\x56\xfe\x0d\x33\xc4\x30\x7e\x27\xd6\
+\xcc\x2b\xfa\x5a\x6c\xcc\x9a\x7c\xb7\x88\x3a\x4c\xcc\xf7\x70\x31\
+\xb5\xeb\xf3\x1c\x4a\x9e\x94\xe9\x50\x5e\x11\x35\x69\xab\xb1\x32\
+\x83\xce\x34\x40\xec\xa2\xc7\x38\xf8\x3a\x72\x06\x60\x66\xde\x2f\
+\x79\xb3\x5b\x56\x63\xb4\x80\x72\x24\x56\x61\x5d\xa9\x4d\xeb\x44\
+\x9b\xc1\x57\xd8\x24\xa6\xb8\x56\x14\x9a\x68\xc9\xbb\x62\x90\x66\
+\x57\xe1\x9f\xc5\x0f\x15\x0e\xeb\x28\xcf\x41\xab\xf2\x92\x9a\x9f\
+\xa7\x14\x75\x25\x3d\xef\x85\xff\x02\x47\xf2\xde\x45\xcf\xff\x07\
+\xb5\x55\xf8\x7d\xa1\xbb\xf8\xfd\x1d\x75\x3f\x50\x7a\x09\x3a\xca\
+\x78\x5f\x1a\x3e\xc2\xb6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x38\x6a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\xbc\x00\x00\x01\x2c\x08\x06\x00\x00\x00\x21\x34\x60\x9d\
+\x00\x00\x01\x85\x69\x43\x43\x50\x49\x43\x43\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x00\x00\x28\x91\x7d\x91\x3d\x48\xc3\x50\x14\x85\x4f\
+\x53\xa5\x45\x2a\x0a\x76\x10\x71\xc8\x50\x9d\x2c\x88\x8a\x38\x4a\
+\x2b\x16\xc1\x42\x69\x2b\xb4\xea\x60\xf2\xd2\x3f\x68\xd2\x90\xa4\
+\xb8\x38\x0a\xae\x05\x07\x7f\x16\xab\x0e\x2e\xce\xba\x3a\xb8\x0a\
+\x82\xe0\x0f\x88\x9b\x9b\x93\xa2\x8b\x94\x78\x5f\x52\x68\x11\xe3\
+\x85\xc7\xfb\x38\xef\x9e\xc3\x7b\xf7\x01\x42\xb3\xca\x54\xb3\x67\
+\x12\x50\x35\xcb\x48\x27\x62\x62\x2e\xbf\x2a\x06\x5e\x11\x82\x0f\
+\x83\x08\x20\x28\x31\x53\x4f\x66\x16\xb3\xf0\xac\xaf\x7b\xea\xa5\
+\xba\x8b\xf2\x2c\xef\xbe\x3f\xab\x5f\x29\x98\x0c\xf0\x89\xc4\xf3\
+\x4c\x37\x2c\xe2\x0d\xe2\xd9\x4d\x4b\xe7\xbc\x4f\x1c\x66\x65\x49\
+\x21\x3e\x27\x9e\x30\xe8\x82\xc4\x8f\x5c\x97\x5d\x7e\xe3\x5c\x72\
+\x58\xe0\x99\x61\x23\x9b\x8e\x13\x87\x89\xc5\x52\x17\xcb\x5d\xcc\
+\xca\x86\x4a\x3c\x43\x1c\x51\x54\x8d\xf2\x85\x9c\xcb\x0a\xe7\x2d\
+\xce\x6a\xb5\xce\xda\xf7\xe4\x2f\x0c\x15\xb4\x95\x0c\xd7\x69\x8d\
+\x22\x81\x25\x24\x91\x82\x08\x19\x75\x54\x50\x85\x85\x28\xed\x1a\
+\x29\x26\xd2\x74\x1e\xf3\xf0\x8f\x38\xfe\x14\xb9\x64\x72\x55\xc0\
+\xc8\xb1\x80\x1a\x54\x48\x8e\x1f\xfc\x0f\x7e\xcf\xd6\x2c\x4e\x4f\
+\xb9\x49\xa1\x18\xd0\xfb\x62\xdb\x1f\x63\x40\x60\x17\x68\x35\x6c\
+\xfb\xfb\xd8\xb6\x5b\x27\x80\xff\x19\xb8\xd2\x3a\xfe\x5a\x13\x98\
+\xfb\x24\xbd\xd1\xd1\x22\x47\xc0\xc0\x36\x70\x71\xdd\xd1\xe4\x3d\
+\xe0\x72\x07\x18\x7e\xd2\x25\x43\x72\x24\x3f\x2d\xa1\x58\x04\xde\
+\xcf\xe8\x9b\xf2\xc0\xd0\x2d\xd0\xb7\xe6\xce\xad\x7d\x8e\xd3\x07\
+\x20\x4b\xb3\x5a\xbe\x01\x0e\x0e\x81\xf1\x12\x65\xaf\x7b\xbc\x3b\
+\xd8\x3d\xb7\x7f\x7b\xda\xf3\xfb\x01\xfa\xd8\x72\x77\x90\xa8\xff\
+\x60\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\
+\xbd\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\
+\x00\x2e\x23\x01\x78\xa5\x3f\x76\x00\x00\x00\x07\x74\x49\x4d\x45\
+\x07\xe5\x0c\x01\x10\x0c\x1b\xcd\xe7\x8f\x65\x00\x00\x00\x19\x74\
+\x45\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x43\x72\x65\x61\x74\
+\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x57\x81\x0e\x17\
+\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xed\xdd\x77\x9c\x5c\x75\
+\xbd\xff\xf1\xd7\x99\x99\xed\x93\x1e\x12\x02\x04\x42\x13\xa4\x37\
+\x11\x15\x05\x05\x14\xb1\x20\x2a\xf6\x5e\x60\x41\xf1\xea\xbd\xd7\
+\xfe\xbb\x17\x2c\x57\x2c\x58\x11\x92\x20\x2a\x22\x57\xf4\x72\x15\
+\x0b\xd8\x01\x51\x01\x51\xc1\x0b\xd2\x41\x3a\x92\x90\x9e\xdd\xcd\
+\xb6\x99\xf9\xfe\xfe\xf8\x4e\x20\x84\x94\xdd\xd9\x33\x6d\xe7\xf5\
+\x7c\x3c\xce\x23\x21\xec\x9e\x39\xf3\x3d\xed\x3d\xdf\xf9\x9c\xef\
+\x17\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x52\x2b\x4b\x6c\x02\x49\x0d\x68\x3b\xe0\x79\xc0\x5e\xc0\
+\xdc\xf2\xbf\x2d\x05\x6e\x06\xae\x04\x56\xda\x44\x92\x24\x49\x6a\
+\x36\x1d\xc0\x6b\xca\x81\x76\x04\x08\x9b\x59\xfa\x80\x73\x80\x79\
+\x36\x99\x24\x49\x92\x9a\x41\x16\x38\x11\xb8\x63\x0b\x21\x77\x53\
+\xcb\x52\xe0\xe5\x36\x9f\x24\x49\x92\x1a\xd9\x7c\xe0\xf2\x71\x06\
+\xdd\x0d\x97\x51\xe0\x34\x9b\x51\x92\x24\x49\x8d\xe8\x78\x60\xd9\
+\x04\xc2\xee\xfa\xa5\x00\xbc\xc9\xe6\x94\x24\x49\x52\xa3\xc8\x00\
+\x1f\x27\xf6\xce\x86\x94\x96\x35\xc0\xd3\x6c\x5a\x49\x92\x24\xd5\
+\x5b\x0e\x58\x08\x94\x52\x0c\xbb\xeb\x97\xcb\x6d\x5e\x49\x92\x24\
+\xd5\x53\x16\xf8\x56\x15\x82\xee\x86\xa5\x0d\x87\xd8\xcc\x92\x24\
+\x49\xaa\x97\x3d\xa9\x4e\xcf\xee\x86\xcb\x59\x36\xb3\x24\x69\x63\
+\x19\x9b\x40\x52\x8d\x1c\x48\xf5\x27\xbb\x79\x9e\xcd\x2c\x49\x92\
+\xa4\x7a\xc8\x01\x7f\xa4\xba\xbd\xbb\x01\x58\x82\x33\x48\x4a\x92\
+\x24\x35\xbd\x66\xfc\x66\xe6\xe3\x35\x08\xbb\x01\x78\xd8\xc0\x2b\
+\x49\x92\xd4\xdc\x9e\x0d\x2c\x07\x3e\xdd\x24\xc1\x37\x01\xfe\x85\
+\xf8\x40\x59\x2d\x02\xef\x2f\x3c\x44\x24\x49\x92\x9a\xdb\x37\xcb\
+\xc1\xae\x04\x9c\xd2\xe0\xdb\x9a\x01\xfe\x03\x28\xd6\x28\xec\x06\
+\xe0\x6d\x1e\x22\x92\x24\x49\xcd\x6d\xc3\x3a\xd8\x95\xc0\x36\x5b\
+\xf9\xf9\x1c\x70\x38\xf0\x0a\x60\x4e\x8d\xb7\xf5\x34\xaa\x3f\x2a\
+\xc3\x86\xcb\xf5\x40\xa7\x87\x88\x24\x49\x52\xf3\xca\x00\x77\x6c\
+\x14\xf2\xfe\x6d\x0b\x3f\x9f\x07\x7e\xba\x41\xe8\x5c\x06\x1c\x50\
+\xc3\x6d\xbd\xb3\x86\x61\x77\xfd\x6c\x6b\xbf\x05\xce\x04\x5e\x0b\
+\xec\x53\x6e\x03\x49\x52\x8b\xf3\xe1\x0e\xa9\x79\xe4\x81\x07\x81\
+\x19\x1b\xfc\xdb\xb5\xc4\x1e\xdc\xb0\xd1\xcf\x76\x00\x3f\x02\x8e\
+\xdb\xe8\xdf\x2f\x05\x5e\x59\xa3\xed\xfd\x30\xf0\x19\xea\x57\x6b\
+\x5c\x02\x06\x81\xa5\xc0\x3d\xc0\x03\xe5\xe5\x51\xe2\x68\x0e\x8f\
+\x01\x2b\x80\x01\x60\x04\x18\x2e\xff\x59\xf4\x50\x93\x24\x03\xaf\
+\xa4\xfa\x78\x1a\xb1\xd7\x74\x43\x43\xc0\xf4\x72\x58\x5b\x2f\x43\
+\x9c\xbe\xf7\xa4\x4d\xac\xe3\x61\x60\xb7\x8d\x7e\xbe\x9a\xd7\x97\
+\xe3\x81\x4f\x12\x27\x9d\x68\x6b\xd0\x76\x1d\x29\xb7\xe3\x50\x39\
+\x20\xaf\x23\xf6\x16\x6f\xb8\xac\x22\x3e\x2c\xb8\x6c\x83\x3f\x1f\
+\x2e\x07\xe6\x42\x79\x91\x24\x49\xd2\x04\xbd\x83\xa7\x7e\x8d\x5f\
+\xe2\xa9\xb5\xb9\xff\xca\xe6\x6b\x67\x57\x52\x9f\xaf\xf9\x77\x02\
+\xce\xa6\xb6\x35\xbd\xb5\x58\xd6\x01\xff\x00\x7e\x07\x7c\x1b\xf8\
+\x10\xf0\x12\x60\xbe\x1d\x0a\x92\x24\x49\xe3\xf7\xc3\x4d\x04\xae\
+\x41\xa0\x7b\x83\x9f\x79\x39\x30\xca\x96\xc7\xa9\xed\xa8\xd3\xf6\
+\x27\xc0\x17\x27\x59\xe0\xdd\xdc\x52\x00\x1e\x01\x7e\x0e\x7c\xa1\
+\xfc\x61\xe5\x08\x60\x67\x60\x8a\x87\xb2\x24\xd5\xfe\x06\x24\xa9\
+\xf1\xcd\x02\xee\x05\xa6\x6e\xf4\xef\x97\x03\x2f\x2b\x87\xac\x03\
+\x81\xab\x80\x69\x5b\x58\xcf\x1f\xa8\xef\xf4\xbb\x0b\x88\x65\x19\
+\xed\x2d\xba\x1f\x0b\xc4\x9a\xe1\x55\xc0\xfd\xc4\x9a\xe2\xfb\x80\
+\xbb\xcb\xed\x72\x3f\xb1\x84\xc2\x12\x09\x49\x4a\x51\xce\x26\x90\
+\x9a\xc2\xeb\x36\x11\x76\x29\x07\xa6\x40\xac\x91\xfd\xe9\x56\xc2\
+\x2e\xc0\x15\x75\x7e\x1f\xf7\x03\x7d\xe5\x00\xdf\xaa\xd7\xdc\x69\
+\xe5\x65\xc1\x26\xfe\xff\x08\xf0\x10\x70\x1b\x71\x98\xb5\xab\x81\
+\xbf\x50\x9b\x9a\x6b\x49\x92\xa4\xba\xe9\x24\x8e\x32\xb0\xb9\xb1\
+\x67\xdf\x42\x1c\x79\x60\x6b\x5f\xb3\x8f\x12\x1f\x58\xab\xb7\x25\
+\xb4\x46\x59\x43\x5a\xcb\x32\xe0\x42\xe0\x50\x4f\x05\x49\x92\x34\
+\x59\xbd\x37\xa5\xe0\xf4\x1d\xea\x5f\xc6\x94\x03\xd6\x1a\x62\x2b\
+\x5a\xfa\xa8\xdd\x38\xca\x92\x24\x49\x35\xb3\x2d\x71\xbc\xd8\x89\
+\x86\xa5\x87\x81\x79\x0d\xf0\x7e\x66\x10\x47\x36\x30\xc0\x56\xb6\
+\x7c\xde\x53\x42\x92\xc6\x2f\x63\x13\x48\x0d\x7d\x7e\x7e\x9d\xad\
+\x4f\x1f\x3c\x16\xff\x42\x2c\x7b\xa8\xb7\x1e\x20\xeb\xae\xad\xd8\
+\x5d\x36\x81\x24\x49\x9a\x4c\xde\x4d\x7a\x3d\x83\x17\x13\xbf\x0e\
+\x9f\x05\x74\x11\xeb\x82\x3b\xcb\x01\xb4\x96\x21\x74\x3a\x71\x94\
+\x02\x7b\x6b\xc7\xbf\x3c\x82\x43\x9a\x49\x92\xa4\x49\xe4\xd9\x55\
+\x08\x86\xc5\xf2\x3a\x57\x6f\xb0\xac\x9f\x49\x6c\x05\xf0\x33\x6a\
+\x33\x1b\xda\xb7\x0d\xaf\x15\x2d\xff\xee\x69\x21\x49\x92\x26\x8b\
+\x5d\x88\x35\xb7\xb5\x0c\x53\x25\xe0\x74\x62\x0f\x62\xb5\x7b\x7b\
+\xb7\xc3\x07\xd7\xc6\xbb\x0c\x93\x4e\x69\x8b\x24\x49\x52\xdd\xcd\
+\x25\x8e\xc1\x5a\xcf\x70\x75\x0b\xd5\x1f\xcd\xe1\x4c\x43\xec\xb8\
+\x96\xfb\x70\xa2\x20\x49\x92\x34\x09\x6c\x03\xdc\xd0\x00\xe1\xea\
+\x12\xaa\xff\x40\x6b\xf7\x56\xde\xeb\x30\xb0\xd2\xa0\xfb\xf8\xb2\
+\x9a\x58\x73\x2d\x49\x92\xd4\xb4\xe6\x36\x48\xd8\x0d\xc0\x72\xe2\
+\x88\x0e\x0f\x03\x67\x54\xf1\x3d\xcf\x07\x6e\x67\xd3\xe5\x15\x1f\
+\x23\x96\x76\xfc\xce\xb0\xfb\xf8\xf2\x0e\x4f\x13\x49\x92\xd4\xac\
+\x76\x22\x96\x11\x34\x5a\xc0\xba\x82\x38\x0e\x70\x35\xcd\x06\xce\
+\x07\x06\xcb\x41\xb7\xaf\x1c\x76\xd7\xf7\x30\xb7\x01\x1f\x27\x4e\
+\xb9\xeb\x8c\x6b\xf0\x74\x4f\x17\x49\x92\xd4\x6c\xf6\x21\xd6\x67\
+\x36\x5a\xb8\xfa\x36\xd0\x5e\xc3\x76\x98\x49\x1c\x36\x6d\xda\x66\
+\xfe\xff\xf3\xa9\xfd\x83\x7c\x8d\xb8\x3c\x40\x63\x4c\x0f\x2d\x49\
+\x92\x34\x26\xcf\x23\x96\x0f\x34\x62\xb0\xba\x10\x38\x01\x78\x01\
+\xb0\x77\x83\xb4\xd7\x76\xc0\xd5\x86\x5e\x6e\xdd\xc2\x07\x03\x49\
+\x92\xa4\x86\x71\x22\xd0\xdf\x04\xe1\xaa\x40\x1c\x13\xb8\x51\x74\
+\x01\xe7\x11\xcb\x1f\x5a\x39\xf4\x7e\xc5\x53\x48\x92\x24\x35\xaa\
+\x04\x38\x8d\xe6\xaa\x49\xed\x23\x4e\x4a\xf1\x5e\x62\xbd\x71\x23\
+\xb4\xe1\xbf\x02\xa3\x2d\x1c\x78\x87\x88\x0f\xf5\x49\x92\x24\x35\
+\x94\x2c\x71\xfc\xd9\x62\x93\x86\xac\x55\xc0\x87\x80\x5c\x83\xb4\
+\xe7\xeb\x69\xed\x69\x8a\xcf\xf4\x94\x92\x24\x49\x8d\xa4\x83\xe6\
+\x9f\x52\xf7\x46\xe0\x0d\xc0\xbe\xc4\x1a\xd2\x46\x98\x08\xe1\x18\
+\x5a\x77\xd6\xb6\xdb\x1a\xe8\xc3\x87\x24\x49\x6a\x71\x3d\xc0\x4f\
+\x27\x59\xd8\x1a\x00\x3e\xdf\x20\xed\x7b\x64\x8b\x86\xde\x22\xb0\
+\x83\xa7\x97\x24\x49\xaa\xb7\x69\xc0\x95\x93\x2c\x68\xad\x02\xce\
+\x22\xce\x0c\xd7\x28\x5e\x08\xac\x6b\xc1\xd0\x7b\x9c\xa7\x98\x24\
+\x6d\x5d\xc6\x26\x90\xaa\x26\x0f\x5c\x4a\x1c\x43\x76\xb2\x58\x09\
+\xfc\x19\x38\x1c\xb8\x0e\x58\x02\xfc\x85\x58\xb2\x51\x4f\xbf\x06\
+\xde\x49\x1c\x55\xa2\x95\xec\xec\x69\x26\x49\x92\xea\xe9\xfd\x4c\
+\xee\xde\xc5\x12\xf0\x1b\x1a\x6b\xf6\xaf\x8f\xd3\x5a\x3d\xbc\xff\
+\xe9\x69\x26\x49\x5b\x67\x0f\xaf\x54\x1d\xed\x40\xef\x24\x7f\x8f\
+\x7f\x07\xee\x05\xde\x0c\xcc\x6b\x90\x6d\x3a\x13\xb8\xa4\x85\x8e\
+\xb3\x0e\x4f\x35\x49\x92\x54\x2f\x6f\xa3\xb5\x7a\x1a\x3f\xd3\x40\
+\x6d\x3f\x03\xb8\xbb\x45\xda\xfd\x74\x4f\x35\x49\xda\x3a\x7b\x78\
+\xa5\xf4\x4d\x03\xce\x68\xb1\xf7\xdc\xbd\x89\x7f\xab\xd7\xb0\x65\
+\xab\x80\xb7\x13\x27\xf7\x98\xec\x56\x7a\xba\x49\xd2\xd6\x65\x6d\
+\x02\x29\x75\x9f\x05\x8e\x6d\xb1\xf7\xbc\x03\xb1\xa6\xf7\x50\xe2\
+\x43\x7a\x05\xe0\x51\x62\x2f\x64\x25\x0e\x01\xde\x07\xfc\xa9\xc2\
+\xe0\xfa\x20\x30\x0b\x38\x6c\x92\xb7\xfb\x79\xc0\x1d\x9e\x72\x92\
+\x24\xa9\x96\x8e\xa1\x75\xa7\xbc\x2d\x01\x67\x13\x4b\x0a\x26\xa2\
+\x8b\x27\x4a\x12\x7e\x44\xe5\x93\x2b\x4c\x03\x1e\x9e\xe4\x6d\xbe\
+\xa7\xa7\x9c\x24\x6d\x9d\xb3\xf4\x48\xe9\xd9\x01\xb8\xa0\x85\xcf\
+\xab\x35\xc4\xd9\xbf\x8e\x27\x7e\x7b\xd4\x06\xdc\x0f\xfc\x8a\xf1\
+\xf5\xf4\xbe\x1e\xd8\xad\xfc\xf7\x13\x80\x4f\x10\x47\x5f\x18\xaf\
+\x21\x26\xf7\x30\x65\x2b\x88\x3d\xd9\x92\x24\x49\x35\xd1\x05\xfc\
+\x81\xd6\xec\xd9\xdd\xd2\x6c\x6c\xa7\x8c\xb3\x1d\x13\x62\x19\xc3\
+\xc6\x33\x8a\x9d\xc6\xf8\x6a\x82\x13\xe0\x63\x93\xbc\x7d\xbf\xea\
+\x69\x27\x49\x92\x6a\x25\x07\x7c\xcf\x80\xfb\xa4\x65\x29\xb0\x7f\
+\x05\x6d\xb9\x80\x4d\x97\x84\x14\x89\xe5\x12\x53\xc7\xb0\x8e\x1e\
+\xe0\x73\xc4\xde\xdd\xc9\x5a\x3a\xf2\x45\x7c\x06\x43\x92\x24\xd5\
+\x48\x06\xf8\x92\x01\xf7\x29\xcb\x20\xb1\xfe\xf6\x4b\xc0\xff\x03\
+\x5e\x43\x1c\x9b\x78\x6b\xde\xbb\x95\xf5\x2e\x21\xf6\x1a\x6f\x1c\
+\x7c\x13\x62\x3d\xeb\x87\x88\x65\x14\x93\xb5\x5d\xfb\x81\x93\x3d\
+\xed\x24\x49\x52\xad\x24\xc0\xa7\x89\x3d\x6e\x86\xdc\x2d\x2f\x77\
+\xb0\xf5\x87\xd9\xba\x81\xbb\xc6\xb8\xbe\xb5\xc0\x0d\xc0\x6f\x81\
+\x6b\x88\x23\x42\x4c\xf6\x87\x05\xff\x42\x65\xbd\xe6\x92\x24\x49\
+\x15\x87\xdd\x4f\x18\x76\xb7\xba\x8c\x00\xe7\x8c\x21\xec\x26\xc4\
+\x9a\xd4\xd0\xd6\xd6\x16\x92\x24\xb1\xed\x9e\x58\x96\x11\x7b\xbe\
+\x9d\x55\x4d\x92\x24\xd5\x34\xec\xda\xb3\x3b\xb6\xaf\xdf\x9f\x37\
+\x86\xf6\x6c\x07\xbe\x94\xcd\x66\x43\x3e\x9f\x0f\xb3\x66\xcd\x0a\
+\x53\xa7\x4e\x35\xf4\xc6\xa0\x7b\x06\x30\xdb\x53\x4e\x92\x26\x7e\
+\xe3\x96\x34\x76\x59\xe2\xc4\x12\xff\xe6\xf9\x33\x26\x0f\x11\x1f\
+\xb0\xfa\x51\xf9\xef\x8f\x9b\x39\x73\xe6\x8e\x21\x84\xa3\x8a\xc5\
+\xe2\xfb\x32\x99\xcc\x01\xd9\xec\x93\x9f\xc1\x2a\x14\x0a\xac\x5d\
+\xbb\x96\x10\x42\x2b\xb5\x57\x00\x6e\x02\xce\x07\xbe\x4b\x2c\xdd\
+\x90\x24\x19\x78\xa5\x9a\x69\x03\xbe\x06\xf4\xda\x14\xe3\x36\x04\
+\xc9\xfd\x99\x6c\xe6\xbe\x9e\xee\xee\xd1\xb6\xb6\xb6\x3d\x92\x24\
+\xd9\x99\xad\x3c\xc8\x56\x28\x14\x58\xb3\x66\x4d\x2b\x84\xdc\xfb\
+\x81\x4b\x81\x8b\x81\xbf\x11\x47\xa5\x90\x24\x19\x78\xa5\x9a\xea\
+\x00\xbe\x09\xbc\xd1\xa6\x18\xc3\x85\x25\xc9\x90\xc9\x66\xc8\x64\
+\x32\x64\x32\x59\xb2\xd9\x2c\xb9\x5c\x96\x5c\x36\x4b\x92\x8c\xed\
+\xb2\x13\x42\xa0\xaf\xaf\x8f\xd1\xd1\xd1\xc9\xd8\x44\x45\x62\x4f\
+\xee\xcf\x80\x5f\x00\x37\x12\x1f\xba\x93\x24\x19\x78\xa5\xba\xe8\
+\x06\xfe\x1b\x78\x85\x4d\xf1\x64\x99\x4c\x66\x13\xe1\x36\xfe\x5b\
+\x92\x24\x64\x92\x24\xfe\x99\x19\xfb\xa5\x26\x84\xc0\xe8\xe8\x28\
+\x03\x03\x03\x94\x4a\xa5\xc9\xd4\x5c\x6b\x81\xdf\x01\x3f\x07\xae\
+\x00\xfe\xc1\xf8\x66\xa0\x93\x24\x19\x78\xa5\xaa\xc8\x03\x3f\x04\
+\x5e\xd8\xd2\x17\x8a\x24\x06\xda\xf5\x3d\xb5\xd9\x5c\x8e\x6c\x26\
+\x86\xda\x27\x7a\x6c\x13\x92\x0a\xaf\x28\x21\x04\x8a\xc5\x22\x23\
+\x23\x23\x0c\x0f\x0f\x4f\x96\xa0\x5b\x22\x96\x2a\xfc\x06\xf8\x09\
+\xf0\x7b\xe2\xec\x73\x92\x24\x03\xaf\xd4\x50\x61\xf7\x47\xc0\x31\
+\xad\x13\x6c\x13\x32\x99\x6c\xec\xad\xcd\x3e\xd1\x63\x9b\xcb\x66\
+\xcb\xbd\xb9\xe9\x5d\x32\x0a\x85\x02\x23\x23\x23\x8c\x8e\x8e\x52\
+\x2c\x16\x27\xc3\xc3\x69\x23\xc4\x5e\xdb\xab\x89\xd3\x4c\xff\x19\
+\x78\x80\xe6\x2d\x55\xc8\x12\x4b\x79\x66\x03\x3b\x01\xf3\xcb\xcb\
+\x36\xc0\x2c\x60\x1a\xf1\xdb\x8f\x0d\x87\x4b\xeb\x07\x56\x00\x8f\
+\x95\xdf\xfb\x5d\xc4\xd2\x8d\x15\x58\x97\x2c\xc9\xc0\x2b\x35\x9c\
+\xae\x72\xd8\x3d\x76\x72\x85\xd9\xcc\x93\x7a\x64\x63\x19\xc2\x13\
+\x25\x09\xb1\x14\x01\x12\x9e\x28\x45\x48\x33\xe4\xae\x0f\xba\xeb\
+\xd6\xad\x9b\x2c\xb5\xb9\x8f\x11\x6b\x70\x7f\x5d\x0e\xb9\x0f\x35\
+\xe1\x3d\xa0\x1b\xd8\x19\xd8\x05\xd8\xad\xbc\xec\x4a\x9c\xe6\x79\
+\x7b\xe2\x54\xcd\x13\x51\x04\xee\x06\xae\x05\x2e\x2f\xb7\x55\xbf\
+\x97\x18\x49\x06\x5e\xa9\xbe\x72\xc4\x9a\xdd\xd7\x34\x69\xb0\x2d\
+\x64\xb3\xd9\x6c\x2e\x97\x4b\x72\xb9\x1c\xd9\x6c\x7c\x68\x2c\xed\
+\xe0\x3a\x56\x21\x04\x4a\xa5\x12\xa3\xa3\xa3\x0c\x0f\x0f\x53\x28\
+\x14\x9a\xfd\xf8\x58\x41\x7c\xd8\xec\x7b\xc4\x32\x85\xe1\x06\xd9\
+\xae\x6e\xe2\xb7\x12\x5d\x40\x67\xf9\x38\x86\xd8\x03\x3b\x1d\x98\
+\x09\xcc\x05\xb6\x05\x76\x28\x07\xda\x9d\x81\xed\x88\xbd\xb9\x99\
+\x1a\x6d\xe7\x2a\xe0\x7f\x80\x6f\x10\x1f\xd6\xb3\x8e\x59\x92\x81\
+\x57\xaa\xc3\x39\xf1\x59\xe0\x43\x0d\x10\x5c\x1f\xaf\x9b\xcd\x96\
+\x4b\x0a\x36\x2e\x2b\x08\x21\x3c\x5e\x0a\xb0\xfe\x67\x93\x24\x09\
+\x49\x8d\xd2\xed\xfa\xd7\xdf\x70\x29\x95\x4a\x8f\x2f\x85\x42\x61\
+\xb2\x94\x2b\xac\x1f\x1f\xf7\x9c\x72\x58\xab\xf5\xf8\xb8\x19\x60\
+\x2a\x30\x0f\xd8\x83\xd8\x03\xbb\x0b\xb1\xd4\x60\x87\x72\x88\xed\
+\x22\x0e\x9d\x97\x2d\x87\xdd\xa4\xc1\xaf\xf3\x45\xe0\xe6\xf2\x07\
+\x87\xff\x01\x1e\xf4\xf2\x23\xc9\xc0\x2b\xd5\xc6\x1b\x81\x0b\xa9\
+\x52\x6f\x57\x92\x24\x4f\x0a\xa8\xeb\x43\xed\xe6\x82\x6d\xbd\x7a\
+\x65\x37\x67\x74\x74\x94\x91\x91\x11\x0a\x85\x02\xa5\x52\xe9\x49\
+\x81\x7b\x92\x0a\xc0\x0d\xc0\xe9\xc0\xaf\xa8\x7e\x1d\x6a\x52\x0e\
+\xad\x0b\x80\xfd\x80\x7d\xcb\xcb\xd3\xcb\xc1\x36\x3f\x49\xdb\x79\
+\x08\xf8\x25\x70\x2e\x71\x04\x8b\x92\x97\x22\x49\x06\x5e\xa9\x3a\
+\x76\x01\xfe\x0a\xcc\x48\x7b\xc5\xd9\x6c\x96\x19\x33\xa6\x91\xcb\
+\xb5\x11\x42\x89\xd1\xd1\x02\x49\x92\x69\xf8\x06\xd9\x70\xf4\x84\
+\x91\x91\x11\x8a\xc5\x96\x7a\xee\x68\x09\xf0\x11\x62\x79\x4b\xb5\
+\xea\x30\x7a\xca\x61\x76\x3f\xe0\x90\xf2\x9f\x7b\x55\xe3\x18\x6c\
+\x22\x7f\x25\xce\xce\xf7\xbf\x55\x6c\x77\x49\x06\x5e\xa9\x65\xcf\
+\x85\xcb\x80\xe3\xaa\xb1\xf2\xd9\xb3\x67\xd2\xd6\xd6\xf6\xf8\x7f\
+\x17\x8b\x25\x8a\xc5\xda\x74\x62\x6d\x58\x62\xb0\xbe\xbc\x60\x73\
+\xbd\xc7\xeb\x7b\x6c\x8b\xc5\x22\xc5\x62\xf1\xf1\x5e\xdc\x16\x75\
+\x2a\xb0\x30\xad\xcf\x3c\xc4\xfa\xd9\x5d\x89\x3d\xb6\x07\x95\x97\
+\x3d\x89\xf5\xb6\x5e\x8b\x37\x3a\x14\x81\xbf\x03\x67\x00\x3f\xc5\
+\x11\x1e\x24\x19\x78\xa5\x54\xbc\x88\x38\x21\x40\xea\xdd\xae\x99\
+\x4c\x86\xb9\x73\xb7\x79\xd2\xbf\x55\x18\x78\x03\x30\x48\xec\xf5\
+\x2a\x95\xcf\xdf\xf5\xf5\x9a\x81\x38\x2c\xd6\x43\xc0\x3d\x21\x84\
+\x7b\xfa\xfb\xfb\xff\xad\x50\x28\x24\x2d\x50\x76\x50\x2d\xb7\x01\
+\xcf\x01\x56\x6f\xe5\x1a\xda\xbe\xc1\x3e\x48\x88\x43\x76\xed\x4a\
+\xac\xb5\xdd\x03\xd8\xa7\x1c\x6c\xb7\xe1\xc9\x43\x78\x69\x6c\xc7\
+\xfc\x75\xc4\x9a\xfa\x6b\xf1\x01\x37\x49\x06\x5e\x69\x42\xe7\xc1\
+\xaf\xa8\xd2\x78\xbb\x99\x4c\x86\x39\x73\x66\x3f\xa9\x47\x75\x4b\
+\x81\x77\xfd\x83\x5f\xeb\x7b\x59\x8b\xc5\x62\x31\x84\xf0\x93\xb6\
+\xb6\xb6\xaf\x75\x74\x74\xfc\x3d\x9b\xcd\xf6\x2d\x5b\xb6\x6c\x74\
+\xd6\xac\x59\xeb\x87\x94\x9a\x02\x8c\x26\x49\xb2\x76\xf9\xf2\xe5\
+\xeb\xc7\xfa\x6a\x23\x8e\x81\xba\xc0\xdd\x3b\x21\x77\x01\x5f\x27\
+\x3e\xb0\x36\x48\xac\xa1\xdd\x91\x38\xba\xc1\xd3\xca\xcb\xbc\xf5\
+\xfb\xa0\x1c\x7c\xa7\xda\x6c\xa9\x2b\x02\x97\x00\x1f\x03\xee\xb3\
+\x39\x24\x19\x78\xa5\xf1\xdb\x96\xd8\x33\x9a\xab\xd6\x0b\xcc\x98\
+\x31\x8d\xce\xce\xce\x0d\x02\x6f\x91\x75\xeb\x86\x1e\x2f\x19\x58\
+\x1f\x70\xd7\x97\x1e\x94\x8d\x94\x6f\xf2\x9f\x27\x3e\xcd\x3e\x5e\
+\x3f\x04\x5e\xe9\xee\x4d\x4d\xf0\x9a\x59\x77\xfd\xe5\xf3\xe1\x8b\
+\xc0\x3a\x9b\x43\x92\xa4\xb1\x3b\x90\x58\x22\x10\xaa\xb5\x24\x49\
+\x12\xa6\x4c\xc9\x87\xd9\xb3\x67\x86\x19\x33\xa6\x87\x5c\x2e\xb7\
+\xa5\x9f\x5f\x07\x7c\x93\xf8\xb5\xf8\x44\xbc\xbf\x9a\xef\xc9\xc5\
+\xa5\x8e\xcb\x9d\xc0\x8b\xfd\x00\x22\x49\xd2\xd8\xcd\x22\xf6\xa6\
+\xd6\xfb\x26\x3e\x48\x7c\x48\x6a\xe7\x94\xde\xd7\x41\xd5\x0e\xf2\
+\x2e\x2e\x75\x5c\xd6\x97\x39\xcc\xf7\x12\x26\x49\xd2\xd6\x25\xc4\
+\x99\xb3\xea\x75\xe3\x1e\x02\x16\x31\xf1\x1e\xdd\x8d\xe5\x88\x43\
+\x6b\x19\x8e\x5c\x26\xf3\xb2\x0a\xf8\x20\x71\xb4\x0b\x49\x92\xb4\
+\x05\xfb\x11\x7b\x58\x6b\x79\xa3\x1e\x05\x2e\x06\x76\xaf\xe2\xfb\
+\xfa\xbe\x81\xc8\xa5\x45\x96\xdb\x80\x63\xb1\xcc\x41\x92\xa4\x2d\
+\x3a\x8d\xda\x94\x00\x94\x80\xab\x88\x13\x0d\x54\xfb\xe6\xfc\x4e\
+\x83\x90\x4b\x0b\x2d\x05\xe2\xc3\x9a\xbb\x78\x39\x93\x24\x69\xd3\
+\x12\xe0\x53\x55\x0e\xbd\xf7\x02\xaf\xa2\x4a\x53\x17\x6f\xc2\x02\
+\x1a\xa3\x3e\xd9\xc5\xa5\x96\x4b\x3f\xf0\x59\x60\x9a\x97\x35\x49\
+\x92\x36\x1d\x7a\xff\x85\x58\x57\x9b\xf6\x4d\xf8\x52\xe2\x38\xae\
+\xb5\xf6\x7f\x06\x20\x97\x16\x5d\x96\x00\x1f\x20\x4e\xe1\x2c\xa9\
+\x85\x65\x6d\x02\xe9\x29\xae\x07\xae\x00\x0e\x03\xe6\xa4\xb4\xce\
+\xdb\x81\x97\x03\x6b\xeb\xf0\x7e\xe6\x00\xcf\x77\xb7\xaa\x05\xe5\
+\x89\xb3\x28\xbe\x7d\x83\xf3\x70\xc8\x66\x91\x24\xe9\x09\xdd\xc4\
+\x29\x4d\x97\x33\xb1\x5e\xa6\x95\xc0\xde\x75\x7c\x1f\xfb\xe3\xf0\
+\x64\x2e\x2e\x01\x78\x0c\xf8\x0a\x71\xca\x67\x1f\x6e\x93\x24\x69\
+\x03\xdb\x00\x1f\x05\xfe\x51\xc1\x0d\x76\x1d\x70\x5c\x9d\xb7\x3f\
+\x47\xec\xd9\x32\xf0\xb8\xb8\xc4\x65\x04\xf8\x0d\xb1\xe7\x77\x86\
+\x97\x38\x69\xf2\xb3\xa4\x41\xda\xba\x75\xc0\x1f\x81\x73\x89\xa5\
+\x0e\xcb\xcb\xff\xde\x46\xec\x05\xde\xdc\x03\x68\xab\x80\xd7\x03\
+\x3f\xaf\xf3\xf6\x97\x80\x1d\x80\xc3\xdd\x95\xd2\xe3\xf7\xbe\x5d\
+\x80\xe3\x89\xa3\xb3\x1c\x0e\xcc\x04\x1e\x01\xfa\x6c\x1e\x49\x92\
+\x9e\xd0\x49\x1c\x43\xf7\x0b\xc4\xa9\x4e\x07\x80\xe1\x72\x20\xfe\
+\x2e\xe9\xcd\x98\x96\x86\x7d\xb0\xac\xc1\xc5\x65\x2c\xdf\xc8\xfc\
+\x18\x78\x21\xd0\xe1\x25\x4e\x9a\x3c\xac\x61\x92\xd2\x3b\x97\xb6\
+\x29\xdf\x24\x57\x94\x6f\x9c\x8d\x24\x03\xfc\x19\x38\xd8\x5d\x25\
+\x8d\xc9\x7d\xc0\x45\xc0\xb7\x81\xfb\xcb\x81\x58\x52\x93\xb2\xa4\
+\x41\x4a\xcf\x00\x71\x14\x86\xd1\x06\xdc\xb6\x40\x1c\x9a\xe9\x45\
+\xee\x26\x69\x4c\x66\x00\x47\x00\xef\x05\x8e\x2c\xdf\x2f\xef\xc7\
+\x51\x1e\xa4\xa6\x64\x0f\xaf\xd4\x3a\xe6\x11\x27\xbe\xe8\xb4\x29\
+\xa4\x8a\xf4\x11\x4b\x1e\xbe\x09\x5c\xdb\xa0\x1f\x6e\x25\x6d\x82\
+\x3d\xbc\x52\xeb\xe8\x27\x0e\x51\xb6\xb7\x4d\x21\x55\xa4\xa3\x7c\
+\x0e\xbd\x15\x78\x33\xb0\x1d\x71\x72\x8b\x15\x58\xf2\x20\x35\x34\
+\x7b\x78\xa5\xd6\xf2\x42\xe0\x97\x9e\xfb\x52\x6a\x02\x70\x03\xf0\
+\x7d\xe0\x7b\xc0\xa3\x36\x89\x64\xe0\x95\x54\x5f\x6d\xc0\xcd\xc0\
+\x9e\x36\x85\x94\xba\x51\xe2\xd0\x85\x17\x01\x97\x03\xab\x6d\x12\
+\xa9\x31\x58\xd2\x20\xb5\x96\x12\x71\x22\x8a\x63\x6d\x0a\xa9\x2a\
+\xf7\xd4\xdd\x80\x57\x02\xa7\x10\xcb\x87\xfa\x88\xe3\xfb\x16\x6d\
+\x1e\xa9\x7e\xec\xe1\x95\x5a\xcf\x4c\xe0\xee\xf2\x9f\x92\xaa\xef\
+\x7e\xe0\x87\xc0\x77\x80\x5b\xcb\x1f\x3c\x25\xd5\xf8\xd3\xa8\xa4\
+\xd6\x32\x48\x7c\xd8\xe6\x30\x9b\x42\xaa\x89\xe9\xc0\xb3\x81\x5e\
+\xe0\xc5\xc4\x21\x02\xef\x23\x0e\x65\x28\xa9\x06\xec\xe1\x95\x5a\
+\xd3\xce\xc0\xed\x38\x9b\x94\x54\xcf\x0f\x9e\x3f\x27\xf6\xfa\xfe\
+\x06\xc7\xf7\x95\x0c\xbc\x92\xaa\xe2\x3b\xc0\x5b\x6c\x06\xb5\x98\
+\x12\x70\x25\xf0\x0d\xe2\x94\xe0\x7d\x40\x17\x30\x9f\x58\x73\xfb\
+\x2c\xe0\x70\x60\x4e\x0d\xef\x91\x0f\x12\xa7\x23\xbf\x00\xf8\x07\
+\x0e\x71\x26\x49\x52\x6a\xf6\x05\x46\xca\x37\x57\x17\x97\x56\x58\
+\x56\x11\x1f\x28\xdb\x5a\x90\xed\x00\x9e\x03\x7c\x1e\x78\xa0\x1c\
+\x92\x6b\xb1\x7d\xeb\x47\x79\x78\x1d\x4e\x10\x23\x49\x52\x6a\x7e\
+\x60\x08\x72\x69\x91\x65\x14\x78\x41\x05\xe7\x48\x0e\x38\x1a\xf8\
+\x16\x4f\x4c\x30\x51\x8b\xe5\x11\xe0\xd3\xc0\x2e\x5e\xa6\x24\x49\
+\x9a\x98\x7d\x81\x61\xc3\x90\x4b\x0b\x2c\x57\xa6\x70\xbe\xe4\x81\
+\x57\x11\xa7\x17\x5e\x53\xa3\xed\x1e\x2e\xbf\xde\x0b\xf0\x41\x73\
+\xa9\x62\xd6\xf0\x2a\x7d\xa7\x6e\x93\x27\x0c\x1d\x48\xa9\x74\x10\
+\x24\x0b\x48\x98\x0f\x61\x3e\x30\x07\x92\x6e\x62\xbd\x5c\x57\xf9\
+\x62\x3e\x44\x7c\x78\xa3\x9f\x38\x43\xd1\x23\x24\xc9\xc3\xc0\x2d\
+\x24\xa5\xbf\xb1\x6c\xe0\x36\x2e\x61\xc4\x46\xad\xaa\x8b\x80\x37\
+\x56\xfd\x55\xf6\xcc\xc0\xfc\x2c\x4c\xc9\x40\x57\x06\x3a\x12\xc8\
+\x24\x90\x2d\x5f\x86\x8a\x01\x4a\x01\x86\x02\xac\x2b\xc1\x9a\x12\
+\x3c\x50\x80\x7b\x9b\xbc\x9c\x71\x4e\x02\x0b\x32\x30\x63\x83\xf7\
+\xdd\x91\x81\x5c\x02\x99\x72\x84\x49\x92\x78\x36\x14\x43\xfc\xb3\
+\x14\x60\x24\xc0\x70\x80\xa1\x12\xf4\x97\xe0\xb1\x12\xdc\x53\xc2\
+\xb3\xa1\x62\x5f\x00\x3e\x94\xe2\xfa\x66\x12\xeb\x7d\xf7\x01\xa6\
+\x02\xb3\x81\x1d\x80\xdd\xcb\x7f\x76\xa6\x7c\x8f\x0d\xc0\xff\x01\
+\x5f\x23\x7e\x33\x33\x58\x95\x4c\xf0\xde\xee\x79\x14\xb3\xbb\x12\
+\xd8\x15\xc2\xf6\xc4\x11\x5d\xe6\x95\xdf\xdf\x74\x60\x1a\x30\x85\
+\x24\xb4\x13\x92\x36\xe2\x64\x36\x45\x62\x0f\xfa\x28\xf1\x08\x5d\
+\x03\xc9\x6a\x08\xab\x80\x65\x10\x1e\x22\x24\x0f\x40\xe9\x7e\x72\
+\xa5\x5b\x39\x67\xe8\x01\x0f\x47\x19\x78\xd5\x7c\x4e\xa4\x9d\x99\
+\x3d\x47\x90\x24\x2f\x05\x8e\x01\xf6\x20\xde\xca\xd3\x30\x0c\xfc\
+\x81\x10\x7e\x41\x29\x73\x19\xdf\xe8\xbb\xcb\x06\x4f\xdd\x02\xe0\
+\x46\x60\x46\xea\x6b\xde\x39\x81\xbd\xdb\x60\x9b\xb6\x18\xf4\x2a\
+\x31\x58\x82\x7f\x8e\xc2\xad\x05\xf8\x67\x13\x84\xdf\x0e\xe0\xc0\
+\x2c\x6c\x9b\x83\x19\xd9\x18\x6e\xd3\x52\x02\xfa\x8b\xb0\xbc\x00\
+\xf7\x15\xe1\x6e\x87\x73\x1d\x87\xcf\x02\x1f\xad\xd1\x6b\x4d\x03\
+\xf6\x22\x0e\x45\x76\x2c\xf1\x21\xb8\x34\x6b\x72\x1f\x02\xce\x25\
+\x3e\x78\xb7\xa2\xa2\x35\xbc\xa7\x73\x27\x8a\x6d\xfb\x12\xd8\x17\
+\xd8\x8b\x24\xec\x5d\xbe\x76\x77\xd7\xa0\x7d\xd6\x00\x37\x01\x57\
+\x93\xe1\x2a\xb2\xfd\xd7\x72\x36\xc3\x1e\xa2\x32\xf0\xaa\x31\x9d\
+\xd2\x7d\x30\x24\xa7\x10\x92\xd7\x00\x53\x6a\xf4\xaa\x7f\x80\xb0\
+\x98\x15\x03\x97\xd8\xf3\x3b\x4e\xbd\xd3\x17\x40\xe1\xbe\x54\xd6\
+\xb5\xaa\x00\x3f\xd8\xc2\x28\x4a\xbb\x65\xe0\x80\x76\x98\x95\x4b\
+\xef\x2a\x13\x02\x3c\x34\x0a\x7f\x1a\x81\x95\x0d\xd8\xbe\x7b\x65\
+\x60\xcf\xb6\xf8\x9e\xb3\x35\xba\xb4\xae\x2b\xc1\x23\xa3\xf0\xd7\
+\x02\xac\xa9\xf1\x87\x81\xdd\x32\x70\x74\x4a\xd9\x68\x6b\xc7\xd3\
+\xa6\x4c\x01\x9e\x96\x85\xb9\x59\xc8\x97\x7b\xcf\xdb\xca\xdf\x18\
+\x24\xe5\x0f\x07\xa5\x10\xfb\x1e\xef\x1e\x86\x3f\x16\x2e\x04\xde\
+\x5a\xb3\x73\x04\x7e\xc2\xa2\xfe\x57\x94\xef\xb3\xdb\x00\xaf\x07\
+\xde\x0e\xec\x9f\xe2\x7b\x5a\x51\x0e\xf2\x0b\xd9\xd2\x98\xbe\xef\
+\x98\x3d\x85\xb6\xe1\x23\x49\x4a\xcf\x86\xe4\x19\x04\x0e\x26\x61\
+\x7a\x03\x9d\x3d\x7d\x90\xfc\x98\xa4\x78\x31\x73\xd7\xfd\x8a\x33\
+\x9c\x98\x43\xe9\xcb\xd9\x04\x1a\x7f\x70\x9a\xf2\x52\x28\xfd\x07\
+\x21\x39\xb4\x0e\xaf\xfe\x5c\x48\x9e\xcb\xac\x9e\x4f\xd3\xcb\x7f\
+\xb2\xed\xc0\x7f\x7b\x71\x6c\x20\x33\x13\x38\xbc\x1d\xe6\xb5\xa5\
+\xff\x71\x3a\x49\x60\xc7\x76\xd8\xb6\x0d\x6e\x1e\x82\xbf\x36\xc8\
+\x4c\xad\x07\x65\xe1\xe9\xed\x30\xa5\x0e\xe5\x95\xdd\x19\xd8\xbd\
+\x03\x76\x69\x87\x25\xa3\x70\xfd\x28\x3c\x36\x89\x47\xb4\xea\x01\
+\x0e\xcc\xc1\x76\x39\x98\x9e\xdb\xf2\xf7\x48\x19\x62\xc9\x4c\x8e\
+\xf5\xdf\x2e\xec\x55\xa7\xad\x0e\xc0\x63\xc0\x57\x89\xbd\xb2\x2f\
+\x06\x4e\x07\x0e\x4a\xe1\x3d\xcd\x22\x96\x6a\xf4\x02\xff\x8f\x38\
+\x9b\xdb\xe8\x53\x7e\xaf\x63\xf8\xb5\x84\xf0\x8d\xc7\x4f\xca\xc6\
+\xeb\xea\x9a\x02\xe1\xcd\x84\xcc\x9b\x59\x92\xbf\x9b\x53\x92\xb3\
+\x58\xde\x77\x81\x9d\x1a\x4a\x53\xc6\x26\xd0\x98\x9d\x34\xf5\x99\
+\xf4\xe6\x7f\x0f\xe1\x67\x50\x97\xb0\xbb\x61\xfa\x59\x00\xc9\x85\
+\x2c\x99\x72\x3d\x27\x4d\xd9\xd3\x9d\xd3\x00\x0e\xcf\xc1\x09\xdd\
+\xb0\x5d\x5b\x75\x6f\xa8\xed\x09\x1c\xdc\x05\xc7\xb6\xd7\xf7\xfd\
+\xee\x9e\x81\xd7\x74\xc2\xa1\x5d\xf5\x09\xbb\x1b\xca\x26\xb0\x7d\
+\x3b\xbc\xbc\x1b\x8e\x6e\x9b\x7c\x5d\x19\xb3\x13\x78\x71\x3b\xbc\
+\xb6\x07\xf6\xe9\x84\x99\xb9\x4a\xee\x5e\x3b\x13\x1f\x3a\xab\xa7\
+\x51\xe0\xa7\xc0\xb3\xd8\x39\xfb\x01\x8e\x6b\x1f\x98\xe0\x7b\x5a\
+\x6f\x57\xe0\x62\xe0\x77\xb1\x53\xa0\xa9\xbf\xbd\xdd\x9d\x10\x16\
+\x33\x2b\x7f\x13\xa7\xe6\x9f\xef\x85\x55\x06\x5e\xd5\xce\x69\x74\
+\xd0\x3b\xe5\x2c\x32\xa5\x6b\xcb\x17\xd3\x06\x12\x0e\x21\x13\x6e\
+\xa4\x37\x7f\xb2\x3b\xaa\x4e\xb6\x4f\x62\xf0\xdb\xa7\x33\x7e\xfd\
+\x5a\x93\xcf\x3b\xc0\x82\x76\x78\x79\x9d\x26\x8a\x3b\xaa\x0d\x5e\
+\xd0\x15\x43\x4a\x23\xc9\x25\xb0\x5b\x07\xbc\xae\x2b\x96\x1c\x4c\
+\x06\x47\xe6\xe0\xf8\x6e\xd8\xa9\x3d\x7e\xd8\xa9\xdc\x2c\xe2\x64\
+\x12\xf5\x96\x70\x4a\xcf\x6b\x78\x51\xd7\x07\xd9\xb1\xbd\x67\x82\
+\xef\x69\x63\xcf\x2e\x87\xde\x1f\x51\xbf\x1e\xed\xb4\xec\x49\x89\
+\x2b\xe9\xed\xf9\x1c\x27\x3a\x3a\x85\x0c\xbc\xaa\xb6\xf7\xe4\xf7\
+\x66\x24\x7f\x03\x84\x7f\x6b\xe0\xe3\xa5\x0b\x58\x44\x6f\xcf\xe7\
+\xb0\x2e\xbd\xb6\x0e\xcb\xc2\xb1\xdd\xf5\x0b\x7e\xdb\xb5\xd5\x36\
+\xf4\xce\x4e\xe0\xb5\x9d\xb1\x8c\x20\x69\xe0\x43\x2d\x9f\x85\xe7\
+\x77\xc1\x73\x9a\xb8\xab\x77\xd7\x0c\xbc\xa9\x0b\xf6\x4c\xf5\x83\
+\xd4\x0e\x75\x7d\x4f\xef\x9a\xb6\x33\xa7\xe4\x7f\x4f\x48\xbe\x4b\
+\x1c\xfd\xa0\x5a\xf7\xf5\x57\x10\x1f\x44\x3d\xa7\x8a\xaf\x53\xab\
+\xcf\x07\x1f\x62\x66\xcf\x4f\x38\x91\x76\x24\x03\xaf\xaa\xe2\xe4\
+\x9e\xa3\x28\x72\x0d\x09\x7b\x37\xcd\x85\xb1\x37\xbf\xd8\x1d\x57\
+\x8b\xa6\x06\x5e\xd2\x0e\x07\x74\xd5\xae\x57\x77\x4b\xa1\xf7\xa8\
+\xb6\xea\xbf\xce\x4e\x09\x1c\xd7\x05\x33\x9a\x24\x44\x66\x13\xd8\
+\xb7\xb3\x36\x6d\x93\xb6\xe7\x97\x7b\xd0\xf3\xa9\x77\xec\x75\xd5\
+\xed\x3d\xf5\x4e\x79\x1b\xb9\xe2\x4d\x04\x0e\xaf\xd1\x2b\x76\x00\
+\xa7\x02\xb7\xf1\xe8\xe8\x4b\x9b\xfb\x7a\x93\xbc\x84\x59\xf9\xff\
+\xe1\x0c\x9f\x3b\x92\x81\x57\x69\x3b\xa5\xe7\x4d\x24\xc9\x2f\x88\
+\xc3\xeb\x34\x93\x77\x73\x72\xfe\x3f\xdd\x81\x55\x36\x3d\x07\xf3\
+\x1b\xa8\xc3\x65\xb7\x0e\xd8\xb7\x8a\x97\xb3\x5d\x12\x38\xaa\x2b\
+\x3e\x24\xd6\x6c\x76\xef\x80\xe3\x9a\xa4\x73\x6c\x26\xf0\xea\x4e\
+\xd8\xa3\xa3\x5a\x23\x5d\xac\xa9\xf9\x7b\xfa\x00\x5d\xf4\xe6\xff\
+\x1b\xc2\xb7\xa9\xdd\x68\x36\x1b\x9a\x46\x5f\xf1\xf8\x49\x70\xd5\
+\x39\x9e\x47\xf3\xa7\x7b\xf1\x95\x81\x57\x29\xf6\x44\xe4\x5f\x45\
+\x48\x2e\x20\x0e\x28\xde\x84\xbd\x01\x7c\x82\xde\x29\x27\xb8\x23\
+\x5b\x48\x02\x1c\xd8\x59\x9d\xfe\xbb\xb9\x09\x3c\xaf\x0b\xda\x9b\
+\xf8\x72\xb9\x63\x3b\xbc\xa0\xc1\x4f\xe7\x5d\x12\x78\x69\x37\xcc\
+\xae\x5a\x27\xde\xfa\xe9\x7a\x6b\xe7\xa4\xae\x1d\x19\xcc\xff\x11\
+\x78\x83\x27\x69\x2a\xe7\xf9\xc7\x38\x75\xca\xb3\x6d\x08\x19\x78\
+\x35\x71\xa7\xf4\x1c\x0d\x7c\x8f\xa6\x9f\xc2\x32\x2c\xa6\x37\x3f\
+\xc7\x1d\xda\x42\xba\x33\x70\x44\xca\x3d\x99\x1d\xc0\x31\x9d\xd0\
+\x39\x09\x2e\x95\xbb\x77\xc4\x9a\xeb\x46\xd4\x95\x81\x17\x74\x57\
+\xbb\x07\x7d\x15\xb0\xba\x86\xef\x6a\x4f\x32\xd9\xbf\xb2\x7e\xf8\
+\x31\xa5\x93\x59\x42\xe9\x4b\x36\x83\x0c\xbc\x9a\x98\xf7\x74\xee\
+\x44\x48\xfe\x07\x26\xc5\xc3\x01\xdb\x00\x5f\x77\xa7\xb6\x98\xf9\
+\x6d\xb1\x47\x36\x2d\x2f\xea\xa8\x46\x1d\x69\x7d\x24\xc4\x91\x34\
+\x76\x6c\xc0\x87\xed\x3a\xcb\x53\x2d\x57\xd7\x3d\x40\x5f\x0d\xdf\
+\xd5\x1e\xe5\xeb\x90\xd2\x14\x92\x67\xc6\xb1\xe0\x25\x03\xaf\x2a\
+\x71\x06\x39\x8a\xb9\x8b\xa9\xc6\xf4\xb2\xf5\x73\x22\xbd\x53\x0f\
+\x75\xe7\xb6\x90\x6c\x02\x87\xa6\xf4\xd5\xfd\x33\xb3\xf1\x81\xb8\
+\xc9\x24\x97\xc0\x73\x3a\x5b\xf5\xe8\xf8\xbd\x27\xc8\xa4\x49\xbd\
+\xef\xb2\x0d\x34\xee\xcb\x9f\x4d\x20\x00\x96\xe4\x3f\x0e\x3c\x2b\
+\xe5\xb5\x0e\x01\x97\x41\xb8\x96\x52\xe6\x2f\xb4\x8d\x3e\xc4\x68\
+\xd7\x6a\xb6\x5b\x35\xc0\x43\x53\xa7\x92\x4d\x66\x90\x2b\xee\x48\
+\x31\x39\x8c\x24\x1c\x01\x1c\x93\xfe\x87\xb0\xd2\x67\x80\xa3\xdd\
+\xc1\x2d\x64\xdb\x36\x98\x3e\x32\xb1\x2f\xaf\xf3\xc0\xde\x55\x0a\
+\x86\xa3\x21\x4e\xa5\xbb\xa2\x08\x8f\x95\xa0\x2f\xc0\x8a\x00\xd3\
+\x12\x98\x9e\xc0\x8c\x04\xb6\xc9\xc1\xcc\x6c\x75\x4a\x29\xa6\x65\
+\xe3\x28\x08\x57\x8d\xb6\xda\x91\xf1\x13\x4f\x8e\xb1\xe6\x49\x96\
+\x93\x09\xd7\x11\x92\x1b\x81\xdb\x48\x32\x0f\x32\x3a\xfa\x30\x99\
+\xce\x3e\xb6\x5b\x35\xc0\xad\x64\xd8\x76\x66\x27\x83\xc3\x5d\xb4\
+\xe5\x7a\x28\x96\xb6\x23\x29\xcd\x27\x93\xd9\x91\x10\x0e\x2e\xdf\
+\x4b\xaa\x39\x04\xdc\x4b\x78\xe7\xd4\x99\x7c\x73\xed\x4a\x77\x96\
+\x0c\xbc\x1a\xbb\xf7\x74\xee\x44\x91\x0f\xa7\xb8\xc6\x15\x84\xf0\
+\x29\xba\xda\xbe\xc3\x57\x56\xaf\x7e\x6a\x06\x06\x58\xbb\x12\x58\
+\x09\xfc\x03\xb8\x0a\x38\x93\x93\xa7\xee\x4e\x12\x3e\x0e\xe1\xad\
+\x29\x6e\xcb\x51\xbc\x27\xbf\x37\xe7\xf4\xdf\xea\x8e\xae\xfa\x4d\
+\x12\xd6\x16\xa1\xaf\x08\x2b\x4a\xb0\xba\x04\xfd\x01\x96\x87\x38\
+\x7e\xed\xb4\x04\xf2\x09\xcc\xa9\x62\x98\x83\xd8\xcb\x7b\x70\x1b\
+\x5c\x31\x81\x40\xf7\xdc\x09\x4f\x72\xb0\x89\xcf\x5e\xc0\xfd\xc3\
+\x70\xf5\x28\x0c\x6f\xe2\xff\x0f\x06\x58\xb2\x7e\x5a\xe0\xf2\xb4\
+\xc9\xcf\xc8\xc2\x5e\x1d\xb1\xc6\x35\x4d\xbb\xb4\xc3\x4d\xa3\xf1\
+\x0c\x6c\x05\x59\x96\x00\x7f\x9a\x54\xef\xa9\x3d\xb9\x19\xd8\x97\
+\x34\xc6\x1e\x2f\x01\x6b\x0b\xb0\xbc\x08\x0f\x17\xe1\x8e\xd2\x34\
+\xa0\x13\xb8\xa6\x7c\x7d\x2e\x94\x0f\xd2\x0d\x7e\x69\xe5\x08\xb0\
+\xb6\xfc\x1f\xf7\x3e\x65\x9d\xa7\x4e\xdd\x8d\x50\x7a\x33\x21\x79\
+\x2b\x84\x9d\x52\xcf\x2e\x6d\xe1\x08\xe0\x52\x2f\xbc\x32\xf0\x6a\
+\xec\x8a\xb9\xb3\x48\xef\xf9\xf6\x8b\xc9\x26\xa7\x71\x4e\xff\x8a\
+\x71\xff\xe6\xe2\xb5\x77\x03\x6f\xe3\x94\x9e\xdf\x12\x92\xf3\x89\
+\x8f\x0c\xa5\x11\x34\x4e\x06\xde\xe7\x8e\xae\x92\x75\x01\xfe\x39\
+\x02\xb7\x17\xe0\x91\xb0\xe9\x9f\x79\x28\xc4\x65\xc3\x30\xf7\xcc\
+\x72\x98\xeb\xa8\x42\xf0\xdd\x3e\x47\x9c\xc5\xb5\x02\xdb\x25\xb0\
+\x43\xca\xa5\x0c\xa3\x01\xfe\x3c\x08\x7f\x2f\x8d\xef\xf7\xfe\x52\
+\x84\x5b\xd6\xc1\x8b\x3b\x60\x4e\x8a\xdb\xd4\x96\xc0\x61\xed\xf0\
+\xf3\x91\xd6\x38\x46\xf3\x99\xdf\x3f\x11\xda\x26\x89\xf9\xed\x8b\
+\x60\x64\x08\xf8\x22\x95\x94\xa2\x15\x02\xac\x2a\xc2\x92\x02\xdc\
+\x5a\xd8\xf8\x1b\x91\x36\xe2\x37\x6e\xc7\x00\x7f\x05\x3e\x09\x5c\
+\x5e\x8e\xc6\x63\x73\xee\xda\x7b\x80\xd3\x39\x91\xff\x62\x66\xfe\
+\x3f\x48\xf8\x30\x69\x8e\xfc\x13\xc2\xf3\x0c\xbc\x1a\x0f\x6b\x78\
+\x5b\xdd\x49\x3d\xfb\x02\xaf\x4e\x65\x5d\x09\x67\xb3\xa8\xff\x8d\
+\x9c\xd3\xb7\x62\x42\xeb\x59\x38\x70\x11\x49\xf2\xde\xf4\x2e\x8c\
+\xbc\xd1\xa9\x29\xab\x60\xa0\x04\xff\x37\x08\x17\x0e\xc0\x6f\x47\
+\x37\x1f\x76\x37\xe7\xfa\x22\x7c\x6f\x1d\x2c\xab\x42\x0e\xe9\xce\
+\xc2\xce\x15\x76\x7c\xed\xdf\x96\xee\x18\xb0\x85\x00\xd7\x55\x10\
+\x76\xd7\x1b\x04\x7e\x34\x0c\xcb\x52\x2e\x41\x98\xd7\x96\xd6\x47\
+\xca\xc6\x37\x33\x77\xcd\xa4\x7b\x4f\x09\x01\xf8\x36\x70\x20\xf0\
+\xab\x31\x1f\x8b\x4b\x47\xe1\x86\x41\xb8\x60\x00\x7e\x38\x04\xd7\
+\x14\xb6\x56\xfe\x73\x08\xf0\x53\xe0\x17\xc0\xae\xe3\xde\xce\x4b\
+\x18\x61\x71\xff\x7f\x10\x78\x03\xf1\x7b\xa0\xb4\xde\xff\xde\x48\
+\x06\x5e\x8d\xe3\xa2\xf1\x81\x74\xd6\x13\x7e\xc6\xc2\xfe\xf7\xa5\
+\x76\x41\x5b\xd8\x77\x3e\xf0\xc3\xb4\x6e\x77\xcc\x98\xf2\x2c\x77\
+\x76\x8a\xd6\x16\xe1\xbb\xeb\xe0\x4f\xc5\x89\xad\x67\x18\xf8\xc9\
+\x10\xac\xac\x42\xe8\xdd\xa5\x82\x2f\xb0\x7a\x48\xff\x41\xb5\x5b\
+\x87\xe1\xb6\xd2\xc4\xd7\x73\xd9\x30\x0c\x96\xd2\xdb\xae\xb6\x04\
+\x0e\x6b\x91\x2f\xf9\xb2\xc9\x64\xee\xca\x7e\x00\x78\x09\xd0\xcb\
+\xe6\x26\xd6\xb8\x62\x14\x16\xf5\xc3\xf9\x03\x70\xe9\x70\xfc\xe6\
+\x60\xfc\xa7\xdc\x0b\x81\x3f\x03\x2f\xaf\x68\x2b\x17\xf7\xff\x2f\
+\x24\xe9\x0d\x29\x96\x84\xdd\xbc\x10\xcb\xc0\xab\xb1\xe9\xcd\xcf\
+\x21\x49\x26\x3e\x20\x7a\x12\x06\x28\x96\xde\x9b\xfa\xf6\x85\xf0\
+\xa9\xf4\x6e\x78\xa5\xe3\xdc\xe1\x29\x2a\xa6\xd7\x51\x43\x01\xf8\
+\xf9\x10\x0c\x97\xd2\xdd\xc6\xd9\x15\x74\xea\x1f\x90\x4b\x77\xaa\
+\xe4\x55\x05\xb8\x2e\xa5\x30\x3f\x0c\xdc\x3c\x9c\x6e\x1b\xcd\x6f\
+\xf3\x58\x9e\x24\x67\x24\xb0\x98\xd8\x1b\x7b\x15\x69\xf6\xa4\x6e\
+\xdc\x79\x00\x97\x00\x6f\xab\xec\x5c\x2f\x7c\x85\xc7\x6b\x9a\x26\
+\x7a\x7f\x48\xe6\xb9\xdb\x35\x1e\xd6\xf0\xb6\xb2\x84\x13\x09\x29\
+\x7c\xa9\x19\x92\x0b\x39\x6f\xf0\xc1\xd4\xb7\x6f\xf1\xc0\x4d\xf4\
+\xe6\xaf\x23\x8d\xd1\x23\x42\x32\xf6\xf9\xeb\x7b\xf3\x47\x96\x6f\
+\x1a\x0d\xba\xdf\xc2\x37\x59\x38\x30\xb9\x86\xe5\xe9\x07\xee\x1c\
+\x81\xfd\x52\x1c\x19\x61\x4a\x05\x81\x77\x5e\xca\x97\xc4\x5b\x53\
+\xee\x58\xfc\x5b\x11\xf6\x28\xc2\xf4\x94\x2a\x74\xf2\x59\x98\x9f\
+\x6c\x50\x5f\xdd\x60\x1f\xaa\x06\x02\xac\x29\xc0\x50\x80\xbe\x12\
+\xac\x0d\x30\x1c\x62\x99\x47\x7f\x80\x11\xe2\x88\x1a\x6d\xe5\x87\
+\x22\x7b\xca\x4b\x77\x02\xb3\x72\xff\x64\x5a\x36\x07\x34\xd2\x04\
+\x34\xab\x48\x92\xeb\x29\x85\xbf\x92\x49\x1e\xa0\x54\x7a\x80\x4c\
+\xe6\x41\xb2\xc5\x3e\x8a\x6d\x83\x0c\xae\x19\x64\x01\x23\xac\xa1\
+\x83\xb5\x53\xbb\xc8\x84\xd9\x64\x98\x45\x12\xb6\x23\x84\x9d\x49\
+\x92\x03\x88\xa3\xce\xcc\xdd\xcc\xfa\xef\x21\xd6\xdd\xbe\x1b\x38\
+\x13\x98\x5e\x85\xf7\xd0\x5e\x0e\xd7\xcb\x81\xcb\xc6\xf5\x9b\xe7\
+\x0f\x3e\x4c\x6f\xfe\x8f\xc0\x11\x29\x6c\x47\x27\x67\x90\xe1\x0c\
+\x4a\x48\x06\x5e\x6d\x39\x04\xf2\xca\x94\xd6\xf3\xfd\x2a\x6e\xe5\
+\x95\xa4\x33\x5c\xda\xfe\xc4\xa7\x99\x83\x3b\xbe\x41\x5d\x5b\x80\
+\x3d\x4a\xe9\x3d\xc4\x96\x4b\x60\x8f\x0c\xdc\x39\xc6\xfb\x61\x0f\
+\xe9\x05\x49\x88\xa3\x55\xdc\x52\x85\x7b\xf1\x03\xa3\xe9\x6e\xe7\
+\x6e\x39\x78\xa8\x01\x86\x28\x0b\x40\x7f\x31\xd6\x74\x3f\x5c\x1c\
+\x7b\x19\xc8\xca\xf2\x2f\x2f\x7d\xd2\xa9\xfd\x4b\x18\x3d\xb1\xfc\
+\x51\xaa\xae\xb1\x1d\xb8\x16\xc2\xa5\x64\x92\x5f\x72\x6e\xff\x1d\
+\x63\xbc\x06\x0d\xc2\xda\x41\x2a\x1b\x47\xa3\x08\x2c\x22\xd6\xf5\
+\x7e\x8d\x58\xee\x90\xf6\xac\x1e\xed\xc0\x45\xe5\xf0\xfd\xd7\xf1\
+\xed\xe7\x70\x2f\x49\x72\x44\x2a\x5b\xf1\xe0\xec\x1e\x58\xde\x87\
+\x64\xe0\xd5\x66\xbd\x67\xca\x2c\x8a\x21\x8d\x8b\xce\x1a\x16\xf7\
+\xff\xa1\x7a\x37\xc1\xf0\x47\x92\x54\xae\xd5\x53\x39\x75\xea\xae\
+\xe5\x27\x87\xd5\xa8\x96\x16\x60\xc7\x14\x27\xfa\xdb\x66\x1c\x81\
+\xf7\x69\xd9\x74\x67\xfb\x5a\x52\xa5\x41\x01\xfe\x52\x80\xbd\x43\
+\x7a\xdb\x3a\x27\x4b\xc5\x23\x5a\xa4\xa5\xbf\x08\x57\x0f\xa5\xd5\
+\xd3\x7c\x11\xb1\x87\x73\xa8\xce\x47\xf3\x75\xb4\x71\x3c\x67\xf7\
+\x2f\xab\xd3\xeb\xdf\x07\x1c\x0f\xbc\x0e\x38\x0b\x48\xbb\x04\x60\
+\x1a\xb1\x87\xf7\xc5\xc0\xdf\xc6\xfc\x5b\x49\xf2\x70\x6a\x5b\x30\
+\xb5\xe0\xc3\xc8\x32\xf0\x6a\x2b\x4a\x3c\x17\xd2\x18\xb9\x20\xdc\
+\x49\x35\x7b\x4d\x03\x8f\xa4\xd6\x37\x51\x2c\xee\x46\xfc\xca\x4f\
+\x8d\xea\xa1\x94\x03\xef\x94\x71\xf4\x16\xcf\x49\xf9\x91\x86\xbb\
+\xab\x14\x78\x0b\xc0\xea\x22\xcc\x4e\xe9\xf2\xdd\x08\x53\x27\x8f\
+\x86\xb4\xc2\xee\xb7\x88\x0f\x6f\x35\xc2\xac\x1a\x8f\xd5\x31\xec\
+\x3e\x71\xa5\x87\xef\x01\xbf\x01\x3e\x05\xbc\x33\xe5\xfb\xfe\x5c\
+\xe0\x97\x3c\x2b\xf7\x1a\xf6\xef\x5c\x41\x52\x9a\x0f\xd9\xed\x81\
+\x59\xc0\x6c\x4a\xa5\x59\x24\x49\xfc\xfb\xfa\x7f\x9b\x5c\xb3\x79\
+\xca\xc0\xab\x86\x17\x4a\xcf\x4c\xe5\x5b\xae\x90\xb9\xab\xba\x1b\
+\x9a\x79\x34\xb5\x3c\x9d\xc9\xec\xe0\x8e\x6f\x70\x7f\x2f\xc1\x61\
+\x21\xbd\x61\xc1\x7a\xc6\x11\x62\xa7\xa5\x18\xfc\x86\x4b\xf0\x60\
+\x15\xab\x67\x56\xa5\x18\x78\xdb\x12\xd8\x31\xa9\xee\xf6\xd6\xe0\
+\x8a\x06\x7c\x05\xf8\x20\x69\x3d\x14\x35\xb9\x2c\x2b\x7f\x10\xf8\
+\x4e\xb9\x9d\xc6\x37\xe5\x7a\x1e\x58\x90\x81\x19\x99\xf8\x21\xb2\
+\x33\x81\xf6\xc7\xff\x9c\x43\x86\xdf\x95\xef\x07\x4f\xee\xff\x48\
+\x12\x5b\x5e\x06\x5e\xd5\xfb\xf6\x90\x3c\x33\x95\x9e\xd3\x24\xbc\
+\x89\xde\xfc\x9b\xaa\x7b\x1f\x4b\x6b\x55\xc1\xc0\xdb\x0c\xd6\x95\
+\x2a\x7b\xe0\x6c\x53\x3a\xc6\x71\x90\xf7\xa4\xd8\xc3\xdb\x57\xe5\
+\xe7\x68\x96\x15\x61\xf7\x14\xd7\xb7\x7d\x16\x1e\x6c\xda\x79\x19\
+\x0a\xc0\x47\x80\x2f\x61\x8d\xfe\xd6\x5c\x07\x3c\x87\x38\xca\xc2\
+\xa7\x80\x6d\x37\xf9\x53\x7b\x65\x60\xdb\x2c\x4c\xcf\xc0\xd4\x2a\
+\xce\x8a\x28\x19\x78\x55\x75\x09\xfb\xb4\xe0\x7b\x9e\xe9\x8e\x6f\
+\x02\x83\x29\x06\xde\xb1\x4e\x0f\xdc\x4e\xec\xb1\x4a\x33\xb4\x57\
+\xd3\x83\x25\x78\x76\x8a\xeb\xcb\x37\x6d\x4f\xdc\x00\xf0\x2e\xa8\
+\xea\x83\xb3\x93\x4d\x01\x38\x9f\x38\x4b\xd9\x47\x81\x5e\xda\xe9\
+\x61\xff\x6c\x9c\xa1\x70\x66\x36\xdd\x73\x41\x32\xf0\xaa\x6e\x4e\
+\xa2\x1b\xd8\xa6\xe5\xde\x77\x48\x6d\xfa\x64\x55\x35\xf0\xa6\xd8\
+\x49\x37\xd6\xd2\x88\x79\x49\xba\xcf\xb1\x57\xbb\x87\x77\x35\xb1\
+\xee\x35\xad\x31\x83\xbb\x9b\x32\xe0\x3c\x08\x9c\x48\x9c\x0c\x41\
+\xe3\xb7\x82\x93\xba\xbf\x48\x31\x81\x24\x39\x99\x1c\x79\x9b\x44\
+\x06\x5e\x4d\xb2\xbd\x9e\xdf\xa9\x45\x47\x2e\x34\xf0\x36\x83\x91\
+\x14\x03\x6f\x2e\x89\x57\xb9\xad\x7d\x5b\x3f\x33\xe5\xc0\x37\x54\
+\x83\x6f\xd6\xd3\x0c\xbc\x1d\x4d\xd7\xc3\x7b\x35\xf0\x06\xe0\x9f\
+\x9e\x30\x15\x38\x69\xca\x6c\x32\x7c\x0c\xc2\xa9\x64\x5a\x66\x82\
+\x69\xb5\x38\xbf\xb7\x68\x45\x21\x6c\xdf\xa2\xef\xdc\x0b\x7b\x8a\
+\x47\x51\xd5\xd6\x3c\x9c\xf2\xaa\xc7\xd2\x6f\xd5\x99\x72\xe0\x1b\
+\xac\x41\xe0\x2d\xd4\xa1\x27\xbc\xfe\x0a\xc4\x5a\xdd\x63\x0d\xbb\
+\x15\xea\xcd\x9f\x4c\x26\xdc\x0b\xe1\x03\x5e\x13\xd5\x4a\xec\xe1\
+\x6d\xcd\xcf\x39\xf9\x16\x7d\xb6\xc3\x47\x86\xd3\xd2\x9e\xb9\x0f\
+\xd8\xa5\x2a\xeb\x4e\xfb\x19\xfb\xce\x31\xcc\x37\x92\xf6\x95\xb0\
+\x16\x23\xc0\xa6\x19\x78\x9b\x63\x86\xe1\x15\xc4\x7a\xdd\x1f\x7b\
+\x02\x56\xe0\xa4\x29\xb3\xc9\x94\xbe\x0d\xbc\xd4\xc6\x90\x81\x57\
+\x2d\xa2\xd4\x6d\xf6\xd3\x84\x74\x67\x6e\x07\xd6\x41\x15\x1e\x7e\
+\x0c\x29\x7f\x18\x1b\x4b\x1f\x56\x97\x9f\xbf\x26\x00\x00\x16\x35\
+\x49\x44\x41\x54\xda\x57\xc2\x62\x0d\x3e\x50\xa6\xf9\x12\x8d\x3f\
+\x7c\xd4\x55\xc0\x3b\x80\xfb\x3d\xf9\x2a\xf0\xae\xae\x1d\xc8\x84\
+\xdf\x40\xb2\xa7\x8d\xa1\x56\x65\x49\x43\x4b\xe6\xdd\x8c\xb5\xac\
+\x9a\x60\x40\xa2\x40\x9c\xc1\x69\x75\x43\x07\x39\x60\x4c\xf5\xea\
+\x99\x94\x03\x5f\x2d\x46\xf8\x4a\xb3\x9d\x1a\xf7\x4e\x30\x04\x7c\
+\x1c\x78\x91\x61\xb7\x42\xa7\x76\xcd\x27\x97\xbd\x06\x30\xec\xca\
+\xc0\x2b\x49\x15\xb8\x15\xf8\x76\xea\x6b\x4d\xbb\x9e\x74\x70\x2c\
+\xa1\x38\xe5\x94\xdd\x6c\x5f\xa0\x34\xe6\x43\xac\x37\x11\xc7\x8c\
+\xfd\x0c\x8d\x31\x73\x5a\xf3\x79\x1b\x9d\x94\x72\x97\x02\x3b\xda\
+\x18\x32\xf0\xaa\x05\x95\xd6\xd9\x06\x4a\xc9\xf7\x49\xbb\x4f\xb6\
+\x3d\xe5\x2d\x5c\x3b\x86\xcd\x4b\xbb\x47\xb6\x16\xc5\x62\x69\x5e\
+\xbd\x43\x43\xd5\xf4\x0f\x03\x9f\x06\x9e\x05\xdc\xe8\x29\x36\x01\
+\x9d\xf9\xb3\x21\x1c\x5c\xb3\xd7\x0b\xc4\x87\x4e\xd7\x14\x61\x59\
+\xa1\x44\xc2\x27\x09\xc9\xbb\x48\x4a\xc7\x91\x09\x07\x52\x08\xdb\
+\x02\xdf\x70\xc7\xa8\x1e\xac\xe1\x6d\xcd\xcf\x39\xeb\x9c\x90\x68\
+\x0b\x16\xf5\xff\x0e\x8b\x9c\xc7\xea\xaf\xc0\x9f\xca\xe1\x24\xa5\
+\xc0\x9b\x62\xd3\x97\x80\x91\x31\xfc\x5c\xda\x81\xb7\x7b\x0c\x0f\
+\xca\x35\x52\xe0\x6d\x9c\xc9\x78\xff\x0c\x9c\x0a\xdc\xe0\xa9\x35\
+\x41\x27\x77\x1f\x02\xbc\xb3\x8a\xaf\xb0\x14\xb8\x96\x90\xfc\x85\
+\x55\x85\x21\x6e\x1b\x79\x21\xf7\x15\x8f\x64\x80\x4e\x62\x8f\xfc\
+\x7f\x02\x9f\x7d\xca\x6f\xf5\xe6\x4b\xee\x1c\x19\x78\x55\x1b\x49\
+\xe8\x4b\x6f\x5d\xfc\x80\x85\xfd\xaf\xb3\x51\x5b\x56\x09\xf8\x1a\
+\x70\x58\x6a\x1f\x12\xba\x52\x4c\x72\xa3\x63\xbc\xb7\x8e\xa4\xfd\
+\xa0\x5c\xd5\x3f\x2f\x15\xe9\xcc\xac\x24\xad\x09\x64\x0a\x75\xfe\
+\x00\x9c\x30\x4a\xac\xd5\xfd\xea\x18\x3f\xa2\x68\xab\x6d\x9a\x39\
+\x2b\xf5\x0f\xee\x49\x18\x80\xe4\x5b\x50\xfa\x0e\x0b\xd7\xdd\xb8\
+\xd1\xa7\xba\x2f\x03\x33\x89\x93\x5e\x3f\x0c\x3c\xe2\x4e\x90\x81\
+\x57\xf5\x15\x32\x0f\x91\xa4\xf4\x21\x3b\x30\xcf\x06\x6d\x79\x3f\
+\x04\xee\x00\x9e\x9e\x4e\xe0\x4d\xf1\x1e\x3d\xd6\x31\x7d\x57\xa5\
+\xdc\xe9\xd4\x5d\xd5\xc0\x7b\x07\x70\x1a\x9d\x99\xb3\x53\x0b\xbc\
+\x83\x75\x0e\xbc\x53\xb2\x57\x03\x5f\xf0\x54\x4a\xc9\xa9\xf9\xa7\
+\x53\xe2\x88\x94\x3f\x94\xfc\x80\x51\xfe\x85\xf3\xfb\x97\x6e\xe1\
+\xa7\x56\x02\xd7\xbb\x03\xd4\x88\xac\xe1\x6d\x45\x2b\xd7\x3e\x40\
+\x7a\x8f\xa9\x3c\xdd\x06\x6d\x79\xa3\xc0\x99\xe9\x85\xc5\x6c\x7a\
+\x5b\x36\x34\xc6\xc3\xfc\xc1\x90\x6e\x05\x42\x4f\x55\x2e\xad\x83\
+\xc0\xa7\x80\x83\x81\xdf\x92\xe6\x83\x48\x43\x75\xfe\x96\x39\x9b\
+\x0c\x78\x1a\xa5\xa8\xc4\x1b\x53\x0e\xbb\x9f\x64\x61\xff\xeb\x38\
+\x7f\x60\xa9\x8d\x2b\x03\xaf\x9a\xc7\x25\x8c\x90\xde\x2c\x45\xdb\
+\xf0\x9e\xce\x9d\x6c\x54\x8f\x2a\xe0\x1f\x13\x5e\xcb\x82\x24\xdd\
+\x1a\xde\xfe\x31\x06\xb9\x02\x30\x92\x62\xe8\xeb\x49\xbd\x87\xf7\
+\x2a\xe0\x19\xc4\xba\xc8\x75\x9c\xd4\x3d\x0f\xe8\x4e\x6d\xed\x03\
+\xd6\xf4\x4f\x32\xc7\xa7\xb6\xa6\xc0\x8f\x59\xd8\x7f\xba\x4d\x2a\
+\x03\xaf\x9a\x54\x72\x73\x6a\xab\x2a\xe6\x8e\xb5\x3d\x5b\xde\x10\
+\x70\xce\x84\xd7\xb2\x4b\xca\x55\x56\x2b\xc6\x11\x62\x07\x52\x0c\
+\xbc\xf9\xd4\x7a\xa9\x1f\x03\xde\x0e\x1c\x43\x1c\x06\xae\x7c\xe5\
+\xce\xa6\xfb\xe4\xfd\xa3\x45\x8f\xe0\xc9\xe2\x03\x74\x91\xee\x37\
+\x6f\x1f\xb7\x51\x65\xe0\x55\x13\xe7\x5d\xae\x49\x71\x6d\xaf\xb7\
+\x41\x05\x7c\x07\x98\xd8\x03\x91\x73\x52\x0c\xbc\x01\xb8\x67\x1c\
+\x21\x76\x6d\x8a\x81\xb7\x2b\x03\xdb\x4f\xa8\x97\xb7\x08\x9c\x0f\
+\xec\x07\x5c\xc0\xc6\xe3\x28\x84\xd2\xe1\xa9\x6d\xeb\x68\x80\x7b\
+\xed\xe1\x9d\x34\x06\xa7\xee\x0b\xa4\xf3\x89\x2b\xe1\x2e\x16\xf7\
+\xdf\x66\xa3\xca\xc0\xab\x26\x16\xd2\x0c\xbc\x47\x70\x72\xcf\xfe\
+\xb6\x69\xcb\x5b\x09\xfc\xa6\xe2\xdf\xde\x23\x03\xd3\x53\xac\xdf\
+\x1d\x2c\xc1\x9a\x71\x04\xb9\x65\x29\xf7\x72\xee\x56\xf1\x7b\xf9\
+\x3b\xb1\x47\xf7\xdd\xc4\xa1\x9f\x9e\x1a\x43\x92\x4c\x7a\x23\xa3\
+\xf4\xdb\xbb\x3b\xb9\x94\x76\x49\x71\x65\xb7\xd8\x9e\x32\xf0\xaa\
+\xc9\x7b\x01\xfa\xaf\x67\xa2\xbd\x71\x4f\xba\x05\x67\xce\xb4\x51\
+\x05\x5c\x5d\xf1\x6f\xee\x9b\xf2\x8c\x13\xcb\xc7\x39\xb8\xee\x1d\
+\xc5\x74\x87\xe7\x9a\x37\xee\xde\xea\x25\xc4\xaf\x8f\x0f\x25\xd6\
+\xec\x6e\xda\xc9\x3d\x2f\x80\x90\x5e\xdd\xfc\x72\x03\xef\x24\x33\
+\x2d\xb5\x35\x85\xb0\xd6\xe6\x94\x81\x57\xcd\xed\x02\x86\x20\xf9\
+\x71\x7a\x2b\x0c\x2f\xe6\xe4\x9e\xb7\x34\xd4\x7b\x3c\x65\xca\x2b\
+\xe8\xcd\x2f\xa3\x37\x1f\xe8\xcd\x7f\xc5\x9d\x5e\x13\x77\x55\xf4\
+\x5b\x07\x66\x61\x76\xca\xf5\xbb\x0f\x8f\x33\xf0\x0e\x00\xab\x53\
+\x0c\x7f\xd3\x72\xb0\xdb\x56\x2f\xb1\xfd\xc4\x61\xdd\x5e\x06\xec\
+\x4a\x9c\x46\x77\x68\xcb\x1f\x2e\x93\x93\x52\x6d\xa7\xbb\x0b\x1e\
+\xb5\x93\x4a\x32\x2d\xc5\x75\x75\xda\x9e\x32\xf0\x6a\x12\x5c\x17\
+\x8b\x17\xa7\x7c\x34\x9d\x5b\x9e\xdd\xa7\xbe\xde\xd5\x33\x97\x53\
+\xa6\x7c\x87\x10\x2e\x05\x66\xbb\xa3\x6b\x6a\x74\xdc\xbf\x31\x3f\
+\x81\x03\xbb\xd2\xdd\x8a\xe1\x00\x37\x57\x50\x93\xfb\x68\x8a\xe1\
+\x2f\x01\xf6\x6b\xdb\xd4\xff\x29\x00\x57\x02\x27\x01\x3b\x03\xaf\
+\x06\x2e\x03\xb6\x3e\xe5\x77\x6f\xfe\x48\xe0\x35\xa9\x6d\x63\x7f\
+\x31\x0e\xc9\xa6\x49\x74\x5d\x0f\x69\x7e\x55\xe2\xf5\x53\x06\x5e\
+\x4d\x02\x73\xd7\xfd\x06\x92\x07\x52\x5b\x5f\x48\x7a\x48\x32\xbf\
+\xe4\xa4\xa9\xcf\xac\xcb\xfb\x79\xf3\xdc\x1e\x7a\xa7\x7c\x88\x5c\
+\x72\x17\x21\xbc\xc5\x1d\x5c\x17\xe3\xab\xe5\x9e\x9f\xc0\xf3\xbb\
+\x20\xe5\x6a\x06\x96\x8c\x56\xf6\x7b\x37\x16\xe2\x43\x5c\x69\x99\
+\xd3\x06\x87\x64\x21\x3e\x42\x77\x0b\xb1\x64\xe1\xe9\xc0\xd1\xc0\
+\x37\x80\xe5\x63\x5e\xd7\x69\x74\x90\xb0\x38\xd5\x76\x7a\x78\xd4\
+\x23\x76\xb2\x29\x85\x75\x29\xae\x6d\x3f\xce\x48\x3d\x27\xcc\x74\
+\x27\xc9\xc0\xab\xda\x3a\x83\x02\x84\xb3\x52\x5e\xeb\x2c\x32\xa5\
+\xab\xe8\xcd\x9f\x5c\xb3\xf7\xf1\xfe\xe9\xd3\xe9\x9d\xf2\x21\x7a\
+\x06\xee\x83\xf0\x39\x60\xaa\x3b\xb7\x2e\xb2\xc0\x1b\xc6\xfc\xd3\
+\x07\x66\xe1\x98\x2e\xe8\x4e\xf9\x32\x14\x80\x5b\x2a\x0c\x72\x83\
+\xc0\x3f\x53\x0e\x81\x07\x75\xad\xe5\xe8\x8e\x97\x00\x07\x10\x4b\
+\x16\xee\xa1\x92\x69\x2e\x46\xf2\x5f\x23\xf0\xb4\xd4\xb6\xab\x10\
+\xe0\x06\xcb\x19\x26\xe1\x5d\x7d\x45\x8a\x6b\x9b\xc3\x92\x7c\x3a\
+\xdf\x28\xbc\x63\xf6\x14\x7a\xf3\x17\x03\x27\xba\x93\x64\xe0\x55\
+\xed\x0d\xf5\x9f\xcf\xa6\x9f\x04\x9f\x88\x2e\x60\x11\xbd\xf9\xdf\
+\xd1\x3b\xf5\xd0\xaa\x6d\x7b\x6f\x7e\x1f\x7a\xf3\xe7\x32\x3c\xfa\
+\x70\x39\xe8\x6e\xe3\x0e\xad\x99\x6e\x4e\x7c\xca\xd0\x47\xcf\x25\
+\xce\x02\xb6\x65\x7b\x65\xe0\x55\x9d\xf0\xcc\x2e\x68\xaf\xc2\x25\
+\x68\x79\x01\x1e\x9a\x40\x2f\xed\x2d\xa3\x10\x52\xec\xe5\xcd\x30\
+\x95\xdd\xda\xce\xe3\xd4\x9e\x7d\x2b\xfa\xfd\x13\xc9\xd2\x9b\x3f\
+\x9b\x84\x74\x6b\x77\xff\x39\x9a\xe6\x63\xab\x6a\x9c\xdb\xfa\xbd\
+\x29\xaf\x70\x11\xa7\xf6\x1c\x30\xa1\x35\x9c\xdc\x7d\x1c\xed\x43\
+\x37\x02\xaf\x73\xff\xa8\x5e\x72\x36\x41\x8b\xbb\x80\x21\x7a\x93\
+\x8f\x40\xf8\x76\x15\xd6\x7e\x04\x94\xae\xa7\x37\x7f\x0d\x24\xdf\
+\xa2\xc4\x4f\x39\xaf\x6f\xf9\x04\xd6\x97\xf0\x9e\xfc\x5e\x94\x92\
+\xe3\x09\xe1\xf5\xc0\x3e\x00\x84\xc4\xfd\x58\x7b\xc7\x30\x2b\xff\
+\x28\x27\x87\xcb\xc8\x24\x37\x00\xb7\x73\xdd\xba\xcf\xd0\x1f\x62\
+\x88\x5a\x5b\x0e\x8c\x33\x12\x98\x96\xc0\xf4\x0c\xcc\xca\xc0\xcc\
+\x36\xe8\xae\xe2\xfe\x0a\xc0\xcd\x23\x13\x5b\xc7\x43\x01\x1e\x1c\
+\x85\x9d\x52\xad\xb3\xd8\x81\x52\x72\x3d\xbd\xf9\x33\x69\x6b\xff\
+\x12\x67\xaf\x1c\xdb\xd3\xef\x27\x4d\x7d\x26\xd9\xe2\x57\x09\xa4\
+\x5b\x26\x34\x1a\xe0\x9a\x06\x2a\x67\x28\xa5\x5e\xd4\xd2\xca\x81\
+\xf7\x16\x28\x06\x62\x15\x79\x1a\xa6\x11\xf8\x23\xa7\x4c\x79\x3f\
+\x73\xfb\xbe\xc5\x19\x63\x9c\x96\xfe\x0c\x32\x3c\xda\x7d\x2c\x49\
+\x72\x3a\x24\x87\xba\x5f\x54\x6f\x26\x05\x45\xbd\xf9\x2b\x80\x17\
+\x54\xfd\xb6\x16\xb8\x99\x84\x6b\x09\xdc\x4a\x26\xdc\x45\x26\x79\
+\x94\x0c\x8f\x31\xdc\x3f\xc0\x2a\x86\xd9\x9b\x84\xd5\xd3\xf3\xf4\
+\x0f\xe7\x69\x4b\xe6\x12\x32\xbb\x93\xb0\x1b\x25\x0e\x26\xe1\x70\
+\x2a\x7f\x88\xe2\xab\x2c\xea\x7f\x7f\x6b\xef\xe3\xe9\x0b\xa0\x70\
+\xdf\xa4\x7e\x8f\x8f\x8d\xc2\x8f\x86\x27\xbe\x9e\xe9\xc0\xab\x7a\
+\xa0\xad\x2a\x97\xc8\x7e\xe0\x0a\x92\xe4\xe7\x50\xbc\x81\x24\x3c\
+\xc6\xba\xc1\x65\x64\x66\xb7\x91\x1b\x9d\x43\x52\x58\x40\x86\xa3\
+\x08\xc9\xb1\xc0\x81\x55\x69\xa7\xbb\x86\xe1\xca\x09\x06\xde\xdd\
+\x32\x70\x74\x4a\xb3\x1b\xaf\x2b\xdd\xc3\x85\xeb\x76\x9f\x64\xe7\
+\xc8\x4f\x58\xd4\xff\x8a\x3a\x5d\xcf\x6f\x06\xf6\x4d\x7d\xbd\x49\
+\xb8\x8f\x52\x72\x01\x99\x70\x2d\xc5\xdc\x7d\x90\x59\xce\x76\xab\
+\x06\x38\x83\x22\x6f\x9e\xdb\x4d\xe7\xba\xed\xc9\x84\x7d\xc8\x70\
+\x24\x81\x13\x80\x1d\xaa\xfa\x3e\x3b\x73\x33\xf8\xca\xea\xd5\xde\
+\xc0\x35\x16\xf6\xf0\xaa\x1c\x45\xb3\x27\x91\x29\xde\x48\x75\xeb\
+\x5f\x33\x24\x1c\x00\x1c\x40\x42\xec\x99\x2d\x12\x97\x4c\x1e\x66\
+\x11\x47\x22\xa5\x00\xb9\xec\x13\x55\x8e\x69\xf6\x55\x68\xf2\x2a\
+\x06\xb8\x61\x24\x9d\x75\xad\x06\x6e\x1f\x2e\xb1\x5f\x67\x35\xca\
+\xbe\xf2\xc0\xf1\x84\x70\x3c\x64\xe2\xf1\xdd\x99\xe7\x89\xd1\xc8\
+\x92\x4a\x2a\x7c\xc7\x6e\x6d\x71\xe2\x61\x37\x6d\xc3\xa5\x5d\xca\
+\x1f\xb8\xaf\xf4\x40\x4e\xc5\xcf\xaa\x12\x78\x43\xb2\x33\x09\x9f\
+\x20\x24\x90\x29\x5f\xbc\x97\xe4\xa1\x17\xe2\xb8\x7e\x1b\x5c\xb3\
+\xa5\x06\x63\x0d\xaf\xa2\xf3\xd6\xfc\x83\x24\xf3\x06\xa0\x64\x63\
+\xa8\x29\xdd\x33\x02\x0f\xa4\x76\xa7\xbd\x88\x6b\x0b\x87\x10\x38\
+\x67\x92\x7d\x28\x08\x5c\x37\xd4\xa8\xf7\xa2\x8b\x81\xbd\x3c\x90\
+\xd3\xe8\xc0\x48\xbe\x6b\x23\x48\x06\x5e\x6d\xce\xc2\xb5\x97\x43\
+\xf2\x51\x1b\x42\x4d\x67\x75\x01\xae\x4a\xad\xd7\xf2\x5e\xe0\x14\
+\xe0\x6f\x0c\xf7\xff\x3b\x24\x7f\x9d\x2c\x71\x97\x5b\x87\x96\x73\
+\x5f\xc3\x76\xbf\xcd\x01\x7e\x0e\xec\xee\x01\x3d\x41\xe7\xf5\xdd\
+\x41\x08\x97\xdb\x10\x92\x81\x57\x9b\xb3\xa8\xef\xf3\xc0\x27\x6c\
+\x08\x35\x8d\xa1\x12\x5c\x35\x9c\xe6\x1a\x3f\x4a\xac\xb3\x8d\x0f\
+\x75\xb6\x85\xe3\x88\x43\x89\x35\xb7\x24\x39\x85\x6b\x8b\xe9\x0d\
+\x59\x35\x23\xf3\x9f\x55\xd8\xca\x9d\x80\x5f\x11\x67\x9d\xd3\x84\
+\xee\xee\xe1\x74\xfc\xc6\x4e\x32\xf0\x6a\x4b\xa1\xb7\xff\x0c\x92\
+\xe4\x43\x36\x84\x1a\x5e\x21\xc0\xb5\x43\xb0\x34\xb5\x5e\xcb\xab\
+\x89\x53\xfd\x3e\xe1\xec\xfe\x65\x24\xd9\x17\x01\x0f\x35\x6d\x3b\
+\x85\xe4\x63\x2c\xec\xfb\x06\xe9\x0d\x44\x36\xcc\x6e\x9d\x97\x56\
+\x69\x6b\x77\x06\xae\x00\x76\xf1\x00\x9f\x80\x85\xeb\x6e\x20\x69\
+\xc8\x92\x9c\x21\x77\x8e\x0c\xbc\x6a\xa0\x8b\x65\xdf\x17\x08\xbc\
+\x0a\x58\x6b\x63\xa8\x61\xc3\xee\x9f\x06\xe1\xae\xd4\x3a\xb1\x0a\
+\xc0\x07\x89\x8f\x51\x6e\x74\x3e\xac\xb9\x97\x42\xf1\xd9\xc4\xd9\
+\xd2\x9a\x49\x91\x24\x39\x99\xc5\x7d\x67\x96\xff\x7b\x4d\x4a\xeb\
+\xfd\x3b\xd3\x72\xfd\x55\xdc\xee\x9d\x88\xe5\x0d\x8e\xad\x3d\x11\
+\x9d\xfd\x1f\x06\x6e\x6a\x94\x33\x16\x92\x0f\x13\xb8\xd0\x1d\x23\
+\x03\xaf\x1a\xcb\xe2\xfe\x1f\x91\xc9\x1c\x0c\xfc\xcd\xc6\x50\x43\
+\x19\x2d\x87\xdd\x5b\x52\xfd\xc6\xf6\x42\x60\xf3\xf5\xba\xe7\x0f\
+\x3e\x4c\x67\xee\xb9\x04\x7e\xdd\x14\x6d\x14\x58\x0d\xc9\x2b\x58\
+\xd8\x77\xde\x06\xff\x9a\xd6\x07\xd8\x5a\x5c\x13\xf6\x00\x16\x79\
+\x9f\x9a\x80\x2f\x33\x48\x21\x7b\x02\xf0\x68\x9d\x0f\xc6\xfb\x09\
+\xc9\xf3\x58\xd4\xf7\x79\x12\xc7\x70\x90\x81\x57\x8d\xe8\xdc\xb5\
+\xf7\xb0\x6d\xff\xa1\x10\xfe\x15\x7b\x7b\xd5\x08\x46\x58\xc2\x1f\
+\xd6\xfd\x9e\x5b\x4a\x4b\x49\xaf\x46\xb1\x08\x7c\x95\xad\x0d\xa8\
+\xf4\x95\xd5\xab\x59\xdc\x7f\x6c\xf9\x7c\x18\x6e\xe0\x56\xfa\x1d\
+\xd9\xe2\x7e\x2c\xea\xbb\x6c\xa3\x7f\x4f\xab\x87\xf7\x81\x1a\xbd\
+\x8f\x13\x80\xe3\x3c\xe8\x27\xe0\xfc\x35\xf7\x91\xe1\x28\xca\x83\
+\x3e\xd6\xc1\xc5\x94\xda\x0f\x60\x71\xdf\x75\xee\x0c\x19\x78\xd5\
+\xd8\xce\xa0\xc0\xa2\x81\x2f\x93\x09\x7b\x90\xb0\x88\xe6\xaa\xc1\
+\x7a\x94\x10\x3e\x47\x21\xfb\x55\x77\x64\xd3\x0b\xc0\xd7\x99\xd6\
+\xbf\x0b\x77\x85\x23\x88\x83\xda\xdf\x9c\xd2\xba\x4b\xc0\x8a\x31\
+\x6f\xc7\xa2\x81\x2f\x13\x38\x88\xf8\x80\x55\x23\x79\x0c\x38\x95\
+\x6d\xfb\x8f\xe2\xdc\xc1\x4d\xd5\x1c\xa7\x15\x78\x07\x6b\xf4\x7e\
+\x12\xe0\x03\x1e\xfa\x13\xed\xb8\xe8\xbf\x9d\x6c\xe1\x30\x6a\x5b\
+\x92\xb3\x14\x92\x57\xb2\xa8\xff\x0d\x9c\xb7\x6a\x8d\x3b\x41\x06\
+\x5e\x35\xd1\x45\x73\x60\x09\x0b\xfb\x4f\xa1\x10\x16\x90\x84\x33\
+\x81\x95\x0d\xba\xa5\x6b\x09\xc9\x45\x84\xd2\x4b\x58\xd1\x3f\x9f\
+\xc5\x03\x1f\xe1\xfc\x35\xf7\xb9\x03\x53\xb4\xaa\x00\x37\x0f\xc1\
+\xba\x62\xad\x5e\xf1\x76\x02\x47\xb2\xa8\xff\x34\xbe\xfc\x78\xd8\
+\x2a\xa4\x78\x03\x2f\xf1\xa4\x91\xf3\xc7\x60\x71\xff\x6d\x2c\xea\
+\x3f\x96\x24\x1c\x43\x12\xae\xaf\xf3\x47\x81\xd5\x04\x3e\xcd\x48\
+\xe7\x6e\x2c\xea\x5f\xb8\x85\xe9\x5f\xd3\x0a\x1e\xb5\xfc\xd0\x7b\
+\x18\x71\x5a\x1a\x4d\xc4\x39\x43\x0f\x30\xd0\x73\x18\xb0\xb8\xca\
+\xaf\x34\x08\xe1\xb3\x94\xda\xf6\x60\x51\xdf\xa5\x36\xbc\x1a\x85\
+\x33\xad\x69\xfc\xce\x1f\x58\x0a\x7c\x8c\x93\x38\x9d\x64\xca\xb1\
+\x24\xe1\xf5\x24\xe1\xe5\x84\xa4\xa7\x8e\x5b\xf5\x20\x81\x5f\x42\
+\x72\x19\xed\x7d\xbf\xe6\xec\x86\xfe\xba\x79\x72\xb8\xb6\x10\x97\
+\x43\xb3\xb0\x4b\x1b\x4c\xcb\x55\x63\x46\xbc\x7b\x08\xe1\x53\xcc\
+\x1b\xb8\x68\x33\x21\xee\xf6\xba\x05\xde\xf5\x16\x0e\xfc\x16\xf8\
+\x2d\x27\x77\x1f\x02\xc9\xa9\x64\x78\x4d\xed\xce\x85\xe4\x06\x12\
+\x16\x51\xea\xfb\x1e\xe7\xb1\x6e\xfd\x68\x6a\x5b\xd0\x8c\x81\xb7\
+\x1b\x98\xc6\xd8\x7b\xe0\xb5\x39\xdf\x5d\x3a\x00\xf4\x72\xca\x94\
+\xff\x26\xf0\x45\x08\xcf\x48\x71\xed\x4b\x49\x58\x4c\x12\x16\x72\
+\xee\xc0\x92\x4a\x4f\x27\xa9\x6a\x57\x4b\x9b\x40\xa9\x38\x8d\x0e\
+\x0a\xf9\xc3\x08\x1c\x09\x1c\x09\x1c\x42\x9c\x42\xb5\x1a\x02\x71\
+\x72\x80\x3f\x11\xf8\x23\xf0\x7b\x16\xf7\xdf\xe6\x4e\xd8\x8a\xde\
+\xe9\x0b\xa0\x90\x4e\x4f\xf7\xaa\x02\xfc\x60\xa3\xcc\x33\x3f\x81\
+\x3d\x73\xb0\x6d\x3b\xf4\x4c\xe8\xd2\xd2\x07\x5c\x4e\x12\xbe\xc9\
+\xc2\x81\x2b\xd8\x72\x5d\xed\xab\x80\xff\x4d\xe1\x1d\xad\x06\x66\
+\xa4\xd2\x36\x6f\xa3\x93\xce\x29\x47\x13\xc2\xcb\xc8\x84\x63\x08\
+\xc9\xce\x29\xee\xc5\xfe\x78\xdc\x87\xcb\x28\xe6\x7e\x5a\xc1\x37\
+\x17\xef\x04\xce\x4f\x61\x3b\xae\x02\xae\x01\x5e\x4b\xf5\x27\x8a\
+\x58\x05\x2c\xc0\x67\x08\xd2\x77\x4a\xcf\xd1\x84\xe4\x54\xe0\xc5\
+\x40\x67\x85\xe7\xea\x2f\x80\x1f\xb2\xa2\xff\xc7\x5c\xc2\x88\x8d\
+\x2a\x03\xaf\x5a\xef\xd8\x7a\x4f\xe7\x8e\x14\x32\x7b\x93\x24\x4f\
+\x27\x49\x76\x22\xb0\x2d\xb0\x2d\x09\x73\x09\x4c\x01\x3a\xca\x17\
+\xd9\x8e\xf2\xb1\x38\x5a\x5e\x86\x62\x00\x49\x56\x41\x58\x09\xe1\
+\x11\x48\x1e\x24\x09\xf7\x53\xcc\xde\x41\xae\xe3\x56\xce\x5d\xd6\
+\x6f\x13\x37\x58\xe0\xdd\xd0\x0e\x09\xec\x9c\x85\x69\x19\xe8\xc9\
+\x40\x47\x06\xda\x92\x40\x36\x29\x96\x0b\xa9\x32\xc4\x2e\xa0\x3e\
+\x48\xfe\x09\xe1\x4e\x92\xe4\x36\x8a\xfc\x9e\xed\xfa\xfe\xc4\x19\
+\x14\xc6\xb8\x25\xfb\x92\x4e\x1d\xef\x43\xc0\x8e\x55\x69\xf7\x77\
+\x4e\x9d\x49\x47\xf1\x10\x4a\x99\x03\x20\x2c\x80\x30\x1f\x92\xf9\
+\xc4\xaf\xe9\xbb\xca\x4b\x27\xb1\x44\x63\xb0\xbc\xf4\x03\x8f\x10\
+\x92\x87\xc8\x94\x1e\x22\x70\x3b\x21\xb9\x81\x79\xfd\x77\x6c\xa1\
+\x5c\x61\x2c\x5e\x0d\x5c\xd2\x64\x47\xee\x17\x00\xc7\x05\xaf\xa6\
+\x53\xb7\xc9\x53\x1c\x3a\x8a\xa4\xf4\x6c\x92\xcc\x7e\x84\xb0\x33\
+\x81\xb9\x24\xf4\x3c\x1e\x6c\x93\xb0\x86\x90\x59\x09\xdc\x06\xa5\
+\x9b\xc8\x24\x37\xb2\xac\xff\x1a\x43\xae\x0c\xbc\x92\x5a\x37\xf0\
+\x3e\xd9\x32\xe2\x90\x5f\xe7\x00\x69\xd7\x52\x4f\x23\xd6\x92\x4f\
+\xf4\x79\x84\xdb\x80\xbd\x5b\xe0\x28\x38\x06\x9a\x64\x58\xb5\xe8\
+\x67\xc0\x89\x60\x89\x92\xa4\x89\xb1\x86\x57\x52\x35\x04\x62\x7d\
+\xed\xd7\x80\x8b\xa9\xde\xd7\xd1\x83\xe5\x40\x3d\x77\x82\xeb\x69\
+\x95\xaf\xcb\x9b\xe5\x69\xf9\x41\xe0\x2c\xe0\xd3\x60\x0f\xa2\x24\
+\x03\xaf\xa4\xc6\x32\x04\xfc\x14\x38\x0f\xf8\x3d\xb1\x44\xa5\x9a\
+\x46\x81\x47\x52\x08\xbc\x7d\x2d\xb2\x7f\xd6\x94\x3f\x8c\x24\x0d\
+\xbc\x7d\xdf\x07\xbe\x0c\xdc\xe9\xe9\x24\xc9\xc0\x2b\xa9\x91\xdc\
+\x49\x2c\x5b\xf8\x2e\xb1\x1e\xb6\x56\x42\xf9\xf5\x0e\x32\xf0\x8e\
+\x39\x50\x36\x92\x40\x9c\xc4\xe2\x0f\xc0\x2f\x89\x0f\x40\xad\xf2\
+\x74\x92\x64\xe0\x95\xd4\x48\x6e\x04\xfe\xbd\x1c\x58\x0a\x75\xda\
+\x86\x7f\xa6\xb0\x8e\x56\x09\xbc\xab\xa9\x7f\x0f\xef\xfd\xc0\xd5\
+\xc0\x15\xc0\x95\xc4\x19\xc0\x8a\x9e\x4a\x92\x0c\xbc\x92\x1a\xd5\
+\xc7\x88\x43\x54\xd5\xd3\xa3\x06\xde\xad\xca\x03\x2f\x03\xde\x46\
+\xed\x27\x1c\x5a\x4b\x1c\xc2\xec\xd7\xe5\x90\x7b\x27\xd6\xe5\x4a\
+\x32\xf0\x4a\x6a\x12\x2b\x89\x75\xba\xf5\x66\xe0\xdd\xb4\x0c\x70\
+\x30\xf0\x0e\xe0\x95\xc0\x9c\x1a\xbd\x6e\x11\xb8\x03\xf8\x39\xb1\
+\x4c\xe1\x06\x9a\xe7\x61\x39\x49\x06\x5e\x49\x7a\x92\xbb\xe0\xf1\
+\x69\x7e\x0d\xbc\x8d\x63\x2e\xf0\x26\xe0\xad\xc0\x3e\xd4\xa6\x7c\
+\xa1\x9f\x58\xa6\xf0\x6b\xe0\x32\xe2\xf0\x73\xc1\x53\x44\x92\x81\
+\x57\x52\xb3\x6b\x94\xc9\x3f\x96\x32\xf1\xba\xd4\x66\x0f\xbc\x39\
+\xe0\x59\xc0\x49\xc0\x09\x40\x2d\xa6\x36\x5e\x0b\xfc\x96\x38\x91\
+\xc5\x2f\x89\xf5\xc1\x92\x64\xe0\x95\x34\xa9\x6c\xdb\x20\xdb\xf1\
+\x18\x50\x02\xb2\x2d\x1c\x78\xcf\x02\xde\x47\x6d\x7a\x73\x4b\xc0\
+\xfb\x81\xef\x01\x2b\x3c\x0d\x24\x35\x83\x8c\x4d\x20\xa9\x42\xbb\
+\x52\xbb\xba\xd0\xad\x05\xde\x89\x3e\xe5\xdf\xcc\x53\x55\x1f\x06\
+\xbc\x87\xda\x8d\xbc\x90\x21\x8e\xca\x61\xd8\x95\x64\xe0\x95\x34\
+\xe9\x75\x11\xbf\x3e\xaf\xb7\x21\x26\x3e\x76\x6b\xb3\xf6\xf0\x76\
+\x00\x5f\xa7\xf6\xdf\xd6\x4d\xf1\xf0\x97\x64\xe0\x95\xd4\x2a\x3e\
+\x08\x74\x37\xc0\x76\x4c\xf4\xc1\xb5\x66\x0d\xbc\xbd\xc4\x91\x18\
+\x6a\xad\xe4\xa1\x2f\xc9\xc0\x2b\xa9\x55\xec\x0a\x7c\xa4\x01\xb6\
+\x63\xa2\x93\x4f\x34\x63\xe0\xcd\x95\x3f\x70\xd4\x23\xec\x5a\xce\
+\x20\xc9\xc0\x2b\xa9\xa5\x7c\x08\x78\x6e\x9d\xb7\xe1\x91\x09\xfc\
+\x6e\x00\xd6\x35\x61\xbb\xef\x49\x7d\x1e\x1c\x5c\x43\x6d\xa7\x8f\
+\x96\x24\x03\xaf\xa4\xba\xeb\x20\x3e\xb1\xbf\x53\x1d\xb7\x61\x22\
+\x3d\xbc\xa3\xc0\x70\x13\xb6\xfb\xe1\x4c\x6c\x64\x8a\x4a\xfd\x1e\
+\x18\xf0\xb0\x97\xd4\x4c\x1c\x96\x4c\x52\x1a\x76\x00\x7e\x02\x1c\
+\x45\x7d\xbe\xee\x9e\x48\xe0\x1d\x6a\x82\x00\x37\x15\x38\x1a\xd8\
+\x06\x98\x05\xcc\x04\x8e\xad\xc3\x76\x94\x80\xaf\x7a\xb8\x4b\x32\
+\xf0\x4a\x6a\x55\xfb\x97\x43\xef\x71\xc4\x49\x09\x6a\x69\x22\x5f\
+\xb1\x2f\xa5\x71\x27\x4d\x98\x0d\x9c\x5a\x5e\xe6\x36\xc0\xf6\x5c\
+\x08\xfc\xce\x43\x5d\x52\xb3\xb1\xa4\x41\x52\x9a\x9e\x43\x9c\x79\
+\xab\xd6\x23\x37\x3c\x48\xe5\x53\xd9\xde\xd6\x80\xed\x98\x05\xfe\
+\x0b\xb8\x13\xf8\x44\x83\x84\xdd\x9f\x10\xc7\xfb\x75\xca\x60\x49\
+\x06\x5e\x49\x2d\xef\x85\xc0\x45\x40\x7b\x0d\x5f\x73\x19\x30\x58\
+\xe1\xef\xde\xd2\x80\x6d\x38\x05\xf8\x18\xb1\x74\xa1\xde\x56\x12\
+\x1f\x4c\x3c\x91\xe6\x7c\xb8\x4f\x92\x24\x69\x5c\x76\x2d\x87\xcb\
+\x30\x86\xe5\x82\x1a\x7e\xa8\xce\x12\x4b\x13\x42\x05\xcb\x6b\x1b\
+\xb0\x9d\xb7\xaf\xf0\xbd\xa4\xb5\x14\x89\xb3\xa9\xf5\x12\x6b\x86\
+\x25\x49\x92\x5a\xca\x4b\x88\x23\x1b\x8c\x25\x38\x7d\x8a\xda\x4d\
+\x79\xfb\x97\x0a\xc3\xdd\xde\x0d\xd8\xc6\x7b\xd4\x31\xec\x5e\x4b\
+\x7c\xf8\x50\x92\x24\xa9\xa5\xfd\x17\x63\xef\x29\x7c\x53\x8d\xb6\
+\xe9\xa2\x0a\xc2\x5d\x3f\x90\x6f\xa0\x76\x4d\xca\x61\xf3\x8f\x75\
+\x08\xba\x77\x02\xaf\xa7\x3e\x43\x9d\x49\x92\x24\x35\x9c\x0e\xe2\
+\xd3\xfa\x63\x09\x52\x23\xc0\x19\xe5\xdf\xa9\xa6\x8f\x57\x10\xf2\
+\xfe\x4e\x7d\x9e\x65\xe8\x22\x0e\x31\xb6\x37\x70\x10\xb0\x3b\xf0\
+\x76\x62\xef\x6a\xb1\xc6\x41\x77\x09\x70\x5a\x79\x9b\x24\x49\x92\
+\xb4\x81\x1d\x19\x5f\xdd\xec\x4d\xc0\x09\x54\xaf\x07\xf1\xe5\x15\
+\x84\xbd\x4b\xaa\xdc\x46\x09\x30\x0d\x78\x5e\x39\x54\x9e\x0f\xfc\
+\xa9\xdc\x6e\xb5\x0e\xb6\x1b\x2f\x6b\x81\x4f\x02\x33\x3c\x94\x25\
+\x49\x92\x36\xef\x84\x0a\x82\xdb\xdf\x81\x77\x97\x83\x60\x9a\x76\
+\xae\x20\xf4\x7d\xa2\x4a\xed\x32\x0b\x78\x07\xb1\x17\x7c\xa4\xce\
+\xc1\x76\xe3\x65\x1d\xb0\x90\x38\x59\x88\x24\x49\x92\xb6\x22\x01\
+\xbe\x5e\x61\xf0\x5a\x4a\x1c\x7a\x6b\x6a\x4a\xdb\xd2\x49\x9c\x71\
+\xad\x5e\x23\x34\xe4\x80\x23\x81\x6f\x03\x6b\x1a\x2c\xe4\x06\xe2\
+\x83\x86\xdf\x27\x3e\x10\x27\x49\x92\xa4\x71\xc8\x03\x37\x4f\x20\
+\x88\xdd\x0b\x1c\x91\xd2\xb6\xfc\x76\x1c\xaf\x5b\x02\xf6\x4d\xb1\
+\x1d\xde\xda\x80\x21\x37\x00\x05\xe0\x67\xc0\x33\x3c\x54\x25\x49\
+\x92\x2a\xb7\x2f\xd0\x37\x81\x50\x36\x48\x1c\xee\x6c\xa2\x3e\xcd\
+\xf8\x7a\x3c\xd3\x9a\x11\x2e\x01\xfe\xdc\x60\x41\xb7\x08\xfc\x14\
+\x38\xd4\xc3\x53\x52\xab\x4b\x6c\x02\x49\x29\xe9\x25\xd6\x86\x56\
+\x6a\x59\x39\x38\x2f\x9d\xc0\x3a\x8e\x03\x2e\x1f\xe3\xcf\x06\x60\
+\x3f\x36\x3f\xd3\x5a\x27\xb1\xce\x78\x1a\xf1\xc1\xae\x6d\xca\xcb\
+\xbc\x0d\xfe\x3e\x13\x98\x4d\x9c\xfa\x77\x7e\x83\x5d\x53\x7f\x4c\
+\xac\xb1\x96\x24\x03\xaf\x4d\x20\x29\x25\x19\xe0\x62\xe0\x35\x13\
+\x58\xc7\xd7\xcb\x81\x75\x7f\xe0\x69\xc4\x19\xc7\x3a\x89\xbd\xc7\
+\x77\x03\xbf\x01\xae\x04\x86\x37\xf3\xfb\x07\x01\x37\x8c\xe3\xf5\
+\x2e\x07\x1e\x24\xf6\xf4\x76\x97\xc3\xed\x9c\xf2\xd2\x43\x9c\x1e\
+\xb9\x9d\xe6\x1c\x9b\xf6\x31\x60\x01\x95\x4f\xb9\x2c\x49\x92\xa4\
+\x4d\x98\x0e\xdc\x4e\x75\xbf\xaa\xbf\x9d\x38\xcc\xd7\xa6\xcc\x23\
+\xd6\xe6\x06\x17\x06\x81\x6d\x3d\x24\x25\x49\x92\xd2\xb7\x3f\x13\
+\xab\xe7\x1d\xcb\x32\x40\x1c\x11\x61\x63\x19\xe0\x46\xc3\x2e\x01\
+\x78\x94\xd8\x3b\x2e\x49\x92\xa4\x2a\x78\x33\x71\x74\x80\x6a\x06\
+\xba\x7f\xb0\xe9\x69\x81\xdf\x88\xbd\xbc\x01\x38\xd7\xc3\x50\x92\
+\x24\xa9\x7a\x12\xe0\xcc\x1a\x84\xba\xb3\x78\xea\xb3\x08\x19\xe2\
+\x58\xb8\x93\x25\xb8\xf6\x03\x9f\x03\x9e\x4b\xac\x8f\xbe\x85\xb1\
+\xf5\xee\x5a\xce\x20\x49\x92\x54\x65\x39\xe2\x43\x6c\xd5\x0c\x83\
+\x25\xe0\xe4\x4d\xbc\x76\x3b\xf0\x35\x9a\xbf\xa7\xf7\x76\x60\xef\
+\x8d\xde\xdb\x0c\xe0\x6f\x6c\xb9\x76\xf7\x28\x0f\x3f\x49\x92\xa4\
+\xda\xe8\x06\x4e\x24\x4e\xe1\xfb\xbf\xc0\x5d\xa4\x5f\xea\x30\x04\
+\xbc\x70\x13\xaf\x9d\x00\xaf\x02\xee\x6f\xd2\xb0\x7b\x13\xb0\xdd\
+\x66\xda\xf5\x40\xe2\x48\x15\x9b\x0a\xbb\x0e\x45\x26\x49\x9b\xb8\
+\x21\x48\x52\xad\xe4\x88\xe3\xd6\x3e\x03\x38\xbc\xbc\xec\x4d\x1c\
+\x0e\x6c\x22\x56\x00\xcf\x22\x0e\x5d\xb6\xb1\x29\xc0\xbf\x02\xef\
+\x27\x8e\x22\x31\x16\x25\xe2\xf4\xc0\x7d\xc4\xf1\x81\x1f\x03\xd6\
+\x02\xeb\xca\xa1\x72\xa4\xbc\x8c\x96\x7f\xfe\x63\x29\x5e\x4f\x87\
+\x80\xaf\x10\x27\xd1\x18\xd8\xc2\xcf\x7d\x03\x78\xd7\x06\xff\xdd\
+\x0f\xbc\x1e\xb8\xcc\xc3\x4c\x92\x24\xa9\xb1\x4c\x2b\x87\xd5\x7f\
+\x27\x4e\x96\xb0\x94\xca\x7a\x81\x6f\x24\x8e\x9d\xbb\x39\xf3\x88\
+\x65\x0e\x43\x9b\xf8\xdd\x11\xe0\x7a\xe0\x33\xc0\xcb\x81\x5d\xcb\
+\x41\x79\x2c\x4e\x20\xbd\x5e\xdd\x6b\x81\x03\xc6\xf8\xba\xfb\x96\
+\xb7\x3b\x00\xab\x81\x17\x78\x28\x49\x92\x24\x35\x87\x0c\xb0\x27\
+\xf0\x26\xe0\x4b\xc0\x55\xc4\x5e\xd6\xb1\x04\xc6\x33\xc6\xb0\xfe\
+\xa7\x03\xbf\x2c\xff\xfc\x6d\xc4\xde\xdf\xf9\x15\x6e\x6b\xbe\xbc\
+\x8e\x89\x06\xdd\x95\xc0\x7b\x89\x3d\xe0\xe3\x71\x35\xb1\x17\xf8\
+\xf9\x1e\x36\x92\x24\x49\xcd\x2b\x01\xda\x88\xb3\x9f\x1d\x41\x7c\
+\x48\xed\x53\xc0\xa2\x72\x70\x5d\xb1\x41\x70\xbc\x8b\xb1\x95\x16\
+\x64\x81\x67\x56\x10\x30\x37\x0e\xe6\x17\x4c\x30\xe8\x16\x88\x0f\
+\xf6\x6d\x5f\xe1\x36\xbc\x05\x78\xab\x87\x88\x24\x49\xd2\xe4\x96\
+\x27\x96\x01\xbc\x02\xd8\xaf\x86\xaf\xfb\x7e\x2a\x1f\x05\xa2\x04\
+\xfc\x91\x58\xc3\x3c\x91\xda\xdf\xb6\x72\xf0\x96\x24\x49\x92\x52\
+\x75\x02\x4f\xd4\xcf\x8e\x67\x29\x02\x57\x00\xc7\x11\x7b\x99\x25\
+\x49\x92\xa4\x86\xf3\x5c\xc6\x37\x75\x72\x09\xb8\x95\x38\x79\xc4\
+\x01\x38\x3a\x8e\x24\x49\x92\x1a\xd8\x3e\xc4\x21\xca\xc6\x12\x74\
+\x2f\x03\x5e\x0d\xec\x84\xbd\xb9\x92\x24\x49\x6a\x02\xf3\x19\xdf\
+\x24\x16\x4b\x89\x63\x0e\x4b\x92\x24\x49\x0d\x6f\x3a\x70\x03\xe3\
+\xaf\xd9\x7d\x87\x4d\x27\x49\xf5\xe7\xd3\xbd\x92\xb4\x65\x59\xe2\
+\xac\x66\x07\x55\xf0\xbb\xb3\x6c\x3e\x49\x92\x24\x35\xb2\x84\x38\
+\xfb\x5a\xa5\x43\x8f\x1d\x61\x13\x4a\x92\x24\xa9\x91\x9d\x44\xe5\
+\x63\xed\x5e\x89\x0f\xab\x49\x92\x24\xa9\x81\x4d\x05\x96\x57\x18\
+\x76\xff\x41\xe5\xd3\x15\x4b\x92\x24\x49\x35\xb1\x07\x71\xea\xdf\
+\xf1\x86\xdd\x6b\x80\x1d\x6d\x3e\x49\x92\x24\x35\xba\x0c\xf0\x2d\
+\xe2\xec\x68\x63\x09\xba\x0f\x01\xa7\x01\x1d\x36\x9d\x24\x35\x16\
+\x67\xfc\x91\xa4\x2d\x5f\x23\x9f\x03\xbc\x0c\xd8\x1f\xd8\x0e\x68\
+\x27\xd6\xf5\xae\x02\xee\x05\xee\x03\xae\x05\x7e\x07\x0c\xd9\x64\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\xa4\x2d\xf8\xff\x06\x8c\x8d\x24\x5c\x2e\x3a\xf5\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xd3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x03\x00\x00\x00\xd7\xa9\xcd\xca\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x01\x84\x00\x00\x01\x84\x01\
+\x97\x1e\x7c\xa6\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x66\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x4e\xe8\x36\x53\x00\x00\x00\x21\x74\
+\x52\x4e\x53\x00\x02\x04\x0f\x12\x16\x23\x28\x29\x2a\x2d\x48\x4b\
+\x5c\x5e\x76\x7d\x7f\x90\xb2\xb3\xc1\xc6\xca\xd0\xd6\xe6\xe8\xea\
+\xf3\xf7\xf8\xfa\xb8\xfd\x42\xa2\x00\x00\x00\xb2\x49\x44\x41\x54\
+\x28\x91\x75\x92\x5d\x1b\x82\x20\x0c\x85\x0f\x14\xa1\x86\x82\x99\
+\x90\x94\xc2\xfe\xff\x9f\xec\xc2\x8f\xf4\xb1\xed\x6e\xef\x78\xce\
+\xc6\xd9\x80\x39\x94\x69\xbb\x18\xbb\xd6\x28\xec\x43\xba\x4c\x34\
+\xf6\xfd\x48\x94\x9d\xfc\xf1\x22\x90\xaf\xb5\x00\x84\xae\x3d\x85\
+\x62\xe5\xcd\x94\xac\x58\x13\x61\xd3\xd4\x2c\xef\xa7\xa1\xdc\xeb\
+\x96\xc3\x54\x00\x80\x0c\xe9\xc0\x81\x32\x05\x09\xc0\x91\x5d\xf2\
+\xdb\x5a\xb1\xe4\x00\x95\xfd\xac\x7f\x4f\x8f\xad\x8f\xcf\x0a\x86\
+\xea\x85\x7f\xaa\x4d\xac\x26\x83\x96\xf4\x89\x43\x53\x8b\x6e\x14\
+\x27\x0e\x31\x76\x88\x3d\x80\x2a\xd1\xfb\xb5\xc4\xf3\x02\xa0\x8f\
+\x7c\x81\x95\x62\x9b\xb3\xe3\xb2\x1f\xfc\x59\xa2\xae\x07\x4b\x78\
+\x13\x59\xdb\xf9\x45\xf1\xab\xe5\x8f\x01\x7f\xce\xe7\x0b\x8f\x77\
+\x13\x35\x72\x19\xe2\xdf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x01\x77\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xb1\x00\x00\x00\xb1\
+\x01\xc6\x2d\x49\x8d\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xf4\x49\x44\
+\x41\x54\x48\x89\xed\xd3\x3b\x4a\x43\x41\x14\x06\xe0\x0f\xb4\x37\
+\x12\x90\x04\x54\xdc\x81\x08\x3e\x36\xe2\x02\x74\x07\x0a\x21\x10\
+\xb0\x30\xc4\xc2\xbd\xb8\x0e\x1f\xd8\xb8\x00\x8b\xb4\x16\xbe\x56\
+\x90\x6b\x91\xb9\x72\xef\x10\x05\x67\xa6\x8b\x07\xa6\x98\x53\x7c\
+\x3f\xf3\xc3\x50\x6e\x86\x98\x62\xb7\xa0\xf9\x3d\x03\x54\xe1\xbc\
+\x63\xbf\x24\x7e\xda\xc0\xeb\xf3\xaa\xd0\x4b\xfa\x58\xc3\xc3\x82\
+\x90\xec\x97\x0c\xf0\x89\x23\x74\xf0\xb8\x20\x64\x9a\x83\xd7\xc8\
+\x6f\x21\xc3\x14\x7c\x14\x21\xb3\x10\x72\xa8\x5d\xd7\x45\x09\xfc\
+\x0a\xdb\x51\x48\x07\x27\x25\xf0\x71\xd8\x4f\xb4\xeb\xea\xa7\xe0\
+\xcd\xce\x2b\x5c\x87\xfd\x38\xda\x27\xd5\xf2\x8f\xff\x09\xbf\x5c\
+\x6e\xbc\x87\x8f\x06\x32\x09\xfb\xb8\xf3\x51\x0a\xbe\x81\x75\x1c\
+\x84\x90\x19\x76\xb4\x3f\x51\x32\x0e\xe7\x78\x42\x17\x7b\x78\x8b\
+\xe0\xe4\x5a\xea\xb9\x0b\xc8\x4f\x21\x59\xf8\xa6\x79\x25\x35\x16\
+\x87\x64\xe1\xcc\xeb\x89\xeb\xa8\x43\x7a\xb9\xf8\x2a\x8e\x1b\xf7\
+\x0a\xf7\xb8\xc1\x0a\x5e\x72\x03\xe0\x19\xb7\x38\xc3\x56\x09\xb0\
+\x39\x5f\xcc\xea\x99\x75\xbe\xe3\x32\xe7\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x34\x5c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x60\x00\x00\x01\x1e\x08\x06\x00\x00\x00\xb4\x49\xcf\xfd\
+\x00\x00\x01\x85\x69\x43\x43\x50\x49\x43\x43\x20\x70\x72\x6f\x66\
+\x69\x6c\x65\x00\x00\x28\x91\x7d\x91\x3d\x48\xc3\x50\x14\x85\x4f\
+\x53\xa5\x45\x2a\x0a\x76\x10\x71\xc8\x50\x9d\x2c\x88\x8a\x38\x4a\
+\x2b\x16\xc1\x42\x69\x2b\xb4\xea\x60\xf2\xd2\x3f\x68\xd2\x90\xa4\
+\xb8\x38\x0a\xae\x05\x07\x7f\x16\xab\x0e\x2e\xce\xba\x3a\xb8\x0a\
+\x82\xe0\x0f\x88\x9b\x9b\x93\xa2\x8b\x94\x78\x5f\x52\x68\x11\xe3\
+\x85\xc7\xfb\x38\xef\x9e\xc3\x7b\xf7\x01\x42\xb3\xca\x54\xb3\x67\
+\x12\x50\x35\xcb\x48\x27\x62\x62\x2e\xbf\x2a\x06\x5e\x11\x82\x0f\
+\x83\x08\x20\x28\x31\x53\x4f\x66\x16\xb3\xf0\xac\xaf\x7b\xea\xa5\
+\xba\x8b\xf2\x2c\xef\xbe\x3f\xab\x5f\x29\x98\x0c\xf0\x89\xc4\xf3\
+\x4c\x37\x2c\xe2\x0d\xe2\xd9\x4d\x4b\xe7\xbc\x4f\x1c\x66\x65\x49\
+\x21\x3e\x27\x9e\x30\xe8\x82\xc4\x8f\x5c\x97\x5d\x7e\xe3\x5c\x72\
+\x58\xe0\x99\x61\x23\x9b\x8e\x13\x87\x89\xc5\x52\x17\xcb\x5d\xcc\
+\xca\x86\x4a\x3c\x43\x1c\x51\x54\x8d\xf2\x85\x9c\xcb\x0a\xe7\x2d\
+\xce\x6a\xb5\xce\xda\xf7\xe4\x2f\x0c\x15\xb4\x95\x0c\xd7\x69\x8d\
+\x22\x81\x25\x24\x91\x82\x08\x19\x75\x54\x50\x85\x85\x28\xed\x1a\
+\x29\x26\xd2\x74\x1e\xf3\xf0\x8f\x38\xfe\x14\xb9\x64\x72\x55\xc0\
+\xc8\xb1\x80\x1a\x54\x48\x8e\x1f\xfc\x0f\x7e\xcf\xd6\x2c\x4e\x4f\
+\xb9\x49\xa1\x18\xd0\xfb\x62\xdb\x1f\x63\x40\x60\x17\x68\x35\x6c\
+\xfb\xfb\xd8\xb6\x5b\x27\x80\xff\x19\xb8\xd2\x3a\xfe\x5a\x13\x98\
+\xfb\x24\xbd\xd1\xd1\x22\x47\xc0\xc0\x36\x70\x71\xdd\xd1\xe4\x3d\
+\xe0\x72\x07\x18\x7e\xd2\x25\x43\x72\x24\x3f\x2d\xa1\x58\x04\xde\
+\xcf\xe8\x9b\xf2\xc0\xd0\x2d\xd0\xb7\xe6\xce\xad\x7d\x8e\xd3\x07\
+\x20\x4b\xb3\x5a\xbe\x01\x0e\x0e\x81\xf1\x12\x65\xaf\x7b\xbc\x3b\
+\xd8\x3d\xb7\x7f\x7b\xda\xf3\xfb\x01\xfa\xd8\x72\x77\x90\xa8\xff\
+\x60\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\
+\xbd\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\
+\x00\x2e\x23\x01\x78\xa5\x3f\x76\x00\x00\x00\x07\x74\x49\x4d\x45\
+\x07\xe5\x0c\x01\x10\x16\x29\xb5\x1d\x24\x3e\x00\x00\x00\x19\x74\
+\x45\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x43\x72\x65\x61\x74\
+\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x57\x81\x0e\x17\
+\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xed\x9d\x77\x98\x64\x55\
+\x99\x87\xdf\x73\xab\xaa\xf3\xe4\xc4\x0c\x0c\x39\x49\xce\x22\x20\
+\x08\x2e\x18\x51\xd1\xd5\x5d\xb3\xa2\x40\x83\x28\xe6\x75\x51\x31\
+\xac\x02\x26\x74\x51\x18\x40\x10\xd3\x9a\x10\x45\x04\x54\x72\x46\
+\x18\x32\x92\x06\x18\x06\x86\x30\x4c\x9e\xe9\x9e\x9e\xee\x0a\xf7\
+\xec\x1f\xdf\x6d\xa6\x67\xe8\x50\x75\xeb\x56\xec\xdf\xfb\x3c\xf7\
+\x01\x9a\xee\xaa\x5b\xa7\xce\xf9\xdd\xef\x7c\xe7\x0b\x20\x84\x10\
+\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
+\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
+\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
+\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
+\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
+\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\xc4\x26\x38\x0d\x41\
+\x43\x32\x07\x38\x14\xd8\x05\x98\x15\xfd\xec\x25\xe0\x41\xe0\x7a\
+\x60\xa5\x86\x48\x08\x21\x92\xa3\x15\x78\x4f\x24\xb0\x59\xc0\x8f\
+\x70\xf5\x00\xe7\x00\xb3\x35\x64\x42\x08\x51\x1e\x29\xe0\xdd\xc0\
+\x63\xa3\x88\xee\x70\xd7\x4b\xc0\xdb\x34\x7c\x42\x08\x11\x8f\xb9\
+\xc0\x95\x25\x0a\xef\xd0\x2b\x07\x7c\x52\xc3\x28\x84\x10\xa5\xf1\
+\x76\x60\x59\x19\xe2\x3b\x78\xe5\x81\x0f\x68\x38\x85\x10\x62\x6c\
+\x02\xe0\xcb\x91\xf5\xea\x13\xba\xd6\x00\x3b\x6a\x68\x85\x10\x62\
+\x64\xd2\xc0\x3c\x20\x4c\x50\x7c\x07\xaf\x2b\x35\xbc\x42\x08\x31\
+\x3c\x29\xe0\x67\x15\x10\xde\xa1\xae\x88\xfd\x34\xcc\x42\x08\xf1\
+\x4a\x76\xae\x90\xe5\x3b\xf4\xfa\xbe\x86\x59\x88\xfa\x21\xd0\x10\
+\xd4\x0d\x7b\x53\xf9\xc4\x98\x43\x35\xcc\x42\x08\xb1\x31\x69\xe0\
+\xd6\x0a\x5b\xbf\x1e\x58\x82\xb2\x1f\x85\x10\xb2\xea\x37\xe2\xcb\
+\x55\x10\x5f\x0f\x3c\x27\x01\x16\x42\x54\x8a\x83\x80\xe5\xc0\xb7\
+\x1a\x44\x88\x1d\x70\x0a\x76\x40\x56\x0d\x01\xfe\x9b\xa6\x88\x10\
+\xa2\x52\x5c\x14\x09\x4d\x08\x9c\xd8\x00\x96\xfa\x57\x81\x42\x95\
+\xc4\xd7\x03\x1f\xd1\x14\x11\x42\x54\x8a\xa1\x7e\xd4\x95\xc0\x8c\
+\x31\x7e\x3f\x0d\x1c\x02\xbc\x03\x98\x59\xe5\x7b\xfd\x24\x95\x8f\
+\x7a\x18\x7a\xdd\x09\xb4\x69\x8a\x08\x21\x2a\x65\x51\x6e\x5a\xb0\
+\xe6\x73\xa3\xfc\x7e\x17\x70\xf9\x10\x11\x5c\x06\xec\x55\xc5\x7b\
+\x7d\xbc\x8a\xe2\x3b\x98\x0d\x77\x2d\x70\x06\xf0\x1f\xc0\x6e\xd1\
+\x18\x08\x21\x6a\x44\x33\x1d\xc8\x74\x01\xcf\x02\x53\x86\xfc\xec\
+\xf6\xc8\xc2\xf5\x9b\xfc\x6e\x2b\xf0\x27\xe0\xcd\x9b\xfc\xfc\xcf\
+\xc0\x3b\xab\x74\xbf\xff\x05\x9c\x4e\xed\x7c\xd5\x21\xb0\x1e\xab\
+\x9a\xf6\x24\xf0\x4c\x74\xbd\x88\x45\x4b\x2c\x05\x56\x00\xeb\xb0\
+\xf2\x97\x03\xd1\x3f\x0b\x5a\x36\x42\x48\x80\x37\x65\xc7\xc8\xaa\
+\x1c\x4a\x3f\x30\x39\x12\x8f\xa1\xd6\xe7\x3c\xe0\xf8\x61\x5e\xe3\
+\x39\x60\xfb\x4d\x7e\xbf\x92\x63\xff\x76\xe0\x9b\x58\x12\x46\xa6\
+\x4e\xc7\x35\x1b\x8d\x63\x7f\x24\xd8\x7d\x91\x35\x3d\xf4\x5a\x85\
+\x1d\x7e\x2e\x1b\xf2\xcf\xe7\x22\x01\xcf\x47\x97\x10\xa2\x89\x39\
+\x76\x98\x6d\x77\xc8\x2b\x7d\xbb\x9f\x65\x64\xdf\xeb\xca\x1a\x6d\
+\xcb\xb7\x02\x7e\x4c\x75\x7d\xc2\xd5\xb8\xfa\x80\xa7\x80\x1b\x81\
+\x8b\x81\x2f\x02\x6f\xc1\xca\x6c\x2a\x1c\x4e\x88\x26\xe2\xd2\x61\
+\x04\x60\x3d\xd0\x31\xe4\x77\xde\xc6\xe8\x55\xc6\x9e\x8b\xdc\x13\
+\xb5\xda\x8d\xfc\xa0\xc9\x04\x78\xb4\xba\x14\xcf\x03\x57\x01\xdf\
+\x8b\x1e\x9e\x87\x01\xdb\x00\x13\x34\x95\x85\x5c\x10\x8d\xc5\x34\
+\x60\x21\x30\x71\x93\x9f\x5f\x09\x1c\x1d\x2d\xfa\xbd\x81\x1b\x80\
+\x49\xa3\xbc\xce\x2d\xd4\x36\x5d\x77\xeb\xc8\x8d\xd2\x32\x4e\xe7\
+\x63\x1e\xf3\x39\xaf\x02\x16\x61\x3e\xe9\xa7\x81\x27\xa2\x71\x59\
+\x14\xb9\x3c\xe4\xd2\x10\x4d\x41\xba\x49\x3e\xc7\x7f\x0e\x23\xbe\
+\x44\x0b\xd8\x63\x3e\xd6\xcb\xc7\x10\x5f\x80\xeb\x6a\xfc\x39\x16\
+\x61\x3d\xdd\xa6\x8d\xe3\xf9\x38\x29\xba\xb6\x1e\xe6\xff\x67\x81\
+\xc5\xc0\x23\x58\x58\xdd\x4d\xc0\x7c\xaa\xe3\xb3\x17\x42\x0c\x43\
+\x1b\x76\x8a\x3f\x52\xec\xeb\x87\xb0\x93\xfd\x62\xda\xf7\x6c\x5f\
+\x07\x9f\x67\xc9\x38\x71\x43\x24\x75\x2d\x03\x7e\x09\x1c\xa0\xa5\
+\x20\x44\xf5\x39\x39\xa1\x85\xfc\x8b\x3a\x70\xc9\xa4\x81\xb5\x12\
+\xd5\x58\x57\x0f\xd5\x8b\xe3\x16\x42\x00\x9b\x61\xf1\xaa\x49\x14\
+\xa9\xa9\x87\x36\xee\x53\xb0\xc8\x01\x09\x6a\xbc\xeb\xbb\x5a\x12\
+\xa2\x91\x08\x1a\xfc\xde\x7f\xc2\xd8\xe9\xc6\xc5\x70\x4a\xe4\xa6\
+\xa8\x35\x9d\x58\x67\x0c\x11\x8f\x05\x1a\x02\x21\xaa\xc3\x71\x09\
+\x5a\x4e\xbf\x8d\xb6\xaf\xd3\x80\x76\xcc\xaf\xdc\x16\x09\x62\x35\
+\x45\x71\x32\x16\x05\x20\x6b\xb6\xf4\xeb\x79\x14\xc2\x26\x44\x55\
+\x38\xa8\x02\x42\x55\x88\x5e\x73\xf5\x90\x6b\x30\xd3\x6b\x05\xf0\
+\x57\xaa\x93\xad\x76\xb1\xc4\x34\xd6\xf5\x79\x2d\x0b\x21\x2a\xcf\
+\xb6\x98\xcf\xb6\x9a\x8b\x3b\x04\xbe\x16\x59\x58\x95\xb6\x86\xe7\
+\xa0\x83\xb8\x52\xaf\x81\x84\x5c\x51\x42\x88\x51\x98\x85\xc5\x80\
+\xd6\x72\xb1\xff\x8b\xca\x47\x4b\x9c\x21\x51\x2d\xe9\x7a\x1a\xa5\
+\x36\x0b\x51\x51\x66\x00\xf7\xd4\xc1\x62\xbf\x84\xca\x1f\x5e\x76\
+\x8c\xf1\x59\x07\xb0\xba\x15\x12\x5f\xbb\x56\xa3\x5a\xc7\x42\x54\
+\xd4\xf2\xbd\xa7\x4e\x16\xfb\x72\x2c\x62\xe2\x39\xe0\xeb\x15\xfc\
+\xcc\x73\x81\x47\x47\x70\x87\x9c\x1a\xb9\x62\x6e\x94\xf8\xbe\x7c\
+\x1d\xab\x65\x22\x44\xf2\x6c\x15\x6d\xfb\xeb\x6d\xc1\x5f\x87\xc5\
+\x21\x57\x92\xe9\xc0\x85\x58\x51\xa1\x10\x4b\x36\x38\x75\x88\x05\
+\x9e\xc1\x1a\x7a\x66\x25\xc0\x2c\x03\x5e\xa5\xe5\x22\x44\x72\xec\
+\x16\xf9\xf7\xea\x6d\xb1\x5f\x4c\x75\x0b\xe6\x4c\xc5\xc2\xe4\x46\
+\xaa\x65\x71\x38\xd5\x3f\x98\xac\xc7\xeb\x19\xea\x23\x9d\x5c\x88\
+\x86\xe7\xd0\x68\xbb\x5f\x8f\x0b\xfd\x97\xc0\x31\xc0\x11\xc0\xae\
+\x75\x32\x5e\x73\xb0\xe2\x34\xe3\x5d\x84\x1f\x66\xec\xa2\x4b\x42\
+\x88\x51\x78\x37\xd0\xdb\x00\x8b\x3d\x8f\xc5\x24\xd7\x0b\xed\xc0\
+\x05\x34\x5f\x61\xf7\x52\xaf\x1f\x69\x09\x09\x51\x3a\x0e\xeb\x16\
+\xdc\x48\x3e\xcd\x1e\x2c\x49\xe3\x64\xcc\x5f\x5d\x0f\x63\xf8\x59\
+\x46\x2f\x3c\xdf\xec\x57\x3f\x76\x48\x29\x84\x28\x92\x14\x16\xff\
+\x5a\x68\xd0\x45\xbf\x0a\x6b\xb9\x53\x2f\x35\x96\xdf\xcb\xf8\x4e\
+\x6b\x3e\x43\x4b\x4a\x88\xe2\x68\xa5\xf1\x53\x70\xef\x05\xde\x07\
+\xec\x1e\xf9\x20\xeb\x21\x31\xe0\x48\xc6\x6f\x56\xdd\x23\x34\x4f\
+\xc3\x01\x21\x2a\x46\x27\xd6\xad\xa2\x99\x16\xff\x3a\xea\xa7\x34\
+\xe2\xeb\xc6\xa9\x08\x17\x80\x2d\xb4\xbc\x84\x18\x99\x49\xc0\xf5\
+\x4d\xb6\xf0\x57\x01\xdf\xa7\xbe\x6a\x13\x1c\xc5\xf8\xac\x33\xfc\
+\x66\x2d\x31\x51\xcf\xd4\xb2\x1e\x70\x17\xf0\x67\x2c\x86\xb5\x59\
+\x58\x09\xdc\x05\x1c\x02\xdc\x81\xb5\x17\x9a\x4f\xed\x3a\x2d\x0f\
+\x72\x35\xf0\x31\xc6\x5f\x33\xcb\x6d\xb4\xc4\x85\x18\x9e\x4f\x37\
+\xb9\xf5\x15\x02\xd7\x50\x5f\xd9\x59\x5f\x1e\x67\x16\xf0\x69\x5a\
+\x66\x42\x16\xf0\x2b\x69\x01\xba\x9b\x7c\x6c\x1f\x02\x16\x02\x1f\
+\xa4\x3e\xda\x1d\x81\x45\x06\x5c\x32\x8e\xe6\x77\xab\x96\xb8\x10\
+\xaf\xe4\x23\xe3\xcc\x12\x3b\xbd\x8e\xc6\x7e\x0a\xf0\xc4\x38\x19\
+\xf7\xaf\x69\xa9\x09\x59\xc0\x1b\x33\x89\xca\x56\x11\xab\x47\x3a\
+\x86\xf9\x59\xad\xc2\xd4\x56\x01\x1f\xc5\x92\x5d\x9a\x9d\x95\x5a\
+\xe2\xa2\x9e\xa9\x45\x03\xc8\x33\x81\x37\x8e\xb3\x71\xde\x02\xf3\
+\x09\x1f\x80\x1d\x3a\xe6\xb1\x92\x96\x3e\xe6\xeb\xed\x07\x7c\x0a\
+\xf8\x67\x4c\x21\x7d\x16\xeb\x7f\x77\x60\x93\x8f\xfb\x05\xc0\x63\
+\x5a\xe6\x42\x18\x47\x32\x7e\x53\x64\x43\xe0\xc7\x91\x0b\xa0\x1c\
+\xda\x87\xb8\x10\xfe\x44\xfc\x64\x83\x49\x34\x7f\x05\xb5\x9d\xb5\
+\xe4\x44\x3d\x53\xcd\x4c\xa1\x2d\x80\x9f\x33\x7e\xb3\x93\xd6\x60\
+\xd9\x59\x6f\x8f\x76\x1e\x19\x60\x11\xf0\x8f\x12\x2d\xe1\xf7\xb2\
+\xa1\xe4\xe2\x31\xc0\x37\xb0\xe8\x86\x52\xe9\xa7\xb9\xc3\xd2\x56\
+\x44\x96\xbe\x10\xe3\x9e\x76\xe0\x16\xc6\x77\x85\xae\xe1\xb2\xe5\
+\x4e\x2c\x71\x1c\x5d\xe4\x76\xd8\x34\xe3\xeb\x93\x94\xe6\x53\x76\
+\x58\x61\xf7\x66\x1e\xdf\xff\xd5\xb2\x13\xc2\x2c\xde\xdf\x48\x70\
+\x37\xba\x5e\x02\xf6\x8c\x31\x96\x5b\x8f\xe0\xc2\x29\x44\xee\x8d\
+\x89\x45\xbc\x46\x27\xf0\x9d\xc8\xfa\x6d\x56\x57\xcf\x0f\xa8\xcd\
+\xf9\x86\x10\x75\x45\x00\x9c\x25\xc1\x7d\xc5\xb5\x1e\xf3\xdf\x9e\
+\x05\x7c\x05\x78\x0f\xc5\x75\xd8\x38\x79\x8c\xd7\x5d\x12\x59\xd5\
+\x13\x87\xb1\x78\x77\xc6\xaa\xb5\x2d\x6a\xe2\x71\xed\x05\x4e\xd0\
+\xb2\x13\xc2\x16\xfd\xb7\x50\x71\xf0\x62\xae\xc7\x18\xfb\x70\xae\
+\x03\x58\x50\xe4\xeb\xad\xc5\x9a\x98\x5e\x0b\xdc\x86\x45\x5c\x34\
+\xfb\xe1\xe7\xfc\x98\xbb\x0a\x21\x9a\x52\x7c\xbf\x21\xf1\x1d\xf3\
+\xca\x02\xe7\x14\x21\xbe\x2e\xf2\x69\xfa\x4c\x26\xe3\x9d\x73\x1a\
+\xbb\x8d\x9b\x71\x9e\x8c\xb2\xde\x84\x90\xe5\x5b\xe2\x76\xf9\xd0\
+\x22\xc6\xb3\x05\x38\x2b\x95\x4a\xf9\xae\xae\x2e\x3f\x6d\xda\x34\
+\x3f\x71\xe2\x44\x89\xb0\x09\xef\xd7\xb1\xce\xd1\x42\x34\xac\x58\
+\x26\x49\x0a\x4b\xb4\xf8\x1c\xf5\x51\x90\xbc\xde\x59\x8c\x1d\x18\
+\xfd\x29\xfa\xf7\x97\x99\x3a\x75\xea\x96\xde\xfb\xd7\x17\x0a\x85\
+\x4f\x05\x41\xb0\x57\x2a\xb5\xf1\x99\x52\x3e\x9f\x67\xed\xda\xb5\
+\x78\xef\xc7\xd3\x78\x79\xe0\x01\xe0\x42\xe0\x57\x91\xab\x45\x08\
+\x09\x30\x16\xd7\x7a\x36\xcd\x5f\x64\xa7\x12\xf4\x83\x5b\x14\xa4\
+\x82\xa7\x3b\x3b\x3a\x72\x99\x4c\x66\x27\xe7\xdc\x36\x8c\x71\x30\
+\x97\xcf\xe7\x59\xb3\x66\xcd\x78\x10\xdd\x45\x58\xe9\xd2\xdf\x02\
+\xf7\x61\x51\x1f\x42\x48\x80\x23\x5a\x81\x8b\x80\xf7\x6b\x48\x8b\
+\x18\x74\x17\x10\xa4\x02\x82\x20\x20\x08\x52\xa4\x52\x29\xd2\xe9\
+\x14\xe9\x54\x0a\xe7\x8a\xfb\x4a\xbc\xf7\xf4\xf4\xf4\x90\xcb\xe5\
+\x9a\x71\x88\x0a\x91\xa5\xfb\x57\xe0\x6f\x58\xbb\xa7\x9c\x66\x8e\
+\x90\x00\xbf\x92\x0e\xe0\xff\x80\x77\x68\x38\x37\x26\x08\x82\x61\
+\xc4\xd6\x7e\xe6\x9c\x23\x70\xce\xfe\x19\x14\xff\x35\x78\xef\xc9\
+\xe5\x72\xac\x5b\xb7\x8e\x30\x0c\x9b\x69\xb8\xd6\x02\x37\x02\x57\
+\x01\xd7\x01\x4f\x11\xbf\x56\x86\x10\xe3\x42\x80\xbb\x80\x4b\xb1\
+\x96\x37\xe3\xdb\xa2\x0d\x82\x97\x2d\xd9\x54\x3a\x4d\x2a\x30\x91\
+\xdd\x60\xd1\x3a\x5c\xcc\xd1\xf6\xde\x53\x28\x14\xc8\x66\xb3\x0c\
+\x0c\x0c\x34\x8b\xf0\x86\x91\x6b\xe1\x1a\xe0\x2f\xc0\xcd\x58\x76\
+\xa0\x10\x12\xe0\x22\xc5\xf7\x4f\x58\x81\x9d\x71\x22\xb4\x8e\x20\
+\x48\x99\x35\x9b\xda\x60\xd1\xa6\x53\xa9\xc8\xda\x4d\xce\xa5\x9e\
+\xcf\xe7\xc9\x66\xb3\xe4\x72\x39\x0a\x85\x42\x33\x1c\xb6\x65\x23\
+\xab\xf6\x26\x2c\x2d\xfd\x2e\xe0\x99\x06\x76\x2d\xa4\x30\xd7\xdb\
+\x74\x60\x2b\x60\x6e\x74\xcd\xc0\x2a\xcd\x4d\x8a\x76\x87\x43\xc3\
+\xe3\x7a\xb1\x1a\x15\x4b\xa3\xcf\xbe\x00\x73\xb5\xac\x40\x7e\x6d\
+\x09\x70\x09\xb4\x47\xe2\xdb\x34\x65\x25\x4d\x5c\x83\x8d\x2c\x56\
+\x73\x1b\x6c\x70\x21\x98\xeb\x00\x1c\x1b\x5c\x07\x49\x8a\xee\xa0\
+\xf0\xf6\xf5\xf5\x35\x8b\x6f\x77\x29\xe6\xc3\xbd\x3a\x12\xdd\xc5\
+\x0d\xb8\x3e\x3a\xb0\xde\x72\xdb\x62\x45\x90\xb6\x07\xb6\xc3\xd2\
+\xc2\x37\xc7\x52\xbb\xcb\xa1\x80\x55\xb7\xbb\x1d\xb8\x32\x1a\xab\
+\x5e\x49\x93\x04\x78\x24\xd2\x98\xcf\xf7\x3d\x0d\x2a\xb4\xf9\x54\
+\x2a\x95\x4a\xa7\xd3\x2e\x9d\x4e\x93\x4a\xd9\x21\x58\xd2\x42\x5a\
+\x8a\x7b\x21\x0c\x43\x72\xb9\x1c\x03\x03\x03\xe4\xf3\x0d\x5f\xa0\
+\x6c\x05\x76\x78\xf6\x9b\xc8\xad\x30\x50\x27\xf7\xd5\x11\xed\xda\
+\xda\x81\x36\x36\x54\xe5\x6b\x05\x26\x03\x53\x81\x59\xc0\x66\x58\
+\xe5\xbe\xad\x23\xe1\x9d\x13\x59\xbb\xd5\x6a\x5e\xb0\x0a\xf8\x03\
+\xf0\x53\xec\xf0\x51\x7e\x70\x09\xf0\x46\xbf\x7f\x26\x56\x53\xa0\
+\x2e\x2c\xd6\x41\x01\x1d\xb4\x56\x87\x0a\xa9\xf7\xfe\xe5\xad\xfb\
+\xe0\xef\x3a\xe7\xbc\xab\x92\xda\x0e\xbe\xff\xd0\x2b\x0c\xc3\x97\
+\xaf\x7c\x3e\xdf\x2c\xee\x85\xc1\xf8\xdc\x73\x22\xf1\xa8\x76\x7c\
+\x6e\x80\xd5\xbf\x98\x0d\xec\x14\x59\xa8\xdb\x46\xae\x81\x2d\x22\
+\x51\x6d\xc7\x42\x25\x53\x91\xf8\xba\x32\x77\x81\x95\xa6\x00\x3c\
+\x18\x3d\xc8\xfe\x80\x4a\x6b\x4a\x80\xb1\x30\xb3\x5f\x56\xca\x1a\
+\x70\xce\x6d\x24\x98\x83\x22\x3b\x92\xd0\xd6\xca\x6a\x1d\x89\x5c\
+\x2e\x47\x36\x9b\x25\x9f\xcf\x13\x86\xe1\x46\x0f\x80\x26\xc5\x63\
+\x35\x27\xbe\x86\xd5\x35\x2e\x54\x61\xbe\x66\x22\xeb\x74\x0f\x60\
+\xf7\xe8\x7a\x55\x24\xb4\x5d\x4d\x3a\xce\xfd\xc0\xdf\x81\x73\xb1\
+\x08\x91\x10\x31\xee\x04\x78\x5b\xe0\x6e\xca\xef\xe8\xf0\x0a\x52\
+\xa9\x14\x53\xa6\x4c\x22\x9d\xce\xe0\x7d\x48\x2e\x97\xc7\xb9\xa0\
+\xee\x07\x6f\x68\x74\x42\x36\x9b\xa5\x50\x18\x57\xe7\x28\x4b\x80\
+\x2f\x61\xee\xa8\x4a\xf9\x4d\x3a\x23\x71\xdd\x03\x6b\xc3\xb4\x07\
+\xb0\x4b\x25\xe6\x60\x03\x71\x37\x96\x3d\xf9\x47\x9a\xbb\xa0\xbe\
+\x04\x78\x93\xdf\xbb\x02\x78\x73\x25\x6e\x62\xfa\xf4\xa9\x64\x32\
+\x99\x0d\x7b\xaf\x42\x48\xa1\x50\x9d\x87\xfc\x50\x97\xc0\xa0\x3b\
+\x60\x24\xeb\x7a\xd0\xa2\x2d\x14\x0a\x14\x0a\x85\x97\xad\xdc\x71\
+\xca\x49\xc0\xbc\xa4\x9e\xc1\x98\xff\x75\xbb\xc8\xa2\xdd\x27\xba\
+\x76\xc6\xfc\xb5\x4a\x6b\x7f\xe5\xce\xe3\x21\xac\x16\xc6\xe5\x28\
+\x82\xa2\xe9\x05\xf8\x0d\x58\x80\x7c\xe2\x66\x69\x10\x04\xcc\x9a\
+\x35\x63\xa3\x9f\xc5\x14\xe0\xc1\x3a\xbb\xf9\x68\x8b\xe6\xd8\xe0\
+\xef\x1b\xac\x3c\xb6\x18\x78\xd2\x7b\xff\x64\x6f\x6f\xef\xe7\xf2\
+\xf9\xbc\x1b\x07\x6e\x82\x4a\xf1\x08\x70\x30\xb0\x7a\x8c\xf9\xd5\
+\x32\xe4\x3b\x70\x58\x88\xd6\x76\x98\xaf\x76\x27\x60\xb7\x48\x68\
+\x67\xa0\x8a\x66\x71\xe6\xfc\x1d\xd8\x99\xcc\xed\xe8\xc0\xae\x29\
+\x05\xd8\x61\xfe\xbd\x8a\xc4\xfb\x06\x41\xc0\xcc\x99\xd3\x37\xb2\
+\x38\x47\x13\xe0\xc1\x83\xac\x41\x2b\xb4\x50\x28\x14\xbc\xf7\x7f\
+\xc9\x64\x32\x67\xb7\xb6\xb6\x3e\x94\x4a\xa5\x7a\x96\x2d\x5b\x96\
+\x9b\x36\x6d\xda\x60\x08\xd1\x04\x20\xe7\x9c\x5b\xbb\x7c\xf9\xf2\
+\xc1\xd8\xae\x0c\x16\x83\xb9\xb5\xa6\x40\x59\x2c\x00\x7e\x82\x1d\
+\xc0\xad\xc7\x7c\xb0\x5b\x62\xd1\x03\x3b\x46\xd7\xec\xc1\xef\x20\
+\x12\xe2\x89\x1a\xb6\xc4\x29\x00\x97\x60\x6d\xa6\x9e\xd6\x70\x34\
+\x97\x00\x6f\x16\x59\x8e\x15\x6b\xa6\x39\x65\xca\x24\xda\xda\xda\
+\x86\x08\x70\x81\xbe\xbe\xfe\x97\xb7\xf8\x83\x82\x3b\xe8\x2a\x88\
+\xc8\x46\x93\xee\xbb\xd8\x69\x71\xa9\x5c\x0a\xbc\x53\x53\x20\x51\
+\x6b\x4c\xae\x82\xda\xd2\x1b\xad\x87\x1f\x00\x7d\x1a\x8e\xe6\x60\
+\x6f\x2a\x5c\xdb\xd7\x39\xe7\x27\x4c\xe8\xf2\xd3\xa7\x4f\xf5\x53\
+\xa6\x4c\xf6\xe9\x74\x7a\xb4\xdf\xef\xc3\x0a\xff\x6c\x57\xe6\xe7\
+\xfa\x34\xaa\x49\xac\xab\x39\xaf\xc7\x81\x37\xe9\x81\xd8\x1c\x4c\
+\x8b\xac\xcd\x7a\xe8\xa3\x36\x2f\xda\xde\x26\xc1\x3e\xa8\x68\xbc\
+\xae\xe6\xbd\x06\xdd\x12\x73\x25\x61\x8d\xef\xa6\xf8\x6b\x0d\x27\
+\x52\x3f\x70\x5e\x02\x16\xef\xa6\xa4\xb1\x50\x2a\x2d\x56\x5d\xcd\
+\x7c\xad\x02\xbe\x80\x45\x93\x88\x06\x65\x8f\xc8\x02\xad\xe6\xc4\
+\xc9\x61\x05\xb8\x77\xa8\xe0\xe7\xfa\x9d\x16\xa8\xae\x71\x72\x3d\
+\x82\xd5\x6e\x91\x5b\xa2\x41\xf9\x64\x95\xb6\xec\x21\x70\x03\x16\
+\x78\x5f\xe9\xc9\xf2\x31\x2d\x4c\x5d\xe3\xe8\xca\x63\x87\xcf\xdb\
+\x4a\xce\x1a\xd3\x15\xf1\x3f\x15\x16\xe1\x85\xc0\xbb\xa8\x5e\xe1\
+\x93\xad\xeb\xc4\xbf\xad\x4b\x57\xb5\x1b\xc2\x9e\x89\x95\xcc\x14\
+\x0d\x26\xc2\xa7\x44\x7e\xd9\xa4\x27\xc5\x9f\xa9\x4d\x2e\xff\xfd\
+\x5a\x90\xba\xc6\xe9\xb5\x04\xf8\x0c\xe5\x97\xd4\x14\x31\x49\xc5\
+\xf8\x9b\x3b\xb1\x82\x20\x07\x02\x33\x13\xba\x8f\x47\x81\xb7\x51\
+\x9b\x2e\xb7\x33\x81\xc3\x35\x15\xc4\x38\xa4\x0b\xcb\x72\xfd\xe8\
+\x90\x75\xd8\xaf\x61\x69\x0c\x3a\xb0\x14\xc8\xe5\x65\x3e\x85\x57\
+\x02\xbb\xd6\xf0\x73\xec\x89\xc2\xd1\x74\xe9\xf2\x58\x01\xfd\x1f\
+\x61\x29\xe2\x3a\xac\x6b\x10\x66\x00\xff\xcd\x86\x26\x8a\xa5\x5c\
+\x7d\x54\xa8\xc0\x4f\x09\xa4\xa3\x27\xbf\x16\xa0\x2e\x5d\x1b\xea\
+\xa6\x5c\x13\x59\xc6\x53\x24\x71\xf5\xe5\x82\xd8\x94\x3e\xe0\x56\
+\x36\xd4\x2a\x5d\x1e\xfd\x3c\x13\x59\xc9\x23\x1d\xa8\xad\x02\xde\
+\x8b\x15\xf9\xa9\x25\x21\x56\x4b\xf6\x10\x4d\x07\x21\x5e\xd6\x85\
+\x6d\x81\xb7\x63\xd1\x4f\x87\x60\x1d\x43\x9e\x07\x7a\x34\x3c\x8d\
+\x41\x1b\x16\xc3\xfb\x3d\x2c\x35\x72\x1d\xd6\x9e\x66\x39\xf0\x2b\
+\x92\xcb\x68\x4b\x82\xdd\xe4\x86\xd0\xa5\xab\xa8\x1d\xeb\x65\x58\
+\x17\x74\x55\xae\x4b\x00\x57\xc5\xf7\x19\x2c\x37\xb8\x82\xfa\x2b\
+\x14\x12\x60\x5d\x7a\xf7\xd5\x94\x10\xa2\x28\x9e\x06\x7e\x0d\x5c\
+\x0c\x2c\x42\xa5\x30\x6b\xe6\x82\x28\x96\x75\x58\x94\x43\x3d\xb6\
+\xfb\xf5\x58\x28\xce\x1b\x34\x25\x84\x28\x8a\x29\xc0\x61\xc0\xc9\
+\xc0\xeb\x22\x2d\x59\x84\xa2\x28\xea\xd2\x02\x6e\x04\x66\x63\x89\
+\x20\xca\x99\x17\x22\x1e\x3d\x98\x8b\xe2\x22\xac\x40\x7c\x4e\x43\
+\x52\x3f\x16\x70\xbd\xd3\x8b\x85\xa4\xed\xaa\xa1\x10\x22\x16\xad\
+\xd1\x1a\xfa\x30\xf0\x41\x60\x0e\x96\xec\xb1\x02\xb9\x28\x64\x01\
+\x17\xc1\x51\x58\xf7\x59\x8d\x8b\x10\xc9\x30\xd8\x39\xfb\x77\xc0\
+\x6f\x80\x17\x35\x24\x12\xe0\x91\xc8\x60\xdd\x35\x76\xd6\x50\x08\
+\x91\x38\x39\x2c\x54\xf5\xd7\xc0\x95\x8c\xde\x4f\x50\x02\x5c\x11\
+\x4e\x9a\x9a\xa6\x30\x30\x19\x5c\x17\x8e\x76\xf0\xed\xe0\xd2\x98\
+\x3b\xc4\x61\x85\xa4\x0b\x58\xc8\xda\x7a\x9c\x5b\x87\x0b\x57\x73\
+\xee\xba\xf5\x55\xba\xc3\x53\xb0\x6c\xa0\xe6\x66\x22\x30\xcd\x41\
+\xbb\xb3\xc7\x4e\xe0\x36\xd8\x2b\x79\x6f\xa3\xbf\xd6\xc3\x4b\x75\
+\xb6\x73\x9c\xea\xec\xde\x5b\xa3\xfb\x4e\x61\x31\x2c\xce\x6d\xa8\
+\xa5\x17\x7a\xab\xfb\x95\xf5\x76\xf4\xbb\xdc\xab\x81\x7b\xfd\xb1\
+\x06\xab\x33\xfe\x0b\xe0\x96\x68\xbd\x8f\xb0\x22\x03\x47\xb6\xb3\
+\x03\x4f\xa7\xe9\x05\x6d\x58\xb3\xd7\x0c\x90\xc1\xf9\x00\xff\x72\
+\x53\xc9\x30\xba\xf2\x58\x42\x49\x16\x7c\x1f\x9e\x3e\xd2\xf9\x1e\
+\xce\x19\xa8\x2b\xbf\x74\x75\x04\xf8\x43\x99\x16\x3a\x5a\x5f\x0d\
+\x1c\x84\xa5\x39\x6e\x85\xd5\x60\x98\x82\x55\x64\x6a\x63\x43\xcf\
+\xb9\xc1\x4c\x9c\x9e\xe8\x09\xb9\x0c\xeb\x49\xf7\x04\xde\xdf\x41\
+\x21\xb8\x8d\x0b\x7b\x2a\xf9\xe4\x9c\x0a\x3c\x11\xfd\xb3\xf9\xd8\
+\xce\xc1\xb6\x69\x98\x9c\x82\xb6\x00\x5a\x1c\xa4\xdc\x86\x74\x19\
+\x0f\x14\xbc\x89\x70\xbf\x87\xde\x02\xbc\x50\x80\x07\x0b\xb5\x13\
+\xb1\x6d\x1c\x6c\x91\x82\x29\x29\x68\x73\xd0\x1a\xd8\x6c\x49\x45\
+\xf7\xee\x36\xd9\xf0\x86\xde\x1e\xe1\x79\x0f\x39\x0f\xfd\x21\xf4\
+\x84\xf0\x52\x01\x1e\x09\xd5\xc4\xbd\xfe\x58\x84\x95\xc9\xfc\x05\
+\xf0\x30\x9f\x68\x9b\x40\x3e\xb3\x3d\xb0\x1d\xce\x6f\x87\x75\xf5\
+\x98\x09\x4c\x07\x26\x47\x9a\xd1\x85\x25\x7a\xb5\xf2\xca\xb3\xac\
+\x3c\x16\x8d\xd1\x87\x9d\xed\xac\xc2\xfc\xd0\x2f\x46\xef\xf5\x20\
+\x01\xf3\x39\xb7\x77\x71\xf3\x0a\x70\x77\x57\x06\xe7\x67\x03\x1f\
+\xc5\xbb\xf7\x63\x71\xc0\x9d\xd1\x53\x2b\x0e\x05\xcc\x9e\x59\x09\
+\xfc\x9e\x30\x9c\x47\xe0\x9e\xe7\xbc\x75\x95\x90\x85\x1f\x45\x96\
+\x70\xed\xe8\x04\xde\xd0\x0a\x93\x4b\xec\x85\x9a\xf3\x30\xbf\x1f\
+\x1e\x1b\xd2\x55\x3a\x0d\x6c\x1e\xc0\x9e\x19\x98\x91\x86\xb4\x2b\
+\xfe\x9b\x1f\x14\xe4\xde\x02\x3c\x98\x85\x27\xc2\xca\x9f\x6d\x07\
+\xd1\xf2\xda\x2e\x80\x1d\x5a\x60\x42\x6a\xe3\x87\x44\x1c\x06\x3f\
+\xc7\x80\x87\xe7\x72\xf0\x70\x1e\x56\x26\x6c\x19\xef\x99\x82\xfd\
+\xda\x4a\x3f\x6e\x5a\x92\x83\xab\xb2\x23\xff\xff\x76\xa0\xcb\xc1\
+\x16\x01\xcc\x4e\xc1\x84\xc0\x1e\x42\xa9\xe8\x4b\x0c\x3d\xac\x2d\
+\xc0\x3f\xb3\xf0\xe2\x30\x6f\x9e\x06\x0e\xce\xc0\xf6\x2d\xa5\xdd\
+\x9b\xf7\xf0\x54\x16\x6e\xce\x8f\xfc\x3d\x75\x44\xf7\xb6\x55\x00\
+\x33\x53\xd0\x95\xda\xf0\x50\xf7\xd1\x83\x70\x59\x1e\x6e\xc9\x9a\
+\x14\x0e\xc7\x04\x07\xbb\xa4\x60\x56\x00\x93\xd2\xbd\xb4\x07\x05\
+\x02\x7c\x74\xe7\xad\x65\x68\xc6\x70\x0c\x8a\x73\x2f\xf0\x00\xce\
+\xff\x8c\x80\xbf\x91\x77\xeb\x38\xbf\x37\x6c\x7c\x01\xfe\xf8\xe4\
+\x14\xe9\xfc\xae\xc0\x87\x80\x63\xa9\x5c\x2e\xf9\x4a\xe0\x27\xe0\
+\x2e\xe6\xbc\x9e\x45\x49\xdb\x5c\x58\x7d\x88\xda\x65\xfb\x74\x02\
+\x6f\x6d\x83\x29\x25\x0a\x70\xd6\xc3\x9d\xeb\xe1\xe1\x68\x2e\x6d\
+\xee\x60\xe7\x34\x6c\xd9\x62\xdb\xf6\x72\x28\x78\x58\x94\x85\xfb\
+\xf3\xb0\xac\x42\xae\x89\x49\x0e\x76\x0e\x60\x9b\x16\xb3\xd2\x2b\
+\xc5\x40\x08\x8b\x73\xf0\x54\x1e\x9e\x4e\xe8\xb3\xec\x93\x82\x03\
+\xda\x4b\xff\xbb\x17\x72\x70\xf9\x30\x3b\xf0\xe9\x0e\xb6\x09\x60\
+\x4e\x1a\xa6\xa5\x4d\xd8\x46\xa2\xb7\x00\x37\xf7\xc3\xb3\x23\x08\
+\xf0\x61\x19\xd8\xa1\xc4\xe9\x1c\x02\x4f\x0e\xc0\xf5\xc3\x3c\x71\
+\xb7\x70\x30\x37\x65\xf7\x36\x25\x65\x0f\xf5\x91\x58\x9e\x87\x6b\
+\xfa\xcd\xe9\x30\xd2\x83\x6b\xff\xb6\xd1\x5f\xa3\xb2\x3c\x02\x9c\
+\x8d\xe3\xcf\xcc\xeb\x5d\x5a\xcd\x37\x4e\x76\x86\x7f\xa2\xb5\x1d\
+\x17\x7c\x09\x6b\x8d\xfd\xa6\xe8\xd9\x5d\x29\xda\x81\x43\x81\xc3\
+\xd9\xaf\xe5\x79\xee\xce\x2e\x48\xf0\xb5\x57\x63\x69\xd4\x7b\xd6\
+\x4c\x80\x5b\x80\x1d\xd3\xd0\x5e\xa2\xd9\x57\x00\x9e\xcf\xc3\x0a\
+\x0f\x7b\xa7\x60\xdf\x56\x98\x9d\x49\x66\x72\x07\xce\x1e\x08\xd3\
+\x1c\x2c\x0f\x93\xcf\x67\xdc\x21\x80\x83\x5b\x60\xab\x16\xe8\xa8\
+\x70\x4d\xfe\xb4\x83\xa9\x69\xd8\x2c\x65\x0f\xbb\x25\xa1\x09\x4e\
+\x39\xcc\x0e\x60\xf3\x18\xc6\x5a\x4f\x08\x8f\x6f\xe2\x17\xd9\x3f\
+\x05\xfb\x45\x63\x31\x31\xb5\xc1\xda\x1d\xed\xc1\xfb\x4c\x7e\x78\
+\x91\x0b\x80\xad\x53\x26\xe2\xa5\x99\x67\x03\x74\x04\xa7\xf1\x40\
+\xee\x14\xcc\x5f\x7b\x3f\x8e\x1e\x0e\x4b\x6f\xce\x1e\xad\x6d\x6c\
+\xd1\x02\x5d\xc1\x86\xf3\x83\x91\xe8\x0b\x61\x61\x7e\x64\x2f\xef\
+\x66\x01\x6c\x9e\x1e\xfb\x75\x2a\xc7\x0c\xac\x5d\xd3\x81\xec\x97\
+\x79\x92\xbb\x73\xcf\x56\xeb\x8d\xd3\x89\xbc\xca\x71\x1d\x8e\x4c\
+\xb0\x03\x79\x7e\x8a\xf3\x07\x25\xf6\xba\xc5\x59\xf0\x7b\x02\xbf\
+\xa6\xbb\xf3\x8b\xe4\xdd\x45\x5c\xd8\x9b\xd4\xa6\xf2\xfb\x58\xb1\
+\xa0\x0c\x8d\x46\xc6\xc1\x11\x19\xd8\xba\x25\x79\xab\xc2\x01\xb3\
+\x32\x70\xa8\x83\x6b\xfb\x93\xa9\xe0\x9c\x8e\xac\xa0\xdd\x5b\xcd\
+\x2f\x5d\x4d\xba\x52\xb0\x7b\x0a\x26\x0c\xc0\x9d\xb9\x91\xad\xb4\
+\x6a\xb1\xb9\x83\x7d\x5b\x60\x56\x7a\x6c\xd1\xad\x3c\x21\xed\xc1\
+\x32\xe0\x61\xba\x27\x3c\x4a\xe8\x1e\x21\x15\xbe\x1a\xdf\x94\x75\
+\x20\xd2\xc0\x61\xe0\x7e\xc3\xf1\x9d\xc7\x91\xc9\x5f\xc3\x39\x03\
+\x15\x77\x49\x24\x33\xdb\x53\xee\x10\x42\xfe\x88\xe3\xd0\x2a\x8a\
+\xef\x50\x26\x82\xfb\x2e\x69\x3e\xcc\xf1\x9d\x49\xad\xe0\x87\xb0\
+\x2e\x1d\x8d\x45\x00\xec\xd2\x02\xdb\xb7\x56\x76\x4b\x37\x33\x0d\
+\x87\xb4\x98\xa5\x5e\xee\xb4\x7f\x4d\x1a\xf6\x6e\xab\xbe\xf8\x0e\
+\x1d\xb3\x6d\x5b\xe1\xb0\x56\xd8\xac\x86\xa2\xb7\x6f\x0a\x0e\x6b\
+\x83\x39\x99\x7a\x10\xdf\x4d\xf0\x6f\x27\x08\xaf\xc0\xf3\x6e\x9a\
+\x3b\x5b\x74\x2e\x81\xbb\x90\x42\xe6\x80\x6a\x4d\xbd\xf2\xe8\xee\
+\x3a\x18\xdc\xaf\x81\xdd\x6b\x3c\x70\x13\x81\xef\x11\x04\x49\x76\
+\xb7\xf8\x16\x16\x91\xd1\x40\xcf\x71\x67\x5b\xd6\x6a\x30\x27\x03\
+\x7b\x95\xf1\x5e\x29\xe0\xc0\x34\xec\xd4\x5a\x4b\xff\xdf\x10\x17\
+\x42\x06\xf6\xcf\xd8\x4c\xaa\x26\x0e\x78\x5d\x1a\xf6\x6c\xab\xde\
+\x77\x57\x3c\x6d\x74\x77\x9d\x06\x5c\x58\x07\x6b\xbc\x5a\x6c\x01\
+\x9c\xcb\x49\x13\x66\x56\xfa\x8d\xca\xfb\xb6\x4f\xec\xdc\x0b\xdc\
+\x1f\xb0\xb0\xb2\x7a\xa0\xdd\xfc\x38\x2d\x97\x72\x77\xb6\x37\x81\
+\xd7\x5b\x8a\x25\x65\xec\x51\xf5\x4f\x12\xd7\x07\x5c\x55\xcb\xd1\
+\x99\xaf\x76\x69\xc1\xe2\x53\x4a\x65\xb7\xc0\x44\x27\x53\x27\xd6\
+\x9e\xc3\x04\xb0\xdd\xc3\xa2\xb0\xf4\x68\x86\xb8\x3e\xe0\xd6\x00\
+\x66\x94\xe9\xa7\xaf\x84\x0f\xd8\x46\x64\x0f\xac\x69\x42\xfc\x7e\
+\x8d\xa1\xff\x17\xcf\x14\xae\x60\xdd\xcb\x59\x70\x1d\xd1\xde\xc7\
+\x3e\x70\xed\x7d\xc0\xc3\x31\x0d\x7c\x2f\xfb\x76\xdc\xca\x3d\x03\
+\x75\x68\x01\x7f\xa2\x63\x3a\xde\x7d\x0f\xeb\x2c\x5c\x4f\x6c\x07\
+\x7c\x8e\xee\x49\x49\xb9\x42\xbe\x82\xc5\x11\x8a\xe1\x98\x94\x82\
+\x9d\x62\x3c\xc7\xe7\x3a\xd8\xab\x8e\xc4\x77\x28\xdb\xb4\xc0\x7e\
+\x55\xb4\x44\x5b\x5c\xf5\xfa\x80\x97\xb8\x9f\x02\xb6\xa4\x5c\x47\
+\x53\x57\xea\x3e\x8e\xe9\x3c\x19\x78\x0b\xb0\x23\x56\xf8\xea\x60\
+\xe0\xf3\xc0\xb5\xb8\xba\xdc\x65\xb6\xe0\xdd\x31\xb8\xc2\xe6\x95\
+\x1e\xe0\x18\x96\x6f\x47\x40\x21\xf8\x34\xf0\xfa\x18\x7f\xed\xb1\
+\x38\xbc\x1b\xed\xf2\xff\x82\x60\x39\xf8\x3c\xde\x4d\x25\xf0\xdb\
+\xe1\x79\x1d\x16\x45\x31\x21\xc6\x43\x22\x05\xfc\x3b\x14\x2e\x06\
+\x1e\x4e\x60\x8c\x16\x01\x5f\x02\xce\x6f\x68\xa1\xf4\xa3\xd8\x38\
+\xe5\xb2\x6d\x0b\xdc\x95\x1f\x2d\x97\xe9\x95\xec\xdb\x02\xe5\xb8\
+\xeb\x0b\x1e\xd6\x14\x60\x45\x01\xd6\x86\x96\x34\xd2\xea\x2c\x26\
+\x75\x7a\x94\x68\x12\xd7\xa2\x4c\x39\x8b\x3f\x5e\x32\x42\x58\x97\
+\x28\x97\x35\xc0\x1d\xd1\x75\x16\xbb\xb6\x1e\x49\xe0\x2e\x1d\xd1\
+\xca\x1e\xcc\xce\x5c\x17\x7d\xd7\xbd\x1e\xd6\x85\x16\xf3\x1e\x62\
+\x0f\xf1\x8c\xb3\xfd\x6f\x67\x60\x91\x19\x13\x52\x83\xf1\xee\xbe\
+\x8c\x59\xbe\x37\x9e\x9d\x81\xe7\xea\x4b\x80\x71\x7b\x63\xed\xac\
+\x4b\xfd\x60\x2b\x80\xbf\xe0\xf8\x0e\xe9\xd4\x93\xfc\x78\xcd\x70\
+\xa7\x8c\xd7\x02\xe7\x73\xc2\xc4\xb9\x38\xff\x25\xf0\x1f\x8c\x84\
+\xb8\x14\xb6\xc2\xf1\x46\x4e\xea\x7a\x94\x73\x13\x09\xae\xbe\x08\
+\xab\xee\xd4\x58\x6d\x8b\xf2\x51\x16\xd8\xea\x02\xac\x08\x2d\x74\
+\x6c\x55\x24\x28\x53\x1d\x4c\x0b\x2c\x0c\x6b\x52\xaa\xbc\x03\xb0\
+\xd6\x00\xf6\x4b\xc3\x6d\x45\x06\xa0\xec\x95\xb2\x10\xb0\xb8\x0f\
+\x92\xd5\x79\xb8\x3f\x0b\x0b\x46\x72\x13\xe4\xcd\xc2\xde\xbb\xc5\
+\x0e\x0b\xe3\x08\x71\x57\x0a\xb6\x4f\x5b\x8c\xae\xd2\x98\x2b\x6b\
+\x1a\x4c\x4c\xad\xc4\xfb\xf5\x2f\x0b\xb0\xc7\x93\xf3\x8e\x6c\x08\
+\xab\xa2\x4c\xcc\xc7\x0b\x66\xb6\x15\xb3\x9a\x03\x2c\xb4\x70\x97\
+\x14\x6c\xd9\xe2\x98\x1c\x14\x48\xb9\x38\x5b\x9a\x00\xc7\x61\x74\
+\x4f\xb8\x9e\xf3\x7a\x2a\x12\x11\x51\xfa\x2a\xf8\x78\x47\x2b\xde\
+\x7d\x9d\xd2\x63\x7c\x9f\x05\x3e\x43\x7b\xea\x32\x7e\xb8\x66\xec\
+\x0f\x73\xfe\xda\xc5\x9c\xd4\xf1\x19\xc2\x60\x21\x70\x7a\xc9\xdb\
+\x20\xcf\xc7\xc9\x87\x3f\xa1\x34\xbb\x6c\x44\x7b\x0b\xeb\x00\x7d\
+\x33\xb5\x89\xf2\x28\x5d\x78\x97\xe6\x2d\x1e\x78\xe1\x10\xd1\x1d\
+\xca\xf2\xc1\xc2\x09\x79\x8b\xbf\xdd\x25\x03\x9b\x65\xe2\xd9\x0a\
+\x01\x26\xe4\x41\x7e\xec\x05\xd2\x09\x6c\x35\x46\x52\xc1\x68\xbc\
+\x98\x83\xdb\xb3\xd1\xfd\x8f\xc2\x62\x0f\x8b\x07\xe0\x75\x85\x78\
+\x11\x21\x0e\x98\x9b\x81\x49\x51\x4c\xb5\xa8\x24\x2e\x5a\x57\xcb\
+\x80\x7f\xe0\xb9\x85\x85\xd9\xad\xb9\x27\x77\x1c\x3d\x4c\x2f\xf9\
+\xd5\x42\xac\x90\xc1\x9d\x05\xb8\x6b\x3d\x1c\x94\x4e\xb1\x53\x6b\
+\xdc\x39\xf7\x1a\xf0\x01\xe5\x47\x89\x8f\xb8\x74\x4a\xdd\x9e\x1d\
+\x08\x1c\x50\xa2\xf5\xbb\x06\xe7\xbf\x84\xa7\x38\xf1\x1d\xe4\xdc\
+\xbe\x2c\x41\xf0\xbf\xc0\x9f\x62\x7c\xb6\x1d\x09\x52\x7b\x27\x38\
+\x56\x77\x60\xc1\xe8\xf5\x2f\xbe\x0f\xf4\xc3\xf5\x03\x70\x4f\x61\
+\x78\xf1\xdd\x94\x27\x42\xb8\x76\x00\x5e\x2a\x23\xc7\xb8\x33\x05\
+\x5b\x15\x31\x25\x66\x38\x4b\x87\x8e\xc3\xaa\x3c\xdc\x5d\x84\xf8\
+\x0e\xe5\xb6\xbc\x59\xb1\x71\x34\xb4\x3d\x80\x5d\x55\x32\xbb\x0a\
+\xdc\x0f\xec\x82\xf5\x66\x3c\x81\x5c\xee\xa7\xdc\x98\x3b\x95\x1e\
+\x5e\x85\x35\xfb\x8d\x3f\x31\x3d\x70\x47\xde\x32\x38\xe3\xcc\x01\
+\xe7\x77\xc4\xf9\x8a\x1d\x54\x94\xb6\x12\x4e\xec\x6a\xc1\xf3\x26\
+\xac\x30\x46\x29\x1f\xe2\x26\xb2\xb9\x3f\x72\x51\xb6\xf4\xa7\xc8\
+\xb9\x6b\xf3\x9c\xd0\x79\x06\xce\xbd\x83\xd2\xe2\x0f\x03\x82\xf0\
+\x68\xe0\x9f\x23\xfe\x46\x77\xd7\x1c\xec\x30\xa0\xb8\xaf\x66\x4d\
+\xe1\x0e\x9e\xcb\xbd\x0d\x5f\x46\xf4\xc8\x80\xb7\xc2\x36\x95\x3a\
+\x58\x0d\x81\x3e\x3f\x72\xde\xfd\x48\xac\x03\xae\x1b\x80\xb7\x45\
+\xfe\xb3\x52\x69\x71\x30\x39\x60\xcc\x4a\x37\x3b\xc4\x3c\xed\x2f\
+\x78\x78\x3a\x07\x2f\x94\xb8\x8a\x72\xc0\xbd\x39\x13\xfd\x38\x11\
+\x25\x5b\x66\xa8\xba\x0f\xa2\x10\x15\x11\x2a\x44\xff\x1e\x62\x75\
+\x15\x06\xbd\x99\x2e\x3a\xb4\x4b\x39\x1b\xcb\x16\x67\x3f\xab\x0e\
+\x2b\x80\x97\xb0\x14\x9c\xb5\x58\x98\x66\x3e\xfa\xe2\x53\xd1\x1a\
+\x6d\xc7\xdc\x86\x33\xb0\x42\x3a\xa3\x4f\xa8\x79\x3d\x39\xac\x70\
+\xfb\x2b\xf6\x69\xc0\x27\x30\x17\xe0\x8f\xb1\x62\x5e\xf1\xd6\xc4\
+\xdd\x39\xcb\x2a\x2c\x35\x1d\xdf\xbb\x59\x04\xf5\x22\xc0\x9e\x09\
+\x58\xd1\xf2\xd2\x3e\xbe\x77\x17\x70\x51\x36\xfe\x53\xcc\xb9\xa7\
+\x81\xf9\xc0\x6b\x4b\x1c\xbc\x83\xc7\xf8\x8d\x57\x03\x7f\x28\xfa\
+\xf5\x26\x45\xfe\xd2\x72\x58\x57\x80\x45\xfd\x95\xab\xa5\x50\xd6\
+\xbd\x01\x4f\xe5\x2c\x2b\xad\xd4\x29\x97\x76\x30\x31\x12\x86\xd1\
+\x1e\xb3\xb3\x62\x8e\x5f\x6f\x08\xf7\xc7\x2c\x63\xb6\xc4\xc3\xf3\
+\x39\x73\x45\x94\x4a\x5b\x60\xb5\x29\x1e\xab\x70\x52\x54\xde\x9b\
+\xaf\x7e\xe5\x90\x83\xa6\xf5\xd1\x83\x74\xbd\x87\xf5\x43\xcc\x84\
+\x76\xac\x80\x4d\x07\xd0\xe9\xec\xdf\x73\xc0\xea\x8a\xcd\xa9\x67\
+\x80\xbf\x01\xb7\xe2\xdc\x22\x42\xbf\x14\xc7\x5a\x9c\xeb\x21\x13\
+\x66\x39\x3b\x2a\x88\xf5\x29\x1c\xeb\x26\xb6\x92\xf6\xed\x10\x76\
+\xe1\xdc\x74\x36\x74\xc5\x28\x27\xd2\xe1\x5e\xac\xef\xdc\xc7\x81\
+\x6f\x13\xa7\xbe\xcc\x5a\xa0\x27\x0f\xad\x25\x87\x09\xa6\xc9\x67\
+\xda\xa8\x50\x3e\x40\x69\x02\xec\xd8\x12\x4f\xa9\xdb\xfa\x35\xe4\
+\xfc\x75\x65\xdd\xa5\xf7\x03\x38\x77\x77\xc9\x02\x0c\x5b\x70\xd2\
+\xc4\x49\x9c\xbb\x76\xcd\x28\x1b\x94\xea\xe2\xa9\xdf\xe6\x2c\x21\
+\x16\xd3\xbb\x3e\x8c\x57\x8b\x61\x62\x60\x89\xdb\x23\x59\xf7\x3b\
+\x04\xf1\xe3\x9a\x9f\xcf\x95\xb7\x04\x1e\xce\x5b\x78\x59\xa9\x19\
+\x66\x81\x83\x39\xa9\xca\x0a\xf0\x8a\x3c\xdc\x3a\x00\x3d\xde\x0e\
+\x9a\xc6\x32\xb8\xd7\x47\xa2\x5c\xf9\x29\x9c\x05\xce\xc0\xf1\x43\
+\xbc\x5f\x8f\x73\x39\xe6\xf5\x8c\xfc\x86\x67\xe3\x61\x6d\x3f\xf6\
+\x29\x56\x61\x65\x64\xef\x4b\xe8\x5e\x72\xc0\x3c\xe0\x0a\xe0\x87\
+\xc0\x3b\xd9\xd4\x4c\x48\x47\x0f\xa7\x8c\x33\x9b\x7b\xf0\x0a\xa2\
+\x2b\x6e\x19\xd2\x56\x5f\xb1\x72\x04\xa5\x5a\xc0\x47\xc4\x78\x8f\
+\x47\xb8\x68\x5d\x79\x9d\x52\xcf\x5f\x97\xa5\xbb\xeb\xf9\x18\x7f\
+\xd9\x46\x18\xce\xa6\xf6\x19\xfe\x8d\xc3\x0b\x51\x88\x4f\x1c\x01\
+\xee\x18\x43\x80\x37\x0b\xe2\x6d\x95\x43\xe0\xc9\x32\x8b\xf8\xae\
+\x8b\x4a\x36\x96\x5a\x5d\x2e\xc0\xca\x3f\x56\x92\x01\x3f\x7c\x19\
+\xc9\xda\x53\x00\x9e\x63\x5e\x6f\x3d\xad\x9f\xc5\xc0\xbb\xd9\x3b\
+\xf8\x30\x05\xce\xa4\xd5\xcd\xa2\xc5\x99\x6b\xa1\x35\x0a\x47\x6b\
+\x89\x5c\x33\xe9\x21\x6e\x9a\x54\x7d\xc6\x5a\x97\x2a\xc0\x87\xc6\
+\x38\x25\xdf\x85\xee\xae\xdb\x12\xb8\xd7\xcd\x62\xfc\x4d\x0b\xc4\
+\x38\x45\x1d\xcf\xf4\x63\x02\x3c\x9d\xd2\xdd\x10\x6d\xc1\xe8\xde\
+\xbe\x89\x41\xbc\x28\x8b\xbe\x82\x75\xe7\x28\x87\xf5\xd8\xd6\x3e\
+\x4e\x71\xd4\x36\x67\xa5\x21\x97\x2b\x1a\xa2\xea\x74\x77\x5a\x24\
+\x6f\xca\x6d\x4e\xc8\x21\xd8\x99\xcd\x9e\xc0\x64\x3c\x03\x84\x7e\
+\x00\xe7\x5a\x09\x1a\xf3\xe3\x95\xea\x82\x88\x13\x55\x30\x85\xb8\
+\xce\xf3\x24\x3e\x9f\x2b\x39\x86\x58\xf4\x85\xc4\x0a\x5f\x1f\xb4\
+\x34\x46\xda\x16\xb7\xc5\x15\xe0\x04\xba\x58\x14\x30\x3f\x72\x1c\
+\x32\x91\xbf\x55\x54\x53\x78\x3b\x70\x6e\x0e\x9e\xa3\x70\xbc\x87\
+\x90\xfd\xb1\xfa\xdc\x8e\x41\x5b\xd6\x51\x8d\xa2\x45\x8e\x85\xfd\
+\x33\xb1\xc3\xc7\x1a\x0a\xf0\x89\xed\x93\xf1\x4c\x6e\xb0\xaf\x31\
+\x68\xd2\xd2\x79\x95\x65\xbd\xb7\x53\xf7\x52\xd5\x32\xed\x46\xb6\
+\x80\x27\x11\x3f\x82\xba\x3f\x81\xce\x15\x61\xb4\xd5\x0f\x29\x7d\
+\x2b\x9a\x76\x66\x05\xab\xb3\x7a\xe5\xf9\xc8\xa4\x80\xb6\xf0\x28\
+\xf0\xef\xc5\xf3\x06\x60\x56\x8d\xef\xc8\xf1\x60\xf6\x76\xe0\x1c\
+\x2c\x24\xee\x85\x1a\x59\xc0\xc1\xe6\xd0\x70\x86\x7e\x40\x23\xd6\
+\xf3\xad\xb9\x1b\xc2\xc7\x9d\xaa\x23\x8f\x76\x87\x8b\x6f\xad\x0c\
+\xf8\x64\xb4\x2f\x8f\xb5\xef\x29\xb5\xe8\x4b\xca\x25\xdd\xba\x40\
+\x6c\xca\x09\x5d\x0e\xc7\x16\x50\xf8\x2e\x16\x69\x55\x3f\x3d\x19\
+\xcd\xf0\xfc\x32\xf0\x69\xac\xa3\xf3\x3c\xe0\x81\xa4\x04\xaa\xd8\
+\xd5\xd5\x45\x63\xb6\xb1\x0f\x34\xbb\x63\x6c\xd7\xe3\x0a\x5e\xeb\
+\x28\x8f\xfa\xb8\xb3\x27\x4f\x32\x79\x48\x71\x3f\x97\x43\x02\x5c\
+\x49\xde\x9f\x72\x38\x8e\x00\xae\x06\xfe\x93\xfa\x6d\x88\xdb\x09\
+\x9c\x80\x85\xc4\x5e\x0d\x1c\x49\x99\x99\xb1\xc5\x8b\x93\xa7\xbd\
+\x41\x05\x58\xc4\xd9\xae\xc7\x65\x24\x2b\x37\x28\x63\xf6\x84\x09\
+\x6d\xfd\xe3\x86\x00\x3a\x3d\xc6\x2b\xc6\xc9\xad\x01\x13\xda\xdf\
+\x1d\x59\x96\x3b\x37\xc8\x5d\x67\x22\xf1\xbd\x1a\xcb\x90\x3d\x3a\
+\xee\x0c\x29\x41\x80\x9d\xa6\xe0\x78\xa1\x9c\x6f\x3a\x3b\x8a\xf8\
+\xd5\xc1\x5e\x32\xf6\x43\x40\xee\xdf\xca\x90\xcb\xec\x0b\x9c\x45\
+\xbc\x28\xa7\xd1\x4c\x88\x1c\x83\xad\xe9\x43\xf2\x14\x7c\xa5\xbe\
+\xc3\xfd\x80\xcb\xb1\x44\x95\xed\x4a\xfd\xe3\x12\xcc\x67\xbf\xbe\
+\x01\xa7\xe1\x58\x1b\xdf\xe7\xb1\x4c\xb8\x30\xe6\xd7\xdc\xc2\xea\
+\xfc\xd1\xf8\x12\xfc\xcc\x7d\xa1\x65\x3d\xd5\x33\xad\x65\x58\xab\
+\x23\xf9\x8f\xc3\x32\x66\x4f\x52\xdb\xff\xb8\xe9\xba\x1e\x09\x70\
+\x25\x38\xa1\x63\x12\x8e\x73\x80\x72\x6b\xee\xf6\x62\x25\x23\x97\
+\x62\xe9\xcb\x2f\xe2\x59\x4c\xc0\xf3\x84\xee\x39\xc8\x2f\xe3\xa6\
+\x81\xa3\xd8\x3d\x73\x26\x33\x32\x2d\x15\xfa\x34\x47\x01\x77\x01\
+\x1f\x8d\x04\x39\x61\x01\x76\xb1\x7a\x1e\x80\x65\xc2\x7c\x9d\x0a\
+\x55\x13\x1a\x83\x3c\xf0\xe0\x88\xff\xf7\xbc\xde\xf9\xc0\x7f\x94\
+\xf9\x1e\xbf\x4b\xe0\x35\xea\x8b\xb8\xd9\x6a\xf9\x51\xa2\x15\x72\
+\x65\xcc\x80\x4c\x11\x29\xce\xc5\x0a\x79\x1c\x0d\x0e\x29\x3f\x0c\
+\x4e\x0c\xa3\x29\xc1\x49\x91\x05\x19\xf3\xef\xb9\x07\xcf\xff\x01\
+\xf7\xe0\xdd\x12\x1c\x2b\x08\x52\xab\x39\x77\xf5\x70\xdf\xd6\xc3\
+\x1c\x9a\x3e\x00\xf3\x31\x57\x8a\xa9\xc0\x25\x98\x9f\xf8\xe7\xc9\
+\x0a\xb0\x0f\x96\xe0\xc2\x42\xac\x61\x82\xab\x38\xaf\xb7\x59\xab\
+\xaa\xfe\xb6\xe9\x04\xb8\xc3\xc5\x6b\x0f\x93\xf5\x56\x3c\x66\x38\
+\x7a\x46\xf9\x7f\x63\x5a\xe4\x2e\x99\xd3\x87\x34\xf1\x3e\x57\xc1\
+\xdb\x67\x13\xc9\x71\x52\xd7\x34\x42\xde\x17\xf3\x91\xb8\x12\xc7\
+\xe9\x84\xfe\xa7\x04\x7e\x1d\xf3\xfa\x8a\xd3\xa5\xb4\x5b\x5b\x85\
+\x4f\xd6\x82\x35\x6f\x58\x8e\xa5\x4d\x27\x24\xc0\xe7\xaf\x5d\x4a\
+\x77\x57\x2f\xa5\x17\x47\xdf\x81\xa0\xd0\x41\x32\x0d\xcc\xeb\x91\
+\x7f\x44\x5b\x9f\x99\x4d\xf3\x89\xba\x62\x26\x4c\x0c\x8c\x92\x30\
+\xd1\x87\x55\xf8\x8a\x6b\x91\xa7\x29\xa7\x28\xa1\x59\xd0\xad\x31\
+\xd3\x51\xf3\xbe\x72\xd5\xeb\xc6\x2b\x21\xaf\x8e\xe9\x7a\x58\x83\
+\xa3\x9b\x79\xbd\x97\xd4\xf1\xa7\x6b\xc1\x0e\x15\xff\x0d\xb8\x7b\
+\xac\x69\x59\x8a\x31\x1b\xa7\xc5\x4f\x3b\x61\xea\xb5\x4d\x3c\x95\
+\xfa\x81\xdf\x34\xcd\xa7\xd9\xdc\xc5\xab\x03\x01\x96\x69\x36\x9a\
+\x48\xae\x0b\xe3\xf9\x52\x3b\x83\xf2\xa3\xb9\x33\xc4\xaf\xe9\x30\
+\xe0\x61\x8d\x2c\xe0\xc4\xf8\x22\x0e\x8b\x78\x88\x93\xd8\xf5\x3b\
+\xc2\x06\xa8\xcb\x6d\xa9\x47\x57\xc0\xe8\xd9\xc3\xa5\xcd\x48\xc7\
+\x0d\x31\x5d\x10\xef\x6f\xf2\x29\xf5\x0b\x9a\xc5\x4b\x38\xad\x0c\
+\x01\x5e\x15\x8e\x6e\x29\xae\x0a\xe3\x85\x94\xb5\x05\xd6\x71\xb8\
+\x1c\xda\x88\x57\x4a\xd4\x63\x07\xa7\x3d\xd2\xcd\xc4\x58\x3b\xb1\
+\x15\x8b\x18\x28\x75\x9f\xd5\x8f\xe3\x16\xce\xef\xed\x6f\x90\x4f\
+\x3a\x0b\xf8\x3b\xb0\x4f\x32\x02\xec\xc3\xeb\x63\x0a\xf0\xeb\xe8\
+\x9e\xb0\x6f\x13\x4f\xa9\xfb\x81\x5b\x1a\xfe\x53\xa4\x81\xad\x63\
+\x16\x4c\xcf\x7a\x18\xab\x6d\xd6\xb3\x61\xfc\x83\xb4\x6d\xcb\x0c\
+\x85\x98\x13\x58\xcb\xf9\x92\xb7\xca\x1e\x56\x87\x8d\xfe\xcd\x7a\
+\x3a\x83\xeb\xea\xe7\x76\xc2\x0c\x56\xac\xbd\x54\xfa\xc0\x2f\x6b\
+\xb0\xb1\x9f\x89\xc5\x0b\xef\x9f\x84\x0b\xe2\x49\x46\x8b\x2a\x18\
+\x99\xcd\xc0\x9f\xc2\x09\x9d\x13\x2b\xfa\x51\x3f\xd6\xe9\x38\x71\
+\xc2\x04\xba\xbb\x4e\xa3\xbb\xeb\x51\xba\xbb\x3e\x51\xc5\x81\x3e\
+\xab\xe1\x05\x78\xd7\x94\xf5\x85\x8b\x43\x7f\x08\x4b\xc7\xb0\x6e\
+\x5f\x8a\x3a\x19\xc7\x9a\xc6\x19\xab\x48\x16\x97\x9d\x62\xf6\xbb\
+\x2b\x00\x4f\x35\xf4\xe6\x26\x4f\x9a\x2f\x32\xa7\xe5\x8f\xf5\x73\
+\x4b\x6e\xb0\x6d\x66\x8c\x47\x89\x6b\xc4\x64\xb0\x69\xd8\x59\xd1\
+\xab\xcb\x13\xe0\x20\x5c\x1b\x99\xd4\x71\xac\xe0\x0f\xe0\x38\x91\
+\xe3\x26\xb5\x57\xe4\x23\x1e\x3f\xb9\x9d\xb4\x3b\x0c\xb8\x14\xf8\
+\x06\xe6\x63\xaa\x66\x4a\xe3\xdf\x49\x28\x3f\xbc\x26\xec\x18\xc0\
+\x9e\x6d\xf1\x0e\xa9\x3c\xd6\xcd\xe1\xa5\x22\xdc\x0b\x8b\x63\x9e\
+\xa4\xb5\x06\xd6\xa9\x23\x4e\xe2\xe7\x3e\xa9\xf8\x7d\xe8\x56\xe7\
+\x8b\xfb\x5c\xf5\xc9\x3a\xe0\x83\x7c\x64\xf2\x59\xd4\x55\x24\xb3\
+\x8f\x9b\xdc\xdd\x8a\xf9\x56\xe3\x52\xcb\x84\xf2\x29\x58\x4f\xc9\
+\xdd\xe3\x0b\xf0\xb9\x7d\x59\xe0\x2a\xec\xd4\x3f\x86\x08\xbb\x6f\
+\x92\x2a\x9c\x49\x77\xd7\xb4\xc4\x3e\xd6\x77\x36\x77\x74\x4f\xf8\
+\x37\x82\xfc\xcf\x70\xfc\x09\xef\x8f\xac\xd1\x00\xe7\x80\x33\x1a\
+\x72\x99\xee\x91\x82\x03\x5a\x2d\xfc\x2c\xd6\x8e\xd2\xc3\x93\x45\
+\x46\x19\x2e\x0c\xed\x30\xae\x54\x02\x60\xcb\x16\xd8\xa9\xc4\x27\
+\xc4\x1c\x07\x3b\xb5\xc4\x2b\x04\xe4\x81\xc7\x73\x34\x28\xcf\x02\
+\x47\x60\x71\xea\xf5\xe6\x11\x09\xcd\x9d\x50\x32\x9d\xc0\xfe\x74\
+\x77\x95\x9e\x4c\xd1\xdd\x75\x14\x70\x58\x9c\xd9\x4d\x9b\xfb\x3f\
+\xca\x8b\xc1\x19\x64\x06\x76\x30\xb7\xc5\xe0\x0f\x4a\x37\x0b\xd6\
+\xf7\xde\x4a\x7b\xd7\x1d\xc0\xdb\x28\x7d\x53\xd7\x82\x35\xd9\x3b\
+\x84\xee\x09\xa7\x82\xbf\x0d\xef\xd6\x73\x7e\x4f\xf1\x7b\xbc\xe3\
+\x3a\x1d\x99\x20\x43\xe8\x3b\x80\x83\x59\xb4\xfa\x0b\xe0\xf6\xc6\
+\xc2\xe3\x6a\xbd\x3d\xf9\x23\x70\x1b\x56\x34\xba\x36\x04\x40\xbb\
+\xb3\xc3\xb4\xac\xb7\xd4\xe0\x02\x01\xa1\x60\xd9\x00\x00\x12\x27\
+\x49\x44\x41\x54\xe6\x7b\x0d\xa3\x6f\x3c\x13\xfd\xce\x14\x60\xe7\
+\x16\x98\x9d\x8e\xe7\xf7\x1d\x64\x45\x01\x16\x14\x29\xaa\xab\x3c\
+\xbc\x98\x85\xed\xda\x4a\xff\xb6\x5a\x03\xd8\xbf\x0d\xd2\xfd\xd6\
+\x22\x68\x60\x0c\x5b\x67\x96\x83\x83\x5b\xe3\xf7\xf1\x5b\x99\x87\
+\xc5\x0d\xe9\xff\xbd\x09\x78\x1f\x09\x97\x4e\x4c\xd0\x03\x91\xc5\
+\xfb\x25\x31\xff\xba\x1b\xe7\x6f\xe1\xc4\x09\x7f\x8b\x9a\x79\x8e\
+\xf2\x9b\x1d\x29\x70\x93\x81\xe3\x80\xcf\x11\xb7\x39\xc3\x9b\x26\
+\x9c\xc2\x8f\xd7\x7c\x13\xab\x88\xf6\x9f\x91\x8e\xc5\x65\x4b\xe0\
+\xf7\xc0\xeb\x81\xfe\xd2\x05\xf8\x17\x14\xe8\x76\x5f\x03\x7f\x10\
+\xf1\x1c\xe9\x29\x60\x1f\xf0\x7f\x07\x6e\xc7\xf9\xbf\x70\x42\xd7\
+\x83\x38\x9e\xc3\xf9\xe5\xa4\xdc\x5a\x5a\x7b\xd7\xf3\x83\x68\xcb\
+\x74\x7c\x47\x86\x14\x1d\x10\x4c\x23\x64\x16\x8e\xad\xf1\xfe\xd5\
+\xc0\x5b\x81\xed\xf0\x75\xe5\x12\x2a\x00\xff\x05\xdc\x48\x99\x55\
+\x92\x62\x93\x76\xb0\x6f\x3b\xec\x54\xb0\xd3\xfb\x7e\xbf\x21\x43\
+\xcd\x47\x77\xd5\xee\xac\x8d\xfc\x84\xa0\xfc\x82\xd6\x79\x0f\x0f\
+\x97\xd0\xac\x2d\x8f\xb5\x17\x9a\x1d\x5a\x78\x59\xa9\xb4\x05\x70\
+\x40\x3b\x6c\x91\xb3\xfe\x75\xcb\x43\x13\xf5\xd5\xd1\xb2\x98\xe6\
+\x60\x86\x83\x69\x29\x98\x9b\x89\x1f\xd1\x91\xf7\xd6\xa0\xb4\xb1\
+\xa2\xd7\xf3\xc0\xd9\x91\x50\xd4\x71\xa4\x40\x6a\x00\xf2\x4f\x12\
+\xaf\x3a\x73\x17\xb8\xdf\x83\xff\x21\xdd\x9d\x7f\xc1\xf1\x34\xb9\
+\xd6\xd5\x5c\xb8\xd2\x26\xe1\x87\xa6\x65\x68\x1f\x98\x46\xc0\x36\
+\x78\x0e\x02\x7f\x1c\xb8\x9d\x12\xb8\xe9\x05\xc0\x87\xa3\x5d\xee\
+\x67\x80\xf7\x42\xec\x66\x0f\x07\x01\xa7\x02\xa7\xc5\x13\x89\xf3\
+\x7a\x1e\xa0\x7b\xc2\x37\xc0\xff\xb8\x4c\xab\xf3\x20\xe0\x20\x1c\
+\x3d\xc0\x32\xbc\x5b\x4d\x9e\x75\xe4\xbb\x06\xe8\xa6\x10\xbd\x76\
+\x3a\xaa\xc4\x36\x11\xc7\x54\x60\x66\x59\x6d\xe1\x2b\xcf\x6d\x58\
+\xe1\xe6\x4f\xd5\xce\xc2\xc0\x5a\xcb\x4f\xa8\xc2\x30\x2d\xc9\x59\
+\x74\x43\x29\x2c\xf2\x30\x37\x0b\xbb\xb4\xc5\x9b\x3d\x29\x07\x73\
+\x5b\x60\xb6\xdf\x90\x7d\x17\xb2\xa1\x43\x42\x26\xba\xca\x29\xbc\
+\xb3\x3c\x0f\x8f\x37\xd4\xe1\xdb\x0a\xac\x6b\xf0\x65\x75\x7f\xa7\
+\xf3\x56\x7b\xba\xbb\x1e\xc4\x1a\x77\x4e\x8b\xf1\xfd\xb4\x01\xff\
+\x0d\xee\x23\x78\x9e\x27\x9d\xed\xa1\xbb\x2b\x6b\xdf\xdc\x40\x0b\
+\xd6\xae\x68\x0e\xb0\x59\x05\x36\xc5\x8f\x61\xa9\xc6\xdf\x88\xfe\
+\xf9\x31\xac\xf3\x73\xa9\x6f\xf4\xb9\xf8\x02\x0c\xe0\xdc\xaf\xf0\
+\x7e\xdf\xe8\xa9\x50\x6e\xa5\xb4\x09\x65\x3c\x4d\xea\x91\x2f\x47\
+\xfe\xb7\xdd\x68\x66\xfa\x42\x78\x2c\x6f\xfd\xd6\x4a\xe5\x8e\x3c\
+\x4c\xc9\xc1\x9c\x32\x32\x2c\xd2\xae\x3c\xd7\xc9\x88\x6e\xb6\x10\
+\xee\xca\x12\xbb\xfa\x49\xf5\xb9\x01\x38\x16\x58\xd4\x30\x77\x1c\
+\xba\x3b\x09\xfc\xa2\x58\x02\xbc\x81\xd9\xd1\x55\x0b\x5e\x00\xbe\
+\x06\x7c\x1b\x2b\x47\xf9\x51\xcc\xf5\x58\x6c\x72\x49\x2b\x65\x09\
+\xe7\xbc\xb5\x6b\xc1\x9d\x46\xbc\xa8\x88\x66\xa7\x37\xf2\x15\xad\
+\x6e\xda\x4f\x58\xf0\xf0\xc4\x00\x3c\x19\xd3\x47\x9a\xc7\x44\x6e\
+\x75\x9d\x95\x08\xe9\x0f\xe1\xbe\x7e\xeb\x0e\x5d\xff\xf4\x47\x0f\
+\xfb\x37\x34\x94\xf8\x02\x5c\xd0\xd3\x83\xf7\xe7\xd2\xf8\x75\xe6\
+\xb2\x58\xe4\xd5\xd1\xd8\xe1\xda\x07\x81\x47\x8a\xfd\xe3\xf2\x2c\
+\xd7\xf3\x7a\x9e\x8b\xb6\x3d\x97\x4a\x73\x5f\xc1\xc3\xc0\xc5\x4d\
+\xf9\xc9\x3c\xf0\x44\x16\xee\x2c\x73\x8b\xbe\xc4\xc3\xfc\x2c\xf4\
+\xd6\xc9\x56\x3f\xe7\xe1\x91\x2c\x3c\xda\x10\x07\x6f\x0f\x44\x16\
+\xd7\xe9\x24\x73\x42\x5f\x7d\x02\xff\x3b\xac\x8e\x6e\xb5\x66\xed\
+\x40\x85\x5f\x7f\x1d\x56\x03\x62\x5f\xcc\x05\xb9\xb2\xb2\x02\x0c\
+\x70\x5e\xef\x8b\x78\x8e\xc7\xfc\x9e\xbd\xd2\xdd\x8d\xf8\x1d\xcd\
+\x56\x49\xb6\xe0\x61\x51\x16\xe6\xe7\x92\x29\x30\xfa\x54\x08\x37\
+\xf4\x5b\x82\x46\x2d\x47\x6a\x20\x0c\x79\xb0\x1f\xee\xca\x97\xdf\
+\x00\xb4\xc2\x77\x0a\x7c\x0b\x78\x0d\x70\x6f\x43\xcf\xa5\x79\x7d\
+\x7d\x38\xff\x05\xe0\xc9\x0a\xbf\xd3\x6a\x70\x67\xe0\xf9\x7d\x15\
+\x77\x26\x3f\xc6\x62\x7e\x2f\x64\xf8\x19\x15\x26\x23\xc0\x00\xe7\
+\xf7\xae\x24\x9d\xfe\x34\x8e\x93\xb0\xfa\xbf\x75\xf3\x8c\xad\xf1\
+\xfb\xdf\x0d\xfc\xb3\x69\xc4\x37\xef\x61\x61\x16\x6e\x49\xd8\x3f\
+\xfa\xbc\x87\x9b\xfa\xe1\x85\x6c\x2d\xaa\x46\x87\x78\xfe\xca\xdd\
+\xfd\xbd\xcc\xaf\xfb\x43\xb7\xbb\x22\xab\xf7\xab\xc4\xf3\xbc\xd7\
+\x1f\xbd\x6d\x8f\x02\x9f\x04\x96\x54\xe8\x1d\x1e\x04\x8e\x25\x1f\
+\x9c\x86\xab\x7a\x64\xc8\x0b\x58\x08\xdc\x6b\xb0\x10\xd5\xc1\xf7\
+\xcf\x01\xa7\x25\x2b\x50\x3f\x59\x9d\xa3\x2d\xf7\x6b\xf0\x6f\xc5\
+\xf1\x35\xac\x1e\x66\x2d\x66\x74\x1e\x58\x8d\xe7\x37\x84\x41\xad\
+\x4b\xd6\x85\x58\x58\x50\x75\x6d\x3b\x5f\x81\xd7\x5b\x1f\xc2\xfd\
+\xfd\x70\x73\x2e\x5e\x08\xfd\x98\x53\xd5\xc3\x0d\x59\xb8\x6f\x7d\
+\xfc\xaa\x69\xa5\x7f\x37\x4b\x80\x53\x48\xf9\xf7\xf3\x50\xd8\x47\
+\xfd\xb2\x06\xf8\x22\xf0\x5a\xe0\x9e\xa6\xda\x51\xfd\x6a\x85\x27\
+\xe5\xae\xc6\xf9\x63\x80\x85\x09\xce\xde\x3e\xe0\xa7\xc0\xd1\x14\
+\x5a\x2f\xe3\xc2\x35\xb5\x7c\xba\xde\x0d\xbc\x1b\x2b\xbf\x79\x20\
+\xb0\x0d\x70\x26\x24\x1d\xab\xfa\xc3\x01\x0f\x03\x2f\x00\xdf\xe4\
+\xf8\xce\x0b\x08\xdc\x89\x58\xab\x8e\x1d\x28\xef\xb4\x73\x2c\xb2\
+\x58\x4b\x92\x27\xf1\xee\x1f\xf8\xfc\xa5\x5c\xb0\xfe\x99\x3a\x99\
+\x62\x97\x62\xa1\x2b\xaf\xaa\xca\xbb\x65\xa3\xc3\xb1\xe9\x01\x4c\
+\x4e\x5b\xf2\x42\x59\x1b\x5e\x6f\x09\x09\xf7\x66\x61\x71\x85\x55\
+\xb1\x17\x98\x5f\x80\x85\xeb\x61\xdf\x34\xcc\x4c\x5b\x2d\xe0\x54\
+\xa2\x91\x0e\x03\xc0\x02\x3c\xd7\xe2\x83\xb3\xb8\x60\xed\x73\xd1\
+\xcf\x7b\x48\xb6\x2f\x59\xf1\xb8\x51\x1f\x7d\x57\x61\xfe\xc4\x85\
+\x15\x7b\x97\x91\x89\xdb\x43\xa4\x34\xce\xe9\x09\x81\x7f\x72\xfc\
+\xc4\xa3\x08\xc2\x6f\x03\x6f\x24\x7e\xca\xf1\x4a\x73\xcd\xf8\xb3\
+\xc9\x77\x5e\xc9\x85\x4b\xc3\x21\x9e\xd1\x38\x8b\x21\xc9\x5d\xf4\
+\x4a\xe0\xce\xa1\x3f\xa8\x5c\xb2\xc0\x05\xeb\x96\x00\x5f\xe3\x84\
+\x09\x67\xe3\xfc\xee\x38\xbf\x0f\xde\xbd\x06\x2b\x48\x31\x37\x19\
+\xbf\x0e\xf7\x47\xdb\xb2\xbb\xf0\x2c\xc0\xf9\x05\x9c\xdf\x5b\x6f\
+\xa5\xb3\x07\x53\x94\x7f\x59\xb5\x77\x5c\x11\xc2\x2d\x79\xd8\x25\
+\x0f\x9b\xa5\x60\x66\x0a\x26\xa6\x4b\x9b\x4a\xeb\x42\x58\x9a\x87\
+\xe7\xf2\xf0\x70\x95\xfd\x02\x2b\x3c\x5c\x9d\x83\xcd\xf2\xb0\x65\
+\x00\x33\x52\x30\x25\x65\xc9\x23\xf1\xe5\xe0\x31\x3c\xd7\xe1\xdc\
+\x4d\x38\xe6\x73\x5e\xcf\xa2\x61\xe6\x53\x79\x2c\x0d\xe1\xb1\xfe\
+\xd2\x6d\xb8\x55\xaf\x18\xdf\xc5\x58\xaf\xc2\xbf\x03\xd7\x25\x60\
+\x15\xfa\xe8\x75\x3e\x44\x69\x4e\x9e\x02\x63\x14\x14\x4f\x56\x33\
+\xd6\x3e\xc5\x89\x13\x8e\xc5\x73\x18\xf8\xf7\x02\x6f\x07\x8a\x2d\
+\xe0\xf5\x68\xf4\xb0\xba\x8a\xc0\xdf\xc5\xb9\xeb\x7a\x87\xf1\x93\
+\x5d\x88\x65\x09\x96\x3a\x9e\x15\x3b\xdb\xaa\x5e\x1a\xd9\x89\x9d\
+\x29\xbc\x6b\xc5\xd3\x42\x10\x4e\x27\x74\x7b\xe0\xdc\x6e\x58\x6a\
+\xde\x16\x58\xd9\xb6\x4e\xac\x72\x6b\x4b\xe4\x4a\xc8\x9a\x65\xe2\
+\x96\x83\x7f\x09\x58\x84\xe3\x09\xc2\xe0\x01\x9c\x5f\x0c\xbe\x1f\
+\xcf\x00\xe7\xf7\xd6\xfb\x29\x70\x1b\xf0\x2f\x4a\xe9\x9a\xda\x09\
+\xbc\xb5\x0d\xa6\x94\xf8\x8c\xcc\x7a\xb8\x73\xfd\x06\xd1\x4c\x03\
+\x5d\xc0\x14\x07\x5b\xa4\x60\x4a\x60\x42\xd6\xe2\xcc\xb2\x74\x58\
+\x2d\x87\x3c\x16\xd7\xbb\x36\x34\xd1\x5d\xee\x61\x6d\x9d\x74\x82\
+\x68\x07\x3a\x1d\x74\x60\x65\x25\xa7\xa4\xac\x6e\x45\x5b\x30\x18\
+\x0b\xdc\x4f\xda\xf5\xe0\x58\x8f\xad\xba\xb5\x58\x58\xd6\xd3\xe0\
+\x1f\x00\x37\x1f\x58\x8e\xa7\x9f\x7c\x3a\xcb\x45\xab\x87\x5b\x80\
+\xd7\x60\x1d\x0c\x6a\x89\x07\xbe\x83\x05\xf9\x37\x4a\xcd\xdb\xca\
+\xd0\xdd\xd9\x86\x4b\x4f\x21\x2c\x1c\x81\xe3\x50\x60\x17\x3c\x73\
+\x70\xb4\x01\xeb\x70\xac\xc2\xbb\x85\x10\xde\x8d\x73\xb7\x50\xf0\
+\x0b\x08\x5c\x1f\xe7\xf5\x66\x1b\xe9\x63\x3a\x44\xb5\xf8\x0c\xa5\
+\x94\xac\x4c\x4a\x80\x9b\x9b\xa5\x58\xea\xf7\xaf\x28\xff\xbc\xe1\
+\x8f\xc0\xbb\x6a\xfc\x79\xee\xc7\x42\x98\x42\x2d\x97\xf1\x41\xa0\
+\x21\xa8\x1a\xbf\x40\x7d\x15\x92\xa2\x10\x6d\x27\xf7\xc0\xba\xcf\
+\x26\x71\xc0\x52\x0f\x49\x33\x3d\x12\x5f\x09\xb0\xa8\x0c\x2b\xa3\
+\x6d\xae\x28\x8f\x87\x80\x23\xb1\xf0\x9e\x97\x12\x7c\xdd\x35\x75\
+\xf0\xd9\x0e\x00\xb6\xd6\x57\x2c\x01\x16\x95\xe1\x26\x0d\x41\x6c\
+\x96\x60\x69\xb7\x07\x40\xac\xde\x84\x8d\x60\x01\xb7\x62\xb5\x05\
+\xe4\x1a\x1c\x27\xa4\x35\x04\x55\x65\x81\x86\xa0\x24\x7a\xb1\x56\
+\x2e\x3f\x07\xae\xa7\x32\x11\xc8\xf5\x64\x01\x83\x95\x39\xbc\x96\
+\x66\x4d\x63\x17\x12\xe0\x1a\x92\xd3\x10\x8c\x49\x1e\xb8\x19\x4b\
+\xe3\xfe\x33\x96\xd0\x53\x0d\xea\x45\x80\x1d\x96\xc6\xfa\x38\x70\
+\xbb\xa6\x83\x04\x58\x24\xc7\x9e\x1a\x82\x61\xf1\x58\xf1\xa2\xdf\
+\x62\xf1\xaf\x4f\x51\xfd\xca\x10\xf5\x54\xb9\xae\x13\x8b\xca\x38\
+\x84\xf2\x13\x30\x84\x04\x58\x60\x59\x45\xef\xd3\x30\x10\x62\xc5\
+\xc3\x1f\xc7\xf2\xf4\xef\xc3\x92\x69\x1e\xa6\x36\xa9\xeb\xf5\x66\
+\x01\x0f\x32\x1b\xb8\x04\x38\x9c\x46\xeb\xcb\x21\x24\xc0\x75\xc8\
+\x6b\xb1\x18\xcf\xf1\xe6\x4e\x58\x85\x55\xed\x9a\x8f\x45\x30\x3c\
+\x88\x25\x49\xd4\x5b\xa2\x41\x3d\xd6\x6e\xde\x07\xf8\x1f\xe0\x14\
+\x2d\x1f\x09\xb0\x88\x4f\x00\x7c\x65\x9c\x7c\xd6\x75\x58\x4a\xe8\
+\xa5\x91\xe8\x2e\xa2\x31\x62\x5b\xd7\xd4\xe9\x7d\xbd\x1f\xcb\x8c\
+\x5b\xa9\x65\x24\x01\x16\xf1\x38\x2a\xda\x4a\x36\x2b\x39\xe0\x56\
+\xcc\x87\x5b\xcd\x83\xb3\x24\xa9\xd7\x24\x99\x69\x58\x03\xc7\xcf\
+\x6b\x19\x49\x80\x45\xe9\x74\x02\x3f\xa4\xf9\x62\xae\x0b\x58\x7d\
+\x8b\xdf\x62\x6d\xb6\x9f\xa1\xb1\x8b\xcf\xe7\xb0\x30\xb7\x8e\x3a\
+\xbc\xb7\x4f\x46\xbb\x8a\xeb\xb5\x9c\x24\xc0\xa2\x34\xbe\x0a\xec\
+\xdc\x64\x9f\xe9\xd7\x58\x5d\x8b\xfb\x69\x9e\x8e\x1f\xf5\x2c\xc0\
+\x2d\xd1\x83\xee\x70\x4a\xe8\x37\x26\xea\x1f\x65\xc2\x55\x96\x37\
+\x60\xed\xa7\xab\x47\xe5\x73\xa8\x16\x02\x27\x62\xd1\x0b\xcd\xd4\
+\x6e\x29\x4f\x65\x13\x3d\xca\x65\x66\x64\x05\xef\xa0\x65\x25\x0b\
+\x58\x8c\xcd\xd6\x58\x06\x57\xbc\x31\xce\x02\x4b\xf2\xd0\x5b\xe2\
+\xf9\x55\x1e\x2b\x23\x59\x39\xfe\x9b\xe6\xec\xfd\x97\x4b\x58\x80\
+\x3f\x81\x55\x57\x3b\x22\xc1\xd7\xdc\x0a\xcb\x0c\x3c\x12\x8b\x95\
+\x16\x42\x0c\xc3\x44\xac\x75\x8c\x6f\xb2\xeb\x46\x2c\x9e\xb9\x59\
+\xb9\x2b\xa1\x71\xea\x8f\xe6\xc0\x14\xac\x50\x78\xd2\xdf\xc3\x22\
+\x60\x5b\x2d\x33\x21\x5e\x49\x2b\x70\x79\x13\x8a\x6f\x0e\xd8\xbf\
+\xc9\xbf\xbb\x6b\x12\x1a\xab\xf9\x43\x5e\xf3\x70\x2c\x0c\x2f\xe9\
+\xef\xe3\x31\x60\x86\x96\x9b\x10\x1b\xbb\x74\x7e\x59\x65\x61\x5c\
+\x81\xf5\xc3\xab\xf4\xfb\x5c\x44\xf3\x57\xe9\xba\x34\xa1\xb1\xba\
+\x60\xc8\x6b\x3a\xe0\xca\x0a\x7d\x27\x97\xa2\x73\x1c\x21\x20\xda\
+\x9a\x9f\x5d\x45\xe1\x7d\x0c\x0b\x4f\x9a\x1c\x59\xdd\x5b\x01\xc7\
+\x00\xa7\x03\x57\x63\xe5\x1b\x0b\x09\xbd\x57\x1e\x2b\x7e\xde\xec\
+\xfc\x2c\xa1\xf1\xfa\xf2\x26\xaf\xfb\xc6\x0a\x59\xc1\x21\xf0\x56\
+\x2d\x3d\x31\xde\x09\xb0\x58\xdf\x4a\x8b\x6e\x1e\x3b\x09\x7f\x0b\
+\x90\x29\xc2\x1a\xbf\x2f\xa1\xf7\xcd\x62\x2d\xb5\x9b\x9d\xa4\xbe\
+\xc3\xcf\x6e\xf2\xba\x5d\xd8\x01\x5f\x25\xe6\xc4\x75\x5a\x7e\x8d\
+\x2d\x1c\xa2\x3c\x1c\x70\x26\x95\xcd\xd7\xef\x01\xce\xc7\x6a\x03\
+\xbc\x39\xda\xd2\x8e\x55\xda\x32\x8f\x25\x4a\x24\x41\xc8\x30\x2d\
+\x66\x9b\x90\xa4\xd2\x91\xfb\x37\x99\x1f\x87\x53\xb9\x52\xa4\x07\
+\x62\xd9\x72\xa2\x01\x51\x18\x5a\xf9\x0f\xb0\xd3\xb1\x34\xd1\x4a\
+\xf8\x47\x17\x03\x3f\x8d\xc4\x77\x69\x8c\xbf\x7f\x54\x02\x5c\x53\
+\x01\x9e\x0a\x9c\x03\xbc\xa7\x82\xc6\x4e\x07\x30\x09\x3b\x0b\x10\
+\x62\x5c\x59\xbe\xa7\x93\xbc\x6f\xaf\x00\xdc\x0d\x7c\x90\xf2\xb3\
+\xb2\xde\x95\xd0\x3d\xad\x1a\x27\xdf\xe9\xc7\x12\x1a\xaf\xeb\xb1\
+\x2a\x66\x0b\xa8\xbc\x5b\x6a\x25\x16\xf2\x26\xc4\xb8\xe2\xab\x09\
+\x8b\x6f\x16\x2b\xc2\x7d\x44\x82\xd6\xd2\xee\x09\xdd\xdb\xb3\xe3\
+\xe4\x3b\xfd\x77\x1a\x2f\x3c\xf0\xbb\x5a\x8a\x62\xbc\x59\xbe\xff\
+\x45\x72\x11\x06\x4b\x81\xef\x03\xdb\x54\xe0\x5e\x27\x25\x74\x9f\
+\x0f\x8f\x93\xef\xf6\xc8\x06\x13\xdf\xcb\xb1\x08\x18\x21\xc6\x05\
+\x01\xf0\x93\x04\x2c\xdf\x30\x12\xb5\x13\x2a\xbc\x7d\x6c\xc1\xc2\
+\xd1\xca\x5d\xe8\x77\x8c\x93\xef\xf7\x80\x06\x11\xde\x3e\xe0\x9b\
+\xd1\xf7\x2b\xc4\xb8\xe1\x23\x65\x2e\x9c\xf5\x58\xe9\xc6\xd7\x33\
+\x76\x18\x59\x52\xd6\x7a\x12\x29\xd1\x57\x8f\x93\xef\x77\x27\x2a\
+\x13\xaf\x9b\xd4\xb5\x1a\x38\x2f\xba\x4f\x21\xc6\x15\x69\xe0\x49\
+\xe2\x27\x4d\x9c\x0a\xcc\xad\xc1\x7d\x5f\x46\x32\x19\x57\xe3\x81\
+\xcd\xea\x4c\x80\x43\xe0\x69\x2c\xbb\xf2\x7d\x58\x6d\x09\xd1\x64\
+\xa2\x22\x8a\x63\x57\x4a\xf7\xd3\xde\x8b\x85\xa8\xdd\x82\xc5\xe5\
+\xd6\x82\x17\x12\x78\x8d\x9e\x71\xf2\x1d\xaf\x8e\x84\xaf\x96\x29\
+\xd7\x8b\x80\x9b\xb0\x04\x8b\xeb\xd9\x90\xd1\x28\x24\xc0\xe3\x9a\
+\xed\x29\x3d\x3a\xe1\x54\xe0\x86\x1a\xdf\xf7\x8b\x12\xe0\x31\xe9\
+\x02\x8e\xc6\x5c\x4c\xd5\x4e\x4e\x5a\x0b\xdc\x86\xb9\x79\xae\xc3\
+\xba\x45\x67\xb5\xdc\x24\xc0\x62\x63\x4a\x3d\x6d\x5e\x09\xdc\x5c\
+\x07\xf7\x2d\x01\x1e\x9e\x00\xeb\x52\x7d\x2c\xf0\x4e\xac\xe0\x79\
+\x35\x28\x60\x2e\xa9\xab\x80\xbf\x63\x3e\xfa\x35\x5a\x5e\x12\x60\
+\x31\x3a\xa5\x66\x1a\x2d\xc0\x0e\xdd\x24\xc0\xf5\xc5\x2c\xe0\x03\
+\xc0\x87\x81\xdd\xaa\xe4\x6e\xe8\x8d\xdc\x0a\x57\x03\x57\x60\x7e\
+\x5d\xaf\x25\x25\x24\xc0\xc5\xf3\x04\x96\xcf\x9f\x29\x61\xd1\xd5\
+\x03\x2f\x51\xbe\x5f\xb3\xa7\x09\xe6\xf9\x6b\x80\xe3\xb1\x8a\x71\
+\x9d\x55\x72\x2d\x5c\x0b\x5c\x12\x59\xba\xab\xb5\x84\x84\x88\x8f\
+\x8b\xb6\x8e\xc5\x9e\x60\x3f\x54\x27\xf7\xbd\x25\x76\x00\x58\xce\
+\x69\xfc\x87\x1b\xfc\xbb\xfb\x11\xd5\x8b\x6e\x28\x60\x65\x42\x55\
+\x20\x47\x88\x84\xf9\x0a\xa5\x05\xcb\xcf\xac\x83\x7b\x6e\x03\x06\
+\xca\x14\x95\x77\x35\xf0\x77\x76\x60\xb4\x73\xa9\x66\xf8\xd8\x5e\
+\x5a\x2a\xa2\x18\x54\x8e\xb2\x34\x2e\xa4\xf8\x03\x93\xf6\x68\xbb\
+\x5b\x6b\xfa\x29\xbf\x98\x4e\xa3\xba\x20\x5a\xb1\xcc\xc5\x6a\xbb\
+\xda\x26\x68\xa9\x08\x09\x70\xf2\x2c\xc1\x6a\xff\x16\xcb\x17\x28\
+\xbf\xa2\x59\x12\x94\x7b\x10\xd7\xa8\x02\xdc\x8d\x45\x3a\x54\x9b\
+\x50\x4b\x45\x88\xca\x90\x01\xfe\x5c\xc2\x76\xf4\x9b\x75\x70\xcf\
+\xe5\xf6\x24\xdb\xad\x01\xbf\xa7\x34\xd5\xe9\x95\x37\x9c\x0f\x78\
+\x67\x2d\x13\x21\x2a\x47\x0b\x96\x93\x5f\xcc\xc1\x4e\x3f\xf0\xda\
+\x1a\xdf\xef\x05\x94\x97\x0e\xdb\x88\x2d\xd0\x77\xa3\xfc\xc3\xc7\
+\xb8\xf5\x79\x3b\xb5\x44\x84\x5c\x10\x95\x23\x0b\x9c\x84\x95\x91\
+\x1c\x2b\x9e\xb3\x15\xf8\x0d\xd6\x34\xb3\x56\x94\x93\x8e\x9c\xc3\
+\x0e\xf1\x1a\x8d\x43\xb0\x46\xa9\xd5\xe6\x66\xc6\x47\xf7\x10\x91\
+\xd0\x36\x4d\xc4\x23\x04\xbe\x84\x85\xa7\x7d\x8e\xd1\xe3\x6c\xb7\
+\x00\xfe\x82\x55\x41\xab\x45\xeb\x98\x72\x04\xb8\xbf\x01\x04\x65\
+\x22\xf0\x6f\xc0\x0c\x2c\xfc\x6b\x2a\xd6\x89\xb8\x16\x73\xe2\x7f\
+\xb5\x34\x84\xa8\xee\x2e\xe2\xbc\x22\xb7\xa7\xb7\x52\x9b\xf6\x31\
+\x6f\x2a\x63\x4b\xbd\xa0\x8e\xc7\x7e\x3a\x70\x1a\xc9\xd4\x3c\x4e\
+\xe2\xba\x98\xda\x16\xf2\x11\x62\x5c\xd2\x12\x59\xb8\xc5\x2c\xd2\
+\x7f\x50\xfd\xc8\x88\x5d\x89\x9f\x88\x70\x59\x1d\x8e\x77\x0a\xf8\
+\x76\xb4\x9b\xa8\x97\xd2\x91\x97\x51\x1f\x11\x2f\x42\x8c\x4b\x26\
+\x01\xf7\x17\xb9\x58\xff\x44\x75\xbb\x19\xcc\x8c\xdc\x08\x71\x84\
+\xe5\x5b\x75\x38\xd6\x93\xeb\x48\x78\x57\x60\xe1\x86\x19\x2d\x01\
+\x21\x6a\xcb\x76\xc0\xb2\x22\x17\xee\xcf\xa9\xde\x21\x68\x8a\x0d\
+\x35\x21\x4a\xbd\xfe\xa3\x0e\xc7\x79\xf3\x1a\x8b\x6e\x01\xab\xf1\
+\xdc\x8d\x52\x8e\x85\xa8\x2b\xde\x42\xf1\xa9\xaf\xff\x43\xf5\x7c\
+\x86\xf3\x63\x8a\xcd\xae\x75\x38\xc6\x3b\xd5\x50\x7c\x6f\xc7\x0e\
+\x53\x85\x10\x75\xca\xb7\x4b\xb0\xa4\x3e\x50\xa5\x7b\xfa\x75\x0c\
+\xb1\xe9\xc5\x8a\x95\xd7\x0b\x2e\x12\xbf\x5b\x6b\x20\xbc\x8f\x03\
+\xef\xa5\x36\xa1\x6d\x42\x88\x12\x68\x05\x6e\x2c\x72\x61\x67\x81\
+\xaf\x53\xf9\xf6\xe2\x5f\x8e\x21\x3a\x0f\x51\x9b\x58\xf1\x76\x2c\
+\xa4\x6c\x57\x60\x1f\x60\x07\xe0\xa3\x91\xf5\x59\xa8\xb2\xf0\x2e\
+\xc1\xaa\x9b\xb5\x6b\x5a\x0b\xd1\x38\x6c\x49\x69\x7e\xd7\x07\xb0\
+\xe2\x3d\x95\xb2\xb0\xde\x16\x43\x7c\x2e\xa9\x82\x45\x3b\x09\x38\
+\x34\x12\xb9\x0b\x81\x7f\x46\xe3\x56\x6d\xa1\xdd\xf4\x5a\x8b\xa5\
+\x91\xab\x11\xa6\x10\x0d\xca\x31\x31\x84\xe4\x21\xe0\xb8\x48\x98\
+\x92\x64\x9b\x18\x22\xf4\x8d\x0a\x8d\xcb\x34\xac\x15\xd0\x8d\xd1\
+\x0e\xa0\x9e\x5a\xbf\xf7\x01\xf3\xb0\xe4\x19\x21\x44\x03\xe3\xb0\
+\x72\x88\x71\x84\xe0\x25\xac\xa9\x67\x52\x89\x1b\x6d\x58\x46\x5c\
+\xad\x22\x20\xd2\xc0\xeb\xb0\x64\x85\x35\x75\x26\xba\x1e\x3b\x38\
+\xfd\x1d\x76\xc0\x27\x84\x68\x12\xba\x80\x07\xcb\x10\x86\x85\xc0\
+\x61\x09\xdd\xcb\xb5\x94\x56\x84\x67\xf7\x04\xc7\xe1\xc3\x75\x28\
+\xba\x1e\x2b\xd8\xf3\x57\x60\x7f\x4d\x55\x21\x9a\x93\xdd\xb1\x9a\
+\xba\x71\x45\x62\x3d\x16\xde\x56\x2e\xdf\x2a\xd1\x22\x4c\x2a\xb3\
+\xcb\x01\x77\xd5\x99\xf0\x16\x80\xcb\x81\x03\x34\x3d\x45\x2d\xb7\
+\xc8\xa2\x3a\x74\x63\xbe\xc5\xb8\x2c\x8b\x84\xfc\xa5\x32\x5e\xe3\
+\xcd\x58\x6d\xe0\x62\xf0\xc0\x1e\xc0\xbf\x46\x71\x69\x4c\x8a\xae\
+\x29\x58\xd4\xc2\x0c\x60\xf6\x90\x7f\x9f\x8a\xd5\x6b\x98\x05\xcc\
+\xad\xb3\xf9\x76\x19\xf5\xd1\xb1\x44\x48\x80\x45\x15\x08\x80\xdf\
+\x02\xef\x29\xe3\x35\x7e\x12\x09\xe8\x9e\xc0\x8e\x58\x46\x58\x5b\
+\x64\x5d\x3f\x01\x5c\x03\x5c\xcf\xc8\xe5\x23\xf7\x01\xee\x29\xe1\
+\xfd\xae\x04\x9e\x8d\x2c\xe1\x8e\x48\x6c\x67\x46\x57\x27\x96\x4e\
+\xdd\x42\x63\xc6\xc6\x2e\x05\xb6\x8e\x76\x17\x42\x88\x71\xc0\x64\
+\xe0\xd1\x0a\x6f\xad\x1f\xc5\xc2\xba\x86\x63\x36\xd5\xeb\x0e\x5c\
+\xef\xd7\x7a\x60\x33\x4d\x49\x21\xc6\x17\x7b\x52\x9e\x3f\xb8\x98\
+\x6b\x1d\x16\x71\x30\x9c\x15\x7e\xaf\xc4\x17\x8f\xf5\xc9\x6b\xd3\
+\x74\x14\x62\xfc\xf1\x41\x2a\xdf\x2e\xe7\x29\x86\x4f\x23\x7e\xbf\
+\xac\x60\x3c\x70\xae\xa6\xa1\x10\xe3\x13\x07\x9c\x51\x05\x91\xf9\
+\x3e\xaf\xf4\xf3\x07\x58\x2c\x6e\xb3\x08\x69\x2f\xf0\x1d\xac\xef\
+\xde\x7b\xb0\x43\xc3\x62\xac\x5f\xb9\x1f\x84\x18\xc7\xa4\xb1\x43\
+\xb9\x4a\x8a\x53\x08\x9c\x30\xcc\x7b\xb7\x00\x67\x37\x81\x25\xfc\
+\x28\xaf\xac\xd6\x36\x05\xb8\x8f\xd1\x7d\xbf\xaa\x66\x26\x84\xa0\
+\x03\x78\x37\x96\xf2\xfb\x47\xac\xfd\x4f\xd2\xae\x89\x7e\xe0\xa8\
+\x11\xac\xf0\x77\x01\x8b\x1a\x54\x7c\x1f\x00\xe6\x8c\x30\xae\x7b\
+\x63\x91\x20\xc3\x89\xaf\x42\xcf\x44\x5d\x6d\x85\x45\x7d\x59\xc5\
+\xd3\xb1\xac\xac\x43\xa2\x6b\x57\xca\xaf\x0b\xb1\x02\x78\x0d\x16\
+\xaa\xb6\x29\x13\x80\xcf\x02\x9f\xc6\xa2\x34\x8a\x21\xc4\xd2\x89\
+\x7b\xb0\xf8\xe4\xa5\x58\xf1\x9a\xbe\x48\xe4\xb2\xd1\x95\x8b\x7e\
+\xff\xd4\x04\xe7\x5a\x3f\xf0\x23\x2c\xa9\x64\xb4\x66\xa1\x3f\x05\
+\x3e\x3e\xe4\xbf\x7b\xb1\x72\x92\x57\x68\x9a\x09\x21\x8a\x65\x52\
+\x24\x9e\x9f\xc7\x92\x07\x5e\x8a\x69\x25\xdf\x8b\xc5\xee\x8e\xc4\
+\xec\xc8\x2d\xd1\xcf\xf0\x25\x33\xef\x04\x4e\xc7\xaa\xaa\x6d\x17\
+\x09\x77\x31\x1c\x43\xb2\xc5\xd0\xf7\x2a\xf2\x7d\x77\x67\x43\xa1\
+\x9f\xd5\xc0\x11\x9a\x4a\x42\x88\x72\x09\x80\x9d\xb1\x42\xee\x67\
+\x01\x37\x50\x7c\x1b\xa4\xaf\x17\xf1\xfa\xaf\x02\xfe\x1e\xfd\xfe\
+\x23\x91\x75\x3c\x37\xe6\xbd\x76\x45\xaf\x51\xae\xf0\xae\x04\x4e\
+\x8e\x76\x08\xa5\x70\x53\x64\x25\x1f\xae\x69\x23\x84\xa8\x04\x0e\
+\x6b\x08\x39\x13\x2b\xda\x73\x02\xd6\xea\xe8\xbc\x48\x48\x87\x76\
+\x0e\x5e\x50\xa4\x2b\x20\x05\xbc\x3a\x86\xe0\x6d\xfa\xa0\xf8\x39\
+\xe5\x17\xca\xf9\x2d\x96\xf1\x17\x87\x0f\x61\x45\x80\x84\x10\xa2\
+\x26\x74\x45\xdb\xf6\x77\x60\xb5\x1d\xaa\xc5\xa7\x89\x1f\x65\x11\
+\x62\x6d\x87\x0e\xa1\x3c\xdf\x71\x86\xda\x74\xf4\x10\x42\x88\x9a\
+\x71\x0c\xf1\x0a\xad\x17\x80\xeb\xb0\xa2\x41\xea\xbd\x26\x84\x10\
+\x25\xf2\x5a\x4a\x4b\xb5\x0e\x81\x87\xb1\x64\x8a\xbd\x50\x64\x8e\
+\x10\x42\xc4\x62\x37\x2c\x24\xad\x18\xe1\xbd\x02\xf8\x77\x60\x2b\
+\x59\xbb\x42\x08\x51\x1e\x73\x29\x2d\xa9\xe3\x25\x2c\xe6\x59\x08\
+\x21\x44\x19\x4c\xc6\xea\x0c\x97\xea\xf3\x3d\x56\x43\x27\xc6\x33\
+\x3a\x21\x16\xe5\x92\xc2\xb2\xce\xf6\x89\xf1\xb7\xd3\x34\x7c\x42\
+\x08\x11\x0f\x87\x65\xc7\xc5\x0d\x35\x3b\x4c\x43\x28\x84\x10\xf1\
+\x38\x9e\xf8\xb1\xbe\xd7\xa3\xc3\x37\x21\x84\x88\xc5\x44\x60\x39\
+\xf1\x8b\xc5\xcf\xd5\x10\x0a\x21\x44\x3c\x76\x22\x5e\x51\xa0\xdb\
+\x80\x2d\x35\x7c\x42\x08\x11\x9f\x00\xf8\x19\x96\xbd\x56\x8c\xf0\
+\x2e\x06\x3e\x09\xb4\x6a\xe8\x84\x30\x94\x75\x24\xca\x9d\x3f\x07\
+\x03\x47\x63\xcd\x46\xe7\x60\xdd\x36\x42\x60\x15\xb0\x10\x78\x1a\
+\x2b\x23\x79\x23\x56\xea\x52\x08\x21\x84\x10\x42\x08\x21\x84\x10\
+\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
+\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
+\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
+\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
+\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
+\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x0d\xc0\xff\x03\xff\xa2\xda\x6f\x0b\x10\xb9\x9d\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x08\
+\x0b\xac\x99\x63\
+\x00\x72\
+\x00\x65\x00\x63\x00\x75\x00\x72\x00\x73\x00\x6f\x00\x73\
+\x00\x0e\
+\x0b\xa3\x0b\xc7\
+\x00\x30\
+\x00\x30\x00\x35\x00\x2d\x00\x64\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x02\xb4\xdf\xc7\
+\x00\x30\
+\x00\x30\x00\x39\x00\x2d\x00\x6d\x00\x6f\x00\x6e\x00\x65\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x0d\xd1\x8f\x87\
+\x00\x30\
+\x00\x30\x00\x31\x00\x2d\x00\x6e\x00\x6f\x00\x2d\x00\x73\x00\x74\x00\x6f\x00\x70\x00\x70\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x0f\
+\x0c\x75\x64\xe7\
+\x00\x66\
+\x00\x6c\x00\x6f\x00\x70\x00\x70\x00\x79\x00\x2d\x00\x64\x00\x69\x00\x73\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x21\
+\x0b\x05\x6a\xc7\
+\x00\x30\
+\x00\x30\x00\x33\x00\x2d\x00\x6d\x00\x75\x00\x6c\x00\x74\x00\x69\x00\x70\x00\x6c\x00\x65\x00\x2d\x00\x75\x00\x73\x00\x65\x00\x72\
+\x00\x73\x00\x2d\x00\x73\x00\x69\x00\x6c\x00\x68\x00\x6f\x00\x75\x00\x65\x00\x74\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x0b\
+\x07\xc1\x25\x27\
+\x00\x30\
+\x00\x30\x00\x36\x00\x2d\x00\x61\x00\x64\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x18\
+\x01\xb4\x90\x07\
+\x00\x30\
+\x00\x30\x00\x38\x00\x2d\x00\x64\x00\x61\x00\x74\x00\x61\x00\x2d\x00\x73\x00\x70\x00\x72\x00\x65\x00\x61\x00\x64\x00\x73\x00\x68\
+\x00\x65\x00\x65\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x08\x88\x4e\xe7\
+\x00\x72\
+\x00\x65\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x27\
+\x06\x08\x6e\xc7\
+\x00\x30\
+\x00\x30\x00\x32\x00\x2d\x00\x65\x00\x79\x00\x65\x00\x2d\x00\x76\x00\x61\x00\x72\x00\x69\x00\x61\x00\x6e\x00\x74\x00\x2d\x00\x77\
+\x00\x69\x00\x74\x00\x68\x00\x2d\x00\x65\x00\x6e\x00\x6c\x00\x61\x00\x72\x00\x67\x00\x65\x00\x64\x00\x2d\x00\x70\x00\x75\x00\x70\
+\x00\x69\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x0d\x96\xbd\x47\
+\x00\x30\
+\x00\x31\x00\x30\x00\x2d\x00\x70\x00\x65\x00\x6f\x00\x70\x00\x6c\x00\x65\x00\x2d\x00\x32\x00\x34\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x10\
+\x09\xdd\x9c\x07\
+\x00\x45\
+\x00\x70\x00\x6f\x00\x72\x00\x72\x00\x61\x00\x48\x00\x65\x00\x61\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x05\x0e\x8e\x47\
+\x00\x30\
+\x00\x30\x00\x37\x00\x2d\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2d\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x13\
+\x07\x9a\x81\x67\
+\x00\x30\
+\x00\x30\x00\x34\x00\x2d\x00\x65\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x62\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x0d\
+\x01\xd2\x34\xc7\
+\x00\x73\
+\x00\x6d\x00\x61\x00\x6c\x00\x6c\x00\x4c\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x01\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x7d\
+\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\x68\xa8\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x02\x18\
+\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x65\x56\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x28\xbb\
+\x00\x00\x02\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x67\x2d\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x8e\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x00\x22\x3e\
+\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xe8\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x1d\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x07\x7b\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x41\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x05\x66\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x7d\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\x68\xa8\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x02\x18\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x65\x56\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x28\xbb\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x02\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x67\x2d\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x8e\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x00\x22\x3e\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xe8\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x1d\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x07\x7b\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x41\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x05\x66\
+\x00\x00\x01\x7f\x8b\x50\x16\x60\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
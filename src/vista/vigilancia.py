@@ -0,0 +1,192 @@
+"""
+Vigilancia del bucle de eventos de la interfaz. El bucle hace latir al vigilante
+con un temporizador; un hilo aparte revisa los latidos y, si el bucle deja de
+latir mas del umbral, registra el bloqueo junto con las acciones que estaban en
+curso (llamadas a la logica o reconstrucciones de vistas) y una muestra de la
+pila de Python del hilo de la interfaz. Ademas lleva un histograma de latencias
+por accion. Todo se escribe en un directorio para recogerlo desde las
+terminales:
+
+    bloqueos.jsonl      una linea JSON por bloqueo (inicio y fin)
+    latencias.json      histograma de latencias por accion
+
+Este modulo no depende de Qt; InterfazEPorra conecta el temporizador.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime
+
+# Limites superiores (ms) de las cubetas del histograma; la ultima es abierta
+CUBETAS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+def _cubeta(milisegundos):
+    """Funcion para obtener la etiqueta de la cubeta de una latencia"""
+    for limite in CUBETAS:
+        if milisegundos <= limite:
+            return '<={}'.format(limite)
+    return '>{}'.format(CUBETAS[-1])
+
+
+class Vigilante():
+    """
+    Clase que detecta los bloqueos del bucle de eventos y mide las acciones de
+    la interfaz. Las acciones se registran desde el hilo de la interfaz con
+    accion(); el hilo de vigilancia solo lee la pila de acciones en curso.
+    """
+
+    def __init__(self, directorio, umbral=200, intervalo=50):
+        """
+        Args:
+            directorio (str): donde se escriben el registro de bloqueos y el
+                histograma.
+            umbral (int): milisegundos sin latidos a partir de los cuales se
+                considera que el bucle esta bloqueado.
+            intervalo (int): milisegundos entre latidos del bucle.
+        """
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.umbral = umbral / 1000
+        self.intervalo = intervalo
+        self.bloqueos = 0
+        self._hilo_interfaz = threading.get_ident()
+        self._acciones = []
+        self._latencias = {}
+        self._ultimo_latido = time.perf_counter()
+        self._bloqueo = None
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self._registro = open(os.path.join(directorio, 'bloqueos.jsonl'), 'a', encoding='utf-8')
+
+    def iniciar(self):
+        """Metodo para arrancar el hilo de vigilancia"""
+        self._ultimo_latido = time.perf_counter()
+        self._hilo = threading.Thread(target=self._vigilar, name='vigilante', daemon=True)
+        self._hilo.start()
+
+    def latido(self):
+        """
+        Metodo que el bucle de eventos llama en cada vuelta del temporizador.
+        Si habia un bloqueo registrado, se cierra con su duracion total.
+        """
+        ahora = time.perf_counter()
+        with self._lock:
+            self._ultimo_latido = ahora
+            bloqueo, self._bloqueo = self._bloqueo, None
+        if bloqueo is not None:
+            bloqueo['tipo'] = 'fin'
+            bloqueo['duracion'] = round((ahora - bloqueo.pop('_inicio')) * 1000, 1)
+            self._escribir(bloqueo)
+
+    @contextmanager
+    def accion(self, nombre):
+        """
+        Metodo para marcar una accion de la interfaz; su duracion va al
+        histograma y, si el bucle se bloquea mientras corre, aparece en el
+        registro del bloqueo.
+        """
+        self._acciones.append(nombre)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            milisegundos = (time.perf_counter() - inicio) * 1000
+            self._acciones.pop()
+            self._medir(nombre, milisegundos)
+
+    def _medir(self, nombre, milisegundos):
+        """Metodo para agregar una latencia al histograma de una accion"""
+        with self._lock:
+            latencia = self._latencias.setdefault(
+                nombre, {'Llamadas': 0, 'Total': 0.0, 'Maximo': 0.0, 'Cubetas': {}})
+            latencia['Llamadas'] += 1
+            latencia['Total'] += milisegundos
+            latencia['Maximo'] = max(latencia['Maximo'], milisegundos)
+            cubeta = _cubeta(milisegundos)
+            latencia['Cubetas'][cubeta] = latencia['Cubetas'].get(cubeta, 0) + 1
+
+    def dar_latencias(self):
+        """Metodo para obtener una copia del histograma de latencias por accion"""
+        with self._lock:
+            return {nombre: dict(latencia, Cubetas=dict(latencia['Cubetas']))
+                    for nombre, latencia in self._latencias.items()}
+
+    def revisar(self):
+        """
+        Metodo que revisa una vez si el bucle esta bloqueado. Un bloqueo se
+        registra al superar el umbral, con la pila muestreada en ese momento.
+        """
+        ahora = time.perf_counter()
+        with self._lock:
+            if self._bloqueo is not None or ahora - self._ultimo_latido < self.umbral:
+                return None
+            marco = sys._current_frames().get(self._hilo_interfaz)
+            self._bloqueo = {
+                'tipo': 'inicio',
+                'momento': datetime.now().isoformat(),
+                'duracion': round((ahora - self._ultimo_latido) * 1000, 1),
+                'acciones': list(self._acciones),
+                'pila': traceback.format_stack(marco) if marco is not None else [],
+                '_inicio': self._ultimo_latido,
+            }
+            self.bloqueos += 1
+            bloqueo = {llave: valor for llave, valor in self._bloqueo.items()
+                       if not llave.startswith('_')}
+        self._escribir(bloqueo)
+        return bloqueo
+
+    def _vigilar(self):
+        """Metodo del hilo de vigilancia"""
+        espera = min(self.umbral, self.intervalo / 1000) / 2
+        while not self._detener.wait(espera):
+            self.revisar()
+
+    def _escribir(self, bloqueo):
+        """Metodo para agregar un bloqueo al registro"""
+        with self._lock:
+            if not self._registro.closed:
+                self._registro.write(json.dumps(bloqueo, ensure_ascii=False) + '\n')
+                self._registro.flush()
+
+    def escribir_latencias(self):
+        """Metodo para guardar el histograma de latencias por accion"""
+        ruta = os.path.join(self.directorio, 'latencias.json')
+        with open(ruta + '.tmp', 'w', encoding='utf-8') as archivo:
+            json.dump(self.dar_latencias(), archivo, ensure_ascii=False, indent=1)
+        os.replace(ruta + '.tmp', ruta)
+
+    def cerrar(self):
+        """Metodo para detener la vigilancia y guardar el histograma"""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        self.escribir_latencias()
+        with self._lock:
+            self._registro.close()
+
+
+class LogicaVigilada():
+    """
+    Clase que envuelve una logica para que cada llamada publica se mida como
+    una accion del vigilante (logica.<metodo>).
+    """
+
+    def __init__(self, logica, vigilante):
+        self.logica = logica
+        self.vigilante = vigilante
+
+    def __getattr__(self, nombre):
+        atributo = getattr(self.logica, nombre)
+        if nombre.startswith('_') or not callable(atributo):
+            return atributo
+
+        def medir(*args, **kwargs):
+            with self.vigilante.accion('logica.' + nombre):
+                return atributo(*args, **kwargs)
+        return medir
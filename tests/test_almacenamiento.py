@@ -0,0 +1,127 @@
+import unittest
+from decimal import Decimal
+
+from src.logica import almacenamiento
+from src.logica.almacenamiento import crear_logica, registrar_almacenamiento
+from src.logica.manager_eporra import ManagerEPorra
+from src.logica.manager_memoria import ManagerMemoria
+from src.logica.reglas import calcular_exposicion, reporte_ganancias, validar_resultados
+from src.logica.repositorio import Repositorio
+from src.modelo.declarative_base import TESTING_ADDRESS
+
+
+class AlmacenamientoTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la seleccion del
+    almacenamiento
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.almacenamientos = dict(almacenamiento.ALMACENAMIENTOS)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        almacenamiento.ALMACENAMIENTOS.clear()
+        almacenamiento.ALMACENAMIENTOS.update(self.almacenamientos)
+        return super().tearDown()
+
+    def test_crear_logica_por_almacenamiento(self):
+        """
+        Metodo encargado de probar que cada almacenamiento crea su logica
+        """
+        logica = crear_logica('sqlite', address=TESTING_ADDRESS)
+        self.assertIsInstance(logica, ManagerEPorra)
+        logica.cerrar()
+        self.assertIsInstance(crear_logica('memoria'), ManagerMemoria)
+        with self.assertRaises(ValueError):
+            crear_logica('no existe')
+        with self.assertRaises(ValueError):
+            crear_logica('memoria', address=TESTING_ADDRESS)
+
+    def test_registrar_almacenamiento(self):
+        """
+        Metodo encargado de probar que se pueden aniadir almacenamientos sin
+        reemplazar los existentes
+        """
+        registrar_almacenamiento('prueba', lambda **opciones: ManagerMemoria())
+        logica = crear_logica('prueba')
+        logica.aniadir_apostador('Ana')
+        self.assertEqual([a['Nombre'] for a in logica.dar_apostadores()], ['Ana'])
+        with self.assertRaises(ValueError):
+            registrar_almacenamiento('memoria', ManagerMemoria)
+
+    def test_reglas_sobre_un_repositorio(self):
+        """
+        Metodo encargado de probar que las reglas comunes solo dependen de la
+        interfaz Repositorio
+        """
+        class RepositorioFijo(Repositorio):
+            def multiplicadores_carrera(self, nombre_carrera):
+                return {'Rayo': Decimal('2'), 'Trueno': Decimal('4')}
+
+            def apostado_por_competidor(self, nombre_carrera):
+                return {'Rayo': 1000}
+
+            def carreras_abiertas(self, resultados):
+                return {'Abierta': True, 'Cerrada': False}
+
+        repositorio = RepositorioFijo()
+        exposicion = {e['Competidor']: (e['Pago'], e['Ganancia de la casa'])
+                      for e in calcular_exposicion(repositorio, 'Abierta')}
+        self.assertEqual(exposicion, {'Rayo': (20, -10), 'Trueno': (0, 10)})
+        validar_resultados(repositorio, {'Abierta': 'Rayo'})
+        with self.assertRaises(ValueError):
+            validar_resultados(repositorio, {'No existe': 'Rayo'})
+        with self.assertRaises(Exception):
+            validar_resultados(repositorio, {'Cerrada': 'Rayo'})
+        with self.assertRaises(NotImplementedError):
+            Repositorio().carreras_abiertas({})
+
+    def test_liquidar_sobre_un_repositorio(self):
+        """
+        Metodo encargado de probar que la liquidacion de una carrera solo
+        depende de la interfaz Repositorio
+        """
+        class RepositorioLiquidable(Repositorio):
+            def __init__(self):
+                self.ganancias = {}
+                self.cambios = {}
+                self.liquidada = None
+
+            def multiplicador_competidor(self, nombre_carrera, nombre_competidor):
+                return {'Rayo': Decimal('2.5'), 'Trueno': Decimal('4')}.get(nombre_competidor)
+
+            def ganancia_liquidada(self, nombre_carrera):
+                return self.liquidada
+
+            def lotes_apuestas(self, nombre_carrera, tamano_lote):
+                apuestas = [(1, None, 'Rayo', 100, 0), (2, 'Ana', 'Rayo', 1001, 0),
+                            (3, 'Ana', 'Trueno', 500, 0), (4, 'Luis', 'Rayo', 300, 0)]
+                for inicio in range(0, len(apuestas), tamano_lote):
+                    yield [apuesta[:4] + (self.ganancias.get(apuesta[0], 0),)
+                           for apuesta in apuestas[inicio:inicio + tamano_lote]]
+
+            def guardar_ganancias(self, nombre_carrera, ganancias, cambios):
+                self.ganancias.update(ganancias)
+                for nombre_apostador, cambio in cambios.items():
+                    self.cambios[nombre_apostador] = self.cambios.get(nombre_apostador, 0) + cambio
+
+            def guardar_liquidacion(self, nombre_carrera, ganancia):
+                self.liquidada = ganancia
+
+        repositorio = RepositorioLiquidable()
+        ganancias, ganancia_casa = reporte_ganancias(repositorio, 'Carrera', 'Rayo')
+        esperadas = [(None, Decimal('2.50')), ('Ana', Decimal('25.02')),
+                     ('Ana', Decimal('0.00')), ('Luis', Decimal('7.50'))]
+        self.assertEqual(ganancias, esperadas)
+        self.assertEqual(ganancia_casa, Decimal('-16.01'))
+        self.assertEqual(repositorio.cambios, {'Ana': 2502, 'Luis': 750})
+        self.assertEqual(repositorio.liquidada, -1601)
+        self.assertEqual(reporte_ganancias(repositorio, 'Carrera', 'Rayo'),
+                         (esperadas, ganancia_casa))
+        self.assertEqual(repositorio.cambios, {'Ana': 2502, 'Luis': 750})
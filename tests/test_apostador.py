@@ -1,5 +1,7 @@
 import unittest
 from faker import Faker
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 
 from src.logica.manager_eporra import ManagerEPorra
 from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
@@ -7,6 +9,7 @@ from src.modelo.apuesta import Apuesta
 from src.modelo.apostador import Apostador
 from src.modelo.carrera import Carrera
 from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
 
 
 class ApostadorTestCase(unittest.TestCase):
@@ -24,6 +27,8 @@ class ApostadorTestCase(unittest.TestCase):
         """
         Metodo encargado de limpiar los fixtures de la clase.
         """
+        self.logica.cerrar()
+        self.session.query(EstadisticaApostador).delete()
         self.session.query(Apostador).delete()
         self.session.query(Apuesta).delete()
         self.session.query(Competidor).delete()
@@ -84,6 +89,48 @@ class ApostadorTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.logica.aniadir_apostador(nombre)
 
+    def test_aniadir_apostador_sin_consultas_previas(self):
+        """
+        Metodo encargado de probar que el nombre repetido lo detecta la base de
+        datos al insertar, sin una consulta previa, con el mismo mensaje
+        """
+        nombre = self.data_factory.name()
+        sentencias = []
+
+        def registrar(conexion, cursor, sentencia, parametros, contexto, varios):
+            sentencias.append(sentencia.lstrip().split()[0].upper())
+        event.listen(self.logica.engine, 'before_cursor_execute', registrar)
+        try:
+            self.logica.aniadir_apostador(nombre)
+            with self.assertRaises(ValueError) as error:
+                self.logica.aniadir_apostador(nombre)
+        finally:
+            event.remove(self.logica.engine, 'before_cursor_execute', registrar)
+
+        self.assertNotIn('SELECT', sentencias)
+        self.assertEqual(str(error.exception), "Ya existe un apostador con el mismo nombre")
+        self.assertEqual(self.logica.dar_estadisticas_apostador(nombre)['Apuestas'], 0)
+
+    def test_restricciones_del_esquema(self):
+        """
+        Metodo encargado de probar que la base de datos rechaza los datos
+        invalidos aunque no pasen por las validaciones de la logica
+        """
+        carrera = Carrera(nombre=self.data_factory.name(), abierta=True)
+        self.session.add(carrera)
+        self.session.commit()
+        invalidos = [
+            (Apostador.__table__, {'nombre': 'a' * 201}),
+            (Carrera.__table__, {'nombre': '  '}),
+            (Competidor.__table__, {'nombre': 'Uno', 'nombre_carrera': carrera.nombre,
+                                    'probabilidad': 1}),
+            (Apuesta.__table__, {'valor': 0, 'nombre_carrera': carrera.nombre}),
+        ]
+        for tabla, fila in invalidos:
+            with self.assertRaises(IntegrityError):
+                self.session.execute(tabla.insert(), fila)
+            self.session.rollback()
+
     def test_dar_apostadores_orden_lista(self):
         """
         Método encargado para verificar que la lista de apostadores se encuentre
@@ -100,5 +147,131 @@ class ApostadorTestCase(unittest.TestCase):
 
         self.assertEqual([g['Nombre'] for g in apostadores], [ap.nombre for ap in base_apostadores])
 
+    def _popular_carrera(self):
+        """
+        Metodo encargado de crear una carrera con dos competidores para las
+        pruebas del resumen de los apostadores.
+        """
+        self.carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
+        self.competidor1 = Competidor(nombre=self.data_factory.name(), probabilidad=0.25, ganador=False)
+        self.competidor2 = Competidor(nombre=self.data_factory.name(), probabilidad=0.75, ganador=False)
+        self.carrera.competidores.extend([self.competidor1, self.competidor2])
+        self.session.add(self.carrera)
+        self.session.commit()
+
+    def test_estadisticas_apostador_incrementales(self):
+        """
+        Método encargado de probar que el resumen de un apostador se actualiza
+        al crear, editar, liquidar y eliminar apuestas.
+        """
+        self._popular_carrera()
+        nombre = self.data_factory.name()
+        self.logica.aniadir_apostador(nombre)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(nombre)['Apuestas'], 0)
+
+        self.logica.crear_apuesta(nombre, self.carrera.nombre, 10, self.competidor1.nombre)
+        self.logica.crear_apuesta(nombre, self.carrera.nombre, 30, self.competidor2.nombre)
+        estadisticas = self.logica.dar_estadisticas_apostador(nombre)
+        self.assertEqual(estadisticas['Apuestas'], 2)
+        self.assertEqual(estadisticas['Apostado'], 40)
+        self.assertEqual(estadisticas['Carreras'], 1)
+        self.assertIsNotNone(estadisticas['Ultima actividad'])
+
+        ids = {a['Competidor']: a['Id'] for a in self.logica.dar_apuestas_carrera(self.carrera.nombre)}
+        self.logica.editar_apuesta(ids[self.competidor1.nombre], nombre, self.carrera.nombre, 20, self.competidor1.nombre)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(nombre)['Apostado'], 50)
+
+        self.logica.dar_reporte_ganancias(self.carrera.nombre, self.competidor1.nombre)
+        self.logica.dar_reporte_ganancias(self.carrera.nombre, self.competidor1.nombre)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(nombre)['Ganado'], 80)
+
+        self.assertTrue(self.logica.eliminar_apuesta(self.carrera.nombre, ids[self.competidor2.nombre]))
+        estadisticas = self.logica.dar_estadisticas_apostador(nombre)
+        self.assertEqual(estadisticas['Apuestas'], 1)
+        self.assertEqual(estadisticas['Apostado'], 20)
+        self.assertEqual(estadisticas['Carreras'], 1)
+
+        self.logica.eliminar_apuesta(self.carrera.nombre, ids[self.competidor1.nombre])
+        self.assertEqual(self.logica.dar_estadisticas_apostador(nombre)['Carreras'], 0)
+
+    def test_reconstruir_estadisticas_apostadores(self):
+        """
+        Método encargado de probar que la reconstruccion completa del resumen
+        coincide con el resumen mantenido de forma incremental.
+        """
+        self._popular_carrera()
+        nombres = [self.data_factory.name() for i in range(3)]
+        for i, nombre in enumerate(nombres):
+            self.logica.aniadir_apostador(nombre)
+            for j in range(i):
+                self.logica.crear_apuesta(nombre, self.carrera.nombre, 5 + j, self.competidor1.nombre)
+        self.logica.dar_reporte_ganancias(self.carrera.nombre, self.competidor1.nombre)
+
+        incrementales = [self.logica.dar_estadisticas_apostador(n) for n in nombres]
+        self.logica.reconstruir_estadisticas_apostadores()
+        reconstruidas = [self.logica.dar_estadisticas_apostador(n) for n in nombres]
+
+        self.assertEqual(incrementales, reconstruidas)
+        self.assertEqual(reconstruidas[2]['Apuestas'], 2)
+        self.assertEqual(reconstruidas[2]['Apostado'], 11)
+        self.assertEqual(reconstruidas[2]['Ganado'], 44)
+
+    def test_tablas_de_posiciones_apostadores(self):
+        """
+        Método encargado de probar las tablas de posiciones de los apostadores
+        que mas han apostado y que mas han ganado.
+        """
+        self._popular_carrera()
+        nombres = sorted(self.data_factory.name() for i in range(4))
+        for i, nombre in enumerate(nombres):
+            self.logica.aniadir_apostador(nombre)
+            competidor = self.competidor1 if i % 2 == 0 else self.competidor2
+            self.logica.crear_apuesta(nombre, self.carrera.nombre, 10 * (i + 1), competidor.nombre)
+        self.logica.dar_reporte_ganancias(self.carrera.nombre, self.competidor1.nombre)
+
+        apostadores = self.logica.dar_mayores_apostadores(3)
+        self.assertEqual([a['Apostador'] for a in apostadores], nombres[::-1][:3])
+        self.assertEqual(apostadores[0]['Apostado'], 40)
+
+        ganadores = self.logica.dar_mayores_ganadores(2)
+        self.assertEqual([g['Apostador'] for g in ganadores], [nombres[2], nombres[0]])
+        self.assertEqual(ganadores[0]['Ganado'], 120)
+
+    def test_buscar_apostadores_por_prefijo(self):
+        """
+        Método encargado de probar la busqueda de apostadores por prefijo, sin
+        diferenciar mayusculas ni tildes y limitada a k resultados.
+        """
+        for nombre in ['Álvaro Gómez', 'alvaro Pérez', 'Alba Ruiz', 'Beatriz Díaz']:
+            self.logica.aniadir_apostador(nombre)
+
+        self.assertEqual([a['Nombre'] for a in self.logica.buscar_apostadores('ALVA')],
+                         ['Álvaro Gómez', 'alvaro Pérez'])
+        self.assertEqual([a['Nombre'] for a in self.logica.buscar_apostadores('al', k=2)],
+                         ['Alba Ruiz', 'Álvaro Gómez'])
+        self.assertEqual(self.logica.buscar_apostadores('z'), [])
+
+
+    def test_eliminar_apostador_en_cascada(self):
+        """
+        Método encargado de probar que al eliminar un apostador se borran sus
+        apuestas y su resumen, y se descuentan los totales de los competidores.
+        """
+        self._popular_carrera()
+        nombre = self.data_factory.name()
+        otro = self.data_factory.name()
+        self.logica.aniadir_apostador(nombre)
+        self.logica.aniadir_apostador(otro)
+        self.logica.crear_apuesta(nombre, self.carrera.nombre, 10, self.competidor1.nombre)
+        self.logica.crear_apuesta(nombre, self.carrera.nombre, 30, self.competidor1.nombre)
+        self.logica.crear_apuesta(otro, self.carrera.nombre, 5, self.competidor1.nombre)
 
-        
\ No newline at end of file
+        self.assertTrue(self.logica.eliminar_apostador(nombre))
+        self.assertIsNone(self.logica.dar_apostador(nombre))
+        self.assertEqual(self.session.query(EstadisticaApostador).filter(
+            EstadisticaApostador.nombre_apostador == nombre).count(), 0)
+        apuestas = self.logica.dar_apuestas_carrera(self.carrera.nombre)
+        self.assertEqual([a['Apostador'] for a in apuestas], [otro])
+        competidor = self.logica.dar_competidores_mas_apostados(self.carrera.nombre, k=1)[0]
+        self.assertEqual((competidor['Apuestas'], competidor['Apostado']), (1, 5))
+        self.assertFalse(self.logica.eliminar_apostador(nombre))
@@ -1,5 +1,6 @@
 import unittest
 import random
+from datetime import datetime, timedelta
 from faker import Faker
 
 from src.logica.manager_eporra import ManagerEPorra
@@ -8,6 +9,8 @@ from src.modelo.apuesta import Apuesta
 from src.modelo.apostador import Apostador
 from src.modelo.carrera import Carrera
 from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+from src.modelo.volumen_apuestas import MINUTOS_VOLUMEN, VolumenApuestas, minuto
 
 
 class ApuestaTestCase(unittest.TestCase):
@@ -25,6 +28,8 @@ class ApuestaTestCase(unittest.TestCase):
         """
         Metodo encargado de limpiar los fixtures de la clase.
         """
+        self.logica.cerrar()
+        self.session.query(EstadisticaApostador).delete()
         self.session.query(Apostador).delete()
         self.session.query(Apuesta).delete()
         self.session.query(Competidor).delete()
@@ -37,7 +42,7 @@ class ApuestaTestCase(unittest.TestCase):
         self.apostador_1 = Apostador(nombre=self.data_factory.name())
         self.apostador_2 = Apostador(nombre=self.data_factory.name())
         self.carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
-        self.competidor = Competidor(nombre=self.data_factory.name(), probabilidad=1, carrera=self.carrera)
+        self.competidor = Competidor(nombre=self.data_factory.name(), probabilidad=0.5, carrera=self.carrera)
 
         self.session.add(self.apostador_1)
         self.session.add(self.apostador_2)
@@ -157,7 +162,7 @@ class ApuestaTestCase(unittest.TestCase):
         self.session.add(base_apuestas[1])
         self.session.commit()
 
-        self.logica.editar_apuesta(0, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
+        self.logica.editar_apuesta(base_apuestas[0].id, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
         apuestas = self.logica.dar_apuestas_carrera(self.carrera.nombre)
         
         base_apuestas_nombres = [a.nombre_apostador for a in sorted(base_apuestas, key=lambda ap: ap.nombre_apostador)]
@@ -182,7 +187,7 @@ class ApuestaTestCase(unittest.TestCase):
         self.session.add(base_apuestas[0])
         self.session.commit()
 
-        self.logica.editar_apuesta(0, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
+        self.logica.editar_apuesta(base_apuestas[0].id, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
         apuestas = self.logica.dar_apuestas_carrera(self.carrera.nombre)
         
         self.assertEqual(apuestas[0]['Valor'], valor_1)
@@ -204,7 +209,120 @@ class ApuestaTestCase(unittest.TestCase):
         self.session.add(base_apuestas[0])
         self.session.commit()
 
-        self.logica.editar_apuesta(0, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
+        self.logica.editar_apuesta(base_apuestas[0].id, self.apostador_1.nombre, self.carrera.nombre, valor, self.competidor.nombre)
         apuestas = self.logica.dar_apuestas_carrera(self.carrera.nombre)
         
-        self.assertEqual(apuestas[0]['Valor'], valor_1)
\ No newline at end of file
+        self.assertEqual(apuestas[0]['Valor'], valor_1)
+
+    def test_editar_apuesta_por_id(self):
+        """
+        Metodo encargado de probar que la edición de una apuesta por su id solo
+        modifica esa apuesta, aunque el apostador tenga otras en la carrera.
+        """
+        self._popular_datos_para_apuesta()
+        self.competidor.probabilidad = 0.5
+        base_apuestas = [Apuesta(valor=10, ganancia=0, carrera=self.carrera,
+            apostador=self.apostador_1, competidor=self.competidor) for i in range(3)]
+        self.session.add_all(base_apuestas)
+        self.session.commit()
+
+        self.assertTrue(self.logica.editar_apuesta(base_apuestas[1].id, self.apostador_2.nombre,
+                                                   self.carrera.nombre, 50, self.competidor.nombre))
+
+        apuestas = {a['Id']: a for a in self.logica.dar_apuestas_carrera(self.carrera.nombre)}
+        self.assertEqual(apuestas[base_apuestas[1].id]['Valor'], 50)
+        self.assertEqual(apuestas[base_apuestas[1].id]['Apostador'], self.apostador_2.nombre)
+        self.assertEqual(apuestas[base_apuestas[0].id]['Valor'], 10)
+        self.assertEqual(apuestas[base_apuestas[2].id]['Apostador'], self.apostador_1.nombre)
+        self.assertEqual(self.logica.dar_apuesta(self.carrera.nombre, base_apuestas[1].id)['Valor'], 50)
+
+    def test_editar_apuesta_con_apostador_inexistente(self):
+        """
+        Metodo encargado de probar que editar una apuesta con un apostador que
+        no existe no modifica la apuesta ni el resumen de su apostador.
+        """
+        self._popular_datos_para_apuesta()
+        self.logica.crear_apuesta(self.apostador_1.nombre, self.carrera.nombre, 10, self.competidor.nombre)
+        apuesta = self.logica.dar_apuestas_carrera(self.carrera.nombre)[0]
+        estadisticas = self.logica.dar_estadisticas_apostador(self.apostador_1.nombre)
+
+        self.assertFalse(self.logica.editar_apuesta(apuesta['Id'], 'No existe', self.carrera.nombre,
+                                                    20, self.competidor.nombre))
+
+        self.assertEqual(self.logica.dar_apuesta(self.carrera.nombre, apuesta['Id']), apuesta)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(self.apostador_1.nombre), estadisticas)
+
+    def test_eliminar_apuesta_por_id(self):
+        """
+        Metodo encargado de probar la eliminación de una apuesta por su id.
+        """
+        self._popular_datos_para_apuesta()
+        apuesta = Apuesta(valor=10, ganancia=0, carrera=self.carrera,
+            apostador=self.apostador_1, competidor=self.competidor)
+        self.session.add(apuesta)
+        self.session.commit()
+
+        self.assertFalse(self.logica.eliminar_apuesta('otra carrera', apuesta.id))
+        self.assertTrue(self.logica.eliminar_apuesta(self.carrera.nombre, apuesta.id))
+        self.assertEqual(self.logica.dar_apuestas_carrera(self.carrera.nombre), [])
+        self.assertFalse(self.logica.eliminar_apuesta(self.carrera.nombre, apuesta.id))
+
+
+    def test_volumen_de_apuestas_por_minuto(self):
+        """
+        Metodo encargado de probar que las apuestas guardan su fecha y que el
+        volumen por minuto se mantiene al crear, editar y eliminar apuestas.
+        """
+        self._popular_datos_para_apuesta()
+        otro = Competidor(nombre=self.data_factory.name(), probabilidad=0.5, carrera=self.carrera)
+        self.session.add(otro)
+        self.session.commit()
+        carrera, competidor = self.carrera.nombre, self.competidor.nombre
+
+        self.logica.crear_apuesta(self.apostador_1.nombre, carrera, 10, competidor)
+        self.logica.crear_apuesta(self.apostador_2.nombre, carrera, 20, competidor)
+        self.logica.crear_apuesta(self.apostador_1.nombre, carrera, 5, otro.nombre)
+        self.assertTrue(all(a.fecha is not None for a in self.session.query(Apuesta)))
+
+        volumen = {v['Competidor']: (v['Apuestas'], v['Apostado'])
+                   for v in self.logica.dar_volumen_carrera(carrera, 5)}
+        self.assertEqual(volumen, {competidor: (2, 30), otro.nombre: (1, 5)})
+        ahora = datetime.now()
+        self.assertEqual(self.logica.dar_volumen_carrera(carrera, 5, ahora + timedelta(minutes=10)), [])
+        self.assertEqual(sum(v['Apostado'] for v in self.logica.dar_volumen_por_minuto(carrera)), 35)
+
+        apuestas = self.logica.dar_apuestas_carrera(carrera)
+        primera = next(a for a in apuestas if a['Valor'] == 10)
+        self.assertTrue(self.logica.editar_apuesta(primera['Id'], self.apostador_1.nombre, carrera,
+                                                   12, otro.nombre))
+        segunda = next(a for a in apuestas if a['Valor'] == 20)
+        self.assertTrue(self.logica.eliminar_apuesta(carrera, segunda['Id']))
+        volumen = {v['Competidor']: (v['Apuestas'], v['Apostado'])
+                   for v in self.logica.dar_volumen_carrera(carrera, 5)}
+        self.assertEqual(volumen, {otro.nombre: (2, 17)})
+
+        self.logica.eliminar_apostador(self.apostador_1.nombre)
+        volumen = {v['Competidor']: (v['Apuestas'], v['Apostado'])
+                   for v in self.logica.dar_volumen_carrera(carrera, 5)}
+        self.assertEqual(volumen, {})
+        self.assertEqual(self.session.query(VolumenApuestas).count(), 0)
+
+    def test_volumen_fuera_de_la_ventana_se_borra(self):
+        """
+        Metodo encargado de probar que los intervalos de volumen mas antiguos
+        que la ventana mas larga se borran al abrir uno nuevo
+        """
+        self._popular_datos_para_apuesta()
+        carrera, competidor = self.carrera.nombre, self.competidor.nombre
+        antiguo = minuto(datetime.now()) - timedelta(minutes=MINUTOS_VOLUMEN + 5)
+        self.session.add(VolumenApuestas(nombre_carrera=carrera, minuto=antiguo,
+                                         nombre_competidor=competidor,
+                                         numero_apuestas=3, total_apostado=30))
+        self.session.commit()
+
+        self.logica.crear_apuesta(self.apostador_1.nombre, carrera, 10, competidor)
+        self.session.expire_all()
+        self.assertEqual([v.minuto for v in self.session.query(VolumenApuestas)],
+                         [minuto(datetime.now())])
+        volumen = self.logica.dar_volumen_por_minuto(carrera, MINUTOS_VOLUMEN * 2)
+        self.assertEqual([(v['Apuestas'], v['Apostado']) for v in volumen], [(1, 10)])
@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
+from src.modelo.apuesta import Apuesta
+from src.modelo.apostador import Apostador
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+
+
+class ArchivoTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias del archivo de carreras
+    liquidadas
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        self.logica = ManagerEPorra(TESTING_ADDRESS,
+                                    archivo=os.path.join(self.directorio, 'archivo.sqlite'))
+        (self.engine, self.session) = crear_session(TESTING_ADDRESS)
+
+        self.nombre_apostador = self.data_factory.name()
+        self.logica.aniadir_apostador(self.nombre_apostador)
+        self.carreras = []
+        for i in range(2):
+            carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=None)
+            carrera.competidores.append(Competidor(
+                nombre=self.data_factory.name(), probabilidad=0.25, ganador=False))
+            carrera.competidores.append(Competidor(
+                nombre=self.data_factory.name(), probabilidad=0.75, ganador=False))
+            self.session.add(carrera)
+            self.session.commit()
+            self.carreras.append((carrera.nombre, [c.nombre for c in carrera.competidores]))
+        for nombre, competidores in self.carreras:
+            self.logica.crear_apuesta(self.nombre_apostador, nombre, 10, competidores[0])
+            self.logica.crear_apuesta(self.nombre_apostador, nombre, 20, competidores[1])
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.logica.cerrar()
+        self.session.query(EstadisticaApostador).delete()
+        self.session.query(Apostador).delete()
+        self.session.query(Apuesta).delete()
+        self.session.query(Competidor).delete()
+        self.session.query(Carrera).delete()
+
+        self.session.commit()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def _liquidar(self, indice):
+        """
+        Metodo encargado de terminar una carrera y generar su reporte.
+        """
+        nombre, competidores = self.carreras[indice]
+        self.logica.terminar_carrera(competidores[0])
+        return self.logica.dar_reporte_ganancias(nombre, competidores[0])
+
+    def test_archivar_solo_carreras_liquidadas(self):
+        """
+        Metodo encargado de probar que solo se archivan las carreras terminadas
+        con reporte y que salen de las tablas principales
+        """
+        self._liquidar(0)
+        self.assertEqual(self.logica.archivar_carreras(), 1)
+
+        archivada, en_curso = self.carreras[0][0], self.carreras[1][0]
+        self.assertEqual(self.session.query(Carrera).filter(Carrera.nombre == archivada).count(), 0)
+        self.assertEqual(self.session.query(Competidor).filter(
+            Competidor.nombre_carrera == archivada).count(), 0)
+        self.assertEqual(self.session.query(Apuesta).filter(
+            Apuesta.nombre_carrera == archivada).count(), 0)
+        self.assertEqual(self.session.query(Apuesta).count(), 2)
+        self.assertIsNotNone(self.logica.dar_carrera(en_curso))
+        self.assertEqual(self.logica.archivar_carreras(), 0)
+
+    def test_lectura_transparente_de_carreras_archivadas(self):
+        """
+        Metodo encargado de probar que las consultas siguen encontrando las
+        carreras archivadas
+        """
+        _, ganancias_casa = self._liquidar(0)
+        apuestas_antes = self.logica.dar_apuestas_carrera(self.carreras[0][0])
+        self.logica.archivar_carreras()
+        nombre, competidores = self.carreras[0]
+
+        carrera = self.logica.dar_carrera(nombre)
+        self.assertFalse(carrera.abierta)
+        self.assertEqual(carrera.ganancia, ganancias_casa)
+        self.assertEqual(sorted(c['Nombre'] for c in self.logica.dar_competidores_carrera(nombre)),
+                         sorted(competidores))
+        self.assertEqual(sorted(c['Nombre'] for c in self.logica.dar_carreras()),
+                         sorted(n for n, _ in self.carreras))
+        apuestas = self.logica.dar_apuestas_carrera(nombre)
+        self.assertEqual([(a['Valor'], a['Ganancia']) for a in apuestas],
+                         [(a['Valor'], a['Ganancia']) for a in apuestas_antes])
+        self.assertEqual([a['Carrera'] for a in self.logica.dar_apuestas_apostador(self.nombre_apostador)],
+                         sorted([n for n, _ in self.carreras] * 2))
+
+        with self.assertRaises(ValueError):
+            self.logica.guardar_cambios_carrera(nombre, [], True)
+
+    def test_reconstruir_estadisticas_incluye_archivo(self):
+        """
+        Metodo encargado de probar que el resumen de los apostadores sigue
+        contando las apuestas archivadas
+        """
+        self._liquidar(0)
+        antes = self.logica.dar_estadisticas_apostador(self.nombre_apostador)
+        self.logica.archivar_carreras()
+        self.logica.reconstruir_estadisticas_apostadores()
+        despues = self.logica.dar_estadisticas_apostador(self.nombre_apostador)
+        for llave in ('Apuestas', 'Apostado', 'Ganado', 'Carreras'):
+            self.assertEqual(despues[llave], antes[llave])
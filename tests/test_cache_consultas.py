@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+
+
+class CacheConsultasTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la cache de las consultas de
+    listas
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        address = 'sqlite:///' + os.path.join(self.directorio, 'compartida.sqlite')
+        self.logica = ManagerEPorra(address)
+        self.otra_terminal = ManagerEPorra(address)
+        self.carrera = self.data_factory.name()
+        self.competidores = [self.data_factory.name() for _ in range(2)]
+        self.logica.guardar_cambios_carrera(self.carrera, [
+            {'Nombre': self.competidores[0], 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+            {'Nombre': self.competidores[1], 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        self.apostador = self.data_factory.name()
+        self.logica.aniadir_apostador(self.apostador)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.logica.cerrar()
+        self.otra_terminal.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def test_reutilizar_resultados_sin_escrituras(self):
+        """
+        Metodo encargado de probar que las consultas repetidas se responden de
+        la cache con copias que la interfaz puede modificar
+        """
+        competidores = self.logica.dar_competidores_carrera(self.carrera)
+        competidores.append({'Nombre': 'Pendiente', 'Probabilidad': 0.1, 'Estado': 'Nueva'})
+        competidores[0]['Nombre'] = 'Editado'
+        self.assertEqual(sorted(c['Nombre'] for c in self.logica.dar_competidores_carrera(self.carrera)),
+                         sorted(self.competidores))
+        self.logica.dar_carreras()
+        self.logica.dar_carreras()
+
+        metricas = self.logica.dar_metricas_cache()
+        self.assertEqual(metricas['dar_competidores_carrera'],
+                         {'Aciertos': 1, 'Fallos': 1, 'Tasa de aciertos': 0.5})
+        self.assertEqual((metricas['Total']['Aciertos'], metricas['Total']['Fallos']), (2, 2))
+
+    def test_invalidar_con_escrituras_propias_y_externas(self):
+        """
+        Metodo encargado de probar que cualquier escritura, de la logica o de
+        otra terminal, invalida los resultados guardados
+        """
+        self.assertEqual(self.logica.dar_apuestas_carrera(self.carrera), [])
+        self.logica.crear_apuesta(self.apostador, self.carrera, 10, self.competidores[0])
+        self.assertEqual(len(self.logica.dar_apuestas_carrera(self.carrera)), 1)
+
+        self.otra_terminal.crear_apuesta(self.apostador, self.carrera, 20, self.competidores[1])
+        self.otra_terminal.aniadir_apostador(self.data_factory.name())
+        self.assertEqual(len(self.logica.dar_apuestas_carrera(self.carrera)), 2)
+        self.assertEqual(len(self.logica.dar_apostadores()), 2)
+        self.assertEqual(self.logica.dar_metricas_cache()['Total']['Aciertos'], 0)
+        self.assertEqual(len(self.logica.dar_apostadores()), 2)
+        self.assertEqual(self.logica.dar_metricas_cache()['dar_apostadores']['Aciertos'], 1)
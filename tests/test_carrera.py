@@ -1,13 +1,16 @@
 import unittest
 import random
 from faker import Faker
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 
-from src.logica.manager_eporra import ManagerEPorra
+from src.logica.manager_eporra import ManagerEPorra, _error_de_restriccion
 from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
 from src.modelo.apuesta import Apuesta
 from src.modelo.apostador import Apostador
 from src.modelo.carrera import Carrera
 from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
 
 
 class CarreraTestCase(unittest.TestCase):
@@ -69,6 +72,8 @@ class CarreraTestCase(unittest.TestCase):
         """
         Metodo encargado de limpiar los fixtures de la clase.
         """
+        self.logica.cerrar()
+        self.session.query(EstadisticaApostador).delete()
         self.session.query(Apostador).delete()
         self.session.query(Apuesta).delete()
         self.session.query(Competidor).delete()
@@ -152,6 +157,49 @@ class CarreraTestCase(unittest.TestCase):
         self.assertEqual(
             num_carrera, 1, "No se deben crear carreras con nombres duplicados")
 
+    def test_crear_carrera_inserta_competidores_en_bloque(self):
+        """
+        Metodo encargado de probar que los competidores de una carrera nueva se
+        insertan con una sola sentencia y con su multiplicador calculado
+        """
+        nombre = self.data_factory.name()
+        competidores = [{"Nombre": "{} {}".format(nombre, i), "Probabilidad": 0.25, "Estado": "Nueva"}
+                        for i in range(4)]
+        sentencias = []
+
+        def registrar(conexion, cursor, sentencia, parametros, contexto, executemany):
+            if sentencia.startswith('INSERT INTO competidor'):
+                sentencias.append(sentencia)
+
+        event.listen(self.logica.engine, 'before_cursor_execute', registrar)
+        try:
+            self.logica.guardar_cambios_carrera(nombre, competidores, True)
+        finally:
+            event.remove(self.logica.engine, 'before_cursor_execute', registrar)
+
+        self.assertEqual(len(sentencias), 1)
+        guardados = self.logica.dar_competidores_carrera(nombre)
+        self.assertEqual(len(guardados), 4)
+        self.assertTrue(all(c['Multiplicador'] == 4 for c in guardados))
+        self.assertEqual(len(self.logica.buscar_competidores(nombre, nombre.lower())), 4)
+
+    def test_crear_carrera_con_competidores_repetidos(self):
+        """
+        Metodo encargado de probar que no se guarda una carrera con competidores
+        repetidos, ni entre si ni con competidores de otras carreras
+        """
+        nombre = self.data_factory.name()
+        repetidos = [{"Nombre": "Repetido", "Probabilidad": 0.5, "Estado": "Nueva"},
+                     {"Nombre": "Repetido", "Probabilidad": 0.5, "Estado": "Nueva"}]
+        with self.assertRaises(ValueError):
+            self.logica.guardar_cambios_carrera(nombre, repetidos, True)
+
+        existentes = [{"Nombre": self.nombre_competidor1, "Probabilidad": 0.5, "Estado": "Nueva"},
+                      {"Nombre": "Otro", "Probabilidad": 0.5, "Estado": "Nueva"}]
+        with self.assertRaises(ValueError):
+            self.logica.guardar_cambios_carrera(nombre, existentes, True)
+        self.assertIsNone(self.logica.dar_carrera(nombre))
+
     def test_crear_carrera_tamano_nombre_superior_a_200_caracteres(self):
         """
         Metodo encargado de probar la creacion de una carrera en e-porra,
@@ -186,6 +234,8 @@ class CarreraTestCase(unittest.TestCase):
 
         with self.assertRaises(Exception):
             self.logica.guardar_cambios_carrera(nombre, competidores, True)
+        # Los competidores de la prueba no cumplen las restricciones del esquema
+        self.session.rollback()
 
     def test_terminar_carrera_con_ganador_nulo(self):
         """
@@ -196,6 +246,17 @@ class CarreraTestCase(unittest.TestCase):
         with self.assertRaises(Exception):
             self.logica.terminar_carrera(nombre_ganador)
 
+    def test_terminar_carrera_con_ganador_inexistente(self):
+        """
+        Metodo encargado de probar la terminacion de una carrera en e-porra,
+        cuando el ganador no es un competidor. Se espera el mismo error que en
+        la logica en memoria y que la carrera siga abierta.
+        """
+        with self.assertRaises(ValueError) as contexto:
+            self.logica.terminar_carrera('No existe')
+        self.assertEqual(str(contexto.exception), "No existe el competidor No existe")
+        self.assertTrue(self.logica.dar_carrera(self.nombre_carrera).abierta)
+
     def test_terminar_carrera_con_ganador_longitud_cero(self):
         """
         Metodo encargado de probar la terminacion de una carrera en e-porra,
@@ -271,6 +332,153 @@ class CarreraTestCase(unittest.TestCase):
 
         self.assertEqual([g[0] for g in lista_ganancias], [ap.nombre_apostador for ap in base_apuestas])
 
+    def test_reporte_ganancias_guardado_y_reliquidar(self):
+        """
+        Método encargado de probar que el reporte de una carrera terminada se
+        guarda una vez, se lee sin escribir y se puede recalcular
+        """
+        self._popular_datos_reporte()
+        with self.assertRaises(Exception):
+            self.logica.reliquidar_carrera(self.nombre_carrera)
+        self.logica.terminar_carrera(self.nombre_competidor1)
+        reporte = self.logica.dar_reporte_ganancias(self.nombre_carrera, self.nombre_competidor1)
+        self.assertIsNotNone(self.session.query(Carrera.fecha_liquidacion).filter(
+            Carrera.nombre == self.nombre_carrera).scalar())
+
+        sentencias = []
+
+        def registrar(conexion, cursor, sentencia, parametros, contexto, varios):
+            sentencias.append(sentencia)
+        event.listen(self.logica.engine, 'before_cursor_execute', registrar)
+        try:
+            self.assertEqual(self.logica.dar_reporte_ganancias(
+                self.nombre_carrera, self.nombre_competidor1), reporte)
+        finally:
+            event.remove(self.logica.engine, 'before_cursor_execute', registrar)
+        self.assertFalse([s for s in sentencias if not s.lstrip().upper().startswith('SELECT')])
+
+        lista_ganancias, ganancias_casa = self.logica.reliquidar_carrera(
+            self.nombre_carrera, self.nombre_competidor2)
+        ganancias = dict(lista_ganancias)
+        self.assertEqual(ganancias[self.apostador_1.nombre], 0)
+        self.assertGreater(ganancias[self.apostador_2.nombre], 0)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(self.apostador_1.nombre)['Ganado'], 0)
+        ganador = self.session.query(Competidor.nombre).filter(Competidor.ganador.is_(True)).scalar()
+        self.assertEqual(ganador, self.nombre_competidor2)
+        self.assertEqual(self.logica.dar_reporte_ganancias(
+            self.nombre_carrera, self.nombre_competidor1), (lista_ganancias, ganancias_casa))
+
+    def test_generar_reporte_ganancias_por_lotes(self):
+        """
+        Método encargado de probar que el reporte por lotes produce las
+        ganancias en orden de apostador, escribe cada lote antes de producirlo
+        y liquida la carrera al terminar
+        """
+        apostadores = [self.data_factory.name() for _ in range(3)]
+        for nombre in apostadores:
+            self.logica.aniadir_apostador(nombre)
+        valores = [random.randint(1, 100) for _ in range(7)]
+        for i, valor in enumerate(valores):
+            competidor = self.nombre_competidor1 if i % 2 == 0 else self.nombre_competidor2
+            self.logica.crear_apuesta(apostadores[(i * 2) % 3], self.nombre_carrera, valor, competidor)
+        self.logica.terminar_carrera(self.nombre_competidor1)
+
+        generador = self.logica.generar_reporte_ganancias(
+            self.nombre_carrera, self.nombre_competidor1, tamano_lote=2)
+        ganancias = [next(generador)]
+        self.assertIsNone(self.session.query(Carrera.fecha_liquidacion).filter(
+            Carrera.nombre == self.nombre_carrera).scalar())
+        with self.assertRaises(StopIteration) as fin:
+            while True:
+                ganancias.append(next(generador))
+        ganancias_casa = fin.exception.value
+
+        self.assertEqual([g[0] for g in ganancias], sorted(apostadores[(i * 2) % 3] for i in range(7)))
+        self.assertEqual(ganancias_casa, sum(valores) - sum(g[1] for g in ganancias))
+        self.assertEqual(sum(self.logica.dar_estadisticas_apostador(nombre)['Ganado']
+                             for nombre in apostadores), sum(g[1] for g in ganancias))
+        self.assertEqual(self.logica.dar_reporte_ganancias(self.nombre_carrera, self.nombre_competidor1),
+                         (ganancias, ganancias_casa))
+        self.assertEqual(list(self.logica.generar_reporte_ganancias(
+            self.nombre_carrera, self.nombre_competidor1, tamano_lote=3)), ganancias)
+
+    def test_repetir_reporte_ganancias_interrumpido(self):
+        """
+        Método encargado de probar que un reporte por lotes interrumpido deja
+        los resumenes de los apostadores al dia con las ganancias guardadas y
+        se puede repetir
+        """
+        ana, bea = sorted(self.data_factory.name() for _ in range(2))
+        self.logica.aniadir_apostador(ana)
+        self.logica.aniadir_apostador(bea)
+        for _ in range(3):
+            self.logica.crear_apuesta(ana, self.nombre_carrera, 10, self.nombre_competidor2)
+        self.logica.crear_apuesta(bea, self.nombre_carrera, 10, self.nombre_competidor1)
+        self.logica.terminar_carrera(self.nombre_competidor1)
+
+        generador = self.logica.generar_reporte_ganancias(
+            self.nombre_carrera, self.nombre_competidor1, tamano_lote=2)
+        for _ in range(3):
+            next(generador)
+        generador.close()
+
+        lista_ganancias, _ = self.logica.dar_reporte_ganancias(
+            self.nombre_carrera, self.nombre_competidor1)
+        ganancias = dict(lista_ganancias)
+        self.assertGreater(ganancias[bea], 0)
+        self.assertEqual(self.logica.dar_estadisticas_apostador(bea)['Ganado'], ganancias[bea])
+        self.assertEqual(self.logica.dar_estadisticas_apostador(ana)['Ganado'], 0)
+
+    def test_dar_exposicion_carrera(self):
+        """
+        Método encargado de probar el calculo de lo que pagaria la casa por cada
+        competidor a partir del multiplicador guardado
+        """
+        self._popular_datos_reporte()
+
+        exposicion = {e['Competidor']: e for e in self.logica.dar_exposicion_carrera(self.carrera.nombre)}
+        total = self.valor_apuesta1 + self.valor_apuesta2
+        for competidor, valor in [(self.competidor1, self.valor_apuesta1), (self.competidor2, self.valor_apuesta2)]:
+            pago = round(valor * competidor.multiplicador, 2)
+            self.assertEqual(exposicion[competidor.nombre]['Apostado'], valor)
+            self.assertEqual(exposicion[competidor.nombre]['Pago'], pago)
+            self.assertEqual(exposicion[competidor.nombre]['Ganancia de la casa'], total - pago)
+
+    def test_competidores_en_orden_de_creacion(self):
+        """
+        Método encargado de probar que los competidores de una carrera se
+        listan en el orden en que se crearon aunque se apueste por el segundo,
+        ya que la interfaz los edita por su posicion
+        """
+        nombre = self.data_factory.name()
+        # El segundo va primero tanto por nombre como por valor apostado
+        competidores = sorted((self.data_factory.unique.name() for _ in range(2)), reverse=True)
+        apostador = self.data_factory.name()
+        self.logica.guardar_cambios_carrera(nombre, [
+            {'Nombre': competidor, 'Probabilidad': 0.5, 'Estado': 'Nueva'}
+            for competidor in competidores], True)
+        self.logica.aniadir_apostador(apostador)
+        self.logica.dar_exposicion_carrera(nombre)
+        self.logica.crear_apuesta(apostador, nombre, 10, competidores[1])
+
+        carrera = next(c for c in self.logica.dar_carreras() if c['Nombre'] == nombre)
+        self.assertEqual([c['Nombre'] for c in carrera['Competidores']], competidores)
+        self.assertEqual([c['Nombre'] for c in self.logica.dar_competidores_carrera(nombre)],
+                         competidores)
+
+    def test_buscar_carreras_y_competidores_por_prefijo(self):
+        """
+        Método encargado de probar la busqueda por prefijo de carreras y de los
+        competidores de una carrera
+        """
+        prefijo = self.nombre_carrera[:3].upper()
+        carreras = [c['Nombre'] for c in self.logica.buscar_carreras(prefijo)]
+        self.assertIn(self.nombre_carrera, carreras)
+
+        competidores = self.logica.buscar_competidores(self.nombre_carrera, self.nombre_competidor1[:4].lower())
+        self.assertIn(self.nombre_competidor1, [c['Nombre'] for c in competidores])
+        self.assertEqual(self.logica.buscar_competidores('otra carrera', ''), [])
+
     def test_eliminar_carrera(self):
         """
         Método encargado de probar la eliminación de una carrera
@@ -289,4 +497,57 @@ class CarreraTestCase(unittest.TestCase):
         resultado = self.logica.eliminar_carrera(self.carrera.nombre)
         carrera = self.session.query(Carrera).filter(
             Competidor.nombre == self.nombre_carrera).first()
-        self.assertFalse(resultado, "Se elimino la carrera")
\ No newline at end of file
+        self.assertFalse(resultado, "Se elimino la carrera")
+
+    def test_eliminar_carrera_borra_competidores(self):
+        """
+        Método encargado de probar que la base de datos borra en cascada los
+        competidores de una carrera eliminada
+        """
+        self.assertTrue(self.logica.eliminar_carrera(self.nombre_carrera))
+        competidores = self.session.query(Competidor).filter(
+            Competidor.nombre_carrera == self.nombre_carrera).count()
+        self.assertEqual(competidores, 0)
+
+    def test_terminar_carreras_en_bloque(self):
+        """
+        Método encargado de probar el cierre de varias carreras en una sola
+        transaccion y que despues no se aceptan apuestas
+        """
+        otra = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
+        otra.competidores.append(Competidor(nombre=self.data_factory.name(), probabilidad=0.5, ganador=False))
+        otra.competidores.append(Competidor(nombre=self.data_factory.name(), probabilidad=0.5, ganador=False))
+        self.session.add(otra)
+        self.session.commit()
+        ganador_otra = otra.competidores[1].nombre
+
+        with self.assertRaises(ValueError):
+            self.logica.terminar_carreras([(self.nombre_carrera, self.nombre_competidor1),
+                                           (otra.nombre, self.nombre_competidor2)])
+        self.assertTrue(self.logica.dar_carrera(self.nombre_carrera).abierta)
+
+        self.logica.terminar_carreras([(self.nombre_carrera, self.nombre_competidor1),
+                                       (otra.nombre, ganador_otra)])
+        ganadores = {c.nombre for c in self.session.query(Competidor).filter(Competidor.ganador.is_(True))}
+        self.assertEqual(ganadores, {self.nombre_competidor1, ganador_otra})
+        self.assertFalse(self.logica.dar_carrera(otra.nombre).abierta)
+
+        with self.assertRaises(Exception):
+            self.logica.crear_apuesta(None, otra.nombre, 10, ganador_otra)
+        with self.assertRaises(Exception):
+            self.logica.terminar_carreras([(otra.nombre, ganador_otra)])
+        self.assertFalse(self.logica._tiene_apuestas(otra.nombre))
+
+    def test_mensaje_de_cada_restriccion_de_nombre(self):
+        """
+        Metodo encargado de probar que el nombre vacio y el nombre largo de una
+        carrera incumplen restricciones distintas, cada una con su mensaje
+        """
+        mensajes = []
+        for nombre in ('   ', 'a' * 201):
+            with self.assertRaises(IntegrityError) as contexto:
+                self.session.execute(Carrera.__table__.insert(), {'nombre': nombre})
+            self.session.rollback()
+            mensajes.append(str(_error_de_restriccion(contexto.exception, nombre)))
+        self.assertEqual(mensajes, ["El nombre de la carrera no debe estar vacio",
+                                    "El nombre de la carrera puede tener hasta 200 caracteres"])
@@ -7,6 +7,7 @@ from src.modelo.apuesta import Apuesta
 from src.modelo.apostador import Apostador
 from src.modelo.carrera import Carrera
 from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
 
 
 class CompetidorTestCase(unittest.TestCase):
@@ -32,6 +33,8 @@ class CompetidorTestCase(unittest.TestCase):
 		"""
         Metodo encargado de limpiar los fixtures de la clase.
         """
+		self.logica.cerrar()
+		self.session.query(EstadisticaApostador).delete()
 		self.session.query(Apostador).delete()
 		self.session.query(Apuesta).delete()
 		self.session.query(Competidor).delete()
@@ -153,4 +156,44 @@ class CompetidorTestCase(unittest.TestCase):
 		probabilidad = 0.5
 
 		with self.assertRaises(ValueError):
-			self.logica.aniadir_competidor(self.carrera, nombre, probabilidad)
\ No newline at end of file
+			self.logica.aniadir_competidor(self.carrera, nombre, probabilidad)
+
+	def test_aniadir_competidor_guarda_multiplicador(self):
+		"""
+		Metodo encargado de probar que al crear un competidor se guarda su
+		multiplicador de pago, que es la cuota que muestra la interfaz.
+		"""
+		nombre= self.data_factory.name()
+
+		self.logica.aniadir_competidor(self.carrera, nombre, 0.25)
+		self.session.commit()
+
+		base_competidor = self.session.query(Competidor).filter(Competidor.nombre == nombre).first()
+		self.assertEqual(base_competidor.multiplicador, 4)
+		self.assertEqual(self.logica.dar_competidores_carrera(self.carrera.nombre)[0]['Multiplicador'], 4)
+
+		base_competidor.probabilidad = 0.5
+		self.assertEqual(base_competidor.multiplicador, 2)
+
+	def test_competidores_mas_apostados(self):
+		"""
+		Metodo encargado de probar la tabla de posiciones de los competidores por
+		los que mas se ha apostado en una carrera.
+		"""
+		nombres = [self.data_factory.name() for i in range(3)]
+		for nombre in nombres:
+			self.logica.aniadir_competidor(self.carrera, nombre, 0.3)
+		self.session.commit()
+		apostador = self.data_factory.name()
+		self.logica.aniadir_apostador(apostador)
+
+		self.logica.crear_apuesta(apostador, self.carrera.nombre, 5, nombres[0])
+		self.logica.crear_apuesta(apostador, self.carrera.nombre, 50, nombres[1])
+		self.logica.crear_apuesta(apostador, self.carrera.nombre, 20, nombres[2])
+		self.logica.crear_apuesta(apostador, self.carrera.nombre, 10, nombres[2])
+
+		competidores = self.logica.dar_competidores_mas_apostados(self.carrera.nombre, 2)
+		self.assertEqual([c['Competidor'] for c in competidores], [nombres[1], nombres[2]])
+		self.assertEqual(competidores[1]['Apuestas'], 2)
+		self.assertEqual(competidores[1]['Apostado'], 30)
+
@@ -0,0 +1,231 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from decimal import Decimal
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
+from src.modelo.dinero import a_centavos, de_centavos
+from src.modelo.migraciones import VERSION
+from src.modelo.apuesta import Apuesta
+from src.modelo.apostador import Apostador
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+
+
+class DineroTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la representacion de los
+    valores monetarios como enteros en centavos
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.logica = ManagerEPorra(TESTING_ADDRESS)
+        (self.engine, self.session) = crear_session(TESTING_ADDRESS)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.session.query(EstadisticaApostador).delete()
+        self.session.query(Apostador).delete()
+        self.session.query(Apuesta).delete()
+        self.session.query(Competidor).delete()
+        self.session.query(Carrera).delete()
+
+        self.session.commit()
+        return super().tearDown()
+
+    def test_conversion_centavos(self):
+        """
+        Metodo encargado de probar la conversion entre valores y centavos
+        """
+        self.assertEqual(a_centavos(10), 1000)
+        self.assertEqual(a_centavos(0.1), 10)
+        self.assertEqual(a_centavos(Decimal('2.345')), 234)
+        self.assertEqual(de_centavos(1050), Decimal('10.50'))
+
+    def test_valores_guardados_como_enteros(self):
+        """
+        Metodo encargado de probar que el valor de una apuesta se guarda en
+        centavos y la suma se hace en la base de datos
+        """
+        carrera = Carrera(nombre='Carrera dinero', abierta=True, ganancia=None)
+        self.session.add(carrera)
+        for valor in (0.1, 0.2, 0.3):
+            self.session.add(Apuesta(valor=valor, ganancia=0, carrera=carrera))
+        self.session.commit()
+
+        crudos = [v for (v,) in self.engine.execute('SELECT valor FROM apuesta ORDER BY valor')]
+        self.assertEqual(crudos, [10, 20, 30])
+        total = self.engine.execute('SELECT SUM(valor) FROM apuesta').scalar()
+        self.assertEqual(de_centavos(total), Decimal('0.60'))
+
+    def test_migracion_base_de_datos_existente(self):
+        """
+        Metodo encargado de probar la migracion de una base de datos con los
+        valores guardados como numeros de punto flotante
+        """
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, 'legado.sqlite')
+            conexion = sqlite3.connect(ruta)
+            conexion.executescript("""
+                CREATE TABLE apostador (nombre VARCHAR PRIMARY KEY);
+                CREATE TABLE carrera (nombre VARCHAR PRIMARY KEY, abierta BOOLEAN, ganancia NUMERIC);
+                CREATE TABLE competidor (nombre VARCHAR, probabilidad NUMERIC, ganador BOOLEAN,
+                    nombre_carrera VARCHAR, PRIMARY KEY (nombre, nombre_carrera));
+                CREATE TABLE apuesta (id INTEGER PRIMARY KEY, valor NUMERIC, ganancia NUMERIC,
+                    nombre_apostador VARCHAR, nombre_competidor VARCHAR, nombre_carrera VARCHAR);
+                INSERT INTO carrera VALUES ('Legado', 0, 12.5);
+                INSERT INTO apuesta VALUES (1, 10.25, 0, NULL, NULL, 'Legado');
+            """)
+            conexion.commit()
+            conexion.close()
+
+            logica = ManagerEPorra('sqlite:///' + ruta)
+            apuesta = logica.session.query(Apuesta).first()
+            self.assertEqual(apuesta.valor, Decimal('10.25'))
+            self.assertEqual(logica.dar_carrera('Legado').ganancia, Decimal('12.50'))
+            self.assertEqual(logica.engine.execute('PRAGMA user_version').scalar(), VERSION)
+            llaves = {(fila[2], fila[3], fila[6]) for fila in
+                      logica.engine.execute('PRAGMA foreign_key_list(apuesta)')}
+            self.assertIn(('competidor', 'nombre_carrera', 'CASCADE'), llaves)
+            columnas = {fila[1] for fila in logica.engine.execute('PRAGMA table_info(competidor)')}
+            self.assertIn('multiplicador', columnas)
+            self.assertNotIn('cuota', columnas)
+            self.assertEqual(logica.eliminar_carrera('Legado'), 0)
+            logica.session.close()
+            logica.engine.dispose()
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_migracion_competidores_repetidos_entre_carreras(self):
+        """
+        Metodo encargado de probar que la migracion al nombre de competidor
+        unico renombra los competidores repetidos en carreras distintas
+        """
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, 'legado.sqlite')
+            conexion = sqlite3.connect(ruta)
+            conexion.executescript("""
+                CREATE TABLE apostador (nombre VARCHAR PRIMARY KEY);
+                CREATE TABLE carrera (nombre VARCHAR PRIMARY KEY, abierta BOOLEAN, ganancia NUMERIC);
+                CREATE TABLE competidor (nombre VARCHAR, probabilidad NUMERIC, ganador BOOLEAN,
+                    nombre_carrera VARCHAR, PRIMARY KEY (nombre, nombre_carrera));
+                CREATE TABLE apuesta (id INTEGER PRIMARY KEY, valor NUMERIC, ganancia NUMERIC,
+                    nombre_apostador VARCHAR, nombre_competidor VARCHAR, nombre_carrera VARCHAR);
+                INSERT INTO carrera VALUES ('Norte', 1, NULL);
+                INSERT INTO carrera VALUES ('Sur', 1, NULL);
+                INSERT INTO competidor VALUES ('Rayo', 0.5, 0, 'Sur');
+                INSERT INTO competidor VALUES ('Rayo', 0.5, 0, 'Norte');
+                INSERT INTO apuesta VALUES (1, 10, 0, NULL, 'Rayo', 'Sur');
+                INSERT INTO apuesta VALUES (2, 20, 0, NULL, 'Rayo', 'Norte');
+            """)
+            conexion.commit()
+            conexion.close()
+
+            logica = ManagerEPorra('sqlite:///' + ruta)
+            competidores = sorted(logica.session.query(Competidor.nombre, Competidor.nombre_carrera))
+            self.assertEqual(competidores, [('Rayo', 'Norte'), ('Rayo (Sur)', 'Sur')])
+            apuestas = sorted(logica.session.query(Apuesta.id, Apuesta.nombre_competidor))
+            self.assertEqual(apuestas, [(1, 'Rayo (Sur)'), (2, 'Rayo')])
+            self.assertEqual(logica.buscar_competidores('Sur', 'rayo'), [{'Nombre': 'Rayo (Sur)'}])
+            logica.session.close()
+            logica.engine.dispose()
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_migracion_desde_version_7_con_competidores_repetidos(self):
+        """
+        Metodo encargado de probar que una base de datos en la version 7, sin el
+        indice unico, con el mismo competidor en dos carreras se puede abrir
+        """
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, 'version_7.sqlite')
+            logica = ManagerEPorra('sqlite:///' + ruta)
+            logica.cerrar()
+            conexion = sqlite3.connect(ruta)
+            conexion.executescript("""
+                DROP INDEX ux_competidor_nombre;
+                INSERT INTO carrera (nombre, nombre_normalizado, abierta) VALUES ('Norte', 'norte', 1);
+                INSERT INTO carrera (nombre, nombre_normalizado, abierta) VALUES ('Sur', 'sur', 1);
+                INSERT INTO competidor (nombre, nombre_normalizado, probabilidad, ganador,
+                    nombre_carrera, numero_apuestas, total_apostado)
+                    VALUES ('Rayo', 'rayo', 0.5, 0, 'Norte', 0, 0);
+                INSERT INTO competidor (nombre, nombre_normalizado, probabilidad, ganador,
+                    nombre_carrera, numero_apuestas, total_apostado)
+                    VALUES ('Rayo', 'rayo', 0.5, 0, 'Sur', 0, 0);
+                PRAGMA user_version = 7;
+            """)
+            conexion.close()
+
+            logica = ManagerEPorra('sqlite:///' + ruta)
+            self.assertEqual([c['Nombre'] for c in logica.dar_competidores_carrera('Sur')],
+                             ['Rayo (Sur)'])
+            self.assertEqual(logica.engine.execute('PRAGMA user_version').scalar(), VERSION)
+            logica.cerrar()
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_migracion_competidores_repetidos_en_fragmentos(self):
+        """
+        Metodo encargado de probar que la migracion al nombre de competidor
+        unico tambien renombra las apuestas y los cambios pendientes guardados
+        en los fragmentos
+        """
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, 'version_7.sqlite')
+            directorio_fragmentos = os.path.join(directorio, 'fragmentos')
+            logica = ManagerEPorra('sqlite:///' + ruta, directorio_fragmentos=directorio_fragmentos)
+            logica.guardar_cambios_carrera('Norte', [
+                {"Nombre": "Rayo", "Probabilidad": 0.5, "Estado": "Nueva"},
+                {"Nombre": "Nube", "Probabilidad": 0.5, "Estado": "Nueva"}], True)
+            logica.guardar_cambios_carrera('Sur', [
+                {"Nombre": "Otro", "Probabilidad": 0.5, "Estado": "Nueva"},
+                {"Nombre": "Brisa", "Probabilidad": 0.5, "Estado": "Nueva"}], True)
+            logica.aniadir_apostador('Ana')
+            logica.crear_apuesta('Ana', 'Sur', 10, 'Otro')
+            fragmento = logica.fragmentos.ruta('Sur')
+            logica.cerrar()
+            conexion = sqlite3.connect(ruta)
+            conexion.executescript("""
+                DROP INDEX ux_competidor_nombre;
+                UPDATE competidor SET nombre = 'Rayo', nombre_normalizado = 'rayo'
+                    WHERE nombre = 'Otro';
+                PRAGMA user_version = 7;
+            """)
+            conexion.close()
+            conexion = sqlite3.connect(fragmento)
+            conexion.executescript("""
+                UPDATE apuesta SET nombre_competidor = 'Rayo';
+                UPDATE cambio_pendiente SET nombre_competidor = 'Rayo'
+                    WHERE nombre_competidor IS NOT NULL;
+            """)
+            conexion.close()
+
+            logica = ManagerEPorra('sqlite:///' + ruta, directorio_fragmentos=directorio_fragmentos)
+            self.assertEqual([c['Nombre'] for c in logica.dar_competidores_carrera('Sur')],
+                             ['Rayo (Sur)', 'Brisa'])
+            self.assertEqual([a['Competidor'] for a in logica.dar_apuestas_carrera('Sur')],
+                             ['Rayo (Sur)'])
+            logica.terminar_carrera('Rayo (Sur)')
+            ganancias, _ = logica.dar_reporte_ganancias('Sur', 'Rayo (Sur)')
+            self.assertEqual(ganancias, [('Ana', Decimal('20.00'))])
+            logica.cerrar()
+            conexion = sqlite3.connect(fragmento)
+            nombres = {n for (n,) in conexion.execute(
+                "SELECT nombre_competidor FROM cambio_pendiente WHERE nombre_competidor IS NOT NULL")}
+            conexion.close()
+            self.assertNotIn('Rayo', nombres)
+        finally:
+            shutil.rmtree(directorio)
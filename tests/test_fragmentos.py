@@ -0,0 +1,207 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
+from src.modelo.apuesta import Apuesta
+from src.modelo.cambio_pendiente import CambioPendiente
+from src.modelo.apostador import Apostador
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+
+
+class FragmentosTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias del modo fragmentado, en el que
+    las apuestas de cada carrera se guardan en su propio archivo SQLite
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        self.logica = ManagerEPorra(TESTING_ADDRESS, directorio_fragmentos=self.directorio)
+        (self.engine, self.session) = crear_session(TESTING_ADDRESS)
+
+        self.apostador = Apostador(nombre=self.data_factory.name())
+        self.session.add(self.apostador)
+        self.carreras = []
+        for i in range(2):
+            carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
+            carrera.competidores.append(Competidor(
+                nombre=self.data_factory.name(), probabilidad=0.5, ganador=False))
+            carrera.competidores.append(Competidor(
+                nombre=self.data_factory.name(), probabilidad=0.5, ganador=False))
+            self.session.add(carrera)
+            self.carreras.append(carrera)
+        self.session.commit()
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.session.query(EstadisticaApostador).delete()
+        self.session.query(Apostador).delete()
+        self.session.query(Apuesta).delete()
+        self.session.query(Competidor).delete()
+        self.session.query(Carrera).delete()
+
+        self.session.commit()
+        self.logica.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def test_apuestas_en_archivo_de_la_carrera(self):
+        """
+        Metodo encargado de probar que las apuestas quedan en el fragmento de su
+        carrera y no en la base de datos principal
+        """
+        carrera = self.carreras[0]
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10,
+                                  carrera.competidores[0].nombre)
+
+        self.assertTrue(os.path.exists(self.logica.fragmentos.ruta(carrera.nombre)))
+        self.assertFalse(os.path.exists(self.logica.fragmentos.ruta(self.carreras[1].nombre)))
+        self.assertEqual(self.session.query(Apuesta).count(), 0)
+        apuestas = self.logica.dar_apuestas_carrera(carrera.nombre)
+        self.assertEqual([a['Apostador'] for a in apuestas], [self.apostador.nombre])
+        self.assertEqual(self.logica.dar_apuestas_carrera(self.carreras[1].nombre), [])
+
+    def test_dar_apuestas_apostador_une_fragmentos(self):
+        """
+        Metodo encargado de probar que el listado entre carreras une los
+        fragmentos en orden de carrera
+        """
+        for carrera in self.carreras:
+            self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10,
+                                      carrera.competidores[0].nombre)
+
+        apuestas = self.logica.dar_apuestas_apostador(self.apostador.nombre)
+        self.assertEqual([a['Carrera'] for a in apuestas],
+                         sorted(c.nombre for c in self.carreras))
+
+    def test_apuestas_en_paralelo(self):
+        """
+        Metodo encargado de probar que carreras distintas reciben apuestas desde
+        hilos distintos
+        """
+        nombre_apostador = self.apostador.nombre
+
+        def apostar(nombre_carrera, nombre_competidor):
+            for _ in range(20):
+                self.logica.crear_apuesta(nombre_apostador, nombre_carrera, 5,
+                                          nombre_competidor)
+
+        datos = [(c.nombre, c.competidores[1].nombre) for c in self.carreras]
+        hilos = [threading.Thread(target=apostar, args=d) for d in datos]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        for nombre, _ in datos:
+            self.assertEqual(len(self.logica.dar_apuestas_carrera(nombre)), 20)
+
+    def test_reporte_y_eliminacion_en_fragmento(self):
+        """
+        Metodo encargado de probar el reporte de ganancias y la eliminacion de
+        una carrera en modo fragmentado
+        """
+        carrera = self.carreras[0]
+        ganador = carrera.competidores[0].nombre
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10, ganador)
+
+        lista_ganancias, ganancias_casa = self.logica.dar_reporte_ganancias(carrera.nombre, ganador)
+        self.assertEqual(lista_ganancias, [(self.apostador.nombre, 20)])
+        self.assertEqual(ganancias_casa, -10)
+        self.assertFalse(self.logica.eliminar_carrera(carrera.nombre))
+
+        vacia = self.carreras[1].nombre
+        self.assertTrue(self.logica.eliminar_carrera(vacia))
+        self.assertFalse(self.logica.fragmentos.existe(vacia))
+
+    def test_resumenes_se_consolidan_al_consultarlos(self):
+        """
+        Metodo encargado de probar que registrar una apuesta no actualiza los
+        resumenes de la base de datos principal hasta que se consultan
+        """
+        carrera = self.carreras[0]
+        competidor = carrera.competidores[0].nombre
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10, competidor)
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 5, competidor)
+        self.assertEqual(self.session.query(EstadisticaApostador).count(), 0)
+        self.assertEqual(self.session.query(Competidor.numero_apuestas).filter(
+            Competidor.nombre == competidor).scalar(), 0)
+
+        estadisticas = self.logica.dar_estadisticas_apostador(self.apostador.nombre)
+        self.assertEqual((estadisticas['Apuestas'], estadisticas['Apostado'],
+                          estadisticas['Carreras']), (2, 15, 1))
+        self.assertEqual(self.logica.dar_competidores_mas_apostados(carrera.nombre, 1),
+                         [{'Competidor': competidor, 'Apuestas': 2, 'Apostado': 15}])
+        sesion = self.logica.fragmentos.sesion(carrera.nombre)
+        self.assertEqual(sesion.query(CambioPendiente).count(), 0)
+
+    def test_apuesta_solo_escribe_en_el_fragmento(self):
+        """
+        Metodo encargado de probar que registrar una apuesta, con su volumen por
+        minuto, no escribe en la base de datos principal
+        """
+        carrera = self.carreras[0]
+        competidor = carrera.competidores[0].nombre
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10, competidor)
+        observador = sqlite3.connect(TESTING_ADDRESS.replace('sqlite:///', ''))
+        try:
+            (antes,) = observador.execute('PRAGMA data_version').fetchone()
+            self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 5, competidor)
+            (despues,) = observador.execute('PRAGMA data_version').fetchone()
+        finally:
+            observador.close()
+
+        self.assertEqual(antes, despues)
+        self.assertEqual(self.logica.dar_volumen_carrera(carrera.nombre),
+                         [{'Competidor': competidor, 'Apuestas': 2, 'Apostado': 15}])
+
+    def test_cambios_consolidados_no_se_suman_dos_veces(self):
+        """
+        Metodo encargado de probar que si los cambios ya sumados no alcanzan a
+        borrarse del fragmento, no se vuelven a sumar
+        """
+        carrera = self.carreras[0]
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10,
+                                  carrera.competidores[0].nombre)
+        sesion = self.logica.fragmentos.sesion(carrera.nombre)
+        (ultimo,) = sesion.query(CambioPendiente.id).one()
+        # Simula una interrupcion despues de sumar los cambios y antes de borrarlos
+        self.logica.session.query(Carrera).filter(Carrera.nombre == carrera.nombre).update(
+            {Carrera.cambios_consolidados: ultimo}, synchronize_session=False)
+        self.logica.session.commit()
+
+        estadisticas = self.logica.dar_estadisticas_apostador(self.apostador.nombre)
+        self.assertEqual(estadisticas['Apuestas'], 0)
+        self.assertEqual(sesion.query(CambioPendiente).count(), 0)
+        self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 5,
+                                  carrera.competidores[0].nombre)
+        estadisticas = self.logica.dar_estadisticas_apostador(self.apostador.nombre)
+        self.assertEqual((estadisticas['Apuestas'], estadisticas['Apostado']), (1, 5))
+
+    def test_carrera_terminada_cierra_su_fragmento(self):
+        """
+        Metodo encargado de probar que una carrera terminada no recibe apuestas,
+        comprobandolo en su fragmento
+        """
+        carrera = self.carreras[0]
+        self.logica.terminar_carrera(carrera.competidores[0].nombre)
+
+        with self.assertRaises(Exception):
+            self.logica.crear_apuesta(self.apostador.nombre, carrera.nombre, 10,
+                                      carrera.competidores[0].nombre)
+        self.assertEqual(self.logica.dar_apuestas_carrera(carrera.nombre), [])
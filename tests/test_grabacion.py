@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+import unittest
+from faker import Faker
+
+from src.logica.grabacion import Grabadora, leer_grabacion, reproducir, resumir_latencias
+from src.logica.manager_eporra import ManagerEPorra
+from src.logica.manager_memoria import ManagerMemoria
+
+
+class GrabacionTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la grabacion y reproduccion
+    de llamadas a la logica
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, 'grabacion.jsonl')
+        self.logica = Grabadora(ManagerEPorra(
+            'sqlite:///' + os.path.join(self.directorio, 'original.sqlite')), self.ruta)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.logica.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def _grabar(self):
+        """
+        Metodo encargado de ejecutar una carga de trabajo sobre la logica
+        grabada.
+        """
+        carrera = self.data_factory.name()
+        competidores = [self.data_factory.name() for _ in range(2)]
+        apostadores = [self.data_factory.name() for _ in range(3)]
+        self.logica.guardar_cambios_carrera(carrera, [
+            {'Nombre': competidores[0], 'Probabilidad': 0.4, 'Estado': 'Nueva'},
+            {'Nombre': competidores[1], 'Probabilidad': 0.6, 'Estado': 'Nueva'}], True)
+        for nombre in apostadores:
+            self.logica.aniadir_apostador(nombre)
+        with self.assertRaises(ValueError):
+            self.logica.aniadir_apostador(apostadores[0])
+        for i in range(6):
+            self.logica.crear_apuesta(apostadores[i % 3], carrera, 10 + i, competidores[i % 2])
+        self.logica.editar_apuesta(1, apostadores[2], carrera, 25.5, competidores[1])
+        self.logica.dar_apuestas_carrera(carrera)
+        self.logica.terminar_carrera(competidores[1])
+        self.logica.dar_reporte_ganancias(carrera, competidores[1])
+        return carrera
+
+    def test_grabar_llamadas_publicas(self):
+        """
+        Metodo encargado de probar que se graban solo las llamadas publicas
+        hechas desde fuera, con su tamano y sus errores
+        """
+        carrera = self._grabar()
+        llamadas = leer_grabacion(self.ruta)
+
+        metodos = [llamada['metodo'] for llamada in llamadas]
+        self.assertEqual(metodos.count('crear_apuesta'), 6)
+        self.assertEqual(metodos.count('terminar_carreras'), 0)
+        self.assertEqual([l['error'] for l in llamadas if l['error']], ['ValueError'])
+        consulta = next(l for l in llamadas if l['metodo'] == 'dar_apuestas_carrera')
+        self.assertEqual((consulta['args'], consulta['tamano']), ([carrera], 6))
+        self.assertTrue(all(l['duracion'] >= 0 for l in llamadas))
+        self.assertEqual([l['momento'] for l in llamadas], sorted(l['momento'] for l in llamadas))
+
+    def test_reproducir_contra_logica_nueva(self):
+        """
+        Metodo encargado de probar que la reproduccion deja la logica de destino
+        en el mismo estado que la original y reporta las latencias
+        """
+        carrera = self._grabar()
+        destino = ManagerMemoria()
+        resultados = reproducir(self.ruta, destino, velocidad=1000)
+        grabadas = len(leer_grabacion(self.ruta))
+
+        self.assertEqual(len(resultados['crear_apuesta']['latencias']), 6)
+        self.assertEqual(resultados['aniadir_apostador']['errores'], 1)
+        self.assertEqual(destino.dar_reporte_ganancias(carrera, None),
+                         self.logica.dar_reporte_ganancias(carrera, None))
+        self.assertEqual([a['Nombre'] for a in destino.dar_apostadores()],
+                         [a['Nombre'] for a in self.logica.dar_apostadores()])
+        resumen = resumir_latencias(resultados)
+        self.assertEqual(sum(r['Llamadas'] for r in resumen), grabadas)
+        self.assertTrue(all(r['p50'] <= r['p99'] <= r['Maximo'] for r in resumen))
+
+    def test_grabar_generadores_y_omitir_consultas_periodicas(self):
+        """
+        Metodo encargado de probar que un generador se graba al recorrerlo, con
+        el numero de elementos, que la reproduccion lo recorre y que la consulta
+        periodica de la version no se graba
+        """
+        carrera = self.data_factory.name()
+        competidores = [self.data_factory.name() for _ in range(2)]
+        self.logica.guardar_cambios_carrera(carrera, [
+            {'Nombre': competidores[0], 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+            {'Nombre': competidores[1], 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        for i in range(3):
+            nombre = self.data_factory.name()
+            self.logica.aniadir_apostador(nombre)
+            self.logica.crear_apuesta(nombre, carrera, 10, competidores[0])
+        self.logica.terminar_carrera(competidores[0])
+        for _ in range(5):
+            self.logica.dar_version_datos()
+
+        lotes = list(self.logica.generar_reporte_ganancias(carrera, competidores[0], 2))
+        llamadas = leer_grabacion(self.ruta)
+        self.assertNotIn('dar_version_datos', [l['metodo'] for l in llamadas])
+        reporte = llamadas[-1]
+        self.assertEqual((reporte['metodo'], reporte['tamano'], reporte['generador']),
+                         ('generar_reporte_ganancias', len(lotes), True))
+
+        destino = ManagerMemoria()
+        reproducir(self.ruta, destino)
+        self.assertEqual(destino.dar_carrera(carrera).ganancia,
+                         self.logica.dar_carrera(carrera).ganancia)
@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from faker import Faker
+from sqlalchemy.exc import OperationalError
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
+from src.modelo.apuesta import Apuesta
+from src.modelo.apostador import Apostador
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+
+
+class InstantaneaTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la copia de solo lectura de
+    la base de datos usada por los reportes
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        self.logica = ManagerEPorra(TESTING_ADDRESS)
+        (self.engine, self.session) = crear_session(TESTING_ADDRESS)
+        self.logicas = []
+
+        self.carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
+        self.competidor = Competidor(nombre=self.data_factory.name(), probabilidad=0.5, ganador=False)
+        self.carrera.competidores.append(self.competidor)
+        self.carrera.competidores.append(Competidor(
+            nombre=self.data_factory.name(), probabilidad=0.5, ganador=False))
+        self.session.add(self.carrera)
+        self.session.commit()
+        self.nombre_apostador = self.data_factory.name()
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        for logica in self.logicas:
+            logica.instantanea.cerrar()
+            logica.session.close()
+        self.session.query(EstadisticaApostador).delete()
+        self.session.query(Apostador).delete()
+        self.session.query(Apuesta).delete()
+        self.session.query(Competidor).delete()
+        self.session.query(Carrera).delete()
+
+        self.session.commit()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def _crear_logica(self, instantanea, intervalo=None):
+        """
+        Metodo encargado de crear la logica con copia para los reportes.
+        """
+        logica = ManagerEPorra(TESTING_ADDRESS, instantanea=instantanea,
+                               intervalo_instantanea=intervalo)
+        self.logicas.append(logica)
+        return logica
+
+    def test_reportes_leen_la_copia(self):
+        """
+        Metodo encargado de probar que los reportes se consultan en la copia y
+        solo ven las apuestas nuevas despues de actualizarla
+        """
+        logica = self._crear_logica(':memory:')
+        logica.aniadir_apostador(self.nombre_apostador)
+        logica.crear_apuesta(self.nombre_apostador, self.carrera.nombre, 10, self.competidor.nombre)
+        self.assertEqual(logica.dar_mayores_apostadores(), [])
+
+        logica.instantanea.refrescar()
+        self.assertEqual(logica.dar_mayores_apostadores(),
+                         [{'Apostador': self.nombre_apostador, 'Apostado': 10}])
+        self.assertEqual(len(logica.dar_apuestas_apostador(self.nombre_apostador)), 1)
+        exposicion = {e['Competidor']: e['Apostado'] for e in logica.dar_exposicion_carrera(self.carrera.nombre)}
+        self.assertEqual(exposicion[self.competidor.nombre], 10)
+
+    def test_copia_de_solo_lectura_en_archivo(self):
+        """
+        Metodo encargado de probar la copia guardada en un archivo, que no
+        acepta escrituras
+        """
+        ruta = os.path.join(self.directorio, 'reportes.sqlite')
+        logica = self._crear_logica(ruta)
+        self.assertTrue(os.path.exists(ruta))
+        with logica.instantanea.sesion() as sesion:
+            self.assertEqual(sesion.query(Carrera).count(), 1)
+            with self.assertRaises(OperationalError):
+                sesion.execute("DELETE FROM carrera")
+
+    def test_actualizacion_programada(self):
+        """
+        Metodo encargado de probar que la copia se actualiza sola cada intervalo
+        """
+        logica = self._crear_logica(':memory:', intervalo=0.05)
+        logica.aniadir_apostador(self.nombre_apostador)
+        logica.crear_apuesta(self.nombre_apostador, self.carrera.nombre, 10, self.competidor.nombre)
+        limite = time.time() + 5
+        while not logica.dar_mayores_apostadores() and time.time() < limite:
+            time.sleep(0.05)
+        self.assertEqual(len(logica.dar_mayores_apostadores()), 1)
+
+    def test_copia_reemplazada_se_libera_al_terminar_sus_consultas(self):
+        """
+        Metodo encargado de probar que una copia reemplazada sigue disponible
+        para las consultas en curso y se libera cuando terminan, y que en
+        archivo la copia nueva no se escribe sobre la que sigue abierta
+        """
+        ruta = os.path.join(self.directorio, 'reportes.sqlite')
+        logica = self._crear_logica(ruta)
+        instantanea = logica.instantanea
+        logica.aniadir_apostador(self.nombre_apostador)
+
+        with instantanea.sesion() as sesion:
+            instantanea.refrescar()
+            self.assertTrue(os.path.exists(ruta + '.2'))
+            self.assertEqual(sesion.query(Apostador).count(), 0)
+            self.assertEqual(len(instantanea._copias), 2)
+        self.assertEqual(len(instantanea._copias), 1)
+        with instantanea.sesion() as sesion:
+            self.assertEqual(sesion.query(Apostador).count(), 1)
+
+        instantanea.refrescar()
+        self.assertEqual(len(instantanea._copias), 1)
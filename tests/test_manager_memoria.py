@@ -0,0 +1,251 @@
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.logica.manager_memoria import ManagerMemoria
+from src.modelo.declarative_base import crear_session, TESTING_ADDRESS
+from src.modelo.apuesta import Apuesta
+from src.modelo.apostador import Apostador
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+from src.modelo.estadistica_apostador import EstadisticaApostador
+
+
+class ManagerMemoriaTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias que comparan la logica en
+    memoria con la logica sobre SQLite
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.sqlite = ManagerEPorra(TESTING_ADDRESS)
+        self.memoria = ManagerMemoria()
+        (self.engine, self.session) = crear_session(TESTING_ADDRESS)
+
+        self.apostadores = [self.data_factory.unique.name() for _ in range(4)]
+        self.carreras = []
+        for _ in range(2):
+            nombre = self.data_factory.unique.name()
+            competidores = [self.data_factory.unique.name() for _ in range(3)]
+            self.carreras.append((nombre, competidores))
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.sqlite.cerrar()
+        self.session.query(EstadisticaApostador).delete()
+        self.session.query(Apostador).delete()
+        self.session.query(Apuesta).delete()
+        self.session.query(Competidor).delete()
+        self.session.query(Carrera).delete()
+
+        self.session.commit()
+        return super().tearDown()
+
+    def _en_ambas(self, metodo, *args):
+        """
+        Metodo encargado de ejecutar la misma operacion en las dos logicas y
+        verificar que ambas dan el mismo resultado o el mismo error.
+        """
+        resultados = []
+        for logica in (self.sqlite, self.memoria):
+            try:
+                resultados.append(('ok', getattr(logica, metodo)(*args)))
+            except Exception as e:
+                resultados.append((type(e), str(e)))
+        self.assertEqual(resultados[0], resultados[1], metodo)
+        return resultados[0][1]
+
+    def _poblar(self):
+        """
+        Metodo encargado de crear en las dos logicas las mismas carreras,
+        apostadores y apuestas.
+        """
+        for nombre, competidores in self.carreras:
+            self._en_ambas('guardar_cambios_carrera', nombre, [
+                {'Nombre': competidores[0], 'Probabilidad': 0.2, 'Estado': 'Nueva'},
+                {'Nombre': competidores[1], 'Probabilidad': 0.3, 'Estado': 'Nueva'},
+                {'Nombre': competidores[2], 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        for nombre in self.apostadores:
+            self._en_ambas('aniadir_apostador', nombre)
+        for i in range(12):
+            nombre, competidores = self.carreras[i % 2]
+            self._en_ambas('crear_apuesta', self.apostadores[i % 4], nombre,
+                           self.data_factory.random_int(2, 500) / 4, competidores[i % 3])
+
+    def _ids(self, logica, nombre_carrera):
+        """
+        Metodo encargado de obtener los ids de las apuestas de una carrera en
+        una logica, en el orden en que se crearon.
+        """
+        return sorted(a['Id'] for a in logica.dar_apuestas_carrera(nombre_carrera))
+
+    def _sin_ids(self, apuestas):
+        """
+        Metodo encargado de quitar los ids, que cada logica asigna a su manera.
+        """
+        return [{llave: valor for llave, valor in a.items() if llave != 'Id'} for a in apuestas]
+
+    def _por_nombre(self, competidores):
+        """
+        Metodo encargado de ordenar los competidores, que SQLite no retorna en
+        un orden fijo.
+        """
+        return sorted(competidores, key=lambda c: c['Nombre'])
+
+    def _comparar_lecturas(self):
+        """
+        Metodo encargado de comparar todas las consultas de las dos logicas.
+        """
+        carreras = [logica.dar_carreras() for logica in (self.sqlite, self.memoria)]
+        for carrera in carreras[0] + carreras[1]:
+            carrera['Competidores'] = self._por_nombre(carrera['Competidores'])
+        self.assertEqual(carreras[0], carreras[1])
+        for nombre, competidores in self.carreras:
+            if self.memoria.dar_carrera(nombre) is not None:
+                self.assertEqual(self._por_nombre(self.sqlite.dar_competidores_carrera(nombre)),
+                                 self._por_nombre(self.memoria.dar_competidores_carrera(nombre)))
+            self._en_ambas('dar_competidores_mas_apostados', nombre, 5)
+            self._en_ambas('dar_exposicion_carrera', nombre)
+            self._en_ambas('dar_volumen_carrera', nombre, 60)
+            self._en_ambas('buscar_competidores', nombre, competidores[0][:2], 5)
+            self.assertEqual(self._sin_ids(self.sqlite.dar_apuestas_carrera(nombre)),
+                             self._sin_ids(self.memoria.dar_apuestas_carrera(nombre)))
+        for nombre in self.apostadores:
+            self.assertEqual(self._sin_ids(self.sqlite.dar_apuestas_apostador(nombre)),
+                             self._sin_ids(self.memoria.dar_apuestas_apostador(nombre)))
+            estadisticas = [logica.dar_estadisticas_apostador(nombre)
+                            for logica in (self.sqlite, self.memoria)]
+            for llave in ('Apuestas', 'Apostado', 'Ganado', 'Carreras'):
+                self.assertEqual(estadisticas[0][llave], estadisticas[1][llave])
+        self._en_ambas('dar_mayores_ganadores', 3)
+        self._en_ambas('dar_mayores_apostadores', 3)
+        self._en_ambas('buscar_apostadores', self.apostadores[0][:1].lower())
+        self._en_ambas('buscar_carreras', '')
+
+    def test_mismo_resultado_que_sqlite(self):
+        """
+        Metodo encargado de probar que un mismo escenario da los mismos
+        resultados en la logica en memoria y en la logica sobre SQLite
+        """
+        self._poblar()
+        self._comparar_lecturas()
+
+        nombre, competidores = self.carreras[0]
+        ids = [self._ids(logica, nombre) for logica in (self.sqlite, self.memoria)]
+        for logica, ids_logica in zip((self.sqlite, self.memoria), ids):
+            self.assertTrue(logica.editar_apuesta(ids_logica[0], self.apostadores[3], nombre,
+                                                  42.5, competidores[2]))
+            self.assertFalse(logica.editar_apuesta(ids_logica[1], self.apostadores[0], nombre,
+                                                   1, competidores[0]))
+            self.assertTrue(logica.eliminar_apuesta(nombre, ids_logica[2]))
+        self._comparar_lecturas()
+
+        self._en_ambas('terminar_carreras', [(nombre, competidores[2])])
+        reportes = [logica.dar_reporte_ganancias(nombre, competidores[2])
+                    for logica in (self.sqlite, self.memoria)]
+        self.assertEqual(reportes[0], reportes[1])
+        self._comparar_lecturas()
+        self._en_ambas('reliquidar_carrera', nombre, competidores[0])
+        self._en_ambas('dar_reporte_ganancias', nombre, competidores[0])
+        self._comparar_lecturas()
+
+        self._en_ambas('eliminar_apostador', self.apostadores[1])
+        self._en_ambas('eliminar_carrera', self.carreras[1][0])
+        self._comparar_lecturas()
+
+    def test_mismas_validaciones_que_sqlite(self):
+        """
+        Metodo encargado de probar que las dos logicas rechazan los mismos
+        datos con los mismos mensajes
+        """
+        self._poblar()
+        nombre, competidores = self.carreras[0]
+        otra = self.data_factory.unique.name()
+
+        self._en_ambas('guardar_cambios_carrera', '  ', [], True)
+        self._en_ambas('guardar_cambios_carrera', nombre, [], True)
+        self._en_ambas('guardar_cambios_carrera', otra, [
+            {'Nombre': 'A', 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        self._en_ambas('guardar_cambios_carrera', otra, [
+            {'Nombre': competidores[0], 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+            {'Nombre': 'B', 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        self._en_ambas('aniadir_apostador', '')
+        self._en_ambas('aniadir_apostador', self.apostadores[0])
+        self._en_ambas('crear_apuesta', self.apostadores[0], nombre, 0, competidores[0])
+        self._en_ambas('terminar_carreras', [(nombre, '')])
+        self._en_ambas('terminar_carrera', 'No existe')
+        self._en_ambas('terminar_carreras', [(nombre, 'No existe')])
+        self._en_ambas('terminar_carreras', [(nombre, competidores[0])])
+        self._en_ambas('terminar_carreras', [(nombre, competidores[1])])
+        self._en_ambas('crear_apuesta', self.apostadores[0], nombre, 10, competidores[0])
+        self._en_ambas('eliminar_carrera', nombre)
+        self._comparar_lecturas()
+
+    def test_editar_y_eliminar_sobre_sus_propios_datos(self):
+        """
+        Metodo encargado de probar que la logica en memoria empieza vacia y que
+        editar carreras, competidores y apostadores cambia sus propios datos
+        """
+        self.assertEqual(self.memoria.dar_carreras(), [])
+        self.assertEqual(self.memoria.dar_apostadores(), [])
+        self._poblar()
+        nombre, competidores = self.carreras[0]
+        nuevo_nombre = self.data_factory.unique.name()
+        apostador = self.data_factory.unique.name()
+
+        self.assertTrue(self.memoria.editar_carrera(nombre, nuevo_nombre))
+        self.assertIsNone(self.memoria.dar_carrera(nombre))
+        self.assertEqual(self.memoria.buscar_carreras(nuevo_nombre), [{'Nombre': nuevo_nombre}])
+        self.assertTrue(all(a['Carrera'] == nuevo_nombre
+                            for a in self.memoria.dar_apuestas_carrera(nuevo_nombre)))
+        self.assertRaises(ValueError, self.memoria.editar_carrera,
+                          nuevo_nombre, self.carreras[1][0])
+
+        self.assertTrue(self.memoria.editar_competidor(nuevo_nombre, competidores[0], 'Otro', 0.25))
+        self.assertEqual([c['Nombre'] for c in self.memoria.dar_competidores_carrera(nuevo_nombre)],
+                         ['Otro', competidores[1], competidores[2]])
+        self.assertEqual(self.memoria.dar_competidor(nuevo_nombre, 'Otro').probabilidad, 0.25)
+        self.assertIn('Otro', [a['Competidor'] for a in self.memoria.dar_apuestas_carrera(nuevo_nombre)])
+
+        self.assertTrue(self.memoria.editar_apostador(self.apostadores[0], apostador))
+        self.assertIsNone(self.memoria.dar_apostador(self.apostadores[0]))
+        self.assertEqual(len(self.memoria.dar_apuestas_apostador(apostador)), 3)
+
+        self.memoria.guardar_cambios_carrera(nuevo_nombre, [
+            {'Nombre': 'Otro', 'Probabilidad': 0.2},
+            {'Nombre': competidores[1], 'Probabilidad': 0.3},
+            {'Nombre': competidores[2], 'Probabilidad': 0.4},
+            {'Nombre': 'Nuevo', 'Probabilidad': 0.1, 'Estado': 'Nueva'}], False)
+        self.assertEqual(float(self.memoria.dar_competidor(nuevo_nombre, 'Otro').probabilidad), 0.2)
+        self.assertFalse(self.memoria.eliminar_competidor(nuevo_nombre, 'Otro'))
+        self.assertTrue(self.memoria.eliminar_competidor(nuevo_nombre, 'Nuevo'))
+        self.assertIsNone(self.memoria.dar_competidor(nuevo_nombre, 'Nuevo'))
+
+    def test_mismos_casos_limite_que_sqlite(self):
+        """
+        Metodo encargado de probar que las dos logicas coinciden en el reporte
+        con apuestas sin apostador o con un ganador que no existe, y al editar
+        una apuesta con un competidor de otra carrera
+        """
+        self._poblar()
+        nombre, competidores = self.carreras[0]
+        self._en_ambas('crear_apuesta', None, nombre, 15, competidores[1])
+
+        self._en_ambas('dar_reporte_ganancias', nombre, 'No existe')
+        for logica in (self.sqlite, self.memoria):
+            with self.assertRaises(ValueError):
+                logica.editar_apuesta(self._ids(logica, nombre)[0], self.apostadores[0], nombre,
+                                      20, self.carreras[1][1][0])
+        self._comparar_lecturas()
+
+        self._en_ambas('terminar_carreras', [(nombre, competidores[1])])
+        self._en_ambas('dar_reporte_ganancias', nombre, competidores[1])
+        self._en_ambas('dar_reporte_ganancias', nombre, competidores[1])
+        self._comparar_lecturas()
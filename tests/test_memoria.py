@@ -0,0 +1,126 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.modelo.carrera import Carrera
+from src.modelo.competidor import Competidor
+
+
+class MemoriaTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias del modo en memoria con puntos
+    de control en el archivo de la base de datos
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, 'memoria.sqlite')
+        self.address = 'sqlite:///' + self.ruta
+        self.logicas = []
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        for logica in self.logicas:
+            logica.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def _crear_logica(self, **kwargs):
+        """
+        Metodo encargado de crear una logica sobre el archivo de la prueba.
+        """
+        logica = ManagerEPorra(self.address, **kwargs)
+        self.logicas.append(logica)
+        return logica
+
+    def _crear_carrera(self, logica):
+        """
+        Metodo encargado de crear una carrera con una apuesta.
+        """
+        carrera = Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0)
+        competidor = Competidor(nombre=self.data_factory.name(), probabilidad=0.5, ganador=False)
+        carrera.competidores.extend([competidor, Competidor(
+            nombre=self.data_factory.name(), probabilidad=0.5, ganador=False)])
+        logica.session.add(carrera)
+        logica.session.commit()
+        nombre_apostador = self.data_factory.name()
+        logica.aniadir_apostador(nombre_apostador)
+        logica.crear_apuesta(nombre_apostador, carrera.nombre, 10, competidor.nombre)
+        return carrera.nombre
+
+    def test_guardar_al_cerrar_y_cargar_al_iniciar(self):
+        """
+        Metodo encargado de probar que los cambios en memoria llegan al archivo
+        al cerrar y se cargan al iniciar de nuevo
+        """
+        logica = self._crear_logica(en_memoria=True)
+        nombre_carrera = self._crear_carrera(logica)
+        self.assertFalse(os.path.exists(self.ruta))
+        logica.cerrar()
+        self.logicas.remove(logica)
+
+        en_disco = self._crear_logica()
+        self.assertEqual(len(en_disco.dar_apuestas_carrera(nombre_carrera)), 1)
+
+        recargada = self._crear_logica(en_memoria=True)
+        self.assertEqual(len(recargada.dar_apuestas_carrera(nombre_carrera)), 1)
+        self.assertEqual(recargada.dar_carrera(nombre_carrera).nombre, nombre_carrera)
+
+    def test_puntos_de_control_periodicos(self):
+        """
+        Metodo encargado de probar que el archivo se actualiza despues de un
+        commit cuando ya paso el intervalo, sin cerrar la logica
+        """
+        logica = self._crear_logica(en_memoria=True, intervalo_guardado=0.05)
+        time.sleep(0.06)
+        nombre_carrera = self._crear_carrera(logica)
+        self.assertTrue(self._guardada(nombre_carrera))
+
+        otra_carrera = self._crear_carrera(logica)
+        self.assertFalse(self._guardada(otra_carrera))
+        time.sleep(0.06)
+        logica.aniadir_apostador(self.data_factory.name())
+        self.assertTrue(self._guardada(otra_carrera))
+
+    def test_punto_de_control_con_transaccion_abierta(self):
+        """
+        Metodo encargado de probar que un punto de control no copia una
+        transaccion sin confirmar: espera un tiempo limitado y falla
+        """
+        logica = self._crear_logica(en_memoria=True)
+        logica.puntos_de_control.ESPERA_MAXIMA = 0.05
+        nombre_carrera = self._crear_carrera(logica)
+        logica.session.add(Carrera(nombre=self.data_factory.name(), abierta=True, ganancia=0))
+        logica.session.flush()
+        with self.assertRaises(TimeoutError):
+            logica.puntos_de_control.guardar()
+        self.assertFalse(os.path.exists(self.ruta))
+        logica.session.rollback()
+        logica.puntos_de_control.guardar()
+        self.assertTrue(self._guardada(nombre_carrera))
+
+    def _guardada(self, nombre_carrera):
+        """
+        Metodo encargado de consultar directamente en el archivo si la carrera
+        ya fue guardada.
+        """
+        if not os.path.exists(self.ruta):
+            return False
+        conexion = sqlite3.connect(self.ruta)
+        try:
+            return conexion.execute("SELECT COUNT(*) FROM carrera WHERE nombre = ?",
+                                    (nombre_carrera,)).fetchone()[0] == 1
+        finally:
+            conexion.close()
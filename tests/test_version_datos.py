@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+import unittest
+from faker import Faker
+
+from src.logica.manager_eporra import ManagerEPorra
+from src.logica.manager_memoria import ManagerMemoria
+
+
+class VersionDatosTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias de la deteccion de cambios
+    hechos por otras terminales
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.data_factory = Faker()
+        Faker.seed(0)
+        self.directorio = tempfile.mkdtemp()
+        address = 'sqlite:///' + os.path.join(self.directorio, 'compartida.sqlite')
+        self.logica = ManagerEPorra(address)
+        self.otra_terminal = ManagerEPorra(address)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.logica.cerrar()
+        self.otra_terminal.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def test_detectar_escrituras_de_otra_terminal(self):
+        """
+        Metodo encargado de probar que la version solo cambia con escrituras,
+        propias o de otra terminal, y que despues se leen los datos nuevos
+        """
+        carrera = self.data_factory.name()
+        self.logica.guardar_cambios_carrera(carrera, [
+            {'Nombre': self.data_factory.name(), 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+            {'Nombre': self.data_factory.name(), 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+        version = self.logica.dar_version_datos()
+        self.assertEqual([c['Abierta'] for c in self.logica.dar_carreras()], [True])
+        self.assertEqual(self.logica.dar_version_datos(), version)
+
+        ganador = self.otra_terminal.dar_competidores_carrera(carrera)[0]['Nombre']
+        self.otra_terminal.terminar_carrera(ganador)
+        self.otra_terminal.aniadir_apostador(self.data_factory.name())
+
+        self.assertNotEqual(self.logica.dar_version_datos(), version)
+        self.assertEqual([c['Abierta'] for c in self.logica.dar_carreras()], [False])
+        self.assertEqual(len(self.logica.dar_apostadores()), 1)
+
+        version = self.logica.dar_version_datos()
+        self.logica.aniadir_apostador(self.data_factory.name())
+        self.assertNotEqual(self.logica.dar_version_datos(), version)
+
+    def test_logica_sin_escritores_externos(self):
+        """
+        Metodo encargado de probar que la logica en memoria no ofrece version
+        """
+        self.assertIsNone(ManagerMemoria().dar_version_datos())
+
+    def test_detectar_apuestas_de_otra_terminal_en_fragmentos(self):
+        """
+        Metodo encargado de probar que la version cambia con las apuestas que
+        otra terminal registra en un fragmento abierto, aunque no escriba en la
+        base de datos principal
+        """
+        address = 'sqlite:///' + os.path.join(self.directorio, 'fragmentada.sqlite')
+        fragmentos = os.path.join(self.directorio, 'fragmentos')
+        logica = ManagerEPorra(address, directorio_fragmentos=fragmentos)
+        otra_terminal = ManagerEPorra(address, directorio_fragmentos=fragmentos)
+        try:
+            carrera = self.data_factory.name()
+            competidor = self.data_factory.name()
+            logica.guardar_cambios_carrera(carrera, [
+                {'Nombre': competidor, 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+                {'Nombre': self.data_factory.name(), 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+            logica.crear_apuesta(None, carrera, 10, competidor)
+            self.assertEqual(len(logica.dar_apuestas_carrera(carrera)), 1)
+            version = logica.dar_version_datos()
+
+            otra_terminal.crear_apuesta(None, carrera, 20, competidor)
+            self.assertNotEqual(logica.dar_version_datos(), version)
+            self.assertEqual(len(logica.dar_apuestas_carrera(carrera)), 2)
+        finally:
+            logica.cerrar()
+            otra_terminal.cerrar()
+
+    def test_detectar_fragmentos_que_crea_otra_terminal(self):
+        """
+        Metodo encargado de probar que la version cambia cuando otra terminal
+        registra apuestas en un fragmento que esta logica aun no ha abierto
+        """
+        address = 'sqlite:///' + os.path.join(self.directorio, 'fragmentada.sqlite')
+        fragmentos = os.path.join(self.directorio, 'fragmentos')
+        logica = ManagerEPorra(address, directorio_fragmentos=fragmentos)
+        otra_terminal = ManagerEPorra(address, directorio_fragmentos=fragmentos)
+        try:
+            carrera = self.data_factory.name()
+            competidor = self.data_factory.name()
+            logica.guardar_cambios_carrera(carrera, [
+                {'Nombre': competidor, 'Probabilidad': 0.5, 'Estado': 'Nueva'},
+                {'Nombre': self.data_factory.name(), 'Probabilidad': 0.5, 'Estado': 'Nueva'}], True)
+            self.assertEqual(logica.dar_apuestas_carrera(carrera), [])
+            version = logica.dar_version_datos()
+
+            otra_terminal.crear_apuesta(None, carrera, 10, competidor)
+            self.assertNotEqual(logica.dar_version_datos(), version)
+            self.assertEqual(len(logica.dar_apuestas_carrera(carrera)), 1)
+
+            otra_terminal.crear_apuesta(None, carrera, 20, competidor)
+            self.assertEqual(len(logica.dar_apuestas_carrera(carrera)), 2)
+        finally:
+            logica.cerrar()
+            otra_terminal.cerrar()
@@ -0,0 +1,80 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from src.logica.manager_memoria import ManagerMemoria
+from src.vista.vigilancia import LogicaVigilada, Vigilante
+
+
+class VigilanciaTestCase(unittest.TestCase):
+    """
+    Clase para la creacion de pruebas unitarias del vigilante de bloqueos del
+    bucle de eventos
+    """
+
+    def setUp(self):
+        """
+        Metodo encargado de la inicializacion de los fixtures de la clase.
+        """
+        self.directorio = tempfile.mkdtemp()
+        self.vigilante = Vigilante(self.directorio, umbral=50)
+
+    def tearDown(self):
+        """
+        Metodo encargado de limpiar los fixtures de la clase.
+        """
+        self.vigilante.cerrar()
+        shutil.rmtree(self.directorio)
+        return super().tearDown()
+
+    def _bloqueos(self):
+        """
+        Metodo encargado de leer el registro de bloqueos.
+        """
+        with open(os.path.join(self.directorio, 'bloqueos.jsonl'), encoding='utf-8') as archivo:
+            return [json.loads(linea) for linea in archivo]
+
+    def test_registrar_bloqueo_con_acciones_y_pila(self):
+        """
+        Metodo encargado de probar que un bloqueo se registra una sola vez, con
+        las acciones en curso y la pila del hilo de la interfaz, y se cierra con
+        el siguiente latido
+        """
+        self.vigilante.latido()
+        self.assertIsNone(self.vigilante.revisar())
+        with self.vigilante.accion('vista.mostrar_apuestas'):
+            with self.vigilante.accion('logica.dar_apuestas_carrera'):
+                time.sleep(0.06)
+                bloqueo = self.vigilante.revisar()
+                self.assertIsNone(self.vigilante.revisar())
+        self.vigilante.latido()
+
+        self.assertEqual(bloqueo['acciones'], ['vista.mostrar_apuestas', 'logica.dar_apuestas_carrera'])
+        self.assertTrue(any('test_registrar_bloqueo_con_acciones_y_pila' in marco
+                            for marco in bloqueo['pila']))
+        inicio, fin = self._bloqueos()
+        self.assertEqual((inicio['tipo'], fin['tipo']), ('inicio', 'fin'))
+        self.assertGreaterEqual(fin['duracion'], inicio['duracion'])
+        self.assertEqual(self.vigilante.bloqueos, 1)
+
+    def test_histograma_de_latencias_por_accion(self):
+        """
+        Metodo encargado de probar que las llamadas a la logica vigilada se
+        miden por metodo y el histograma se guarda al cerrar
+        """
+        logica = LogicaVigilada(ManagerMemoria(), self.vigilante)
+        logica.aniadir_apostador('Ana')
+        logica.aniadir_apostador('Luis')
+        with self.assertRaises(ValueError):
+            logica.aniadir_apostador('Ana')
+        logica.dar_apostadores()
+
+        self.vigilante.cerrar()
+        with open(os.path.join(self.directorio, 'latencias.json'), encoding='utf-8') as archivo:
+            latencias = json.load(archivo)
+        self.assertEqual(latencias['logica.aniadir_apostador']['Llamadas'], 3)
+        self.assertEqual(sum(latencias['logica.aniadir_apostador']['Cubetas'].values()), 3)
+        self.assertEqual(latencias['logica.dar_apostadores']['Llamadas'], 1)